@@ -11,18 +11,26 @@ try:
 except ImportError:
     st = None
 
+import uuid
 from datetime import datetime
 
 # Importar módulos de lógica
-from logic.group_formation import formar_grupos
-from ui.components import alerta_erro
-from ui.group_display import exibir_grupos
+from logic.formation_cache import impressao_turma
+from logic.group_formation import METODOS_FORMACAO, formar_grupos, sortear_grupos_em_fluxo
+from logic.rotation import formar_rodadas
+from logic.sharding import dividir_por_coluna, formar_grupos_por_turma, juntar_formacoes, selecionar_estudantes
+from ui.animations import animacao_sorteio_flip_cards
+from ui.components import alerta_aviso, alerta_erro, alerta_info
+from ui.group_display import exibir_grupos, exibir_rodadas, exibir_turmas
 from ui.history_view import exibir_historico
 
 # Importar módulos de UI
 from ui.input_forms import (
     carregar_grupos_salvos,
     entrada_manual_com_preview,
+    formulario_diversidade,
+    formulario_restricoes,
+    formulario_turmas,
     importar_csv_com_mapeamento,
 )
 from ui.settings_view import exibir_configuracoes
@@ -154,11 +162,17 @@ def exibir_pagina_formar_grupos():
 
             metodo = st.radio(
                 "Método de formação:",
-                ["Aleatório", "Sequencial", "Balanceado"],
-                index=["Aleatório", "Sequencial", "Balanceado"].index(metodo_default),
+                METODOS_FORMACAO,
+                index=METODOS_FORMACAO.index(metodo_default),
                 help="Como os grupos serão formados",
             )
 
+        # Opções específicas do método (restrições, rodízio)
+        restricoes, tempo_limite, num_rodadas, otimizacao = exibir_opcoes_metodo(metodo, estudantes)
+
+        # Formação por turma (CSV com várias turmas)
+        coluna_turma, item_por_turma = formulario_turmas(estudantes)
+
         # Opções avançadas
         with st.expander("🔧 Opções Avançadas"):
             col1, col2, col3 = st.columns(3)
@@ -189,6 +203,22 @@ def exibir_pagina_formar_grupos():
                 help="Use um número > 0 para resultados reproduzíveis",
             )
 
+            # Várias tentativas com sementes diferentes, ficando com a melhor
+            tentativas = st.number_input(
+                "Tentativas (fica com a melhor)",
+                min_value=1,
+                max_value=64,
+                value=1,
+                help="Forma os grupos várias vezes e mantém a melhor formação; a semente vencedora é informada",
+            )
+
+            # Sorteio ao vivo: revela cada grupo enquanto sorteia (apenas "Aleatório")
+            sorteio_ao_vivo = metodo == "Aleatório" and st.checkbox(
+                "🎲 Sorteio ao vivo",
+                value=False,
+                help="Revela cada grupo assim que é sorteado, com os mesmos grupos do sorteio sem animação",
+            )
+
         # Descrição
         descricao = st.text_input(
             "📝 Descrição (opcional):",
@@ -197,27 +227,65 @@ def exibir_pagina_formar_grupos():
         )
 
         # Botão formar grupos
+        animar = False
         if st.button("🎯 FORMAR GRUPOS", type="primary", use_container_width=True):
             if len(estudantes) < tamanho_grupo:
                 alerta_erro(f"É necessário pelo menos {tamanho_grupo} estudantes para formar grupos!")
+            elif num_rodadas > 1:
+                st.session_state.pop("formacao_atual", None)
+                semente_val = semente if semente > 0 else None
+                formar_rodizio(
+                    estudantes, tamanho_grupo, num_rodadas, redistribuir, permitir_maior, semente_val, descricao
+                )
+            elif coluna_turma:
+                st.session_state.pop("formacao_atual", None)
+                semente_val = semente if semente > 0 else None
+                formar_por_turma(
+                    estudantes,
+                    coluna_turma,
+                    item_por_turma,
+                    tamanho_grupo,
+                    metodo,
+                    redistribuir,
+                    permitir_maior,
+                    semente_val,
+                    restricoes,
+                    tempo_limite,
+                    descricao,
+                    otimizacao,
+                )
             else:
                 # Formar grupos
                 semente_val = semente if semente > 0 else None
+                relatorio = {}
 
-                grupos = formar_grupos(
+                grupos = formar_ou_sortear(
                     estudantes,
                     tamanho_grupo,
                     metodo,
                     redistribuir,
                     permitir_maior,
                     semente_val,
+                    sorteio_ao_vivo,
+                    restricoes=restricoes,
+                    historico=st.session_state.get("historico_grupos", []),
+                    tempo_limite=tempo_limite,
+                    relatorio=relatorio,
+                    tentativas=tentativas,
+                    tempo_maximo=10.0,
+                    otimizacao=otimizacao,
                 )
+                # O sorteio ao vivo já mostrou a animação
+                usar_animacao = usar_animacao and not sorteio_ao_vivo
+
+                exibir_relatorio_formacao(relatorio)
 
                 # Salvar no histórico
                 data_formatada = datetime.now().strftime("%d/%m/%Y %H:%M")
                 descricao_final = descricao if descricao else f"Grupos de {tamanho_grupo}"
 
                 novo_item = {
+                    "id": uuid.uuid4().hex,
                     "data": data_formatada,
                     "descricao": descricao_final,
                     "grupos": grupos,
@@ -238,8 +306,17 @@ def exibir_pagina_formar_grupos():
                 if "config_rapida" in st.session_state:
                     del st.session_state["config_rapida"]
 
-                # Exibir grupos
-                exibir_grupos(grupos, tamanho_grupo, estudantes, usar_animacao)
+                # Guardada na sessão: a busca "Encontre seu grupo" e os demais controles dos
+                # grupos disparam novas execuções, em que o botão já não está pressionado
+                st.session_state["formacao_atual"] = {
+                    "grupos": grupos,
+                    "tamanho_grupo": tamanho_grupo,
+                    "estudantes": estudantes,
+                    "impressao": impressao_turma(estudantes),
+                }
+                animar = usar_animacao
+
+        exibir_formacao_atual(estudantes, animar)
     else:
         # Estado vazio
         st.info("👆 Selecione uma aba acima para carregar estudantes e formar grupos!")
@@ -261,5 +338,239 @@ def exibir_pagina_formar_grupos():
             """)
 
 
+def exibir_formacao_atual(estudantes, animar):
+    """
+    Exibe os grupos da formação guardada na sessão, também nas execuções seguintes
+    à formação (ex.: ao digitar na busca "Encontre seu grupo").
+
+    A formação é descartada quando a turma carregada já não é a que foi agrupada
+    (lista editada, arquivo reenviado ou revalidado com outro conteúdo), comparando
+    a impressão digital da turma.
+
+    Args:
+        estudantes (list): Estudantes carregados na execução atual
+        animar (bool): Se deve mostrar a animação de sorteio (só logo após formar)
+    """
+    formacao = st.session_state.get("formacao_atual")
+    if formacao is None:
+        return
+
+    if formacao["estudantes"] is not estudantes and formacao["impressao"] != impressao_turma(estudantes):
+        del st.session_state["formacao_atual"]
+        return
+
+    exibir_grupos(formacao["grupos"], formacao["tamanho_grupo"], formacao["estudantes"], animar)
+
+
+def formar_ou_sortear(
+    estudantes, tamanho_grupo, metodo, redistribuir, permitir_maior, semente, sorteio_ao_vivo, **opcoes
+):
+    """
+    Forma os grupos com formar_grupos ou, no sorteio ao vivo, revela cada grupo
+    enquanto o sorteio é consumido.
+
+    Returns:
+        list: Lista de grupos formados
+    """
+    if not sorteio_ao_vivo:
+        return formar_grupos(estudantes, tamanho_grupo, metodo, redistribuir, permitir_maior, semente, **opcoes)
+
+    st.subheader("🎲 Sorteio ao vivo")
+    fluxo = sortear_grupos_em_fluxo(
+        estudantes,
+        tamanho_grupo,
+        semente=semente,
+        redistribuir_solitarios=redistribuir,
+        permitir_grupos_maiores=permitir_maior,
+        **opcoes,
+    )
+    return animacao_sorteio_flip_cards(grupo["estudantes"] for grupo in fluxo)
+
+
+def exibir_opcoes_metodo(metodo, estudantes):
+    """
+    Exibe as opções específicas do método selecionado.
+
+    Returns:
+        tuple: (restrições, tempo limite da busca, número de rodadas, opções de otimização)
+    """
+    restricoes, tempo_limite, num_rodadas, otimizacao = None, 1.0, 1, None
+
+    # Restrições (apenas para o método com restrições)
+    if metodo == "Restrições":
+        restricoes, tempo_limite = formulario_restricoes(estudantes)
+
+    # Rodízio: várias rodadas de uma vez sem repetir pares
+    if metodo == "Novos parceiros":
+        num_rodadas = st.number_input(
+            "🔁 Número de rodadas (rodízio):",
+            min_value=1,
+            max_value=52,
+            value=1,
+            help="Forma várias rodadas de uma vez evitando que os mesmos estudantes se encontrem de novo",
+        )
+
+    # Diversidade: objetivos e orçamento da otimização
+    if metodo == "Diversidade":
+        otimizacao, tempo_limite = formulario_diversidade(estudantes)
+
+    return restricoes, tempo_limite, num_rodadas, otimizacao
+
+
+def formar_rodizio(estudantes, tamanho_grupo, num_rodadas, redistribuir, permitir_maior, semente, descricao):
+    """Forma várias rodadas de uma vez e salva cada uma como um item do histórico."""
+    relatorio = {}
+    historico = st.session_state.setdefault("historico_grupos", [])
+
+    rodadas = formar_rodadas(
+        estudantes,
+        tamanho_grupo,
+        num_rodadas,
+        redistribuir,
+        permitir_maior,
+        semente,
+        historico=historico,
+        tempo_limite=2.0,
+        relatorio=relatorio,
+    )
+
+    data_formatada = datetime.now().strftime("%d/%m/%Y %H:%M")
+    descricao_base = descricao if descricao else f"Grupos de {tamanho_grupo}"
+
+    for numero, grupos in enumerate(rodadas, 1):
+        novo_item = {
+            "id": uuid.uuid4().hex,
+            "data": data_formatada,
+            "descricao": f"{descricao_base} - Rodada {numero}/{num_rodadas}",
+            "grupos": grupos,
+            "estudantes": estudantes,
+            "tamanho_grupo": tamanho_grupo,
+            "metodo": "Novos parceiros",
+        }
+        historico.insert(0, novo_item)  # Adicionar no início
+
+    save_history(historico)
+
+    if "config_rapida" in st.session_state:
+        del st.session_state["config_rapida"]
+
+    exibir_rodadas(rodadas, relatorio)
+
+
+def formar_por_turma(
+    estudantes,
+    coluna,
+    item_por_turma,
+    tamanho_grupo,
+    metodo,
+    redistribuir,
+    permitir_maior,
+    semente,
+    restricoes,
+    tempo_limite,
+    descricao,
+    otimizacao=None,
+):
+    """Forma os grupos dentro de cada turma e salva um item por turma ou um item combinado."""
+    relatorio = {}
+    historico = st.session_state.setdefault("historico_grupos", [])
+
+    formacoes = formar_grupos_por_turma(
+        estudantes,
+        coluna,
+        tamanho_grupo,
+        metodo,
+        redistribuir,
+        permitir_maior,
+        semente,
+        restricoes=restricoes,
+        historico=historico,
+        tempo_limite=tempo_limite,
+        relatorio=relatorio,
+        otimizacao=otimizacao,
+    )
+
+    data_formatada = datetime.now().strftime("%d/%m/%Y %H:%M")
+    descricao_base = descricao if descricao else f"Grupos de {tamanho_grupo}"
+
+    if item_por_turma:
+        divisao = dividir_por_coluna(estudantes, coluna)
+        novos_itens = [
+            {
+                "grupos": grupos,
+                "estudantes": selecionar_estudantes(estudantes, divisao[nome]),
+                "descricao": f"{descricao_base} - {nome}",
+            }
+            for nome, grupos in formacoes.items()
+        ]
+    else:
+        grupos, rotulos = juntar_formacoes(formacoes)
+        novos_itens = [
+            {
+                "grupos": grupos,
+                "estudantes": estudantes,
+                "descricao": f"{descricao_base} - {len(formacoes)} turmas",
+                "rotulos": rotulos,
+            }
+        ]
+
+    for novo_item in novos_itens:
+        novo_item.update(
+            {
+                "id": uuid.uuid4().hex,
+                "data": data_formatada,
+                "tamanho_grupo": tamanho_grupo,
+                "metodo": metodo,
+            }
+        )
+        historico.insert(0, novo_item)  # Adicionar no início
+
+    save_history(historico)
+
+    if "config_rapida" in st.session_state:
+        del st.session_state["config_rapida"]
+
+    exibir_turmas(formacoes, relatorio)
+
+
+def exibir_relatorio_formacao(relatorio):
+    """Exibe avisos do relatório de otimização, quando houver."""
+    if relatorio.get("ignorados"):
+        alerta_aviso(f"{len(relatorio['ignorados'])} pares com matrículas não encontradas foram ignorados.")
+
+    if relatorio and not relatorio.get("valido", True):
+        alerta_aviso(f"Não foi possível atender todas as restrições: {relatorio['violacoes']} violações restantes.")
+
+    if relatorio.get("tentativas", 1) > 1:
+        alerta_info(
+            f"Melhor de {relatorio['tentativas_concluidas']} tentativas: semente {relatorio['semente']} "
+            f"(use-a para reproduzir este resultado)."
+        )
+
+    if "custos_objetivos" in relatorio:
+        custos = ", ".join(
+            f"{nome}: {relatorio['custos_objetivos_iniciais'][nome]:.4g} → {custo:.4g}"
+            for nome, custo in relatorio["custos_objetivos"].items()
+        )
+        alerta_info(
+            f"Otimização: {custos} em {relatorio['iteracoes']} trocas avaliadas (melhor formação aos "
+            f"{relatorio['tempo_ate_melhor'] * 1000:.0f} ms de {relatorio['tempo'] * 1000:.0f} ms)."
+        )
+        with st.expander("📈 Convergência da otimização"):
+            convergencia = relatorio["convergencia"]
+            st.line_chart(
+                {"ms": [ms for ms, _ in convergencia], "Melhor custo": [custo for _, custo in convergencia]},
+                x="ms",
+                y="Melhor custo",
+                use_container_width=True,
+            )
+
+    if "pares_repetidos" in relatorio:
+        alerta_info(
+            f"Pares repetidos do histórico: {relatorio['pares_repetidos']} "
+            f"(antes da otimização: {relatorio['pares_repetidos_iniciais']})."
+        )
+
+
 if __name__ == "__main__":
     main()
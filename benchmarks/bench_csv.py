@@ -0,0 +1,142 @@
+"""
+Benchmark da conversão de CSV em estudantes.
+
+Compara a conversão linha a linha com iterrows (a implementação anterior de
+processar_csv_para_estudantes) com a conversão atual, coluna a coluna, nas duas
+saídas: lista de dicionários e Turma compacta. Também compara a tabela de
+exportação montada com um dicionário por estudante (a implementação anterior de
+criar_dataframe_grupos) com tabela_grupos, para listas e para um Agrupamento.
+
+Uso:
+    python -m benchmarks.bench_csv
+"""
+
+import random
+import time
+
+import pandas as pd
+
+from logic.data_processing import processar_csv_para_estudantes, tabela_grupos
+from logic.roster import Agrupamento
+
+TAMANHOS = [10_000, 50_000, 200_000]
+REPETICOES = 3
+
+
+def gerar_dataframe(total, semente=0):
+    """
+    Gera um DataFrame como o exportado pelo sistema acadêmico, com alguns vazios.
+
+    Args:
+        total (int): Número de linhas
+        semente (int): Semente do gerador
+
+    Returns:
+        DataFrame: Colunas matricula, nome, turma e nota
+    """
+    rng = random.Random(semente)
+    return pd.DataFrame(
+        {
+            "matricula": [None if rng.random() < 0.01 else str(20_000_000 + i) for i in range(total)],
+            "nome": [f" Estudante {i} " for i in range(total)],
+            "turma": [f"T{rng.randrange(30)}" for _ in range(total)],
+            "nota": [f"{rng.uniform(0, 10):.1f}".replace(".", ",") for _ in range(total)],
+        }
+    )
+
+
+def processar_linha_a_linha(df, col_matricula, col_nome, colunas_extras, col_pontuacao):
+    """Conversão anterior: um dicionário por linha, montado com iterrows."""
+    estudantes = []
+    pontuacoes = pd.to_numeric(df[col_pontuacao].astype(str).str.replace(",", ".", regex=False), errors="coerce")
+    for posicao, (_, row) in enumerate(df.iterrows()):
+        matricula = str(row[col_matricula]).strip() if pd.notna(row[col_matricula]) else ""
+        nome = str(row[col_nome]).strip() if pd.notna(row[col_nome]) else ""
+        if matricula and nome:
+            estudante: dict[str, float | str] = {
+                "matricula": matricula,
+                "nome": nome,
+                "completo": f"{matricula}, {nome}",
+            }
+            for coluna in colunas_extras:
+                estudante[coluna] = str(row[coluna]).strip() if pd.notna(row[coluna]) else ""
+            if pd.notna(pontuacoes.iat[posicao]):
+                estudante["pontuacao"] = float(pontuacoes.iat[posicao])
+            estudantes.append(estudante)
+    return estudantes
+
+
+def tabela_por_estudante(grupos):
+    """Tabela de exportação anterior: um dicionário por estudante, depois o DataFrame."""
+    dados = []
+    for i, grupo in enumerate(grupos, 1):
+        for estudante in grupo:
+            dados.append(
+                {
+                    "Grupo": i,
+                    "Matrícula": estudante.get("matricula", ""),
+                    "Nome": estudante.get("nome", ""),
+                    "Completo": estudante.get("completo", ""),
+                }
+            )
+    return pd.DataFrame(dados)
+
+
+def medir(funcao, *args, **kwargs):
+    """
+    Mede o melhor tempo de uma função.
+
+    Args:
+        funcao (callable): Função medida
+        *args: Argumentos posicionais da função
+        **kwargs: Argumentos nomeados da função
+
+    Returns:
+        float: Melhor tempo em segundos
+    """
+    melhor = float("inf")
+    for _ in range(REPETICOES):
+        inicio = time.perf_counter()
+        funcao(*args, **kwargs)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    """Executa o benchmark e imprime a tabela de resultados."""
+    print(f"{'linhas':>10} {'iterrows (s)':>13} {'lista (s)':>10} {'turma (s)':>10} {'ganho':>7}")
+
+    for total in TAMANHOS:
+        df = gerar_dataframe(total)
+        args = (df, "matricula", "nome", ["turma"], "nota")
+        antes = medir(processar_linha_a_linha, *args)
+        lista = medir(processar_csv_para_estudantes, *args)
+        turma = medir(processar_csv_para_estudantes, *args, compacto=True)
+        print(f"{total:>10} {antes:>13.2f} {lista:>10.3f} {turma:>10.3f} {antes / lista:>6.1f}x")
+
+    print()
+    print(f"{'linhas':>10} {'grupos':>12} {'por estudante (s)':>18} {'atual (s)':>10} {'ganho':>7}")
+
+    for total in TAMANHOS:
+        turma = processar_csv_para_estudantes(gerar_dataframe(total), "matricula", "nome", compacto=True)
+        indices = [list(range(inicio, min(inicio + 4, len(turma)))) for inicio in range(0, len(turma), 4)]
+
+        listas = Agrupamento(turma, indices).para_listas()
+        antes = medir(tabela_por_estudante, listas)
+        depois = medir(tabela_grupos, listas)
+        print(f"{total:>10} {'listas':>12} {antes:>18.3f} {depois:>10.3f} {antes / depois:>6.1f}x")
+
+        # Um Agrupamento novo a cada chamada, para não medir a tabela guardada
+        agrupamentos = [Agrupamento(turma, indices) for _ in range(2 * REPETICOES)]
+        antes = medir(lambda: tabela_por_estudante(agrupamentos.pop()))  # noqa: B023
+        depois = medir(lambda: tabela_grupos(agrupamentos.pop()))  # noqa: B023
+        print(f"{total:>10} {'agrupamento':>12} {antes:>18.3f} {depois:>10.3f} {antes / depois:>6.1f}x")
+
+        agrupamento = Agrupamento(turma, indices)
+        tabela_grupos(agrupamento)
+        guardada = medir(tabela_grupos, agrupamento)
+        print(f"{total:>10} {'guardada':>12} {'':>18} {guardada:>10.4f}")
+
+
+if __name__ == "__main__":
+    main()
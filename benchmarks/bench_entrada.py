@@ -0,0 +1,172 @@
+"""
+Benchmark da interpretação da entrada manual.
+
+Compara o processamento linha a linha com validar_formato_entrada (a implementação
+anterior de processar_entrada_com_validacao) com o processamento atual, que
+interpreta o texto inteiro em uma passada e só monta o índice de duplicatas quando
+há matrículas repetidas. Também mede a edição de uma única linha em uma
+SessaoValidacao, que só reinterpreta as linhas alteradas, e a detecção de
+duplicatas estudante a estudante contra validar_duplicatas (factorize) e o preview
+com todas as linhas separadas contra extrair_preview_dados, que só lê as primeiras
+e estima o total.
+
+Uso:
+    python -m benchmarks.bench_entrada
+"""
+
+import random
+import time
+
+from logic.validation import (
+    extrair_preview_dados,
+    processar_entrada_com_validacao,
+    validar_duplicatas,
+    validar_formato_entrada,
+)
+from logic.validation_session import SessaoValidacao
+
+TAMANHOS = [1_000, 10_000, 50_000]
+REPETICOES = 3
+
+
+def gerar_texto(total, semente=0):
+    """
+    Gera um texto de entrada com formatos variados e algumas linhas inválidas.
+
+    Args:
+        total (int): Número de linhas
+        semente (int): Semente do gerador
+
+    Returns:
+        str: Texto com um estudante por linha
+    """
+    rng = random.Random(semente)
+    linhas = []
+    for i in range(total):
+        sorteio = rng.random()
+        if sorteio < 0.8:
+            linhas.append(f"{100000 + i}, Aluno {i}")
+        elif sorteio < 0.95:
+            linhas.append(f"  {100000 + i} Aluno {i}  ")
+        elif sorteio < 0.97:
+            linhas.append("")
+        else:
+            linhas.append("linha sem matrícula")
+    return "\n".join(linhas)
+
+
+def contar_duplicatas_por_estudante(estudantes):
+    """Detecção de duplicatas anterior: um dicionário de ocorrências montado estudante a estudante."""
+    ocorrencias = {}
+    for i, estudante in enumerate(estudantes):
+        matricula = str(estudante.get("matricula", "")).strip()
+        if matricula:
+            info = ocorrencias.setdefault(matricula, {"count": 0, "indices": [], "nomes": []})
+            info["count"] += 1
+            info["indices"].append(i)
+            info["nomes"].append(estudante.get("nome", ""))
+    return {matricula: info for matricula, info in ocorrencias.items() if info["count"] > 1}
+
+
+def processar_linha_a_linha(texto_input):
+    """Processamento anterior: uma chamada de validar_formato_entrada por linha."""
+    estudantes = []
+    erros_linhas = []
+    for num_linha, linha in enumerate(texto_input.split("\n"), 1):
+        valido, resultado = validar_formato_entrada(linha)
+        if resultado is None:
+            continue
+        if valido:
+            estudantes.append(resultado)
+        else:
+            erros_linhas.append({"linha": num_linha, "conteudo": linha.strip(), "erro": resultado})
+    duplicatas = contar_duplicatas_por_estudante(estudantes)
+    return {"estudantes": estudantes, "erros": erros_linhas, "duplicatas": duplicatas}
+
+
+def preview_separando_tudo(texto_input, limite=5):
+    """Preview anterior: separa e limpa todas as linhas para mostrar as primeiras e o total."""
+    linhas = [linha.strip() for linha in texto_input.split("\n") if linha.strip()]
+    preview = [validar_formato_entrada(linha) for linha in linhas[:limite]]
+    return len(linhas), preview
+
+
+def medir(funcao, texto):
+    """
+    Mede o melhor tempo de uma função de processamento.
+
+    Args:
+        funcao (callable): Função que recebe o texto
+        texto (str): Texto de entrada
+
+    Returns:
+        float: Melhor tempo em segundos
+    """
+    melhor = float("inf")
+    for _ in range(REPETICOES):
+        inicio = time.perf_counter()
+        funcao(texto)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    """Executa o benchmark e imprime a tabela de resultados."""
+    print(f"{'linhas':>10} {'linha a linha (ms)':>19} {'atual (ms)':>11} {'ganho':>7}")
+
+    for total in TAMANHOS:
+        texto = gerar_texto(total)
+        antes = medir(processar_linha_a_linha, texto)
+        depois = medir(processar_entrada_com_validacao, texto)
+        print(f"{total:>10} {antes * 1000:>19.1f} {depois * 1000:>11.1f} {antes / depois:>6.1f}x")
+
+    print()
+    print(f"{'linhas':>10} {'texto inteiro (ms)':>19} {'edição (ms)':>12} {'ganho':>7}")
+
+    for total in TAMANHOS:
+        texto = gerar_texto(total)
+        linhas = texto.split("\n")
+        sessao = SessaoValidacao()
+        sessao.atualizar(texto)
+
+        # Edição de uma linha no meio do texto, alternando entre duas versões
+        editados = []
+        for versao in range(REPETICOES):
+            linhas[total // 2] = f"{total // 2}, Aluno Editado {versao}"
+            editados.append("\n".join(linhas))
+
+        completo = medir(processar_entrada_com_validacao, editados[0])
+        melhor = float("inf")
+        for editado in editados:
+            inicio = time.perf_counter()
+            sessao.atualizar(editado)
+            melhor = min(melhor, time.perf_counter() - inicio)
+        print(f"{total:>10} {completo * 1000:>19.1f} {melhor * 1000:>12.1f} {completo / melhor:>6.1f}x")
+
+    print()
+    print(f"{'linhas':>10} {'repetidas':>10} {'por estudante (ms)':>19} {'factorize (ms)':>15} {'ganho':>7}")
+
+    for total in TAMANHOS:
+        for fracao in (0.0, 0.5):
+            # Matrículas sorteadas entre total * (1 - fracao) valores
+            rng = random.Random(total)
+            distintas = max(1, int(total * (1 - fracao)))
+            estudantes = [{"matricula": str(rng.randrange(distintas)), "nome": f"Aluno {i}"} for i in range(total)]
+            if not fracao:
+                estudantes = [{"matricula": str(i), "nome": f"Aluno {i}"} for i in range(total)]
+            antes = medir(contar_duplicatas_por_estudante, estudantes)
+            depois = medir(validar_duplicatas, estudantes)
+            print(f"{total:>10} {fracao:>10.0%} {antes * 1000:>19.1f} {depois * 1000:>15.1f} {antes / depois:>6.1f}x")
+
+    print()
+    print(f"{'linhas':>10} {'separando tudo (ms)':>20} {'preview (ms)':>13} {'ganho':>7}")
+
+    for total in TAMANHOS:
+        texto = gerar_texto(total)
+        antes = medir(preview_separando_tudo, texto)
+        depois = medir(extrair_preview_dados, texto)
+        print(f"{total:>10} {antes * 1000:>20.2f} {depois * 1000:>13.2f} {antes / depois:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+Benchmark da ida e volta de uma turma por CSV, Parquet e Feather.
+
+Mede o tamanho do arquivo, a gravação, a leitura das colunas do arquivo (pd.read_csv
+ou ler_colunar) e a importação completa (importar_csv_em_blocos ou importar_colunar,
+com validação e conversão em Turma) de turmas geradas com gerar_dataframe de
+bench_csv. Sem o pyarrow, só o CSV é medido.
+
+Uso:
+    python -m benchmarks.bench_formatos
+"""
+
+import io
+
+import pandas as pd
+
+from benchmarks.bench_csv import REPETICOES, gerar_dataframe, medir
+from logic.columnar_io import COLUNAR_DISPONIVEL, importar_colunar, ler_colunar
+from logic.csv_import import importar_csv_em_blocos
+from logic.data_processing import processar_csv_para_estudantes
+from logic.roster import Turma
+from utils.exporters import dataframe_turma, gerar_colunar_turma
+
+TAMANHOS = [10_000, 100_000, 300_000]
+FORMATOS = ["parquet", "feather"] if COLUNAR_DISPONIVEL else []
+
+
+def gerar_csv_turma(turma):
+    """Grava a turma em CSV, com as mesmas colunas dos formatos colunares."""
+    return dataframe_turma(turma).to_csv(index=False).encode("utf-8")
+
+
+def main():
+    """Executa o benchmark e imprime a tabela de resultados."""
+    if not COLUNAR_DISPONIVEL:
+        print("pyarrow não instalado: medindo só o CSV")
+
+    print(
+        f"{'linhas':>10} {'formato':>8} {'tamanho (KB)':>13} {'gravação (s)':>13} "
+        f"{'leitura (s)':>12} {'importação (s)':>15}"
+    )
+
+    for total in TAMANHOS:
+        turma = processar_csv_para_estudantes(gerar_dataframe(total), "matricula", "nome", ["turma"], "nota", True)
+        colunas = ["matricula", "nome", "turma", "pontuacao"]
+        args = ("matricula", "nome", ["turma"], "pontuacao")
+
+        gravacao = medir(gerar_csv_turma, turma)
+        dados = gerar_csv_turma(turma)
+        leitura = medir(lambda: pd.read_csv(io.BytesIO(dados), usecols=colunas, dtype=str))  # noqa: B023
+        importacao = medir(lambda: importar_csv_em_blocos(io.BytesIO(dados), *args))  # noqa: B023
+        print(
+            f"{total:>10} {'csv':>8} {len(dados) / 1024:>13,.0f} {gravacao:>13.3f} {leitura:>12.3f} {importacao:>15.3f}"
+        )
+
+        for formato in FORMATOS:
+            # Uma Turma nova a cada chamada, para não medir o arquivo guardado
+            copias = [Turma.concatenar([turma]) for _ in range(REPETICOES)]
+            gravacao = medir(lambda: gerar_colunar_turma(copias.pop(), formato))  # noqa: B023
+            dados, _ = gerar_colunar_turma(turma, formato)
+            leitura = medir(lambda: ler_colunar(io.BytesIO(dados), formato, colunas))  # noqa: B023
+            importacao = medir(lambda: importar_colunar(io.BytesIO(dados), formato, *args))  # noqa: B023
+            print(
+                f"{total:>10} {formato:>8} {len(dados) / 1024:>13,.0f} {gravacao:>13.3f} "
+                f"{leitura:>12.3f} {importacao:>15.3f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark da busca de nomes semelhantes.
+
+Gera turmas de tamanhos crescentes com nomes compostos de listas comuns de nomes e
+sobrenomes, inclui algumas cópias com acento removido, partícula a mais ou erro de
+digitação, e mede o tempo de encontrar_pares_semelhantes e quantas comparações de
+nomes foram feitas (no lugar de n² / 2).
+
+Uso:
+    python -m benchmarks.bench_nomes
+"""
+
+import random
+import time
+
+from logic.name_matching import encontrar_pares_semelhantes
+
+TAMANHOS = [1_000, 10_000, 100_000]
+LIMITE = 200
+
+NOMES = ["Ana", "Maria", "João", "José", "Pedro", "Paulo", "Lucas", "Gabriel", "Fernanda", "Juliana"]
+SOBRENOMES = [
+    "Silva",
+    "Santos",
+    "Oliveira",
+    "Souza",
+    "Rodrigues",
+    "Ferreira",
+    "Alves",
+    "Pereira",
+    "Lima",
+    "Gomes",
+    "Costa",
+    "Ribeiro",
+    "Martins",
+    "Carvalho",
+    "Almeida",
+    "Lopes",
+    "Soares",
+    "Fernandes",
+    "Vieira",
+    "Barbosa",
+]
+
+
+def gerar_nomes(total, semente=0):
+    """
+    Gera nomes com quatro sobrenomes e algumas cópias alteradas.
+
+    Args:
+        total (int): Número de nomes
+        semente (int): Semente do gerador
+
+    Returns:
+        list: Lista de nomes
+    """
+    rng = random.Random(semente)
+    nomes = [" ".join([rng.choice(NOMES)] + rng.sample(SOBRENOMES, 4)) for _ in range(total)]
+    for indice in rng.sample(range(total), total // 100):
+        nome = nomes[rng.randrange(total)]
+        nomes[indice] = rng.choice([nome.replace("ã", "a").replace("é", "e"), nome.replace(" ", " da ", 1), nome[:-1]])
+    return nomes
+
+
+def main():
+    """Executa o benchmark e imprime a tabela de resultados."""
+    print(f"{'nomes':>10} {'tempo (s)':>10} {'comparações':>12} {'todos os pares':>15} {'chaves semelhantes':>19}")
+
+    for total in TAMANHOS:
+        nomes = gerar_nomes(total)
+        matriculas = [str(i) for i in range(total)]
+        relatorio = {}
+
+        inicio = time.perf_counter()
+        encontrar_pares_semelhantes(matriculas, nomes, limite=LIMITE, relatorio=relatorio)
+        tempo = time.perf_counter() - inicio
+
+        todos = total * (total - 1) // 2
+        comparacoes, semelhantes = relatorio["comparacoes"], relatorio["chaves_semelhantes"]
+        print(f"{total:>10} {tempo:>10.2f} {comparacoes:>12} {todos:>15} {semelhantes:>19}")
+
+
+if __name__ == "__main__":
+    main()
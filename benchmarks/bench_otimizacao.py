@@ -0,0 +1,46 @@
+"""
+Benchmark da otimização por diversidade.
+
+Para turmas de tamanhos diferentes, forma grupos pelo método "Diversidade" com
+orçamentos crescentes e mostra o custo final, as trocas avaliadas e em que momento
+a melhor formação foi encontrada, para escolher o orçamento adequado à carga.
+
+Uso:
+    python -m benchmarks.bench_otimizacao
+"""
+
+import numpy as np
+
+from logic.optimization import formar_grupos_otimizados
+
+TAMANHOS = [100, 1_000, 10_000]
+ORCAMENTOS_MS = [10, 50, 200, 1000]
+TAMANHO_GRUPO = 4
+
+
+def main():
+    """Executa o benchmark e imprime a tabela de resultados."""
+    rng = np.random.default_rng(0)
+    print(f"{'estudantes':>10} {'orçamento':>10} {'inicial':>9} {'final':>9} {'trocas':>9} {'melhor (ms)':>12}")
+
+    for total in TAMANHOS:
+        cursos = rng.choice(["ADS", "SI", "CC", "EC"], total)
+        turnos = rng.choice(["manhã", "noite"], total)
+        estudantes = [
+            {"matricula": str(i), "nome": f"Aluno {i}", "curso": c, "turno": t}
+            for i, (c, t) in enumerate(zip(cursos, turnos))
+        ]
+
+        for orcamento_ms in ORCAMENTOS_MS:
+            relatorio = {}
+            formar_grupos_otimizados(
+                estudantes, TAMANHO_GRUPO, semente=1, orcamento_ms=orcamento_ms, relatorio=relatorio
+            )
+            print(
+                f"{total:>10} {orcamento_ms:>10} {relatorio['custo_inicial']:>9} {relatorio['custo']:>9} "
+                f"{relatorio['iteracoes']:>9} {relatorio['tempo_ate_melhor'] * 1000:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark da formação balanceada por pontuação.
+
+Mede o tempo de formar_grupos_por_pontuacao para turmas grandes com notas
+aleatórias e compara a dispersão das médias dos grupos (maior média - menor
+média) com a de uma formação aleatória. As turmas são Turma, como as que a
+importação de CSV produz, e a turma de 100 mil estudantes precisa ficar abaixo de
+LIMITE_SEGUNDOS em todos os tamanhos de grupo.
+
+Uso:
+    python -m benchmarks.bench_pontuacao
+"""
+
+import time
+
+import numpy as np
+
+from logic.balancing import formar_grupos_por_pontuacao
+from logic.partitioning import formar_grupos_indices
+from logic.roster import Turma
+
+TAMANHOS = [10_000, 100_000]
+TAMANHOS_GRUPO = [3, 5, 10]
+REPETICOES = 3
+
+# Tempo máximo aceito para a turma de 100 mil estudantes
+TOTAL_LIMITE = 100_000
+LIMITE_SEGUNDOS = 0.5
+
+
+def dispersao(pontuacoes, grupos):
+    """Diferença entre a maior e a menor média de pontuação dos grupos."""
+    medias = [pontuacoes[grupo].mean() for grupo in grupos]
+    return max(medias) - min(medias)
+
+
+def main():
+    """Executa o benchmark e imprime a tabela de resultados."""
+    rng = np.random.default_rng(0)
+    print(f"{'estudantes':>10} {'grupo':>6} {'tempo (s)':>10} {'dispersão':>10} {'aleatório':>10}")
+
+    for total in TAMANHOS:
+        pontuacoes = rng.normal(7, 2, total).round(1)
+        estudantes = Turma.de_estudantes(
+            [{"matricula": str(i), "nome": f"Aluno {i}", "pontuacao": p} for i, p in enumerate(pontuacoes)]
+        )
+
+        for tamanho_grupo in TAMANHOS_GRUPO:
+            melhor = float("inf")
+            for _ in range(REPETICOES):
+                inicio = time.perf_counter()
+                grupos = formar_grupos_por_pontuacao(estudantes, tamanho_grupo, semente=1)
+                melhor = min(melhor, time.perf_counter() - inicio)
+
+            aleatorios = formar_grupos_indices(estudantes, tamanho_grupo, semente=1)
+            print(
+                f"{total:>10} {tamanho_grupo:>6} {melhor:>10.4f} "
+                f"{dispersao(pontuacoes, grupos):>10.3f} {dispersao(pontuacoes, aleatorios):>10.3f}"
+            )
+            if total == TOTAL_LIMITE:
+                assert melhor < LIMITE_SEGUNDOS, f"{total} estudantes em grupos de {tamanho_grupo}: {melhor:.3f}s"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark da redistribuição de estudantes solitários.
+
+Mede o tempo de redistribuir_solitarios_func com um número crescente de grupos
+no pior caso (todos os grupos com apenas 1 estudante) e mostra a razão entre
+tempos consecutivos: ao dobrar o número de grupos, o tempo deve apenas dobrar.
+
+Uso:
+    python -m benchmarks.bench_redistribuicao
+"""
+
+import time
+
+from logic.group_formation import redistribuir_solitarios_func
+
+TAMANHOS = [12_500, 25_000, 50_000, 100_000]
+REPETICOES = 3
+
+
+def medir(num_grupos, tamanho_grupo, permitir_grupos_maiores):
+    """
+    Mede o melhor tempo de redistribuição para grupos solitários.
+
+    Args:
+        num_grupos (int): Número de grupos com 1 estudante
+        tamanho_grupo (int): Tamanho alvo dos grupos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+
+    Returns:
+        float: Melhor tempo em segundos
+    """
+    melhor = float("inf")
+    for _ in range(REPETICOES):
+        grupos = [[{"matricula": str(i)}] for i in range(num_grupos)]
+        inicio = time.perf_counter()
+        redistribuir_solitarios_func(grupos, tamanho_grupo, permitir_grupos_maiores)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    """Executa o benchmark e imprime a tabela de resultados."""
+    for permitir in (True, False):
+        print(f"permitir_grupos_maiores={permitir}")
+        print(f"{'grupos':>10} {'tempo (s)':>10} {'us/grupo':>10} {'razão':>7}")
+
+        anterior = None
+        for num_grupos in TAMANHOS:
+            tempo = medir(num_grupos, 2, permitir)
+            razao = f"{tempo / anterior:7.2f}" if anterior else f"{'-':>7}"
+            print(f"{num_grupos:>10} {tempo:>10.4f} {tempo / num_grupos * 1e6:>10.2f} {razao}")
+            anterior = tempo
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -2,39 +2,161 @@
 Pacote de lógica de negócio do FormaDevs.
 """
 
+from logic.balancing import (
+    formar_grupos_por_pontuacao,
+    particionar_por_pontuacao,
+)
+from logic.columnar_io import COLUNAR_DISPONIVEL, formato_colunar, importar_colunar
+from logic.constraints import (
+    formar_grupos_com_restricoes,
+    interpretar_pares,
+)
+from logic.csv_import import importar_csv_em_blocos
+from logic.csv_sniffing import farejar_csv, sugerir_colunas
 from logic.data_processing import (
     criar_dataframe_grupos,
     filtrar_estudantes_por_grupo,
     preparar_dados_exportacao,
     processar_csv_para_estudantes,
+    tabela_grupos,
+)
+from logic.formation_cache import (
+    CacheFormacoes,
+    obter_cache_formacoes,
 )
 from logic.group_formation import (
+    METODOS_FORMACAO,
     calcular_estatisticas,
     formar_grupos,
     sortear_grupo_ao_vivo,
+    sortear_grupos_em_fluxo,
+)
+from logic.group_index import IndiceGrupos
+from logic.incremental import (
+    FormacaoIncremental,
+    reformar_incremental,
+)
+from logic.multi_start import (
+    OBJETIVOS,
+    buscar_melhor_semente,
+)
+from logic.name_matching import detectar_nomes_semelhantes, encontrar_pares_semelhantes
+from logic.optimization import (
+    OBJETIVOS_OTIMIZACAO,
+    formar_grupos_otimizados,
+    registrar_objetivo,
+)
+from logic.pair_history import (
+    MatrizPares,
+    formar_grupos_novos_parceiros,
+    obter_matriz_pares,
+)
+from logic.partitioning import (
+    formar_grupos_indices,
+    materializar_grupos,
+)
+from logic.random_streams import (
+    criar_fluxos,
+    criar_gerador,
+)
+from logic.roster import Agrupamento, ColunaTexto, Turma
+from logic.rotation import formar_rodadas
+from logic.sharding import (
+    dividir_por_coluna,
+    formar_grupos_por_turma,
+    juntar_formacoes,
 )
 from logic.validation import (
+    extrair_preview_arquivo,
+    extrair_preview_buffer,
     extrair_preview_dados,
+    indexar_duplicatas,
+    interpretar_texto_entrada,
+    mensagens_validacao_csv,
     processar_entrada_com_validacao,
     validar_csv,
     validar_duplicatas,
     validar_formato_entrada,
 )
+from logic.validation_session import SessaoValidacao
 
 __all__ = [
     # group_formation
+    "METODOS_FORMACAO",
     "formar_grupos",
     "calcular_estatisticas",
     "sortear_grupo_ao_vivo",
+    "sortear_grupos_em_fluxo",
+    # partitioning
+    "formar_grupos_indices",
+    "materializar_grupos",
+    # random_streams
+    "criar_gerador",
+    "criar_fluxos",
     # validation
     "validar_formato_entrada",
     "validar_duplicatas",
+    "indexar_duplicatas",
     "validar_csv",
     "processar_entrada_com_validacao",
+    "interpretar_texto_entrada",
+    "mensagens_validacao_csv",
     "extrair_preview_dados",
+    "extrair_preview_buffer",
+    "extrair_preview_arquivo",
+    # validation_session
+    "SessaoValidacao",
+    # name_matching
+    "detectar_nomes_semelhantes",
+    "encontrar_pares_semelhantes",
+    # csv_import
+    "importar_csv_em_blocos",
+    # csv_sniffing
+    "farejar_csv",
+    "sugerir_colunas",
+    # balancing
+    "formar_grupos_por_pontuacao",
+    "particionar_por_pontuacao",
+    # constraints
+    "formar_grupos_com_restricoes",
+    "interpretar_pares",
+    # group_index
+    "IndiceGrupos",
+    # columnar_io
+    "importar_colunar",
+    "formato_colunar",
+    "COLUNAR_DISPONIVEL",
+    # formation_cache
+    "CacheFormacoes",
+    "obter_cache_formacoes",
+    # incremental
+    "FormacaoIncremental",
+    "reformar_incremental",
+    # multi_start
+    "OBJETIVOS",
+    "buscar_melhor_semente",
+    # optimization
+    "OBJETIVOS_OTIMIZACAO",
+    "formar_grupos_otimizados",
+    "registrar_objetivo",
+    # pair_history
+    "MatrizPares",
+    "obter_matriz_pares",
+    "formar_grupos_novos_parceiros",
+    # rotation
+    "formar_rodadas",
+    # roster
+    "Turma",
+    "Agrupamento",
+    "ColunaTexto",
+    # sharding
+    "formar_grupos_por_turma",
+    "dividir_por_coluna",
+    "juntar_formacoes",
     # data_processing
     "processar_csv_para_estudantes",
     "preparar_dados_exportacao",
     "criar_dataframe_grupos",
+    "tabela_grupos",
     "filtrar_estudantes_por_grupo",
 ]
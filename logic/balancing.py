@@ -0,0 +1,206 @@
+"""
+Módulo de formação balanceada por pontuação.
+Distribui os estudantes de modo que as somas (e médias) de uma pontuação numérica,
+como nota ou nível de habilidade, fiquem o mais parecidas possível entre os grupos.
+
+Usa a heurística LPT (maior pontuação primeiro) com tamanhos de grupo fixos: a cada
+rodada, as próximas maiores pontuações vão para os grupos de menor soma, o maior
+valor para o grupo mais "leve". Cada rodada ordena as somas de uma vez (equivalente
+a esvaziar um heap mínimo), o que mantém o custo em O(n log n) e vetorizado.
+
+Em seguida, um refinamento no estilo Karmarkar-Karp emparelha grupos acima e abaixo
+da média e aplica, em cada par, a troca de dois estudantes que mais aproxima as
+médias, para todos os pares de uma vez.
+"""
+
+import numpy as np
+
+from logic.partitioning import tamanhos_grupos
+from logic.random_streams import permutacao_indices
+from logic.roster import CHAVE_PONTUACAO, Turma, converter_pontuacao
+
+# Passadas do refinamento por trocas (cada uma é O(grupos * tamanho²) vetorizado); o
+# limite mantém 100 mil estudantes bem abaixo de um segundo mesmo com grupos de 3
+PASSADAS_REFINAMENTO = 12
+
+# Fração usada para variar o emparelhamento entre passadas (razão áurea)
+_DESLOCAMENTO_PASSADA = 0.6180339887
+
+
+def pontuacoes_estudantes(estudantes):
+    """
+    Extrai a pontuação de cada estudante como array.
+
+    Estudantes sem pontuação recebem a média dos demais, para não pesarem a favor
+    nem contra nenhum grupo.
+
+    Args:
+        estudantes (list or Turma): Lista de dicionários de estudantes
+
+    Returns:
+        ndarray: Pontuação de cada estudante (float)
+    """
+    if isinstance(estudantes, Turma):
+        valores = np.full(len(estudantes), np.nan) if estudantes.pontuacoes is None else estudantes.pontuacoes.copy()
+    else:
+        valores = np.array(
+            [converter_pontuacao(e.get(CHAVE_PONTUACAO)) for e in estudantes],
+            dtype=float,
+        )
+    ausentes = np.isnan(valores)
+    if ausentes.any():
+        valores[ausentes] = valores[~ausentes].mean() if not ausentes.all() else 0.0
+    return valores
+
+
+def tem_pontuacao(estudantes):
+    """
+    Verifica se algum estudante tem pontuação numérica.
+
+    Args:
+        estudantes (list or Turma): Lista de dicionários de estudantes
+
+    Returns:
+        bool: True se ao menos um estudante tem pontuação
+    """
+    if isinstance(estudantes, Turma):
+        return estudantes.pontuacoes is not None and not np.isnan(estudantes.pontuacoes).all()
+    return any(converter_pontuacao(e.get(CHAVE_PONTUACAO)) is not None for e in estudantes)
+
+
+def particionar_por_pontuacao(pontuacoes, tamanhos, semente=None, gerador=None):
+    """
+    Divide os índices em grupos de tamanhos fixos equilibrando as somas das pontuações.
+
+    Args:
+        pontuacoes (ndarray): Pontuação de cada estudante
+        tamanhos (list): Tamanho de cada grupo
+        semente (int, optional): Semente usada para desempatar pontuações iguais
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+
+    Returns:
+        list: Lista de arrays de índices, um por grupo
+    """
+    pontuacoes = np.asarray(pontuacoes, dtype=float)
+    tamanhos = np.asarray(tamanhos, dtype=np.intp)
+    num_grupos = len(tamanhos)
+
+    # Embaralhar antes da ordenação estável sorteia a ordem entre pontuações iguais
+    embaralhados = permutacao_indices(len(pontuacoes), semente, gerador)
+    ordem = embaralhados[np.argsort(-pontuacoes[embaralhados], kind="stable")]
+
+    somas = np.zeros(num_grupos)
+    grupo_de = np.empty(len(pontuacoes), dtype=np.intp)
+    inicio = 0
+
+    for rodada in range(int(tamanhos.max(initial=0))):
+        # Grupos que ainda recebem alguém, do de menor soma para o de maior
+        abertos = np.flatnonzero(tamanhos > rodada)
+        abertos = abertos[np.argsort(somas[abertos], kind="stable")]
+
+        lote = ordem[inicio : inicio + len(abertos)]
+        grupo_de[lote] = abertos
+        somas[abertos] += pontuacoes[lote]
+        inicio += len(abertos)
+
+    # Agrupar por grupo mantendo a ordem de pontuação dentro de cada um
+    por_grupo = ordem[np.argsort(grupo_de[ordem], kind="stable")]
+    limites = np.concatenate(([0], np.cumsum(tamanhos))).tolist()
+    return [por_grupo[a:b] for a, b in zip(limites[:-1], limites[1:])]
+
+
+def refinar_por_trocas(pontuacoes, grupos, passadas=PASSADAS_REFINAMENTO):
+    """
+    Aproxima as médias dos grupos trocando estudantes entre pares de grupos.
+
+    A cada passada, os grupos são ordenados pela média; cada grupo da metade mais
+    pesada é emparelhado com um da metade mais leve (na primeira passada, o mais
+    pesado com o mais leve) e recebe a melhor troca de um estudante, se ela reduzir
+    a diferença entre as duas médias.
+
+    Args:
+        pontuacoes (ndarray): Pontuação de cada estudante
+        grupos (list): Lista de arrays de índices
+        passadas (int): Número máximo de passadas
+
+    Returns:
+        list: Lista de arrays de índices com os mesmos tamanhos
+    """
+    tamanhos = np.array([len(grupo) for grupo in grupos], dtype=np.intp)
+    num_grupos = len(grupos)
+    metade = num_grupos // 2
+    if metade == 0:
+        return grupos
+
+    # Matriz grupos x vagas, com -1 (índice) e NaN (pontuação) nas vagas vazias
+    ocupadas = np.arange(tamanhos.max()) < tamanhos[:, None]
+    membros = np.full(ocupadas.shape, -1, dtype=np.intp)
+    membros[ocupadas] = np.concatenate(grupos)
+    valores = np.full(ocupadas.shape, np.nan)
+    valores[ocupadas] = pontuacoes[membros[ocupadas]]
+    vagas = ocupadas.shape[1]
+    somas = np.nansum(valores, axis=1)
+
+    for passada in range(passadas):
+        medias = somas / tamanhos
+        ordem = np.argsort(medias, kind="stable")
+        deslocamento = int(passada * metade * _DESLOCAMENTO_PASSADA) % metade
+        leves = np.roll(ordem[:metade], -deslocamento)
+        pesados = ordem[::-1][:metade]
+
+        # Trocar x (do pesado) por y (do leve) muda a diferença das médias em
+        # (y - x) * (1/tam_p + 1/tam_l); calculado para todo x, y de cada par
+        atuais = medias[pesados] - medias[leves]
+        fator = 1 / tamanhos[pesados] + 1 / tamanhos[leves]
+        trocas = (valores[leves][:, None, :] - valores[pesados][:, :, None]).reshape(metade, -1)
+        diferencas = np.abs(atuais[:, None] + trocas * fator[:, None])
+        diferencas[np.isnan(diferencas)] = np.inf
+
+        melhores = diferencas.argmin(axis=1)
+        melhora = diferencas[np.arange(metade), melhores] < atuais - 1e-12
+        if not melhora.any():
+            break
+
+        vaga_p, vaga_l = np.divmod(melhores[melhora], vagas)
+        gp = pesados[melhora]
+        gl = leves[melhora]
+        ganho = trocas[melhora, melhores[melhora]]
+        somas[gp] += ganho
+        somas[gl] -= ganho
+        membros[gp, vaga_p], membros[gl, vaga_l] = membros[gl, vaga_l], membros[gp, vaga_p]
+        valores[gp, vaga_p], valores[gl, vaga_l] = valores[gl, vaga_l], valores[gp, vaga_p]
+
+    return [membros[g, : tamanhos[g]] for g in range(num_grupos)]
+
+
+def formar_grupos_por_pontuacao(
+    estudantes,
+    tamanho_grupo,
+    redistribuir_solitarios=True,
+    permitir_grupos_maiores=True,
+    semente=None,
+    gerador=None,
+):
+    """
+    Forma grupos com somas de pontuação equilibradas.
+
+    Os tamanhos dos grupos seguem as mesmas regras dos demais métodos.
+
+    Args:
+        estudantes (list): Lista de dicionários com dados dos estudantes
+        tamanho_grupo (int): Tamanho desejado para cada grupo
+        redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+        semente (int, optional): Semente para desempatar pontuações iguais
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+
+    Returns:
+        list: Lista de arrays de índices, um por grupo
+    """
+    if not estudantes:
+        return []
+
+    tamanhos = tamanhos_grupos(len(estudantes), tamanho_grupo, redistribuir_solitarios, permitir_grupos_maiores)
+    pontuacoes = pontuacoes_estudantes(estudantes)
+    grupos = particionar_por_pontuacao(pontuacoes, tamanhos, semente, gerador)
+    return refinar_por_trocas(pontuacoes, grupos)
@@ -0,0 +1,253 @@
+"""
+Módulo de leitura de formatos colunares.
+Importa turmas de arquivos Parquet e Feather, que guardam os tipos das colunas e são
+lidos bem mais rápido que CSV: não há texto a interpretar e só as colunas mapeadas
+são lidas do arquivo.
+
+Os formatos dependem do pacote opcional pyarrow; sem ele, COLUNAR_DISPONIVEL é False
+e a importação continua aceitando apenas CSV.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from logic.roster import ColunaTexto, Turma
+from logic.validation import mensagens_validacao_csv
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.feather
+    import pyarrow.ipc
+    import pyarrow.parquet
+
+    COLUNAR_DISPONIVEL = True
+except ImportError:
+    COLUNAR_DISPONIVEL = False
+
+# Formato colunar de cada extensão de arquivo
+EXTENSOES_COLUNARES = {".parquet": "parquet", ".pq": "parquet", ".feather": "feather", ".arrow": "feather"}
+
+MENSAGEM_SEM_PYARROW = "Os formatos Parquet e Feather precisam do pacote pyarrow (pip install pyarrow)"
+
+
+def formato_colunar(nome_arquivo):
+    """
+    Identifica o formato colunar pela extensão do arquivo.
+
+    Args:
+        nome_arquivo (str): Nome ou caminho do arquivo
+
+    Returns:
+        str or None: "parquet", "feather" ou None (ex.: CSV)
+    """
+    return EXTENSOES_COLUNARES.get(os.path.splitext(str(nome_arquivo))[1].lower())
+
+
+def como_texto(serie):
+    """
+    Converte uma coluna em texto, mantendo os valores ausentes como ausentes.
+
+    Uma coluna numérica com lacunas chega do pyarrow como float; os inteiros voltam
+    a ser inteiros antes da conversão, então a matrícula 10 vira "10", e não "10.0".
+
+    Args:
+        serie (Series): Coluna lida do arquivo
+
+    Returns:
+        Series: Coluna com dtype "string"
+    """
+    if pd.api.types.is_float_dtype(serie) and (serie.dropna() % 1 == 0).all():
+        serie = serie.astype("Int64")
+    return serie.astype("string")
+
+
+def _exigir_pyarrow():
+    """Interrompe com uma mensagem clara se o pyarrow não estiver instalado."""
+    if not COLUNAR_DISPONIVEL:
+        raise ImportError(MENSAGEM_SEM_PYARROW)
+
+
+def colunas_colunar(arquivo, formato):
+    """
+    Lê só os nomes das colunas de um arquivo colunar, sem ler os dados.
+
+    Args:
+        arquivo (str or file): Caminho ou arquivo binário com seek
+        formato (str): "parquet" ou "feather"
+
+    Returns:
+        list: Nomes das colunas
+    """
+    _exigir_pyarrow()
+    if hasattr(arquivo, "seek"):
+        arquivo.seek(0)
+    if formato == "parquet":
+        return pyarrow.parquet.read_schema(arquivo).names
+    return pyarrow.ipc.open_file(arquivo).schema.names
+
+
+def ler_tabela_colunar(arquivo, formato, colunas=None, linhas=None):
+    """
+    Lê um arquivo colunar como tabela do pyarrow, sem convertê-lo em DataFrame.
+
+    Args:
+        arquivo (str or file): Caminho ou arquivo binário com seek
+        formato (str): "parquet" ou "feather"
+        colunas (list, optional): Colunas lidas; por padrão, todas
+        linhas (int, optional): Máximo de linhas lidas (ex.: amostra para o mapeamento)
+
+    Returns:
+        pyarrow.Table: Dados lidos, com os tipos guardados no arquivo
+    """
+    _exigir_pyarrow()
+    if hasattr(arquivo, "seek"):
+        arquivo.seek(0)
+
+    if formato == "parquet":
+        leitor = pyarrow.parquet.ParquetFile(arquivo)
+        if linhas is not None:
+            # Só os primeiros grupos de linhas necessários são lidos
+            lote = next(leitor.iter_batches(batch_size=linhas, columns=colunas), None)
+            if lote is not None:
+                return pa.Table.from_batches([lote])
+        return leitor.read(columns=colunas)
+
+    tabela = pyarrow.feather.read_table(arquivo, columns=colunas)
+    return tabela if linhas is None else tabela.slice(0, linhas)
+
+
+def ler_colunar(arquivo, formato, colunas=None, linhas=None):
+    """
+    Lê um arquivo colunar, opcionalmente só algumas colunas e as primeiras linhas.
+
+    Args:
+        arquivo (str or file): Caminho ou arquivo binário com seek
+        formato (str): "parquet" ou "feather"
+        colunas (list, optional): Colunas lidas; por padrão, todas
+        linhas (int, optional): Máximo de linhas lidas (ex.: amostra para o mapeamento)
+
+    Returns:
+        DataFrame: Dados lidos, com os tipos guardados no arquivo
+    """
+    return ler_tabela_colunar(arquivo, formato, colunas, linhas).to_pandas()
+
+
+def _texto_arrow(coluna):
+    """
+    Converte uma coluna do pyarrow em textos sem espaços nas pontas, com "" nos ausentes.
+
+    Texto e inteiros são convertidos pelo próprio pyarrow; floats com valores inteiros
+    viram inteiros antes (a matrícula 10 vira "10", como em como_texto) e os demais
+    tipos passam por str(), como no CSV.
+    """
+    tipo = coluna.type
+    if pa.types.is_floating(tipo):
+        # NaN conta como ausente, como no pandas
+        coluna = pc.if_else(pc.is_nan(coluna), pa.scalar(None, tipo), coluna)
+        if pc.all(pc.equal(pc.floor(coluna), coluna)).as_py() is not False:
+            coluna = pc.cast(coluna, pa.int64())
+            tipo = coluna.type
+    if pa.types.is_dictionary(tipo):
+        tipo = tipo.value_type
+
+    if pa.types.is_integer(tipo) or pa.types.is_string(tipo) or pa.types.is_large_string(tipo):
+        texto = pc.cast(coluna, pa.large_string())
+    else:
+        texto = pa.chunked_array(
+            [[None if valor is None else str(valor) for valor in coluna.to_pylist()]], pa.large_string()
+        )
+    return pc.fill_null(pc.utf8_trim_whitespace(texto), "")
+
+
+def _coluna_texto_arrow(texto):
+    """Copia os buffers de uma coluna de texto do pyarrow em uma ColunaTexto."""
+    array = texto.combine_chunks()
+    _, deslocamentos, dados = array.buffers()
+    limites = np.frombuffer(deslocamentos, dtype=np.int64)[array.offset : array.offset + len(array) + 1]
+    inicio, fim = (int(limites[0]), int(limites[-1])) if len(limites) else (0, 0)
+    return ColunaTexto.de_buffers(memoryview(dados)[inicio:fim] if dados is not None else b"", limites - inicio)
+
+
+def _pontuacoes_arrow(coluna):
+    """Pontuações de uma coluna do pyarrow (NaN = sem pontuação), aceitando vírgula decimal."""
+    tipo = coluna.type
+    if pa.types.is_integer(tipo) or pa.types.is_floating(tipo) or pa.types.is_decimal(tipo):
+        return pc.cast(coluna, pa.float64()).to_numpy()
+    texto = pd.Series(_texto_arrow(coluna).to_numpy()).str.replace(",", ".", regex=False)
+    return pd.to_numeric(texto, errors="coerce").to_numpy(dtype=float, na_value=np.nan)
+
+
+def _validar_colunas(matriculas, nomes):
+    """
+    Valida matrículas e nomes de uma vez, sobre os mesmos textos usados na conversão.
+
+    Valores só com espaços contam como vazios, como nas linhas descartadas por
+    processar_csv_para_estudantes; as duplicadas seguem a ordem da primeira aparição.
+
+    Returns:
+        list: Erros no formato de validar_csv
+    """
+    preenchidas = pc.filter(matriculas, pc.not_equal(matriculas, ""))
+    contagem = pc.value_counts(preenchidas)
+    duplicadas = pc.filter(contagem.field("values"), pc.greater(contagem.field("counts"), 1)).to_pylist()
+    return mensagens_validacao_csv(
+        len(matriculas) - len(preenchidas), pc.sum(pc.equal(nomes, "")).as_py() or 0, duplicadas
+    )
+
+
+def importar_colunar(arquivo, formato, col_matricula, col_nome, colunas_extras=None, col_pontuacao=None):
+    """
+    Importa uma turma de um arquivo Parquet ou Feather, lendo só as colunas mapeadas.
+
+    A Turma é montada direto das colunas do pyarrow: os textos são limpos e filtrados
+    pelo pyarrow e os buffers de cada coluna viram uma ColunaTexto, sem DataFrame nem
+    um objeto por estudante.
+
+    Args:
+        arquivo (str or file): Caminho ou arquivo binário com seek (ex.: upload do Streamlit)
+        formato (str): "parquet" ou "feather"
+        col_matricula (str): Nome da coluna de matrícula
+        col_nome (str): Nome da coluna de nome
+        colunas_extras (list, optional): Colunas copiadas como atributos dos estudantes
+        col_pontuacao (str, optional): Coluna numérica usada pelo método "Balanceado"
+
+    Returns:
+        tuple: (Turma, lista de erros no formato de validar_csv)
+    """
+    colunas_extras = list(colunas_extras or [])
+    existentes = colunas_colunar(arquivo, formato)
+
+    erros = [f"Coluna '{coluna}' não encontrada" for coluna in (col_matricula, col_nome) if coluna not in existentes]
+    if erros:
+        return Turma([], []), erros
+
+    colunas = list(
+        dict.fromkeys([col_matricula, col_nome, *colunas_extras, *([col_pontuacao] if col_pontuacao else [])])
+    )
+    tabela = ler_tabela_colunar(arquivo, formato, colunas)
+    matriculas = _texto_arrow(tabela[col_matricula])
+    nomes = _texto_arrow(tabela[col_nome])
+    erros = _validar_colunas(matriculas, nomes)
+
+    # Linhas sem matrícula ou sem nome são descartadas, como no CSV
+    validas = pc.and_(pc.not_equal(matriculas, ""), pc.not_equal(nomes, ""))
+    atributos = {
+        coluna: _coluna_texto_arrow(pc.filter(_texto_arrow(tabela[coluna]), validas)) for coluna in colunas_extras
+    }
+
+    pontuacoes = None
+    if col_pontuacao:
+        pontuacoes = _pontuacoes_arrow(tabela[col_pontuacao])[validas.to_numpy()]
+        if np.isnan(pontuacoes).all():
+            pontuacoes = None
+
+    turma = Turma(
+        _coluna_texto_arrow(pc.filter(matriculas, validas)),
+        _coluna_texto_arrow(pc.filter(nomes, validas)),
+        atributos,
+        pontuacoes,
+    )
+    return turma, erros
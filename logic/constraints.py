@@ -0,0 +1,357 @@
+"""
+Módulo de formação de grupos com restrições.
+Permite manter estudantes juntos, mantê-los separados e limitar quantos estudantes
+com determinado atributo (ex.: repetentes) ficam no mesmo grupo.
+
+Formato das restrições:
+
+    {
+        "juntos": [("123", "456"), ...],       # pares de matrículas
+        "separados": [("123", "789"), ...],    # pares de matrículas
+        "limites": [{"atributo": "repetente", "valor": "sim", "maximo": 1}, ...],
+    }
+"""
+
+import re
+
+import numpy as np
+
+from logic.local_search import atribuicao_de_grupos, busca_local_trocas, grupos_de_atribuicao, iteracoes_reproduziveis
+from logic.partitioning import formar_grupos_indices
+from logic.random_streams import criar_gerador
+from logic.roster import CHAVE_PONTUACAO, Turma
+
+# Chaves dos dicionários de estudantes que não são atributos
+CHAVES_RESERVADAS = ("matricula", "nome", "completo")
+
+
+def interpretar_pares(texto):
+    """
+    Interpreta um texto com um par de matrículas por linha.
+
+    Aceita os separadores vírgula, ponto e vírgula ou espaço ("123, 456").
+
+    Args:
+        texto (str): Texto com os pares
+
+    Returns:
+        tuple: (list, list) - (pares de matrículas, números das linhas inválidas)
+    """
+    pares = []
+    invalidas = []
+
+    for num_linha, linha in enumerate(texto.split("\n"), 1):
+        partes = [p for p in re.split(r"[,;\s]+", linha.strip()) if p]
+        if not partes:
+            continue
+        if len(partes) == 2:
+            pares.append((partes[0], partes[1]))
+        else:
+            invalidas.append(num_linha)
+
+    return pares, invalidas
+
+
+def atributos_disponiveis(estudantes):
+    """
+    Lista os atributos extras presentes nos estudantes (além de matrícula e nome).
+
+    Args:
+        estudantes (list or Turma): Lista de dicionários de estudantes
+
+    Returns:
+        list: Nomes dos atributos na ordem em que aparecem
+    """
+    if isinstance(estudantes, Turma):
+        return list(estudantes.atributos) + ([CHAVE_PONTUACAO] if estudantes.pontuacoes is not None else [])
+
+    atributos = {}
+    for estudante in estudantes:
+        for chave in estudante:
+            if chave not in CHAVES_RESERVADAS:
+                atributos[chave] = True
+    return list(atributos)
+
+
+def _normalizar_valor(valor):
+    """Normaliza um valor de atributo para comparação."""
+    return str(valor).strip().lower()
+
+
+def preparar_restricoes(estudantes, restricoes):
+    """
+    Converte restrições baseadas em matrículas em restrições sobre índices.
+
+    Args:
+        estudantes (list): Lista de dicionários de estudantes
+        restricoes (dict): Restrições no formato descrito no módulo
+
+    Returns:
+        dict: Pares de índices, máscaras dos limites e pares ignorados
+    """
+    restricoes = restricoes or {}
+
+    posicao = {}
+    for i, estudante in enumerate(estudantes):
+        posicao.setdefault(str(estudante.get("matricula", "")).strip(), i)
+
+    ignorados = []
+
+    def converter(pares):
+        convertidos = set()
+        for par in pares:
+            a = posicao.get(str(par[0]).strip())
+            b = posicao.get(str(par[1]).strip())
+            if a is None or b is None:
+                ignorados.append(tuple(par))
+            elif a != b:
+                convertidos.add((min(a, b), max(a, b)))
+        return sorted(convertidos)
+
+    limites = []
+    for limite in restricoes.get("limites", []):
+        alvo = _normalizar_valor(limite.get("valor", ""))
+        atributo = limite["atributo"]
+        marcados = [_normalizar_valor(e.get(atributo, "")) == alvo for e in estudantes]
+        limites.append((marcados, int(limite.get("maximo", 1))))
+
+    return {
+        "juntos": converter(restricoes.get("juntos", [])),
+        "separados": converter(restricoes.get("separados", [])),
+        "limites": limites,
+        "ignorados": ignorados,
+    }
+
+
+class PontuadorRestricoes:
+    """
+    Pontuador incremental das restrições.
+
+    O custo é o número de violações: pares "juntos" em grupos diferentes, pares
+    "separados" no mesmo grupo e, para cada limite, o excesso de estudantes marcados
+    acima do máximo em cada grupo.
+    """
+
+    def __init__(self, grupo_de, num_grupos, juntos, separados, limites):
+        """
+        Inicializa o pontuador.
+
+        Args:
+            grupo_de (ndarray or list): Grupo inicial de cada estudante
+            num_grupos (int): Número de grupos
+            juntos (list): Pares de índices que devem ficar juntos
+            separados (list): Pares de índices que devem ficar separados
+            limites (list): Pares (máscara de marcados, máximo por grupo)
+        """
+        self.grupo_de = [int(g) for g in grupo_de]
+        total = len(self.grupo_de)
+
+        self.juntos = [[] for _ in range(total)]
+        for a, b in juntos:
+            self.juntos[a].append(b)
+            self.juntos[b].append(a)
+
+        self.separados = [[] for _ in range(total)]
+        for a, b in separados:
+            self.separados[a].append(b)
+            self.separados[b].append(a)
+
+        # Para cada limite: máximo e contagem de marcados por grupo
+        self.maximos = [maximo for _, maximo in limites]
+        self.contagens = [[0] * num_grupos for _ in limites]
+        self.limites_de = [[] for _ in range(total)]
+        for indice, (marcados, _) in enumerate(limites):
+            for i, marcado in enumerate(marcados):
+                if marcado:
+                    self.limites_de[i].append(indice)
+                    self.contagens[indice][self.grupo_de[i]] += 1
+
+        self.candidatos = np.array(
+            [i for i in range(total) if self.juntos[i] or self.separados[i] or self.limites_de[i]],
+            dtype=np.intp,
+        )
+        self.custo = self.custo_total()
+
+    def custo_total(self):
+        """
+        Calcula o custo da atribuição atual do zero.
+
+        Returns:
+            int: Número de violações
+        """
+        g = self.grupo_de
+        custo = sum(1 for a, vizinhos in enumerate(self.juntos) for b in vizinhos if a < b and g[a] != g[b])
+        custo += sum(1 for a, vizinhos in enumerate(self.separados) for b in vizinhos if a < b and g[a] == g[b])
+        for contagem, maximo in zip(self.contagens, self.maximos):
+            custo += sum(max(0, c - maximo) for c in contagem)
+        return custo
+
+    def delta_troca(self, a, b):
+        """
+        Calcula a variação do custo se a e b trocarem de grupo.
+
+        Args:
+            a (int): Índice do primeiro estudante
+            b (int): Índice do segundo estudante
+
+        Returns:
+            int: Variação do número de violações
+        """
+        g = self.grupo_de
+        ga = g[a]
+        gb = g[b]
+        if ga == gb:
+            return 0
+
+        delta = 0
+        for origem, outro, antes, depois in ((a, b, ga, gb), (b, a, gb, ga)):
+            for j in self.juntos[origem]:
+                if j != outro:
+                    delta += (g[j] != depois) - (g[j] != antes)
+            for j in self.separados[origem]:
+                if j != outro:
+                    delta += (g[j] == depois) - (g[j] == antes)
+
+        if self.limites_de[a] or self.limites_de[b]:
+            delta += self._delta_limites(a, b, ga, gb)
+
+        return delta
+
+    def _delta_limites(self, a, b, ga, gb):
+        """Variação do excesso dos limites quando a e b trocam de grupo."""
+        limites_a = self.limites_de[a]
+        limites_b = self.limites_de[b]
+
+        # Só muda a contagem dos limites em que apenas um dos dois está marcado
+        delta = 0
+        for indice in limites_a:
+            if indice not in limites_b:
+                delta += self._delta_mover_marcado(indice, ga, gb)
+        for indice in limites_b:
+            if indice not in limites_a:
+                delta += self._delta_mover_marcado(indice, gb, ga)
+
+        return delta
+
+    def _delta_mover_marcado(self, indice, origem, destino):
+        """Variação do excesso ao mover um estudante marcado de origem para destino."""
+        contagem = self.contagens[indice]
+        maximo = self.maximos[indice]
+        return (contagem[destino] >= maximo) - (contagem[origem] > maximo)
+
+    def grupo_sugerido(self, a, sorteio):
+        """
+        Sugere o grupo de um parceiro "juntos" de a como destino.
+
+        Args:
+            a (int): Índice do estudante
+            sorteio (float): Número em [0, 1) usado para escolher o parceiro
+
+        Returns:
+            int or None: Grupo sugerido ou None se a não tem parceiros
+        """
+        parceiros = self.juntos[a]
+        if not parceiros:
+            return None
+        return self.grupo_de[parceiros[int(sorteio * len(parceiros))]]
+
+    def aplicar_troca(self, a, b):
+        """
+        Troca a e b de grupo e atualiza o custo.
+
+        Args:
+            a (int): Índice do primeiro estudante
+            b (int): Índice do segundo estudante
+        """
+        delta = self.delta_troca(a, b)
+        g = self.grupo_de
+        ga = g[a]
+        gb = g[b]
+
+        for indice in self.limites_de[a]:
+            self.contagens[indice][ga] -= 1
+            self.contagens[indice][gb] += 1
+        for indice in self.limites_de[b]:
+            self.contagens[indice][gb] -= 1
+            self.contagens[indice][ga] += 1
+
+        g[a] = gb
+        g[b] = ga
+        self.custo += delta
+
+
+def formar_grupos_com_restricoes(
+    estudantes,
+    tamanho_grupo,
+    restricoes=None,
+    redistribuir_solitarios=True,
+    permitir_grupos_maiores=True,
+    semente=None,
+    gerador=None,
+    tempo_limite=1.0,
+    relatorio=None,
+):
+    """
+    Forma grupos aleatórios e os ajusta por busca local para respeitar as restrições.
+
+    Os tamanhos dos grupos são os mesmos da formação aleatória; a busca apenas troca
+    estudantes entre grupos e devolve a melhor formação encontrada no tempo limite.
+    Com semente, o tempo limite é convertido em um número fixo de trocas, para que a
+    formação não dependa da velocidade da máquina.
+
+    Args:
+        estudantes (list): Lista de dicionários com dados dos estudantes
+        tamanho_grupo (int): Tamanho desejado para cada grupo
+        restricoes (dict, optional): Restrições no formato descrito no módulo
+        redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+        semente (int, optional): Semente para reprodutibilidade do sorteio aleatório
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+        tempo_limite (float): Tempo máximo de busca em segundos (com semente, o orçamento
+            convertido em iterações)
+        relatorio (dict, optional): Se informado, recebe as estatísticas da busca
+
+    Returns:
+        list: Lista de arrays de índices, um por grupo
+    """
+    if not estudantes:
+        return []
+
+    if gerador is None:
+        gerador = criar_gerador(semente)
+
+    grupos = formar_grupos_indices(
+        estudantes,
+        tamanho_grupo,
+        "Aleatório",
+        redistribuir_solitarios,
+        permitir_grupos_maiores,
+        gerador=gerador,
+    )
+
+    preparadas = preparar_restricoes(estudantes, restricoes)
+    pontuador = PontuadorRestricoes(
+        atribuicao_de_grupos(grupos, len(estudantes)),
+        len(grupos),
+        preparadas["juntos"],
+        preparadas["separados"],
+        preparadas["limites"],
+    )
+    resultado = busca_local_trocas(
+        pontuador, tempo_limite, iteracoes_reproduziveis(tempo_limite, semente), gerador=gerador
+    )
+
+    if relatorio is not None:
+        relatorio.update(
+            {
+                "violacoes": resultado["custo"],
+                "violacoes_iniciais": resultado["custo_inicial"],
+                "valido": resultado["custo"] == 0,
+                "iteracoes": resultado["iteracoes"],
+                "tempo": resultado["tempo"],
+                "interrompida_pelo_tempo": resultado["interrompida_pelo_tempo"],
+                "ignorados": preparadas["ignorados"],
+            }
+        )
+
+    return grupos_de_atribuicao(resultado["grupo_de"], len(grupos))
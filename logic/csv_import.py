@@ -0,0 +1,120 @@
+"""
+Módulo de importação de CSV em blocos.
+Lê planilhas grandes (centenas de MB) sem carregar o arquivo inteiro: só as colunas
+mapeadas são lidas, como texto, em blocos de TAMANHO_BLOCO linhas.
+
+Cada bloco, ao chegar:
+    - é validado (matrículas e nomes vazios, matrículas já vistas em blocos anteriores);
+    - é convertido em uma Turma compacta, e o bloco de texto é descartado.
+
+No fim, as turmas dos blocos são juntadas. A memória fica limitada a um bloco de
+texto, às colunas compactas e ao conjunto de matrículas já vistas.
+"""
+
+import os
+
+import pandas as pd
+
+from logic.data_processing import _coluna_texto, processar_csv_para_estudantes
+from logic.roster import Turma
+from logic.validation import mensagens_validacao_csv
+
+# Linhas lidas por bloco
+TAMANHO_BLOCO = 50_000
+
+
+def importar_csv_em_blocos(
+    arquivo,
+    col_matricula,
+    col_nome,
+    colunas_extras=None,
+    col_pontuacao=None,
+    tamanho_bloco=TAMANHO_BLOCO,
+    progresso=None,
+    relatorio=None,
+    **opcoes_leitura,
+):
+    """
+    Importa um CSV em blocos, validando e convertendo cada bloco ao ser lido.
+
+    Args:
+        arquivo (str or file): Caminho ou arquivo binário com seek (ex.: upload do Streamlit)
+        col_matricula (str): Nome da coluna de matrícula
+        col_nome (str): Nome da coluna de nome
+        colunas_extras (list, optional): Colunas copiadas como atributos dos estudantes
+        col_pontuacao (str, optional): Coluna numérica usada pelo método "Balanceado"
+        tamanho_bloco (int): Linhas lidas por bloco
+        progresso (callable, optional): Chamada como progresso(bytes_lidos, bytes_totais)
+            após cada bloco
+        relatorio (dict, optional): Se informado, recebe o número de linhas, de blocos
+            e de estudantes importados
+        **opcoes_leitura: Opções repassadas a pd.read_csv (ex.: sep, encoding)
+
+    Returns:
+        tuple: (Turma, lista de erros no formato de validar_csv)
+    """
+    if isinstance(arquivo, (str, os.PathLike)):
+        with open(arquivo, "rb") as aberto:
+            return importar_csv_em_blocos(
+                aberto,
+                col_matricula,
+                col_nome,
+                colunas_extras,
+                col_pontuacao,
+                tamanho_bloco,
+                progresso,
+                relatorio,
+                **opcoes_leitura,
+            )
+
+    colunas_extras = list(colunas_extras or [])
+    inicio = arquivo.tell()
+    total = arquivo.seek(0, os.SEEK_END) - inicio
+    arquivo.seek(inicio)
+
+    # Verificar as colunas pelo cabeçalho antes de ler os dados
+    cabecalho = pd.read_csv(arquivo, nrows=0, **opcoes_leitura).columns
+    erros = [f"Coluna '{coluna}' não encontrada" for coluna in (col_matricula, col_nome) if coluna not in cabecalho]
+    if erros:
+        return Turma([], []), erros
+    arquivo.seek(inicio)
+
+    colunas = list(
+        dict.fromkeys([col_matricula, col_nome, *colunas_extras, *([col_pontuacao] if col_pontuacao else [])])
+    )
+    leitor = pd.read_csv(arquivo, usecols=colunas, dtype=str, chunksize=tamanho_bloco, **opcoes_leitura)
+
+    turmas = []
+    # Matrícula -> linha da primeira aparição; as repetidas guardam a linha da primeira
+    vistas = {}
+    duplicadas = {}
+    matriculas_vazias = nomes_vazios = linhas = blocos = 0
+
+    for bloco in leitor:
+        # Vazios como na conversão: ausentes ou só com espaços (as linhas descartadas)
+        matriculas = _coluna_texto(bloco[col_matricula])
+        matriculas_vazias += int((matriculas == "").sum())
+        nomes_vazios += int((_coluna_texto(bloco[col_nome]) == "").sum())
+
+        matriculas = matriculas[matriculas != ""]
+        for linha, matricula in zip(matriculas.index.tolist(), matriculas.tolist()):
+            primeira = vistas.setdefault(matricula, linha)
+            if primeira != linha:
+                duplicadas.setdefault(matricula, primeira)
+
+        turmas.append(
+            processar_csv_para_estudantes(bloco, col_matricula, col_nome, colunas_extras, col_pontuacao, compacto=True)
+        )
+
+        linhas += len(bloco)
+        blocos += 1
+        if progresso is not None:
+            progresso(arquivo.tell() - inicio, total)
+
+    turma = Turma.concatenar(turmas)
+    erros = mensagens_validacao_csv(matriculas_vazias, nomes_vazios, sorted(duplicadas, key=duplicadas.get))
+
+    if relatorio is not None:
+        relatorio.update({"linhas": linhas, "blocos": blocos, "estudantes": len(turma)})
+
+    return turma, erros
@@ -0,0 +1,244 @@
+"""
+Módulo de detecção do formato de CSV.
+Descobre codificação, separador e cabeçalho lendo só os primeiros KB do arquivo
+(planilhas exportadas do Excel costumam vir com ";" e em Latin-1/cp1252) e sugere
+as colunas de matrícula e de nome pelo conteúdo de uma amostra das linhas.
+
+As opções detectadas são as de pd.read_csv, então a leitura completa do arquivo é
+feita uma única vez, já com as opções certas.
+"""
+
+import csv
+import io
+import random
+import re
+from collections import Counter
+
+# Bytes lidos do início do arquivo para detectar o formato
+BYTES_AMOSTRA = 16 * 1024
+
+# Separadores testados, em ordem de preferência nos empates
+SEPARADORES = (",", ";", "\t", "|")
+
+# Codificações testadas depois de UTF-8; latin-1 decodifica qualquer sequência de bytes
+CODIFICACOES = ("cp1252", "latin-1")
+
+# Valores por coluna usados na sugestão de colunas
+TAMANHO_RESERVATORIO = 200
+
+# Pontuação mínima para sugerir uma coluna
+PONTUACAO_MINIMA = 0.5
+
+_PADRAO_MATRICULA = re.compile(r"[A-Za-z]{0,3}\d[\d.\-/]*")
+_PADRAO_NOME = re.compile(r"[^\W\d_]+(?:[ '\-.]+[^\W\d_]+)+\.?")
+_PADRAO_NUMERO = re.compile(r"[-+]?\d+(?:[.,]\d+)?")
+_CABECALHO_MATRICULA = re.compile(r"matr|^ra$|registro|c[oó]digo|^id$|^rgm$", re.IGNORECASE)
+_CABECALHO_NOME = re.compile(r"nome|name|aluno|estudante", re.IGNORECASE)
+
+
+def detectar_codificacao(amostra):
+    """
+    Detecta a codificação de uma amostra de bytes.
+
+    Args:
+        amostra (bytes): Primeiros bytes do arquivo
+
+    Returns:
+        str: "utf-8-sig" (com BOM), "utf-8", "cp1252" ou "latin-1"
+    """
+    if amostra.startswith(b"\xef\xbb\xbf"):
+        return "utf-8-sig"
+    try:
+        amostra.decode("utf-8")
+        return "utf-8"
+    except UnicodeDecodeError as erro:
+        # Um caractere cortado no fim da amostra não conta como erro
+        if erro.start >= len(amostra) - 3 and erro.reason == "unexpected end of data":
+            return "utf-8"
+    for codificacao in CODIFICACOES:
+        try:
+            amostra.decode(codificacao)
+            return codificacao
+        except UnicodeDecodeError:
+            continue
+    return "latin-1"
+
+
+def detectar_separador(linhas):
+    """
+    Detecta o separador pelas linhas de uma amostra.
+
+    Cada separador candidato é usado para ler as linhas com o módulo csv (respeitando
+    aspas, como em "7,5"); vence o que produz o mesmo número de campos (maior que 1)
+    no maior número de linhas.
+
+    Args:
+        linhas (list): Linhas completas da amostra
+
+    Returns:
+        str: Separador detectado ("," se nenhum candidato dividir as linhas)
+    """
+    melhor, melhor_pontuacao = ",", (0, 0)
+    for separador in SEPARADORES:
+        larguras = Counter(len(campos) for campos in csv.reader(linhas, delimiter=separador) if campos)
+        if not larguras:
+            continue
+        largura, frequencia = larguras.most_common(1)[0]
+        if largura > 1 and (frequencia, largura) > melhor_pontuacao:
+            melhor, melhor_pontuacao = separador, (frequencia, largura)
+    return melhor
+
+
+def _numerico(valor):
+    """Verifica se um valor é um número (aceitando vírgula decimal)."""
+    return bool(_PADRAO_NUMERO.fullmatch(valor.strip()))
+
+
+def detectar_cabecalho(linhas, separador):
+    """
+    Decide se a primeira linha é um cabeçalho.
+
+    A primeira linha é tratada como dados só quando, em todas as colunas, ela tem o
+    mesmo tipo (número ou texto) que a maioria das linhas seguintes e ao menos uma
+    coluna é numérica; do contrário, é tratada como cabeçalho.
+
+    Args:
+        linhas (list): Linhas completas da amostra
+        separador (str): Separador dos campos
+
+    Returns:
+        bool: True se a primeira linha for um cabeçalho
+    """
+    linhas_lidas = [campos for campos in csv.reader(linhas, delimiter=separador) if campos]
+    if len(linhas_lidas) < 2:
+        return True
+
+    primeira, corpo = linhas_lidas[0], linhas_lidas[1:]
+    alguma_numerica = False
+    for posicao, valor in enumerate(primeira):
+        valores = [campos[posicao] for campos in corpo if posicao < len(campos) and campos[posicao].strip()]
+        if not valores:
+            continue
+        numerica = sum(map(_numerico, valores)) > len(valores) / 2
+        if numerica != _numerico(valor):
+            return True
+        alguma_numerica = alguma_numerica or numerica
+    return not alguma_numerica
+
+
+def farejar_csv(arquivo, tamanho=BYTES_AMOSTRA):
+    """
+    Detecta codificação, separador e cabeçalho lendo só o início de um arquivo.
+
+    Args:
+        arquivo (file): Arquivo binário com seek (ex.: upload do Streamlit); a posição
+            é restaurada ao final
+        tamanho (int): Bytes lidos do início do arquivo
+
+    Returns:
+        dict: Opções para pd.read_csv ("encoding", "sep" e, sem cabeçalho, "header"
+        e "names" com "Coluna 1", "Coluna 2", ...)
+    """
+    inicio = arquivo.tell()
+    amostra = arquivo.read(tamanho)
+    arquivo.seek(inicio)
+
+    codificacao = detectar_codificacao(amostra)
+    texto = amostra.decode(codificacao, errors="ignore")
+
+    # Descartar a última linha, possivelmente cortada, se houver outras
+    linhas = texto.splitlines()
+    if len(amostra) == tamanho and len(linhas) > 1:
+        linhas = linhas[:-1]
+
+    separador = detectar_separador(linhas)
+    opcoes = {"encoding": codificacao, "sep": separador}
+
+    if linhas and not detectar_cabecalho(linhas, separador):
+        largura = len(next(csv.reader(io.StringIO(linhas[0]), delimiter=separador)))
+        opcoes.update(header=None, names=[f"Coluna {i}" for i in range(1, largura + 1)])
+
+    return opcoes
+
+
+def amostra_reservatorio(valores, tamanho=TAMANHO_RESERVATORIO, semente=0):
+    """
+    Sorteia uma amostra uniforme de um iterável em uma única passada (algoritmo R).
+
+    Args:
+        valores (iterable): Valores, de tamanho possivelmente desconhecido
+        tamanho (int): Tamanho máximo da amostra
+        semente (int): Semente do sorteio
+
+    Returns:
+        list: Até tamanho valores, na ordem em que foram guardados
+    """
+    gerador = random.Random(semente)
+    amostra = []
+    for posicao, valor in enumerate(valores):
+        if posicao < tamanho:
+            amostra.append(valor)
+        else:
+            sorteado = gerador.randrange(posicao + 1)
+            if sorteado < tamanho:
+                amostra[sorteado] = valor
+    return amostra
+
+
+def pontuar_colunas(df, tamanho=TAMANHO_RESERVATORIO):
+    """
+    Pontua cada coluna como matrícula e como nome, pelo conteúdo e pelo cabeçalho.
+
+    A pontuação de matrícula é a fração de valores com cara de matrícula (dígitos,
+    com um prefixo curto de letras opcional) vezes a fração de valores distintos; a de
+    nome é a fração de valores com duas ou mais palavras só de letras. Um cabeçalho
+    sugestivo ("matrícula", "nome", ...) soma 0,25.
+
+    Args:
+        df (DataFrame): Amostra das linhas do CSV
+        tamanho (int): Valores sorteados por coluna
+
+    Returns:
+        dict: {coluna: (pontuação de matrícula, pontuação de nome)}
+    """
+    pontuacoes = {}
+    for coluna in df.columns:
+        valores = amostra_reservatorio(
+            (str(valor).strip() for valor in df[coluna].dropna().tolist() if str(valor).strip()), tamanho
+        )
+        matricula = nome = 0.0
+        if valores:
+            distintos = len(set(valores)) / len(valores)
+            matricula = sum(bool(_PADRAO_MATRICULA.fullmatch(v)) for v in valores) / len(valores) * distintos
+            nome = sum(bool(_PADRAO_NOME.fullmatch(v)) for v in valores) / len(valores)
+        cabecalho = str(coluna).strip()
+        matricula += 0.25 if _CABECALHO_MATRICULA.search(cabecalho) else 0.0
+        nome += 0.25 if _CABECALHO_NOME.search(cabecalho) else 0.0
+        pontuacoes[coluna] = (matricula, nome)
+    return pontuacoes
+
+
+def sugerir_colunas(df, tamanho=TAMANHO_RESERVATORIO):
+    """
+    Sugere as colunas de matrícula e de nome de uma amostra do CSV.
+
+    Args:
+        df (DataFrame): Amostra das linhas do CSV
+        tamanho (int): Valores sorteados por coluna
+
+    Returns:
+        tuple: (coluna de matrícula, coluna de nome); None quando nenhuma coluna
+        atinge PONTUACAO_MINIMA
+    """
+    pontuacoes = pontuar_colunas(df, tamanho)
+
+    col_matricula = max(pontuacoes, key=lambda coluna: pontuacoes[coluna][0], default=None)
+    if col_matricula is not None and pontuacoes[col_matricula][0] < PONTUACAO_MINIMA:
+        col_matricula = None
+
+    candidatas = [coluna for coluna in pontuacoes if coluna != col_matricula]
+    col_nome = max(candidatas, key=lambda coluna: pontuacoes[coluna][1], default=None)
+    if col_nome is not None and pontuacoes[col_nome][1] < PONTUACAO_MINIMA:
+        col_nome = None
+
+    return col_matricula, col_nome
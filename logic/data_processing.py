@@ -3,37 +3,112 @@ Módulo de processamento de dados.
 Funções auxiliares para processar diferentes formatos de entrada.
 """
 
+import weakref
+
+import numpy as np
 import pandas as pd
 
+from logic.balancing import CHAVE_PONTUACAO
+from logic.roster import Agrupamento, Turma
+
+# Colunas da tabela de exportação -> chave do estudante
+COLUNAS_EXPORTACAO = {"Matrícula": "matricula", "Nome": "nome", "Completo": "completo"}
+COLUNAS_PADRAO = ("Matrícula", "Nome", "Completo")
+
+# Tabelas já montadas de cada Agrupamento, por tupla de colunas
+_tabelas = weakref.WeakKeyDictionary()
+
+
+def _coluna_texto(serie):
+    """Converte uma coluna em textos sem espaços nas pontas, com "" nos valores ausentes."""
+    return serie.astype(str).str.strip().where(serie.notna(), "")
+
 
-def processar_csv_para_estudantes(df, col_matricula, col_nome):
+def processar_csv_para_estudantes(df, col_matricula, col_nome, colunas_extras=None, col_pontuacao=None, compacto=False):
     """
     Converte um DataFrame CSV em lista de estudantes.
 
+    A conversão é feita coluna a coluna; linhas sem matrícula ou sem nome são descartadas.
+
     Args:
         df (DataFrame): DataFrame do pandas
         col_matricula (str): Nome da coluna de matrícula
         col_nome (str): Nome da coluna de nome
+        colunas_extras (list, optional): Colunas copiadas como atributos dos estudantes
+        col_pontuacao (str, optional): Coluna numérica (ex.: nota) usada pelo método "Balanceado"
+        compacto (bool): Se True, retorna uma Turma em colunas compactas em vez dos dicionários
 
     Returns:
-        list: Lista de dicionários de estudantes
+        list or Turma: Lista de dicionários de estudantes (ou Turma, se compacto)
     """
-    estudantes = []
+    colunas_extras = colunas_extras or []
+
+    matriculas = _coluna_texto(df[col_matricula])
+    nomes = _coluna_texto(df[col_nome])
+    validas = ((matriculas != "") & (nomes != "")).to_numpy(dtype=bool)
+
+    matriculas = matriculas[validas].tolist()
+    nomes = nomes[validas].tolist()
+    atributos = {coluna: _coluna_texto(df[coluna])[validas].tolist() for coluna in colunas_extras}
+
+    # Aceita vírgula decimal ("7,5"); valores não numéricos ficam sem pontuação
+    pontuacoes = None
+    if col_pontuacao:
+        numeros = pd.to_numeric(df[col_pontuacao].astype(str).str.replace(",", ".", regex=False), errors="coerce")
+        pontuacoes = numeros.to_numpy(dtype=float, na_value=np.nan)[validas]
+
+    if compacto:
+        tem_pontuacao = pontuacoes is not None and not np.isnan(pontuacoes).all()
+        return Turma(matriculas, nomes, atributos, pontuacoes if tem_pontuacao else None)
+
+    estudantes = [{"matricula": m, "nome": n, "completo": f"{m}, {n}"} for m, n in zip(matriculas, nomes)]
+    for coluna, valores in atributos.items():
+        for estudante, valor in zip(estudantes, valores):
+            estudante[coluna] = valor
+    if pontuacoes is not None:
+        for estudante, pontuacao in zip(estudantes, pontuacoes.tolist()):
+            if not np.isnan(pontuacao):
+                estudante[CHAVE_PONTUACAO] = pontuacao
 
-    for _, row in df.iterrows():
-        matricula = str(row[col_matricula]).strip() if pd.notna(row[col_matricula]) else ""
-        nome = str(row[col_nome]).strip() if pd.notna(row[col_nome]) else ""
+    return estudantes
 
-        if matricula and nome:
-            estudantes.append(
-                {
-                    "matricula": matricula,
-                    "nome": nome,
-                    "completo": f"{matricula}, {nome}",
-                }
-            )
 
-    return estudantes
+def tabela_grupos(grupos, colunas=COLUNAS_PADRAO):
+    """
+    Monta a tabela de exportação (coluna "Grupo" e as colunas pedidas) de uma formação.
+
+    A tabela é montada coluna a coluna: o número do grupo vem de np.repeat sobre os
+    tamanhos dos grupos e as demais colunas são lidas pelos índices dos estudantes,
+    sem um dicionário por linha. A tabela de um Agrupamento fica guardada enquanto o
+    Agrupamento existir, então as várias exportações de uma formação a montam uma vez.
+
+    Args:
+        grupos (list or Agrupamento): Lista de grupos
+        colunas (tuple): Colunas desejadas, entre as de COLUNAS_EXPORTACAO
+
+    Returns:
+        DataFrame: Uma linha por estudante, na ordem dos grupos
+    """
+    colunas = tuple(colunas)
+    guardadas = _tabelas.get(grupos) if isinstance(grupos, Agrupamento) else None
+    if guardadas is not None and colunas in guardadas:
+        # Cópia rasa: com copy-on-write, alterações do chamador não chegam ao cache
+        return guardadas[colunas].copy(deep=False)
+
+    chaves = [COLUNAS_EXPORTACAO[coluna] for coluna in colunas]
+    if isinstance(grupos, Agrupamento):
+        numeros, valores = grupos.colunas(chaves)
+    else:
+        numeros = np.repeat(np.arange(1, len(grupos) + 1), [len(grupo) for grupo in grupos])
+        estudantes = [estudante for grupo in grupos for estudante in grupo]
+        valores = {chave: [estudante.get(chave, "") for estudante in estudantes] for chave in chaves}
+
+    tabela = pd.DataFrame({"Grupo": numeros, **{coluna: valores[COLUNAS_EXPORTACAO[coluna]] for coluna in colunas}})
+
+    if isinstance(grupos, Agrupamento):
+        _tabelas.setdefault(grupos, {})[colunas] = tabela
+        return tabela.copy(deep=False)
+    return tabela
 
 
 def preparar_dados_exportacao(grupos):
@@ -41,25 +116,12 @@ def preparar_dados_exportacao(grupos):
     Prepara dados dos grupos para exportação em diferentes formatos.
 
     Args:
-        grupos (list): Lista de grupos
+        grupos (list or Agrupamento): Lista de grupos
 
     Returns:
         list: Lista de dicionários prontos para exportação
     """
-    dados = []
-
-    for i, grupo in enumerate(grupos, 1):
-        for estudante in grupo:
-            dados.append(
-                {
-                    "Grupo": i,
-                    "Matrícula": estudante.get("matricula", ""),
-                    "Nome": estudante.get("nome", ""),
-                    "Completo": estudante.get("completo", ""),
-                }
-            )
-
-    return dados
+    return tabela_grupos(grupos).to_dict("records")
 
 
 def criar_dataframe_grupos(grupos):
@@ -67,13 +129,12 @@ def criar_dataframe_grupos(grupos):
     Cria um DataFrame pandas a partir dos grupos.
 
     Args:
-        grupos (list): Lista de grupos
+        grupos (list or Agrupamento): Lista de grupos
 
     Returns:
         DataFrame: DataFrame com os dados dos grupos
     """
-    dados = preparar_dados_exportacao(grupos)
-    return pd.DataFrame(dados)
+    return tabela_grupos(grupos)
 
 
 def filtrar_estudantes_por_grupo(grupos, numero_grupo):
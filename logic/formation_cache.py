@@ -0,0 +1,176 @@
+"""
+Módulo de cache de formações.
+Guarda os grupos de índices de formações com semente, chaveados por uma impressão
+digital estável da turma e pelos parâmetros da formação, para que pedidos idênticos
+(inclusive de sessões diferentes) não repitam o cálculo.
+
+Formações sem semente não passam pelo cache: cada sorteio deve ser novo. Formações
+com semente que o relógio interrompeu também ficam de fora (ver formar_grupos).
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+from logic.pair_history import chave_item
+from logic.roster import Turma
+
+# Número máximo de formações guardadas (as menos usadas recentemente saem primeiro)
+TAMANHO_CACHE = 128
+
+
+def impressao_turma(estudantes):
+    """
+    Calcula uma impressão digital estável da turma, sensível à ordem e aos atributos.
+
+    Args:
+        estudantes (list or Turma): Lista de dicionários com dados dos estudantes
+
+    Returns:
+        str: Hash hexadecimal da turma
+    """
+    if isinstance(estudantes, Turma):
+        return estudantes.impressao()
+
+    conteudo = json.dumps(estudantes, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.blake2b(conteudo.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _valor_estavel(valor):
+    """Converte parâmetros (restrições, objetivo) em um valor comparável e hashable."""
+    if callable(valor):
+        return f"{valor.__module__}.{valor.__qualname__}"
+    return json.dumps(valor, sort_keys=True, ensure_ascii=False, default=str)
+
+
+def chave_formacao(
+    estudantes, tamanho_grupo, metodo, redistribuir_solitarios, permitir_grupos_maiores, semente, **opcoes
+):
+    """
+    Monta a chave de cache de uma formação.
+
+    O histórico só entra na chave para o método "Novos parceiros", o único que o usa,
+    pelos identificadores dos itens.
+
+    Args:
+        estudantes (list): Lista de dicionários com dados dos estudantes
+        tamanho_grupo (int): Tamanho desejado para cada grupo
+        metodo (str): Método de formação de grupos
+        redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+        semente (int): Semente da formação
+        **opcoes: Demais parâmetros que alteram o resultado (restricoes, historico, ...)
+
+    Returns:
+        tuple: Chave do cache
+    """
+    historico = opcoes.pop("historico", None)
+    if metodo == "Novos parceiros" and historico is not None:
+        opcoes["historico"] = [chave_item(item) for item in historico]
+
+    extras = tuple(sorted((nome, _valor_estavel(valor)) for nome, valor in opcoes.items()))
+    return (
+        impressao_turma(estudantes),
+        tamanho_grupo,
+        metodo,
+        bool(redistribuir_solitarios),
+        bool(permitir_grupos_maiores),
+        semente,
+        extras,
+    )
+
+
+class CacheFormacoes:
+    """
+    Cache LRU de formações, seguro para uso entre threads (sessões do Streamlit).
+    """
+
+    def __init__(self, tamanho_maximo=TAMANHO_CACHE):
+        """
+        Inicializa um cache vazio.
+
+        Args:
+            tamanho_maximo (int): Número máximo de formações guardadas
+        """
+        self.tamanho_maximo = tamanho_maximo
+        self.entradas = OrderedDict()
+        self.acertos = 0
+        self.falhas = 0
+        self._trava = threading.Lock()
+
+    def __len__(self):
+        """Número de formações guardadas."""
+        return len(self.entradas)
+
+    def obter(self, chave):
+        """
+        Busca uma formação no cache, contando acerto ou falha.
+
+        Args:
+            chave (tuple): Chave da formação (ver chave_formacao)
+
+        Returns:
+            tuple or None: (grupos de índices, relatório) ou None se ausente
+        """
+        with self._trava:
+            valor = self.entradas.get(chave)
+            if valor is None:
+                self.falhas += 1
+                return None
+            self.entradas.move_to_end(chave)
+            self.acertos += 1
+            return valor
+
+    def guardar(self, chave, grupos_indices, relatorio=None):
+        """
+        Guarda uma formação, descartando a menos usada se o cache estiver cheio.
+
+        Args:
+            chave (tuple): Chave da formação
+            grupos_indices (list): Lista de arrays de índices
+            relatorio (dict, optional): Relatório da formação
+        """
+        with self._trava:
+            self.entradas[chave] = (grupos_indices, dict(relatorio or {}))
+            self.entradas.move_to_end(chave)
+            while len(self.entradas) > self.tamanho_maximo:
+                self.entradas.popitem(last=False)
+
+    def limpar(self):
+        """Remove todas as formações e zera os contadores."""
+        with self._trava:
+            self.entradas.clear()
+            self.acertos = 0
+            self.falhas = 0
+
+    def estatisticas(self):
+        """
+        Retorna os contadores do cache.
+
+        Returns:
+            dict: Acertos, falhas, taxa de acerto, formações guardadas e tamanho máximo
+        """
+        with self._trava:
+            consultas = self.acertos + self.falhas
+            return {
+                "acertos": self.acertos,
+                "falhas": self.falhas,
+                "taxa_acerto": self.acertos / consultas if consultas else 0.0,
+                "entradas": len(self.entradas),
+                "tamanho_maximo": self.tamanho_maximo,
+            }
+
+
+# Cache compartilhado entre sessões
+_cache_formacoes = CacheFormacoes()
+
+
+def obter_cache_formacoes():
+    """
+    Retorna o cache de formações compartilhado.
+
+    Returns:
+        CacheFormacoes: Cache compartilhado
+    """
+    return _cache_formacoes
@@ -3,8 +3,19 @@ Módulo de processamento e formação de grupos.
 Contém todas as funções relacionadas à lógica de formação de grupos.
 """
 
-import math
-import random
+import numpy as np
+
+from logic.balancing import CHAVE_PONTUACAO, converter_pontuacao, formar_grupos_por_pontuacao, tem_pontuacao
+from logic.constraints import formar_grupos_com_restricoes
+from logic.formation_cache import chave_formacao, obter_cache_formacoes
+from logic.multi_start import buscar_melhor_semente, resolver_objetivo
+from logic.optimization import formar_grupos_otimizados
+from logic.pair_history import formar_grupos_novos_parceiros
+from logic.partitioning import formar_grupos_indices, materializar_grupos, planejar_redistribuicao
+from logic.roster import Agrupamento
+
+# Métodos oferecidos na interface, na ordem de exibição
+METODOS_FORMACAO = ["Aleatório", "Sequencial", "Balanceado", "Restrições", "Novos parceiros", "Diversidade"]
 
 
 def formar_grupos(
@@ -14,68 +25,216 @@ def formar_grupos(
     redistribuir_solitarios=True,
     permitir_grupos_maiores=True,
     semente=None,
+    gerador=None,
+    restricoes=None,
+    historico=None,
+    tempo_limite=1.0,
+    relatorio=None,
+    tentativas=1,
+    objetivo=None,
+    max_trabalhadores=None,
+    tempo_maximo=None,
+    usar_cache=True,
+    otimizacao=None,
 ):
     """
     Forma grupos com o tamanho especificado usando o método selecionado.
 
+    Com tentativas > 1, forma os grupos várias vezes com sementes diferentes (em
+    paralelo para turmas grandes) e devolve a melhor formação segundo o objetivo;
+    a semente vencedora vai para relatorio["semente"] e reproduz o resultado (com
+    semente, os métodos com busca local param por um número fixo de trocas, e não
+    pelo relógio; ver logic.local_search.iteracoes_reproduziveis).
+
+    Formações com semente ficam no cache compartilhado (ver logic.formation_cache):
+    um pedido idêntico devolve os mesmos grupos sem recalcular. Uma formação que o
+    relógio interrompeu (o tempo_maximo das tentativas ou o teto de segurança da busca
+    local) depende da velocidade da máquina e não é guardada.
+
     Args:
-        estudantes (list): Lista de dicionários com dados dos estudantes
+        estudantes (list or Turma): Lista de dicionários com dados dos estudantes
         tamanho_grupo (int): Tamanho desejado para cada grupo
-        metodo (str): Método de formação de grupos ("Aleatório", "Sequencial", "Balanceado")
+        metodo (str): Método de formação de grupos (um de METODOS_FORMACAO)
         redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
         permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
         semente (int, optional): Semente para reprodutibilidade do sorteio aleatório
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser
+            usado no lugar da semente (ex.: um dos fluxos de criar_fluxos)
+        restricoes (dict, optional): Restrições do método "Restrições" (ver logic.constraints)
+        historico (list, optional): Histórico de formações usado pelo método "Novos parceiros"
+        tempo_limite (float): Tempo máximo de otimização em segundos, para métodos que otimizam
+        relatorio (dict, optional): Se informado, recebe estatísticas da otimização
+        tentativas (int): Número de tentativas com sementes diferentes
+        objetivo (str or callable, optional): Objetivo das tentativas (ver logic.multi_start);
+            por padrão, o objetivo do método
+        max_trabalhadores (int, optional): Máximo de processos usados pelas tentativas
+        tempo_maximo (float, optional): Tempo máximo total das tentativas em segundos
+        usar_cache (bool): Se deve consultar e alimentar o cache de formações com semente
+        otimizacao (dict, optional): Objetivos e colunas do método "Diversidade" (ver
+            logic.optimization); o tempo_limite é o orçamento da busca
 
     Returns:
-        list: Lista de grupos, onde cada grupo é uma lista de estudantes
+        list or Agrupamento: Lista de grupos, onde cada grupo é uma lista de estudantes
+        (um Agrupamento de índices quando estudantes é uma Turma)
     """
     if not estudantes:
         return []
 
-    estudantes_copia = estudantes.copy()
-
-    # Aplicar o método selecionado
-    if metodo == "Aleatório":
-        if semente is not None:
-            random.seed(semente)
-        random.shuffle(estudantes_copia)
-        if semente is not None:
-            random.seed(None)  # Resetar para evitar afetar outros sorteios
-    elif metodo == "Balanceado":
-        # Ordenar por matrícula para distribuição balanceada
-        estudantes_copia.sort(key=lambda x: x.get("matricula", ""))
-
-        # Alternar ordem para distribuir de forma mais balanceada
-        estudantes_balanceados = []
-        meio = len(estudantes_copia) // 2
-        for i in range(meio):
-            estudantes_balanceados.append(estudantes_copia[i])
-            if i + meio < len(estudantes_copia):
-                estudantes_balanceados.append(estudantes_copia[i + meio])
-
-        # Adicionar qualquer estudante restante
-        if len(estudantes_copia) % 2 != 0:
-            estudantes_balanceados.append(estudantes_copia[-1])
-
-        estudantes_copia = estudantes_balanceados
-    # Para "Sequencial" não precisamos fazer nada, usamos a ordem original
-
-    # Calcular número de grupos necessários
-    num_grupos = math.ceil(len(estudantes_copia) / tamanho_grupo)
-
-    # Formar os grupos iniciais
-    grupos = []
-    for i in range(num_grupos):
-        inicio = i * tamanho_grupo
-        fim = min(inicio + tamanho_grupo, len(estudantes_copia))
-        grupo = estudantes_copia[inicio:fim]
-        grupos.append(grupo)
+    cache = obter_cache_formacoes() if usar_cache and semente is not None and gerador is None else None
+    if cache is not None:
+        chave = chave_formacao(
+            estudantes,
+            tamanho_grupo,
+            metodo,
+            redistribuir_solitarios,
+            permitir_grupos_maiores,
+            semente,
+            restricoes=restricoes,
+            historico=historico,
+            tempo_limite=tempo_limite,
+            tentativas=tentativas,
+            objetivo=objetivo,
+            tempo_maximo=tempo_maximo,
+            otimizacao=otimizacao,
+        )
+        encontrado = cache.obter(chave)
+        if encontrado is not None:
+            grupos_indices, relatorio_salvo = encontrado
+            if relatorio is not None:
+                relatorio.update(relatorio_salvo)
+            return materializar_grupos(estudantes, grupos_indices)
+
+        # O relatório é guardado junto com os grupos
+        if relatorio is None:
+            relatorio = {}
+
+    if tentativas > 1:
+        parametros = {
+            "tamanho_grupo": tamanho_grupo,
+            "metodo": metodo,
+            "redistribuir_solitarios": redistribuir_solitarios,
+            "permitir_grupos_maiores": permitir_grupos_maiores,
+            "restricoes": restricoes,
+            "historico": historico,
+            "tempo_limite": tempo_limite,
+            "otimizacao": otimizacao,
+        }
+        grupos_indices = buscar_melhor_semente(
+            formar_grupos_metodo,
+            estudantes,
+            parametros,
+            tentativas,
+            resolver_objetivo(objetivo, metodo),
+            semente,
+            gerador,
+            max_trabalhadores,
+            tempo_maximo,
+            relatorio,
+        )
+    else:
+        grupos_indices = formar_grupos_metodo(
+            estudantes,
+            tamanho_grupo,
+            metodo,
+            redistribuir_solitarios,
+            permitir_grupos_maiores,
+            semente,
+            gerador,
+            restricoes,
+            historico,
+            tempo_limite,
+            relatorio,
+            otimizacao,
+        )
+
+    if cache is not None and not relatorio.get("interrompida_pelo_tempo", False):
+        cache.guardar(chave, grupos_indices, relatorio)
+
+    # Os motores trabalham com índices; os dicionários só são montados no final
+    return materializar_grupos(estudantes, grupos_indices)
+
+
+def formar_grupos_metodo(
+    estudantes,
+    tamanho_grupo,
+    metodo="Aleatório",
+    redistribuir_solitarios=True,
+    permitir_grupos_maiores=True,
+    semente=None,
+    gerador=None,
+    restricoes=None,
+    historico=None,
+    tempo_limite=1.0,
+    relatorio=None,
+    otimizacao=None,
+):
+    """
+    Forma grupos de índices com o motor do método selecionado.
 
-    # Verificar se há algum grupo com apenas um aluno e redistribuir se necessário
-    if redistribuir_solitarios:
-        grupos = redistribuir_solitarios_func(grupos, tamanho_grupo, permitir_grupos_maiores)
+    Recebe os mesmos argumentos de formar_grupos (sem as tentativas).
 
-    return grupos
+    Returns:
+        list: Lista de arrays de índices, um por grupo
+    """
+    if metodo == "Restrições":
+        return formar_grupos_com_restricoes(
+            estudantes,
+            tamanho_grupo,
+            restricoes,
+            redistribuir_solitarios,
+            permitir_grupos_maiores,
+            semente,
+            gerador,
+            tempo_limite,
+            relatorio,
+        )
+
+    if metodo == "Balanceado" and tem_pontuacao(estudantes):
+        # Com pontuação (ex.: nota), equilibra as médias dos grupos
+        return formar_grupos_por_pontuacao(
+            estudantes,
+            tamanho_grupo,
+            redistribuir_solitarios,
+            permitir_grupos_maiores,
+            semente,
+            gerador,
+        )
+
+    if metodo == "Diversidade":
+        return formar_grupos_otimizados(
+            estudantes,
+            tamanho_grupo,
+            otimizacao,
+            redistribuir_solitarios,
+            permitir_grupos_maiores,
+            semente,
+            gerador,
+            orcamento_ms=tempo_limite * 1000,
+            relatorio=relatorio,
+        )
+
+    if metodo == "Novos parceiros":
+        return formar_grupos_novos_parceiros(
+            estudantes,
+            tamanho_grupo,
+            historico=historico,
+            redistribuir_solitarios=redistribuir_solitarios,
+            permitir_grupos_maiores=permitir_grupos_maiores,
+            semente=semente,
+            gerador=gerador,
+            tempo_limite=tempo_limite,
+            relatorio=relatorio,
+        )
+
+    return formar_grupos_indices(
+        estudantes,
+        tamanho_grupo,
+        metodo,
+        redistribuir_solitarios,
+        permitir_grupos_maiores,
+        semente,
+        gerador,
+    )
 
 
 def redistribuir_solitarios_func(grupos, tamanho_grupo, permitir_grupos_maiores):
@@ -93,27 +252,17 @@ def redistribuir_solitarios_func(grupos, tamanho_grupo, permitir_grupos_maiores)
     if not grupos:
         return grupos
 
-    # Encontrar grupos com apenas 1 estudante
-    i = len(grupos) - 1
-    while i >= 0:
-        if len(grupos[i]) == 1:
-            aluno_sozinho = grupos[i][0]
-            grupos.pop(i)
-
-            if grupos:  # Se ainda há outros grupos
-                # Encontrar o grupo com menos alunos
-                grupo_menor = min(grupos, key=len)
-                if permitir_grupos_maiores or len(grupo_menor) < tamanho_grupo:
-                    grupo_menor.append(aluno_sozinho)
-                else:
-                    # Se não permitir grupos maiores, criar novo grupo
-                    grupos.append([aluno_sozinho])
-            else:
-                # Se não há mais grupos, recriar o grupo com o aluno solitário
-                grupos.append([aluno_sozinho])
-        i -= 1
-
-    return grupos
+    plano = planejar_redistribuicao([len(grupo) for grupo in grupos], tamanho_grupo, permitir_grupos_maiores)
+
+    # Montar a saída em uma única passada, anexando os solitários aos grupos de destino
+    redistribuidos = []
+    for partes in plano:
+        grupo = grupos[partes[0]]
+        for k in partes[1:]:
+            grupo.extend(grupos[k])
+        redistribuidos.append(grupo)
+
+    return redistribuidos
 
 
 def calcular_estatisticas(grupos):
@@ -121,7 +270,7 @@ def calcular_estatisticas(grupos):
     Calcula estatísticas dos grupos formados.
 
     Args:
-        grupos (list): Lista de grupos
+        grupos (list or Agrupamento): Lista de grupos
 
     Returns:
         dict: Dicionário com estatísticas
@@ -136,10 +285,10 @@ def calcular_estatisticas(grupos):
             "tamanhos": [],
         }
 
-    tamanhos = [len(grupo) for grupo in grupos]
+    tamanhos = grupos.tamanhos() if isinstance(grupos, Agrupamento) else [len(grupo) for grupo in grupos]
     total_estudantes = sum(tamanhos)
 
-    return {
+    estatisticas = {
         "total_grupos": len(grupos),
         "total_estudantes": total_estudantes,
         "menor_grupo": min(tamanhos),
@@ -148,34 +297,98 @@ def calcular_estatisticas(grupos):
         "tamanhos": tamanhos,
     }
 
+    estatisticas.update(calcular_estatisticas_pontuacao(grupos))
+    return estatisticas
+
+
+def calcular_estatisticas_pontuacao(grupos):
+    """
+    Calcula a média de pontuação de cada grupo e a dispersão entre os grupos.
+
+    Estudantes sem pontuação são ignorados; grupos sem nenhuma pontuação ficam com
+    média None e não entram na dispersão.
+
+    Args:
+        grupos (list or Agrupamento): Lista de grupos
+
+    Returns:
+        dict: Médias por grupo e dispersão (maior média - menor média), ou dicionário
+        vazio se nenhum estudante tiver pontuação
+    """
+    if isinstance(grupos, Agrupamento):
+        pontuacoes = grupos.turma.pontuacoes
+        if pontuacoes is None:
+            return {}
+        valores_grupos = [pontuacoes[grupo] for grupo in grupos.grupos_indices]
+        valores_grupos = [valores[~np.isnan(valores)].tolist() for valores in valores_grupos]
+    else:
+        valores_grupos = []
+        for grupo in grupos:
+            valores = [converter_pontuacao(estudante.get(CHAVE_PONTUACAO)) for estudante in grupo]
+            valores_grupos.append([valor for valor in valores if valor is not None])
+
+    medias = [sum(valores) / len(valores) if valores else None for valores in valores_grupos]
+
+    definidas = [media for media in medias if media is not None]
+    if not definidas:
+        return {}
+
+    return {
+        "medias_pontuacao": medias,
+        "dispersao_pontuacao": max(definidas) - min(definidas),
+    }
+
+
+def sortear_grupos_em_fluxo(estudantes, tamanho_grupo, semente=None, gerador=None, **opcoes):
+    """
+    Sorteia os grupos e os entrega um por vez, para revelá-los durante a animação.
+
+    Os grupos são exatamente os de formar_grupos com o método "Aleatório" e os mesmos
+    parâmetros: mesma permutação, mesma redistribuição de solitários e, com várias
+    tentativas, a mesma tentativa vencedora. Sortear os índices custa pouco mesmo em
+    turmas grandes; os estudantes de cada grupo só são montados quando o grupo é
+    entregue (preguiçosamente para uma Turma), então o primeiro grupo aparece sem
+    esperar pelos demais.
+
+    Args:
+        estudantes (list or Turma): Lista de estudantes
+        tamanho_grupo (int): Tamanho de cada grupo
+        semente (int, optional): Semente para reprodutibilidade do sorteio
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+        **opcoes: Demais argumentos de formar_grupos (redistribuir_solitarios,
+            permitir_grupos_maiores, tentativas, relatorio, ...)
 
-def sortear_grupo_ao_vivo(estudantes, tamanho_grupo, callback=None):
+    Yields:
+        dict: {"numero", "estudantes", "revelado"} de cada grupo, na ordem da formação
+    """
+    grupos = formar_grupos(estudantes, tamanho_grupo, "Aleatório", semente=semente, gerador=gerador, **opcoes)
+
+    for numero, grupo in enumerate(grupos, 1):
+        yield {"numero": numero, "estudantes": grupo, "revelado": False}
+
+
+def sortear_grupo_ao_vivo(estudantes, tamanho_grupo, callback=None, semente=None, gerador=None, **opcoes):
     """
     Prepara dados para sorteio ao vivo com animação.
     Retorna lista de grupos já formados, mas prepara estrutura para animação.
 
+    Para revelar os grupos à medida que são sorteados, use sortear_grupos_em_fluxo.
+
     Args:
         estudantes (list): Lista de estudantes
         tamanho_grupo (int): Tamanho de cada grupo
-        callback (callable, optional): Função a ser chamada durante o sorteio
+        callback (callable, optional): Função chamada com cada grupo assim que é sorteado
+        semente (int, optional): Semente para reprodutibilidade do sorteio
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+        **opcoes: Demais argumentos de formar_grupos (ver sortear_grupos_em_fluxo)
 
     Returns:
         list: Grupos formados no formato para animação
     """
-    import random
-
-    estudantes_copia = estudantes.copy()
-    random.shuffle(estudantes_copia)
-
-    num_grupos = math.ceil(len(estudantes_copia) / tamanho_grupo)
-
-    # Preparar estrutura para animação
     grupos_animacao = []
-    for i in range(num_grupos):
-        inicio = i * tamanho_grupo
-        fim = min(inicio + tamanho_grupo, len(estudantes_copia))
-        grupo = estudantes_copia[inicio:fim]
-
-        grupos_animacao.append({"numero": i + 1, "estudantes": grupo, "revelado": False})
+    for grupo in sortear_grupos_em_fluxo(estudantes, tamanho_grupo, semente, gerador, **opcoes):
+        if callback is not None:
+            callback(grupo)
+        grupos_animacao.append(grupo)
 
     return grupos_animacao
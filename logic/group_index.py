@@ -0,0 +1,119 @@
+"""
+Módulo de índice de grupos.
+Responde "em qual grupo eu estou?" sem percorrer os grupos: o índice é montado uma
+vez por formação e cada consulta custa O(1) (por matrícula) ou O(log n) (por nome).
+
+    - Matrícula -> linhas da tabela da formação, em um dicionário.
+    - Nome normalizado (sem acentos, em minúsculas) -> linhas, em uma lista ordenada
+      com uma entrada por palavra do nome: "ana maria silva" entra como
+      "ana maria silva", "maria silva" e "silva", então a busca por prefixo acha o
+      estudante pelo primeiro nome, por um sobrenome ou pelo começo de qualquer um deles.
+"""
+
+from bisect import bisect_left
+
+from logic.data_processing import tabela_grupos
+from logic.name_matching import palavras_simples
+
+# Máximo de estudantes devolvidos por busca
+LIMITE_BUSCA = 20
+
+
+class IndiceGrupos:
+    """
+    Índice reverso de uma formação: de matrícula e de nome para o número do grupo.
+    """
+
+    def __init__(self, grupos):
+        """
+        Monta o índice de uma formação.
+
+        Args:
+            grupos (list or Agrupamento): Lista de grupos
+        """
+        tabela = tabela_grupos(grupos, ("Matrícula", "Nome"))
+        self.numeros = tabela["Grupo"].tolist()
+        self.matriculas = [str(matricula).strip() for matricula in tabela["Matrícula"].tolist()]
+        self.nomes = tabela["Nome"].tolist()
+
+        self.por_matricula = {}
+        for linha, matricula in enumerate(self.matriculas):
+            self.por_matricula.setdefault(matricula, []).append(linha)
+
+        self.chaves = []
+        for linha, nome in enumerate(self.nomes):
+            palavras = palavras_simples(nome)
+            self.chaves.extend((" ".join(palavras[inicio:]), linha) for inicio in range(len(palavras)))
+        self.chaves.sort()
+
+    def __len__(self):
+        """Número de estudantes indexados."""
+        return len(self.numeros)
+
+    def _estudante(self, linha):
+        """Monta o resultado de uma linha da tabela."""
+        return {"grupo": self.numeros[linha], "matricula": self.matriculas[linha], "nome": self.nomes[linha]}
+
+    def grupo_da_matricula(self, matricula):
+        """
+        Retorna o grupo de uma matrícula.
+
+        Args:
+            matricula (str): Matrícula do estudante
+
+        Returns:
+            int or None: Número do grupo (1-indexed) ou None se a matrícula não estiver na formação
+        """
+        linhas = self.por_matricula.get(str(matricula).strip())
+        return self.numeros[linhas[0]] if linhas else None
+
+    def _linhas_nome(self, prefixo, limite):
+        """Retorna as linhas (sem repetições) cujo nome tem um trecho começando pelo prefixo."""
+        prefixo = " ".join(palavras_simples(prefixo))
+        if not prefixo:
+            return []
+
+        encontradas = {}
+        posicao = bisect_left(self.chaves, (prefixo,))
+        while posicao < len(self.chaves) and len(encontradas) < limite:
+            chave, linha = self.chaves[posicao]
+            if not chave.startswith(prefixo):
+                break
+            encontradas.setdefault(linha, None)
+            posicao += 1
+        return list(encontradas)
+
+    def buscar_nome(self, prefixo, limite=LIMITE_BUSCA):
+        """
+        Busca estudantes cujo nome, ou um sobrenome, começa pelo prefixo.
+
+        Acentos e maiúsculas são ignorados ("joao s" acha "João Silva" e "Ana João Souza").
+
+        Args:
+            prefixo (str): Começo do nome
+            limite (int): Máximo de estudantes devolvidos
+
+        Returns:
+            list: Estudantes {"grupo", "matricula", "nome"}, em ordem alfabética do trecho encontrado
+        """
+        return [self._estudante(linha) for linha in self._linhas_nome(prefixo, limite)]
+
+    def buscar(self, consulta, limite=LIMITE_BUSCA):
+        """
+        Busca estudantes por matrícula exata ou por prefixo do nome.
+
+        Args:
+            consulta (str): Matrícula ou começo do nome digitados
+            limite (int): Máximo de estudantes devolvidos
+
+        Returns:
+            list: Estudantes {"grupo", "matricula", "nome"}; as matrículas exatas vêm primeiro
+        """
+        consulta = str(consulta).strip()
+        if not consulta:
+            return []
+
+        linhas = self.por_matricula.get(consulta, [])[:limite]
+        vistas = set(linhas)
+        linhas += [linha for linha in self._linhas_nome(consulta, limite) if linha not in vistas]
+        return [self._estudante(linha) for linha in linhas[:limite]]
@@ -0,0 +1,239 @@
+"""
+Módulo de reformação incremental.
+Atualiza grupos já publicados quando estudantes entram ou saem da turma, movendo o
+mínimo possível de estudantes em vez de formar todos os grupos de novo.
+
+Regras aplicadas:
+    - Quem sai é retirado do seu grupo; grupos que ficam vazios deixam de existir.
+    - Quem entra ocupa as vagas dos grupos abaixo de tamanho_grupo (o menor primeiro);
+      sem vagas, os novatos formam grupos novos de tamanho_grupo.
+    - Por fim, grupos alterados que ficaram com 1 estudante seguem as mesmas regras de
+      solitários da formação (ver planejar_redistribuicao).
+
+O índice matrícula -> grupo é montado uma vez (O(turma)); depois disso, cada entrada
+ou saída custa O(log grupos + tamanho do grupo), e apenas os grupos alterados são copiados.
+"""
+
+import heapq
+
+
+class FormacaoIncremental:
+    """
+    Grupos de uma formação publicada com índice por matrícula e heap de tamanhos,
+    para aplicar entradas e saídas sem percorrer a turma inteira.
+    """
+
+    def __init__(self, grupos, tamanho_grupo, redistribuir_solitarios=True, permitir_grupos_maiores=True):
+        """
+        Inicializa a partir dos grupos publicados (não são alterados).
+
+        Args:
+            grupos (list): Lista de grupos de estudantes
+            tamanho_grupo (int): Tamanho alvo dos grupos
+            redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
+            permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+        """
+        self.grupos = list(grupos)
+        self.tamanho_grupo = tamanho_grupo
+        self.redistribuir_solitarios = redistribuir_solitarios
+        self.permitir_grupos_maiores = permitir_grupos_maiores
+        self.grupo_de = {
+            estudante.get("matricula", ""): numero for numero, grupo in enumerate(self.grupos) for estudante in grupo
+        }
+        self.copiados = set()
+        self.alterados = set()
+        self.movidos = 0
+        self.total_original = len(self.grupos)
+
+        # Entradas (tamanho, grupo) com invalidação preguiçosa, como em planejar_redistribuicao
+        self.heap = [(len(grupo), numero) for numero, grupo in enumerate(self.grupos)]
+        heapq.heapify(self.heap)
+
+    def _grupo_editavel(self, numero):
+        """Copia o grupo na primeira alteração, preservando a formação original."""
+        if numero not in self.copiados:
+            self.grupos[numero] = list(self.grupos[numero])
+            self.copiados.add(numero)
+        self.alterados.add(numero)
+        return self.grupos[numero]
+
+    def _menor_grupo(self, ignorar=None):
+        """Retorna o menor grupo não vazio (o primeiro da lista em caso de empate) ou None."""
+        heap = self.heap
+        adiados = []
+        menor = None
+
+        while heap:
+            tamanho, numero = heap[0]
+            if len(self.grupos[numero]) != tamanho or not tamanho:
+                heapq.heappop(heap)
+            elif numero == ignorar:
+                adiados.append(heapq.heappop(heap))
+            else:
+                menor = numero
+                break
+
+        for entrada in adiados:
+            heapq.heappush(heap, entrada)
+        return menor
+
+    def _inserir(self, estudante, numero):
+        """Coloca um estudante no grupo informado e atualiza o índice e o heap."""
+        grupo = self._grupo_editavel(numero)
+        grupo.append(estudante)
+        self.grupo_de[estudante.get("matricula", "")] = numero
+        heapq.heappush(self.heap, (len(grupo), numero))
+
+    def remover(self, matricula):
+        """
+        Retira um estudante do seu grupo.
+
+        Args:
+            matricula (str): Matrícula do estudante
+
+        Returns:
+            bool: True se o estudante estava em algum grupo
+        """
+        numero = self.grupo_de.pop(matricula, None)
+        if numero is None:
+            return False
+
+        grupo = self._grupo_editavel(numero)
+        for posicao, estudante in enumerate(grupo):
+            if estudante.get("matricula", "") == matricula:
+                del grupo[posicao]
+                break
+
+        if grupo:
+            heapq.heappush(self.heap, (len(grupo), numero))
+        return True
+
+    def adicionar(self, estudantes):
+        """
+        Distribui novos estudantes pelas vagas abertas e, sem vagas, em grupos novos.
+
+        Args:
+            estudantes (list): Estudantes que entram na turma
+
+        Returns:
+            list: Estudantes ignorados por já estarem em algum grupo
+        """
+        ignorados = []
+        pendentes = []
+
+        for estudante in estudantes:
+            if estudante.get("matricula", "") in self.grupo_de:
+                ignorados.append(estudante)
+                continue
+
+            menor = self._menor_grupo()
+            if menor is not None and len(self.grupos[menor]) < self.tamanho_grupo:
+                self._inserir(estudante, menor)
+            else:
+                pendentes.append(estudante)
+
+        for inicio in range(0, len(pendentes), self.tamanho_grupo):
+            numero = len(self.grupos)
+            self.grupos.append([])
+            self.copiados.add(numero)
+            for estudante in pendentes[inicio : inicio + self.tamanho_grupo]:
+                self._inserir(estudante, numero)
+
+        return ignorados
+
+    def aplicar_regra_solitarios(self):
+        """
+        Aplica as regras de solitários aos grupos alterados que ficaram com 1 estudante.
+
+        O estudante vai para o menor outro grupo se couber (ou sempre, se grupos
+        maiores forem permitidos); caso contrário, permanece sozinho.
+        """
+        if not self.redistribuir_solitarios:
+            return
+
+        for numero in sorted(self.alterados, reverse=True):
+            grupo = self.grupos[numero]
+            if len(grupo) != 1:
+                continue
+
+            destino = self._menor_grupo(ignorar=numero)
+            if destino is None or not (self.permitir_grupos_maiores or len(self.grupos[destino]) < self.tamanho_grupo):
+                continue
+
+            estudante = grupo.pop()
+            self._inserir(estudante, destino)
+            if numero < self.total_original:
+                self.movidos += 1
+
+    def resultado(self):
+        """
+        Retorna os grupos atualizados, sem os grupos que ficaram vazios.
+
+        Returns:
+            list: Lista de grupos de estudantes
+        """
+        return [grupo for grupo in self.grupos if grupo]
+
+
+def reformar_incremental(
+    item,
+    entradas=None,
+    saidas=None,
+    tamanho_grupo=None,
+    redistribuir_solitarios=True,
+    permitir_grupos_maiores=True,
+    relatorio=None,
+):
+    """
+    Atualiza os grupos de um item do histórico com as entradas e saídas da turma.
+
+    Os estudantes que não entram nem saem continuam no mesmo grupo, exceto os que
+    ficariam sozinhos e são redistribuídos.
+
+    Args:
+        item (dict): Item do histórico com "grupos", "estudantes" e "tamanho_grupo"
+        entradas (list, optional): Estudantes que entram na turma
+        saidas (list, optional): Matrículas dos estudantes que saem
+        tamanho_grupo (int, optional): Tamanho alvo; por padrão, o do item
+        redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+        relatorio (dict, optional): Se informado, recebe o resumo das alterações
+
+    Returns:
+        dict: Novo item com os grupos e a lista de estudantes atualizados (sem "id",
+        "data" e "descricao", que ficam a cargo de quem salva)
+    """
+    entradas = entradas or []
+    # Uma matrícula repetida sai uma vez só (a segunda busca falharia e a contaria como não encontrada)
+    saidas = list(dict.fromkeys(str(matricula).strip() for matricula in (saidas or [])))
+    tamanho_grupo = tamanho_grupo or item.get("tamanho_grupo", 3)
+
+    formacao = FormacaoIncremental(item["grupos"], tamanho_grupo, redistribuir_solitarios, permitir_grupos_maiores)
+    nao_encontrados = [matricula for matricula in saidas if not formacao.remover(matricula)]
+    ignorados = formacao.adicionar(entradas)
+    formacao.aplicar_regra_solitarios()
+    grupos = formacao.resultado()
+
+    removidos = set(saidas) - set(nao_encontrados)
+    ignorados_ids = {id(estudante) for estudante in ignorados}
+    estudantes = [e for e in item.get("estudantes", []) if e.get("matricula", "") not in removidos]
+    estudantes += [e for e in entradas if id(e) not in ignorados_ids]
+
+    if relatorio is not None:
+        relatorio.update(
+            {
+                "adicionados": len(entradas) - len(ignorados),
+                "removidos": len(removidos),
+                "movidos": formacao.movidos,
+                "grupos_alterados": len([n for n in formacao.alterados if formacao.grupos[n]]),
+                "nao_encontrados": nao_encontrados,
+                "ignorados": [e.get("matricula", "") for e in ignorados],
+            }
+        )
+
+    return {
+        "grupos": grupos,
+        "estudantes": estudantes,
+        "tamanho_grupo": tamanho_grupo,
+        "metodo": item.get("metodo", "Aleatório"),
+    }
@@ -0,0 +1,401 @@
+"""
+Módulo de busca local.
+Melhora uma formação trocando estudantes de grupo, guiada por um pontuador incremental.
+
+Um pontuador guarda a atribuição atual (grupo_de) e sabe calcular a variação do
+custo de uma troca sem reavaliar a formação inteira. Interface esperada:
+
+    grupo_de (list): Grupo atual de cada estudante
+    custo (float): Custo atual da formação (0 = nenhuma penalidade)
+    candidatos (ndarray): Estudantes cujas trocas podem alterar o custo
+    delta_troca(a, b): Variação do custo se a e b trocarem de grupo
+    aplicar_troca(a, b): Efetiva a troca e atualiza o custo
+
+Opcionalmente, grupo_sugerido(a, sorteio) pode indicar um grupo de destino promissor
+para o estudante a (ex.: o grupo de um parceiro), usando sorteio em [0, 1) para
+escolher entre as opções; a busca então troca a com um membro desse grupo.
+
+Há duas buscas: busca_local_trocas, que só aceita trocas que não pioram o custo e
+para ao atingir custo zero, e recozimento_simulado, que aceita pioras com uma
+probabilidade decrescente e usa todo o orçamento de tempo, para objetivos sem um
+custo zero conhecido (ex.: diversidade).
+
+Parar pelo relógio faz o resultado depender da velocidade da máquina. Com uma
+semente, os métodos convertem o orçamento de tempo em um número fixo de trocas
+(iteracoes_reproduziveis); o tempo passa a ser só um teto de segurança. As duas
+buscas indicam em "interrompida_pelo_tempo" se foi o relógio que as parou.
+"""
+
+import math
+import time
+
+import numpy as np
+
+from logic.random_streams import gerador_numpy
+
+# Quantidade de trocas sorteadas de uma vez (e intervalo entre verificações do relógio)
+TAMANHO_LOTE = 1024
+
+# Trocas avaliadas para estimar a temperatura inicial do recozimento
+AMOSTRA_TEMPERATURA = 200
+
+# Trocas avaliadas por segundo de orçamento quando o resultado precisa ser reproduzível;
+# conservador, para que a busca caiba no orçamento mesmo em máquinas lentas
+ITERACOES_POR_SEGUNDO = 50_000
+
+# Com um máximo de iterações, a busca só para pelo relógio após esse múltiplo do orçamento
+FATOR_TETO_TEMPO = 5
+
+# Probabilidade de aceitar uma piora média no início do recozimento
+ACEITACAO_INICIAL = 0.5
+
+# Temperatura final, como fração da inicial
+FRACAO_TEMPERATURA_FINAL = 1e-3
+
+
+def iteracoes_reproduziveis(tempo_limite, semente):
+    """
+    Converte o orçamento de tempo em um número fixo de trocas quando há semente.
+
+    Args:
+        tempo_limite (float): Orçamento de tempo da busca em segundos
+        semente (int, optional): Semente da formação
+
+    Returns:
+        int or None: Máximo de iterações (ao menos um lote), ou None sem semente (a
+        busca então para pelo relógio)
+    """
+    if semente is None:
+        return None
+    return max(TAMANHO_LOTE, int(tempo_limite * ITERACOES_POR_SEGUNDO))
+
+
+def atribuicao_de_grupos(grupos_indices, total):
+    """
+    Converte grupos de índices em um vetor com o grupo de cada estudante.
+
+    Args:
+        grupos_indices (list): Lista de arrays de índices
+        total (int): Número total de estudantes
+
+    Returns:
+        ndarray: Número do grupo (0-indexed) de cada estudante
+    """
+    grupo_de = np.empty(total, dtype=np.intp)
+    for numero, grupo in enumerate(grupos_indices):
+        grupo_de[grupo] = numero
+    return grupo_de
+
+
+def grupos_de_atribuicao(grupo_de, num_grupos):
+    """
+    Converte o vetor de grupos de cada estudante em grupos de índices.
+
+    Args:
+        grupo_de (ndarray or list): Número do grupo (0-indexed) de cada estudante
+        num_grupos (int): Número de grupos
+
+    Returns:
+        list: Lista de arrays de índices, um por grupo
+    """
+    grupo_de = np.asarray(grupo_de, dtype=np.intp)
+    ordem = np.argsort(grupo_de, kind="stable")
+    limites = np.cumsum(np.bincount(grupo_de, minlength=num_grupos))[:-1]
+    return np.split(ordem, limites)
+
+
+class MembrosGrupos:
+    """
+    Membros de cada grupo com posição de cada estudante, para sortear alguém de um
+    grupo e registrar trocas em O(1).
+    """
+
+    def __init__(self, grupo_de):
+        """
+        Inicializa a partir da atribuição atual.
+
+        Args:
+            grupo_de (list): Grupo atual de cada estudante
+        """
+        self.membros = {}
+        self.posicao = [0] * len(grupo_de)
+        for i, g in enumerate(grupo_de):
+            lista = self.membros.setdefault(g, [])
+            self.posicao[i] = len(lista)
+            lista.append(i)
+
+    def sortear(self, grupo, sorteio):
+        """
+        Escolhe um membro do grupo a partir de um número em [0, 1).
+
+        Args:
+            grupo (int): Número do grupo
+            sorteio (float): Número em [0, 1)
+
+        Returns:
+            int: Índice do estudante escolhido
+        """
+        lista = self.membros[grupo]
+        return lista[int(sorteio * len(lista))]
+
+    def trocar(self, a, b, ga, gb):
+        """
+        Registra a troca de a (do grupo ga) com b (do grupo gb).
+
+        Args:
+            a (int): Índice do primeiro estudante
+            b (int): Índice do segundo estudante
+            ga (int): Grupo original de a
+            gb (int): Grupo original de b
+        """
+        posicao = self.posicao
+        self.membros[ga][posicao[a]] = b
+        self.membros[gb][posicao[b]] = a
+        posicao[a], posicao[b] = posicao[b], posicao[a]
+
+
+def busca_local_trocas(pontuador, tempo_limite=1.0, max_iteracoes=None, semente=None, gerador=None):
+    """
+    Executa uma busca local por trocas aleatórias entre grupos.
+
+    Trocas que não pioram o custo são aceitas (movimentos laterais ajudam a sair de
+    platôs), de modo que a atribuição atual é sempre a melhor encontrada. A busca
+    termina ao atingir custo zero, o tempo limite ou o máximo de iterações; com
+    max_iteracoes, o tempo limite vira um teto de segurança (FATOR_TETO_TEMPO vezes
+    maior) e, com uma semente, o resultado é reproduzível.
+
+    Args:
+        pontuador: Pontuador incremental (ver docstring do módulo)
+        tempo_limite (float): Tempo máximo de busca em segundos
+        max_iteracoes (int, optional): Número máximo de trocas avaliadas (ver
+            iteracoes_reproduziveis)
+        semente (int, optional): Semente para reprodutibilidade do sorteio
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+
+    Returns:
+        dict: Atribuição final e estatísticas da busca ("interrompida_pelo_tempo" indica
+        se o relógio parou a busca antes do custo zero ou do máximo de iterações)
+    """
+    rng = gerador_numpy(semente, gerador)
+    total = len(pontuador.grupo_de)
+    limite_iteracoes = max_iteracoes if max_iteracoes is not None else float("inf")
+    if max_iteracoes is not None:
+        tempo_limite *= FATOR_TETO_TEMPO
+    membros = MembrosGrupos(pontuador.grupo_de)
+
+    custo_inicial = pontuador.custo
+    iteracoes = 0
+    melhorias = 0
+    interrompida = False
+    inicio = time.perf_counter()
+
+    pode_buscar = total > 1 and len(pontuador.candidatos) > 0
+    while pode_buscar and pontuador.custo > 0 and iteracoes < limite_iteracoes:
+        if time.perf_counter() - inicio >= tempo_limite:
+            interrompida = True
+            break
+
+        lote = min(TAMANHO_LOTE, limite_iteracoes - iteracoes)
+        avaliadas, aceitas = _executar_lote(pontuador, membros, rng, int(lote))
+        iteracoes += avaliadas
+        melhorias += aceitas
+
+    return {
+        "grupo_de": np.array(pontuador.grupo_de, dtype=np.intp),
+        "custo": pontuador.custo,
+        "custo_inicial": custo_inicial,
+        "iteracoes": iteracoes,
+        "melhorias": melhorias,
+        "tempo": time.perf_counter() - inicio,
+        "interrompida_pelo_tempo": interrompida,
+    }
+
+
+def _executar_lote(pontuador, membros, rng, tamanho):
+    """
+    Avalia um lote de trocas sorteadas, aplicando as que não pioram o custo.
+
+    Returns:
+        tuple: (trocas avaliadas, trocas que reduziram o custo)
+    """
+    grupo_de = pontuador.grupo_de
+    candidatos = pontuador.candidatos
+    grupo_sugerido = getattr(pontuador, "grupo_sugerido", None)
+
+    origens = candidatos[rng.integers(len(candidatos), size=tamanho)].tolist()
+    destinos = rng.integers(len(grupo_de), size=tamanho).tolist()
+    sorteios = rng.random((tamanho, 2)).tolist()
+
+    avaliadas = 0
+    melhorias = 0
+    for a, b, (sorteio, escolha) in zip(origens, destinos, sorteios):
+        avaliadas += 1
+
+        # Metade das propostas vai para um grupo sugerido pelo pontuador
+        if grupo_sugerido is not None and escolha < 0.5:
+            sugerido = grupo_sugerido(a, sorteio)
+            if sugerido is not None:
+                b = membros.sortear(sugerido, escolha * 2)
+
+        ga = grupo_de[a]
+        gb = grupo_de[b]
+        if ga == gb:
+            continue
+
+        delta = pontuador.delta_troca(a, b)
+        if delta > 0:
+            continue
+
+        pontuador.aplicar_troca(a, b)
+        membros.trocar(a, b, ga, gb)
+        if delta < 0:
+            melhorias += 1
+            if pontuador.custo <= 0:
+                break
+
+    return avaliadas, melhorias
+
+
+def temperatura_inicial(pontuador, rng, amostra=AMOSTRA_TEMPERATURA):
+    """
+    Estima a temperatura inicial a partir das pioras de trocas sorteadas, de modo que
+    uma piora média seja aceita com probabilidade ACEITACAO_INICIAL.
+
+    Args:
+        pontuador: Pontuador incremental (ver docstring do módulo)
+        rng (numpy.random.Generator): Gerador da busca
+        amostra (int): Número de trocas avaliadas (nenhuma é aplicada)
+
+    Returns:
+        float: Temperatura inicial (0 se nenhuma troca piora o custo)
+    """
+    grupo_de = pontuador.grupo_de
+    origens = pontuador.candidatos[rng.integers(len(pontuador.candidatos), size=amostra)].tolist()
+    destinos = rng.integers(len(grupo_de), size=amostra).tolist()
+
+    deltas = [pontuador.delta_troca(a, b) for a, b in zip(origens, destinos)]
+    pioras = [delta for delta in deltas if delta > 0]
+    if not pioras:
+        return 0.0
+    return -(sum(pioras) / len(pioras)) / math.log(ACEITACAO_INICIAL)
+
+
+def recozimento_simulado(pontuador, orcamento_ms=200, max_iteracoes=None, semente=None, gerador=None):
+    """
+    Executa um recozimento simulado (simulated annealing) por trocas entre grupos.
+
+    A temperatura cai geometricamente com a fração consumida do orçamento (ou das
+    iterações, quando max_iteracoes é informado; o orçamento vira então um teto de
+    segurança FATOR_TETO_TEMPO vezes maior): no início, pioras são aceitas com
+    frequência para escapar de mínimos locais; no final, a busca é quase gulosa. A
+    melhor atribuição é guardada ao final de cada lote e devolvida se a atual for pior.
+
+    Args:
+        pontuador: Pontuador incremental (ver docstring do módulo)
+        orcamento_ms (float): Orçamento de tempo em milissegundos
+        max_iteracoes (int, optional): Número máximo de trocas avaliadas; com ele, o
+            resfriamento segue as iterações e o resultado é reproduzível
+        semente (int, optional): Semente para reprodutibilidade do sorteio
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+
+    Returns:
+        dict: Melhor atribuição e estatísticas de convergência (custo por lote em
+        "convergencia", como pares (ms, melhor custo))
+    """
+    rng = gerador_numpy(semente, gerador)
+    total = len(pontuador.grupo_de)
+    orcamento = orcamento_ms / 1000
+    inicio = time.perf_counter()
+
+    custo_inicial = pontuador.custo
+    melhor_custo = custo_inicial
+    melhor = np.array(pontuador.grupo_de, dtype=np.intp)
+    iteracoes = 0
+    aceitas = 0
+    melhorias = 0
+    tempo_melhor = 0.0
+    interrompida = False
+    convergencia = [(0.0, custo_inicial)]
+
+    pode_buscar = total > 1 and len(pontuador.candidatos) > 0
+    t0 = temperatura_inicial(pontuador, rng) if pode_buscar else 0.0
+    temperatura = t0
+
+    while pode_buscar and pontuador.custo > 0:
+        decorrido = time.perf_counter() - inicio
+        if max_iteracoes is not None and iteracoes >= max_iteracoes:
+            break
+        if decorrido >= (orcamento if max_iteracoes is None else orcamento * FATOR_TETO_TEMPO):
+            interrompida = True
+            break
+
+        if max_iteracoes is not None:
+            fracao = iteracoes / max_iteracoes
+            lote = min(TAMANHO_LOTE, max_iteracoes - iteracoes)
+        else:
+            fracao = decorrido / orcamento
+            lote = TAMANHO_LOTE
+
+        temperatura = t0 * FRACAO_TEMPERATURA_FINAL**fracao
+        avaliadas, aceitas_lote, melhorias_lote = _executar_lote_recozimento(pontuador, rng, lote, temperatura)
+        iteracoes += avaliadas
+        aceitas += aceitas_lote
+        melhorias += melhorias_lote
+
+        if pontuador.custo < melhor_custo:
+            melhor_custo = pontuador.custo
+            melhor = np.array(pontuador.grupo_de, dtype=np.intp)
+            tempo_melhor = time.perf_counter() - inicio
+        convergencia.append(((time.perf_counter() - inicio) * 1000, melhor_custo))
+
+    return {
+        "grupo_de": melhor,
+        "custo": melhor_custo,
+        "custo_inicial": custo_inicial,
+        "iteracoes": iteracoes,
+        "aceitas": aceitas,
+        "melhorias": melhorias,
+        "temperatura_inicial": t0,
+        "temperatura_final": temperatura,
+        "tempo": time.perf_counter() - inicio,
+        "tempo_ate_melhor": tempo_melhor,
+        "convergencia": convergencia,
+        "interrompida_pelo_tempo": interrompida,
+    }
+
+
+def _executar_lote_recozimento(pontuador, rng, tamanho, temperatura):
+    """
+    Avalia um lote de trocas sorteadas pelo critério de Metropolis.
+
+    Returns:
+        tuple: (trocas avaliadas, trocas aceitas, trocas que reduziram o custo)
+    """
+    grupo_de = pontuador.grupo_de
+    candidatos = pontuador.candidatos
+
+    origens = candidatos[rng.integers(len(candidatos), size=tamanho)].tolist()
+    destinos = rng.integers(len(grupo_de), size=tamanho).tolist()
+    # Limiares de aceitação pré-sorteados: aceitar se delta <= -T * ln(u)
+    limiares = (-temperatura * np.log1p(-rng.random(tamanho))).tolist()
+
+    avaliadas = 0
+    aceitas = 0
+    melhorias = 0
+    for a, b, limiar in zip(origens, destinos, limiares):
+        avaliadas += 1
+        if grupo_de[a] == grupo_de[b]:
+            continue
+
+        delta = pontuador.delta_troca(a, b)
+        if delta > limiar:
+            continue
+
+        pontuador.aplicar_troca(a, b)
+        aceitas += 1
+        if delta < 0:
+            melhorias += 1
+            if pontuador.custo <= 0:
+                break
+
+    return avaliadas, aceitas, melhorias
@@ -0,0 +1,228 @@
+"""
+Módulo de busca com várias sementes.
+Executa K tentativas de formação, cada uma com sua própria semente, e fica com a de
+menor pontuação segundo um objetivo plugável.
+
+Um objetivo é uma função objetivo(estudantes, grupos_indices, relatorio) que devolve
+um número (menor = melhor), onde relatorio traz as estatísticas da própria tentativa
+(ex.: "violacoes" ou "pares_repetidos"). Pode ser passado pelo nome (ver OBJETIVOS)
+ou como função; para rodar em paralelo, a função precisa ser definida no nível do
+módulo (lambdas não podem ser enviadas a outros processos).
+
+Em turmas pequenas, as tentativas rodam em série: criar processos custaria mais do
+que as próprias formações (ver logic.worker_pool).
+"""
+
+import concurrent.futures
+import time
+
+from logic.balancing import pontuacoes_estudantes, tem_pontuacao
+from logic.random_streams import sortear_sementes
+from logic.worker_pool import contexto_trabalhador, criar_executor, planejar_trabalhadores
+
+
+def objetivo_violacoes(estudantes, grupos_indices, relatorio):
+    """Restrições não atendidas (método "Restrições")."""
+    return relatorio.get("violacoes", 0)
+
+
+def objetivo_pares_repetidos(estudantes, grupos_indices, relatorio):
+    """Pares que já se encontraram no histórico (método "Novos parceiros")."""
+    return relatorio.get("pares_repetidos", 0)
+
+
+def objetivo_custo_otimizacao(estudantes, grupos_indices, relatorio):
+    """Custo final da otimização por objetivos (método "Diversidade")."""
+    return relatorio.get("custo", 0)
+
+
+def objetivo_dispersao_pontuacao(estudantes, grupos_indices, relatorio):
+    """Diferença entre a maior e a menor média de pontuação dos grupos."""
+    if not tem_pontuacao(estudantes):
+        return 0.0
+    pontuacoes = pontuacoes_estudantes(estudantes)
+    medias = [pontuacoes[grupo].mean() for grupo in grupos_indices if len(grupo)]
+    return float(max(medias) - min(medias))
+
+
+def objetivo_dispersao_tamanhos(estudantes, grupos_indices, relatorio):
+    """Diferença entre o maior e o menor grupo."""
+    tamanhos = [len(grupo) for grupo in grupos_indices]
+    return max(tamanhos) - min(tamanhos)
+
+
+# Objetivos disponíveis pelo nome
+OBJETIVOS = {
+    "violacoes": objetivo_violacoes,
+    "pares_repetidos": objetivo_pares_repetidos,
+    "custo_otimizacao": objetivo_custo_otimizacao,
+    "dispersao_pontuacao": objetivo_dispersao_pontuacao,
+    "dispersao_tamanhos": objetivo_dispersao_tamanhos,
+}
+
+# Objetivo usado quando nenhum é informado, por método
+OBJETIVO_PADRAO = {
+    "Restrições": "violacoes",
+    "Novos parceiros": "pares_repetidos",
+    "Balanceado": "dispersao_pontuacao",
+    "Diversidade": "custo_otimizacao",
+}
+
+
+def resolver_objetivo(objetivo, metodo=None):
+    """
+    Obtém a função objetivo a partir do nome, da função ou do método de formação.
+
+    Args:
+        objetivo (str or callable, optional): Nome em OBJETIVOS ou função objetivo
+        metodo (str, optional): Método de formação, usado para escolher o objetivo padrão
+
+    Returns:
+        callable: Função objetivo
+    """
+    if objetivo is None:
+        objetivo = OBJETIVO_PADRAO.get(metodo, "dispersao_tamanhos")
+
+    if callable(objetivo):
+        return objetivo
+
+    if objetivo not in OBJETIVOS:
+        raise ValueError(f"Objetivo desconhecido: {objetivo}. Use um de {sorted(OBJETIVOS)}")
+
+    return OBJETIVOS[objetivo]
+
+
+def executar_tentativa(formar, estudantes, parametros, objetivo, semente):
+    """
+    Executa uma tentativa de formação com a semente informada e a pontua.
+
+    Args:
+        formar (callable): Função que forma os grupos de índices
+        estudantes (list): Lista de dicionários com dados dos estudantes
+        parametros (dict): Argumentos nomeados repassados a formar
+        objetivo (callable): Função objetivo
+        semente (int): Semente da tentativa
+
+    Returns:
+        tuple: (pontuação, grupos de índices, relatório da tentativa)
+    """
+    relatorio = {}
+    grupos_indices = formar(estudantes, semente=semente, relatorio=relatorio, **parametros)
+    return objetivo(estudantes, grupos_indices, relatorio), grupos_indices, relatorio
+
+
+def _executar_no_trabalhador(semente):
+    """Executa uma tentativa usando o contexto do processo trabalhador."""
+    contexto = contexto_trabalhador()
+    return executar_tentativa(
+        contexto["formar"], contexto["estudantes"], contexto["parametros"], contexto["objetivo"], semente
+    )
+
+
+def _executar_em_serie(formar, estudantes, parametros, objetivo, sementes, tempo_maximo):
+    """Executa as tentativas em ordem até acabarem ou o tempo esgotar (ao menos uma)."""
+    inicio = time.perf_counter()
+    resultados = {}
+
+    for posicao, semente in enumerate(sementes):
+        if resultados and tempo_maximo is not None and time.perf_counter() - inicio >= tempo_maximo:
+            break
+        resultados[posicao] = executar_tentativa(formar, estudantes, parametros, objetivo, semente)
+
+    return resultados
+
+
+def _executar_em_paralelo(formar, estudantes, parametros, objetivo, sementes, tempo_maximo, trabalhadores):
+    """Distribui as tentativas entre processos e coleta as concluídas no tempo máximo."""
+    resultados = {}
+    executor = criar_executor(
+        trabalhadores, formar=formar, estudantes=estudantes, parametros=parametros, objetivo=objetivo
+    )
+
+    try:
+        futuros = {
+            executor.submit(_executar_no_trabalhador, semente): posicao for posicao, semente in enumerate(sementes)
+        }
+        try:
+            for futuro in concurrent.futures.as_completed(futuros, timeout=tempo_maximo):
+                resultados[futuros[futuro]] = futuro.result()
+        except concurrent.futures.TimeoutError:
+            # Sem nenhuma tentativa concluída, espera pela primeira
+            if not resultados:
+                concluidos, _ = concurrent.futures.wait(futuros, return_when=concurrent.futures.FIRST_COMPLETED)
+                for futuro in concluidos:
+                    resultados[futuros[futuro]] = futuro.result()
+    finally:
+        # Tentativas ainda na fila são canceladas; as em execução terminam em segundo plano
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    return resultados
+
+
+def buscar_melhor_semente(
+    formar,
+    estudantes,
+    parametros,
+    tentativas,
+    objetivo,
+    semente=None,
+    gerador=None,
+    max_trabalhadores=None,
+    tempo_maximo=None,
+    relatorio=None,
+):
+    """
+    Executa várias tentativas de formação e devolve a de menor pontuação.
+
+    Em caso de empate, vence a tentativa sorteada primeiro, de modo que o resultado
+    não depende da ordem em que os processos terminam.
+
+    Args:
+        formar (callable): Função formar(estudantes, semente=..., relatorio=..., **parametros)
+            que devolve grupos de índices; precisa ser definida no nível do módulo
+        estudantes (list): Lista de dicionários com dados dos estudantes
+        parametros (dict): Argumentos nomeados repassados a formar em cada tentativa
+        tentativas (int): Número de tentativas
+        objetivo (callable): Função objetivo (ver resolver_objetivo)
+        semente (int, optional): Semente base das sementes das tentativas
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+        max_trabalhadores (int, optional): Máximo de processos (padrão:
+            logic.worker_pool.MAX_TRABALHADORES)
+        tempo_maximo (float, optional): Tempo máximo total em segundos; tentativas não
+            concluídas nesse tempo são descartadas (ao menos uma sempre conclui)
+        relatorio (dict, optional): Se informado, recebe o relatório da melhor tentativa,
+            sua semente e sua pontuação; "interrompida_pelo_tempo" indica se o tempo
+            máximo descartou tentativas ou o relógio parou a busca de alguma delas
+
+    Returns:
+        list: Lista de arrays de índices da melhor tentativa
+    """
+    sementes = sortear_sementes(tentativas, semente, gerador)
+
+    trabalhadores, paralelo = planejar_trabalhadores(tentativas, len(estudantes) * tentativas, max_trabalhadores)
+
+    if paralelo:
+        resultados = _executar_em_paralelo(
+            formar, estudantes, parametros, objetivo, sementes, tempo_maximo, trabalhadores
+        )
+    else:
+        resultados = _executar_em_serie(formar, estudantes, parametros, objetivo, sementes, tempo_maximo)
+
+    melhor = min(resultados, key=lambda posicao: (resultados[posicao][0], posicao))
+    pontuacao, grupos_indices, relatorio_melhor = resultados[melhor]
+
+    if relatorio is not None:
+        relatorio.update(relatorio_melhor)
+        relatorio.update(
+            {
+                "semente": sementes[melhor],
+                "pontuacao": pontuacao,
+                "tentativas": len(sementes),
+                "tentativas_concluidas": len(resultados),
+                "paralelo": paralelo,
+                "interrompida_pelo_tempo": len(resultados) < len(sementes)
+                or any(r[2].get("interrompida_pelo_tempo", False) for r in resultados.values()),
+            }
+        )
+
+    return grupos_indices
@@ -0,0 +1,206 @@
+"""
+Módulo de nomes semelhantes.
+Procura a mesma pessoa cadastrada duas vezes com matrículas diferentes, como
+"João da Silva" e "Joao Silva", sem comparar todos os pares de nomes.
+
+Etapas:
+    - Normalização: sem acentos, em minúsculas, sem partículas ("da", "de", "dos", ...)
+      e com as palavras em ordem alfabética. Nomes com a mesma chave normalizada
+      ficam juntos em um índice invertido chave -> estudantes e são sempre semelhantes.
+    - Bloqueio por vizinhança ordenada: as chaves distintas são ordenadas duas vezes
+      (pelo texto e pelo texto invertido, para pegar erros no início ou no fim) e cada
+      chave só é comparada com as JANELA seguintes em cada ordem. O custo fica em
+      O(chaves * JANELA) comparações, em vez de O(chaves²).
+    - Verificação: coeficiente de Dice entre os trigramas das duas chaves.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+
+import numpy as np
+
+from logic.roster import valores_coluna
+
+# Partículas ignoradas na comparação de nomes
+PARTICULAS = frozenset({"da", "das", "de", "di", "do", "dos", "du", "e"})
+
+# Coeficiente de Dice mínimo (entre os trigramas) para considerar dois nomes semelhantes
+LIMIAR_SEMELHANCA = 0.8
+
+# Número de chaves seguintes comparadas com cada chave, em cada ordenação
+JANELA = 5
+
+_PADRAO_PALAVRA = re.compile(r"[^\W_]+")
+
+
+def palavras_simples(texto):
+    """
+    Separa um texto em palavras sem acentos e em minúsculas.
+
+    Args:
+        texto (str): Texto qualquer (ex.: nome do estudante)
+
+    Returns:
+        list: Palavras, na ordem em que aparecem
+    """
+    texto = str(texto).casefold()
+    if not texto.isascii():
+        texto = "".join(c for c in unicodedata.normalize("NFKD", texto) if not unicodedata.combining(c))
+    return _PADRAO_PALAVRA.findall(texto)
+
+
+def normalizar_nome(nome):
+    """
+    Normaliza um nome para comparação.
+
+    Args:
+        nome (str): Nome do estudante
+
+    Returns:
+        str: Palavras sem acentos, em minúsculas, sem partículas e em ordem alfabética
+    """
+    return " ".join(sorted(palavra for palavra in palavras_simples(nome) if palavra not in PARTICULAS))
+
+
+def trigramas(chave):
+    """
+    Calcula os trigramas de um nome normalizado, com espaços nas pontas.
+
+    Args:
+        chave (str): Nome normalizado
+
+    Returns:
+        set: Conjunto de trigramas
+    """
+    texto = f" {chave} "
+    return {texto[i : i + 3] for i in range(len(texto) - 2)}
+
+
+def comparar_vizinhas(chaves, limiar=LIMIAR_SEMELHANCA):
+    """
+    Compara cada chave com as JANELA seguintes, na ordem do texto e do texto invertido.
+
+    As interseções de cada deslocamento são calculadas de uma vez em uma compreensão
+    de listas e o limiar é aplicado com NumPy.
+
+    Args:
+        chaves (list): Chaves normalizadas distintas
+        limiar (float): Coeficiente de Dice mínimo entre os trigramas, de 0 a 1
+
+    Returns:
+        tuple: ({(chave, outra): similaridade} dos pares acima do limiar, comparações feitas)
+    """
+    semelhantes = {}
+    comparacoes = 0
+
+    conjunto_de = {chave: trigramas(chave) for chave in chaves}
+
+    for ordem in (sorted(chaves), sorted(chaves, key=lambda chave: chave[::-1])):
+        conjuntos = [conjunto_de[chave] for chave in ordem]
+        tamanhos = np.array([len(conjunto) for conjunto in conjuntos])
+
+        for deslocamento in range(1, min(JANELA, len(ordem) - 1) + 1):
+            comuns = np.array([len(a & b) for a, b in zip(conjuntos, conjuntos[deslocamento:])])
+            similaridades = 2 * comuns / (tamanhos[:-deslocamento] + tamanhos[deslocamento:])
+            comparacoes += len(comuns)
+            for posicao in np.flatnonzero(similaridades >= limiar).tolist():
+                par = (ordem[posicao], ordem[posicao + deslocamento])
+                semelhantes[par] = float(similaridades[posicao])
+
+    return semelhantes, comparacoes
+
+
+def encontrar_pares_semelhantes(matriculas, nomes, limiar=LIMIAR_SEMELHANCA, limite=None, relatorio=None):
+    """
+    Encontra pares de nomes semelhantes com matrículas diferentes.
+
+    Args:
+        matriculas (list): Matrícula de cada linha
+        nomes (list): Nome de cada linha, na mesma ordem
+        limiar (float): Coeficiente de Dice mínimo entre os trigramas, de 0 a 1
+        limite (int, optional): Máximo de pares devolvidos (os das chaves que aparecem primeiro)
+        relatorio (dict, optional): Se informado, recebe o número de nomes distintos, de
+            comparações feitas, de pares de chaves semelhantes e de pares devolvidos
+
+    Returns:
+        list: Pares {"indices", "matriculas", "nomes", "similaridade"} ordenados pelos índices
+    """
+    matriculas = [str(matricula).strip() for matricula in matriculas]
+    nomes = list(nomes)
+
+    # Índice invertido chave normalizada -> estudantes; nomes só com partículas ficam de fora
+    membros = defaultdict(list)
+    for indice, nome in enumerate(nomes):
+        chave = normalizar_nome(nome)
+        if chave:
+            membros[chave].append(indice)
+
+    # Chaves iguais têm similaridade 1; as demais são comparadas só com as vizinhas
+    semelhantes, comparacoes = comparar_vizinhas(list(membros), limiar)
+    semelhantes.update({(chave, chave): 1.0 for chave, indices in membros.items() if len(indices) > 1})
+
+    # Pares de estudantes das chaves semelhantes, na ordem da primeira aparição das chaves
+    # (dentro da mesma chave, cada par uma vez); com limite, a expansão para ao atingi-lo
+    primeiro = {chave: indices[0] for chave, indices in membros.items()}
+    ordem = sorted(
+        semelhantes, key=lambda par: (min(primeiro[par[0]], primeiro[par[1]]), max(primeiro[par[0]], primeiro[par[1]]))
+    )
+    pares = []
+    for chave, outra in ordem:
+        pares.extend(
+            {
+                "indices": [a, b],
+                "matriculas": [matriculas[a], matriculas[b]],
+                "nomes": [nomes[a], nomes[b]],
+                "similaridade": semelhantes[chave, outra],
+            }
+            for a, b in _pares_indices(membros[chave], membros[outra], chave == outra)
+            if matriculas[a] != matriculas[b]
+        )
+        if limite is not None and len(pares) >= limite:
+            break
+
+    pares.sort(key=lambda par: par["indices"])
+    if limite is not None:
+        pares = pares[:limite]
+
+    if relatorio is not None:
+        relatorio.update(
+            {
+                "nomes": len(membros),
+                "comparacoes": comparacoes,
+                "chaves_semelhantes": len(semelhantes),
+                "pares": len(pares),
+            }
+        )
+
+    return pares
+
+
+def _pares_indices(indices, outros, mesma_chave):
+    """Gera os pares (menor, maior) de estudantes de duas chaves (ou de uma mesma chave)."""
+    for i in indices:
+        for j in outros:
+            if i < j:
+                yield i, j
+            elif j < i and not mesma_chave:
+                yield j, i
+
+
+def detectar_nomes_semelhantes(estudantes, limiar=LIMIAR_SEMELHANCA, limite=None, relatorio=None):
+    """
+    Encontra estudantes com nomes semelhantes e matrículas diferentes.
+
+    Args:
+        estudantes (list or Turma): Lista de dicionários de estudantes
+        limiar (float): Coeficiente de Dice mínimo entre os trigramas, de 0 a 1
+        limite (int, optional): Máximo de pares devolvidos
+        relatorio (dict, optional): Se informado, recebe as contagens da busca
+
+    Returns:
+        list: Pares {"indices", "matriculas", "nomes", "similaridade"} ordenados pelos índices
+    """
+    return encontrar_pares_semelhantes(
+        valores_coluna(estudantes, "matricula"), valores_coluna(estudantes, "nome"), limiar, limite, relatorio
+    )
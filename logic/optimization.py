@@ -0,0 +1,396 @@
+"""
+Módulo de otimização da qualidade dos grupos.
+Forma grupos aleatórios e os melhora por recozimento simulado dentro de um orçamento
+de tempo em milissegundos, segundo um ou mais objetivos plugáveis com pesos.
+
+Um objetivo é uma fábrica fabrica(estudantes, grupo_de, num_grupos, opcoes) que
+devolve um pontuador incremental (ver logic.local_search); opcoes é o dicionário de
+otimização inteiro, para que cada objetivo leia as suas chaves. Objetivos novos são
+registrados com registrar_objetivo. Formato das opções:
+
+    {
+        "objetivos": {"diversidade": 1.0, "pontuacao": 0.5},   # nome -> peso
+        "colunas": ["curso", "genero"],                        # colunas da diversidade
+    }
+"""
+
+import numpy as np
+import pandas as pd
+
+from logic.balancing import pontuacoes_estudantes, tem_pontuacao
+from logic.constraints import atributos_disponiveis
+from logic.local_search import (
+    atribuicao_de_grupos,
+    grupos_de_atribuicao,
+    iteracoes_reproduziveis,
+    recozimento_simulado,
+)
+from logic.partitioning import formar_grupos_indices
+from logic.random_streams import criar_gerador
+from logic.roster import CHAVE_PONTUACAO, valores_coluna
+
+# Objetivos usados quando as opções não informam nenhum
+OBJETIVOS_PADRAO = {"diversidade": 1.0}
+
+
+class PontuadorDiversidade:
+    """
+    Pontuador incremental da diversidade de colunas categóricas.
+
+    O custo é o número de pares de estudantes do mesmo grupo com o mesmo valor em
+    cada coluna; quanto menor, mais misturados estão os valores dentro dos grupos.
+    """
+
+    def __init__(self, grupo_de, num_grupos, codigos):
+        """
+        Inicializa o pontuador.
+
+        Args:
+            grupo_de (ndarray or list): Grupo inicial de cada estudante
+            num_grupos (int): Número de grupos
+            codigos (list): Para cada coluna, o código inteiro do valor de cada estudante
+        """
+        self.grupo_de = [int(g) for g in grupo_de]
+        self.codigos = [[int(c) for c in coluna] for coluna in codigos]
+
+        # Contagem de cada valor em cada grupo, por coluna
+        self.contagens = []
+        for coluna in self.codigos:
+            contagem = [[0] * (max(coluna, default=-1) + 1) for _ in range(num_grupos)]
+            for i, codigo in enumerate(coluna):
+                contagem[self.grupo_de[i]][codigo] += 1
+            self.contagens.append(contagem)
+
+        self.candidatos = np.arange(len(self.grupo_de) if self.codigos else 0, dtype=np.intp)
+        self.custo = self.custo_total()
+
+    def custo_total(self):
+        """
+        Calcula o custo da atribuição atual do zero.
+
+        Returns:
+            int: Pares de estudantes do mesmo grupo com o mesmo valor, somados nas colunas
+        """
+        return sum(c * (c - 1) // 2 for contagem in self.contagens for grupo in contagem for c in grupo)
+
+    def delta_troca(self, a, b):
+        """
+        Calcula a variação do custo se a e b trocarem de grupo.
+
+        Args:
+            a (int): Índice do primeiro estudante
+            b (int): Índice do segundo estudante
+
+        Returns:
+            int: Variação do número de pares repetidos
+        """
+        ga = self.grupo_de[a]
+        gb = self.grupo_de[b]
+        if ga == gb:
+            return 0
+
+        delta = 0
+        for coluna, contagem in zip(self.codigos, self.contagens):
+            va = coluna[a]
+            vb = coluna[b]
+            if va != vb:
+                delta += contagem[ga][vb] - contagem[ga][va] + contagem[gb][va] - contagem[gb][vb] + 2
+        return delta
+
+    def aplicar_troca(self, a, b):
+        """
+        Troca a e b de grupo e atualiza o custo.
+
+        Args:
+            a (int): Índice do primeiro estudante
+            b (int): Índice do segundo estudante
+        """
+        self.custo += self.delta_troca(a, b)
+        ga = self.grupo_de[a]
+        gb = self.grupo_de[b]
+
+        for coluna, contagem in zip(self.codigos, self.contagens):
+            va = coluna[a]
+            vb = coluna[b]
+            contagem[ga][va] -= 1
+            contagem[gb][va] += 1
+            contagem[gb][vb] -= 1
+            contagem[ga][vb] += 1
+
+        self.grupo_de[a] = gb
+        self.grupo_de[b] = ga
+
+
+class PontuadorPontuacao:
+    """
+    Pontuador incremental do equilíbrio das médias de pontuação.
+
+    O custo é a soma, nos grupos, do quadrado do desvio da média do grupo em relação
+    à média geral, em desvios-padrão e ponderado pelo tamanho do grupo.
+    """
+
+    def __init__(self, grupo_de, num_grupos, pontuacoes):
+        """
+        Inicializa o pontuador.
+
+        Args:
+            grupo_de (ndarray or list): Grupo inicial de cada estudante
+            num_grupos (int): Número de grupos
+            pontuacoes (ndarray): Pontuação de cada estudante (NaN = média geral)
+        """
+        self.grupo_de = [int(g) for g in grupo_de]
+        pontuacoes = np.asarray(pontuacoes, dtype=float)
+        definidas = pontuacoes[~np.isnan(pontuacoes)]
+        media = float(definidas.mean()) if len(definidas) else 0.0
+        desvio = float(definidas.std()) if len(definidas) else 0.0
+
+        # Pontuações centradas e em desvios-padrão; ausentes contam como a média
+        z = np.where(np.isnan(pontuacoes), 0.0, pontuacoes - media) / (desvio or 1.0)
+        self.z = z.tolist()
+        grupo = np.asarray(self.grupo_de, dtype=np.intp)
+        self.somas = np.bincount(grupo, weights=z, minlength=num_grupos).tolist()
+        self.tamanhos = np.bincount(grupo, minlength=num_grupos).tolist()
+
+        self.candidatos = np.arange(len(self.grupo_de) if desvio else 0, dtype=np.intp)
+        self.custo = self.custo_total()
+
+    def custo_total(self):
+        """
+        Calcula o custo da atribuição atual do zero.
+
+        Returns:
+            float: Soma dos quadrados dos desvios das médias dos grupos
+        """
+        return sum(soma * soma / tamanho for soma, tamanho in zip(self.somas, self.tamanhos) if tamanho)
+
+    def delta_troca(self, a, b):
+        """
+        Calcula a variação do custo se a e b trocarem de grupo.
+
+        Args:
+            a (int): Índice do primeiro estudante
+            b (int): Índice do segundo estudante
+
+        Returns:
+            float: Variação do custo
+        """
+        ga = self.grupo_de[a]
+        gb = self.grupo_de[b]
+        if ga == gb:
+            return 0.0
+
+        d = self.z[a] - self.z[b]
+        sa = self.somas[ga]
+        sb = self.somas[gb]
+        return ((sa - d) ** 2 - sa * sa) / self.tamanhos[ga] + ((sb + d) ** 2 - sb * sb) / self.tamanhos[gb]
+
+    def aplicar_troca(self, a, b):
+        """
+        Troca a e b de grupo e atualiza o custo.
+
+        Args:
+            a (int): Índice do primeiro estudante
+            b (int): Índice do segundo estudante
+        """
+        self.custo += self.delta_troca(a, b)
+        ga = self.grupo_de[a]
+        gb = self.grupo_de[b]
+
+        d = self.z[a] - self.z[b]
+        self.somas[ga] -= d
+        self.somas[gb] += d
+        self.grupo_de[a] = gb
+        self.grupo_de[b] = ga
+
+
+class PontuadorComposto:
+    """
+    Soma ponderada de vários pontuadores sobre a mesma atribuição.
+    """
+
+    def __init__(self, pontuadores, pesos):
+        """
+        Inicializa o pontuador.
+
+        Args:
+            pontuadores (list): Pontuadores incrementais, todos com a mesma atribuição inicial
+            pesos (list): Peso de cada pontuador
+        """
+        self.pontuadores = pontuadores
+        self.pesos = pesos
+        self.grupo_de = pontuadores[0].grupo_de
+        self.candidatos = np.unique(np.concatenate([p.candidatos for p in pontuadores])).astype(np.intp)
+        self.custo = sum(peso * p.custo for p, peso in zip(pontuadores, pesos))
+
+    def delta_troca(self, a, b):
+        """Variação ponderada do custo se a e b trocarem de grupo."""
+        return sum(peso * p.delta_troca(a, b) for p, peso in zip(self.pontuadores, self.pesos))
+
+    def aplicar_troca(self, a, b):
+        """Troca a e b de grupo em todos os pontuadores."""
+        for p in self.pontuadores:
+            p.aplicar_troca(a, b)
+        self.custo = sum(peso * p.custo for p, peso in zip(self.pontuadores, self.pesos))
+
+
+def colunas_diversidade(estudantes, opcoes):
+    """
+    Obtém as colunas usadas na diversidade (por padrão, todos os atributos).
+
+    Args:
+        estudantes (list or Turma): Estudantes
+        opcoes (dict): Opções de otimização
+
+    Returns:
+        list: Nomes das colunas
+    """
+    colunas = opcoes.get("colunas")
+    if colunas is None:
+        colunas = [atributo for atributo in atributos_disponiveis(estudantes) if atributo != CHAVE_PONTUACAO]
+    return list(colunas)
+
+
+def criar_pontuador_diversidade(estudantes, grupo_de, num_grupos, opcoes):
+    """Objetivo "diversidade": mistura os valores das colunas categóricas em cada grupo."""
+    codigos = []
+    for coluna in colunas_diversidade(estudantes, opcoes):
+        valores = pd.Series(valores_coluna(estudantes, coluna), dtype=object).fillna("")
+        codigos.append(pd.factorize(valores.astype(str).str.strip().str.lower())[0])
+    return PontuadorDiversidade(grupo_de, num_grupos, codigos)
+
+
+def criar_pontuador_pontuacao(estudantes, grupo_de, num_grupos, opcoes):
+    """Objetivo "pontuacao": aproxima a média de pontuação de cada grupo da média geral."""
+    if tem_pontuacao(estudantes):
+        pontuacoes = pontuacoes_estudantes(estudantes)
+    else:
+        pontuacoes = np.full(len(grupo_de), np.nan)
+    return PontuadorPontuacao(grupo_de, num_grupos, pontuacoes)
+
+
+# Objetivos disponíveis pelo nome
+OBJETIVOS_OTIMIZACAO = {
+    "diversidade": criar_pontuador_diversidade,
+    "pontuacao": criar_pontuador_pontuacao,
+}
+
+
+def registrar_objetivo(nome, fabrica):
+    """
+    Registra um novo objetivo de otimização.
+
+    Args:
+        nome (str): Nome usado em opcoes["objetivos"]
+        fabrica (callable): Função fabrica(estudantes, grupo_de, num_grupos, opcoes) que
+            devolve um pontuador incremental; precisa ser definida no nível do módulo
+            para uso com várias tentativas em paralelo
+    """
+    OBJETIVOS_OTIMIZACAO[nome] = fabrica
+
+
+def criar_pontuador(estudantes, grupo_de, num_grupos, opcoes):
+    """
+    Cria o pontuador das opções de otimização (composto quando há vários objetivos).
+
+    Args:
+        estudantes (list or Turma): Estudantes
+        grupo_de (ndarray): Grupo inicial de cada estudante
+        num_grupos (int): Número de grupos
+        opcoes (dict): Opções de otimização
+
+    Returns:
+        tuple: (pontuador, dict {nome: pontuador de cada objetivo})
+    """
+    objetivos = opcoes.get("objetivos") or OBJETIVOS_PADRAO
+
+    pontuadores = {}
+    for nome in objetivos:
+        if nome not in OBJETIVOS_OTIMIZACAO:
+            raise ValueError(f"Objetivo de otimização desconhecido: {nome}. Use um de {sorted(OBJETIVOS_OTIMIZACAO)}")
+        pontuadores[nome] = OBJETIVOS_OTIMIZACAO[nome](estudantes, grupo_de, num_grupos, opcoes)
+
+    if len(pontuadores) == 1 and next(iter(objetivos.values())) == 1:
+        return next(iter(pontuadores.values())), pontuadores
+
+    return PontuadorComposto(list(pontuadores.values()), [float(peso) for peso in objetivos.values()]), pontuadores
+
+
+def formar_grupos_otimizados(
+    estudantes,
+    tamanho_grupo,
+    opcoes=None,
+    redistribuir_solitarios=True,
+    permitir_grupos_maiores=True,
+    semente=None,
+    gerador=None,
+    orcamento_ms=200,
+    max_iteracoes=None,
+    relatorio=None,
+):
+    """
+    Forma grupos aleatórios e os melhora por recozimento simulado segundo os objetivos.
+
+    Os tamanhos dos grupos são os mesmos da formação aleatória; a busca apenas troca
+    estudantes entre grupos e devolve a melhor formação encontrada no orçamento.
+
+    Args:
+        estudantes (list or Turma): Lista de dicionários com dados dos estudantes
+        tamanho_grupo (int): Tamanho desejado para cada grupo
+        opcoes (dict, optional): Opções de otimização no formato descrito no módulo
+        redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+        semente (int, optional): Semente para reprodutibilidade do sorteio aleatório
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+        orcamento_ms (float): Orçamento de tempo da busca em milissegundos
+        max_iteracoes (int, optional): Número máximo de trocas avaliadas (resultado reproduzível);
+            com semente e sem ele, o orçamento é convertido em iterações
+        relatorio (dict, optional): Se informado, recebe o custo de cada objetivo e as
+            estatísticas de convergência da busca
+
+    Returns:
+        list: Lista de arrays de índices, um por grupo
+    """
+    if not estudantes:
+        return []
+
+    opcoes = opcoes or {}
+    if gerador is None:
+        gerador = criar_gerador(semente)
+
+    grupos = formar_grupos_indices(
+        estudantes,
+        tamanho_grupo,
+        "Aleatório",
+        redistribuir_solitarios,
+        permitir_grupos_maiores,
+        gerador=gerador,
+    )
+
+    grupo_de = atribuicao_de_grupos(grupos, len(estudantes))
+    pontuador, pontuadores = criar_pontuador(estudantes, grupo_de, len(grupos), opcoes)
+    custos_iniciais = {nome: p.custo for nome, p in pontuadores.items()}
+    if max_iteracoes is None:
+        max_iteracoes = iteracoes_reproduziveis(orcamento_ms / 1000, semente)
+    resultado = recozimento_simulado(pontuador, orcamento_ms, max_iteracoes, gerador=gerador)
+
+    if relatorio is not None:
+        # Custo de cada objetivo na melhor atribuição, recalculado do zero
+        _, finais = criar_pontuador(estudantes, resultado["grupo_de"], len(grupos), opcoes)
+        relatorio.update(
+            {
+                "custo": resultado["custo"],
+                "custo_inicial": resultado["custo_inicial"],
+                "custos_objetivos": {nome: p.custo for nome, p in finais.items()},
+                "custos_objetivos_iniciais": custos_iniciais,
+                "iteracoes": resultado["iteracoes"],
+                "aceitas": resultado["aceitas"],
+                "melhorias": resultado["melhorias"],
+                "temperatura_inicial": resultado["temperatura_inicial"],
+                "tempo": resultado["tempo"],
+                "tempo_ate_melhor": resultado["tempo_ate_melhor"],
+                "convergencia": resultado["convergencia"],
+                "interrompida_pelo_tempo": resultado["interrompida_pelo_tempo"],
+            }
+        )
+
+    return grupos_de_atribuicao(resultado["grupo_de"], len(grupos))
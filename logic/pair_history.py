@@ -0,0 +1,378 @@
+"""
+Módulo de histórico de pares.
+Mantém uma matriz esparsa com quantas vezes cada par de estudantes já ficou no mesmo
+grupo e forma novos grupos minimizando pares repetidos ("Novos parceiros").
+
+A matriz é indexada por matrícula e atualizada de forma incremental: cada item do
+histórico é somado uma única vez e subtraído quando sai do histórico.
+"""
+
+import hashlib
+import threading
+from itertools import combinations
+
+import numpy as np
+
+from logic.local_search import (
+    MembrosGrupos,
+    atribuicao_de_grupos,
+    busca_local_trocas,
+    grupos_de_atribuicao,
+    iteracoes_reproduziveis,
+)
+from logic.partitioning import formar_grupos_indices
+from logic.random_streams import criar_gerador
+
+
+def chave_item(item):
+    """
+    Retorna o identificador de um item do histórico, criando-o se necessário.
+
+    Itens antigos, salvos sem "id", recebem um identificador derivado do conteúdo,
+    que passa a ser salvo junto com o item.
+
+    Args:
+        item (dict): Item do histórico
+
+    Returns:
+        str: Identificador do item
+    """
+    if not item.get("id"):
+        conteudo = hashlib.blake2b(digest_size=16)
+        conteudo.update(f"{item.get('data', '')}\x1f{item.get('descricao', '')}".encode("utf-8"))
+        for grupo in item.get("grupos", []):
+            conteudo.update("\x1e".join(str(e.get("matricula", "")) for e in grupo).encode("utf-8"))
+            conteudo.update(b"\x1d")
+        item["id"] = conteudo.hexdigest()
+    return item["id"]
+
+
+class MatrizPares:
+    """
+    Matriz esparsa e simétrica de contagem de pares, indexada por matrícula.
+    """
+
+    def __init__(self):
+        """Inicializa uma matriz vazia."""
+        self.contagens = {}
+        self.itens = {}
+
+    def __len__(self):
+        """Número de pares distintos com contagem positiva."""
+        return sum(len(vizinhos) for vizinhos in self.contagens.values()) // 2
+
+    def adicionar_grupos(self, grupos, peso=1):
+        """
+        Soma (ou subtrai, com peso negativo) os pares de cada grupo.
+
+        Args:
+            grupos (list): Lista de grupos, cada um como lista de matrículas
+            peso (int): Valor somado a cada par
+        """
+        contagens = self.contagens
+        for grupo in grupos:
+            for a, b in combinations(grupo, 2):
+                if a == b:
+                    continue
+                for x, y in ((a, b), (b, a)):
+                    vizinhos = contagens.setdefault(x, {})
+                    novo = vizinhos.get(y, 0) + peso
+                    if novo > 0:
+                        vizinhos[y] = novo
+                    else:
+                        vizinhos.pop(y, None)
+                        if not vizinhos:
+                            del contagens[x]
+
+    def adicionar_item(self, item):
+        """
+        Soma os pares de um item do histórico, se ainda não foi somado.
+
+        Args:
+            item (dict): Item do histórico
+
+        Returns:
+            bool: True se o item foi somado
+        """
+        chave = chave_item(item)
+        if chave in self.itens:
+            return False
+
+        grupos = [tuple(str(e.get("matricula", "")) for e in grupo) for grupo in item.get("grupos", [])]
+        self.itens[chave] = grupos
+        self.adicionar_grupos(grupos)
+        return True
+
+    def remover_item(self, chave):
+        """
+        Subtrai os pares de um item previamente somado.
+
+        Args:
+            chave (str): Identificador do item
+
+        Returns:
+            bool: True se o item foi subtraído
+        """
+        grupos = self.itens.pop(chave, None)
+        if grupos is None:
+            return False
+        self.adicionar_grupos(grupos, peso=-1)
+        return True
+
+    def sincronizar(self, historico):
+        """
+        Atualiza a matriz para refletir exatamente os itens do histórico.
+
+        Apenas itens novos são somados e apenas itens removidos são subtraídos.
+
+        Args:
+            historico (list): Lista de itens do histórico
+
+        Returns:
+            tuple: (int, int) - (itens somados, itens subtraídos)
+        """
+        atuais = {chave_item(item): item for item in historico}
+
+        removidos = [chave for chave in self.itens if chave not in atuais]
+        for chave in removidos:
+            self.remover_item(chave)
+
+        somados = sum(1 for item in atuais.values() if self.adicionar_item(item))
+        return somados, len(removidos)
+
+    def contagem(self, a, b):
+        """
+        Retorna quantas vezes duas matrículas ficaram no mesmo grupo.
+
+        Args:
+            a (str): Primeira matrícula
+            b (str): Segunda matrícula
+
+        Returns:
+            int: Número de encontros
+        """
+        return self.contagens.get(a, {}).get(b, 0)
+
+    def pares_repetidos(self, grupos):
+        """
+        Conta os encontros repetidos de uma formação.
+
+        Args:
+            grupos (list): Lista de grupos de estudantes (dicionários)
+
+        Returns:
+            int: Soma das contagens de todos os pares que ficaram juntos
+        """
+        total = 0
+        for grupo in grupos:
+            matriculas = [str(e.get("matricula", "")) for e in grupo]
+            total += sum(self.contagem(a, b) for a, b in combinations(matriculas, 2))
+        return total
+
+
+# Matriz compartilhada, mantida em dia por save_history
+_matriz_cache = MatrizPares()
+_trava_cache = threading.Lock()
+
+
+def atualizar_matriz_pares(historico):
+    """
+    Sincroniza a matriz compartilhada com o histórico salvo.
+
+    Args:
+        historico (list): Lista de itens do histórico
+
+    Returns:
+        tuple: (int, int) - (itens somados, itens subtraídos)
+    """
+    with _trava_cache:
+        return _matriz_cache.sincronizar(historico)
+
+
+def obter_matriz_pares(historico=None):
+    """
+    Retorna a matriz compartilhada, sincronizando-a com o histórico se informado.
+
+    Args:
+        historico (list, optional): Lista de itens do histórico
+
+    Returns:
+        MatrizPares: Matriz de pares compartilhada
+    """
+    if historico is not None:
+        atualizar_matriz_pares(historico)
+    return _matriz_cache
+
+
+class PontuadorParceiros:
+    """
+    Pontuador incremental de pares repetidos.
+
+    O custo é a soma, sobre todos os pares de estudantes no mesmo grupo, de quantas
+    vezes esse par já se encontrou.
+    """
+
+    def __init__(self, grupo_de, pesos):
+        """
+        Inicializa o pontuador.
+
+        Args:
+            grupo_de (ndarray or list): Grupo inicial de cada estudante
+            pesos (list): Para cada estudante, dicionário {índice: encontros anteriores}
+        """
+        self.grupo_de = [int(g) for g in grupo_de]
+        self.pesos = pesos
+        self.membros = MembrosGrupos(self.grupo_de)
+        self.candidatos = np.array([i for i, vizinhos in enumerate(pesos) if vizinhos], dtype=np.intp)
+        self.custo = self.custo_total()
+
+    def custo_total(self):
+        """
+        Calcula o custo da atribuição atual do zero.
+
+        Returns:
+            int: Soma dos encontros repetidos
+        """
+        g = self.grupo_de
+        return sum(
+            peso for a, vizinhos in enumerate(self.pesos) for b, peso in vizinhos.items() if a < b and g[a] == g[b]
+        )
+
+    def _encontros(self, a, grupo, ignorar):
+        """Soma dos encontros de a com os membros de grupo, exceto a e ignorar."""
+        vizinhos = self.pesos[a]
+        if not vizinhos:
+            return 0
+        return sum(vizinhos.get(j, 0) for j in self.membros.membros[grupo] if j != a and j != ignorar)
+
+    def delta_troca(self, a, b):
+        """
+        Calcula a variação do custo se a e b trocarem de grupo.
+
+        Args:
+            a (int): Índice do primeiro estudante
+            b (int): Índice do segundo estudante
+
+        Returns:
+            int: Variação da soma de encontros repetidos
+        """
+        ga = self.grupo_de[a]
+        gb = self.grupo_de[b]
+        if ga == gb:
+            return 0
+
+        depois = self._encontros(a, gb, b) + self._encontros(b, ga, a)
+        antes = self._encontros(a, ga, b) + self._encontros(b, gb, a)
+        return depois - antes
+
+    def aplicar_troca(self, a, b):
+        """
+        Troca a e b de grupo e atualiza o custo.
+
+        Args:
+            a (int): Índice do primeiro estudante
+            b (int): Índice do segundo estudante
+        """
+        delta = self.delta_troca(a, b)
+        ga = self.grupo_de[a]
+        gb = self.grupo_de[b]
+
+        self.membros.trocar(a, b, ga, gb)
+        self.grupo_de[a] = gb
+        self.grupo_de[b] = ga
+        self.custo += delta
+
+
+def pesos_por_indice(estudantes, matriz):
+    """
+    Converte a matriz por matrícula em pesos por índice da lista de estudantes.
+
+    Args:
+        estudantes (list): Lista de dicionários de estudantes
+        matriz (MatrizPares): Matriz de pares
+
+    Returns:
+        list: Para cada estudante, dicionário {índice: encontros anteriores}
+    """
+    posicao = {}
+    for i, estudante in enumerate(estudantes):
+        posicao.setdefault(str(estudante.get("matricula", "")), i)
+
+    pesos = [{} for _ in estudantes]
+    for matricula, i in posicao.items():
+        vizinhos = matriz.contagens.get(matricula)
+        if not vizinhos:
+            continue
+        for outra, contagem in vizinhos.items():
+            j = posicao.get(outra)
+            if j is not None:
+                pesos[i][j] = contagem
+
+    return pesos
+
+
+def formar_grupos_novos_parceiros(
+    estudantes,
+    tamanho_grupo,
+    matriz=None,
+    historico=None,
+    redistribuir_solitarios=True,
+    permitir_grupos_maiores=True,
+    semente=None,
+    gerador=None,
+    tempo_limite=1.0,
+    relatorio=None,
+):
+    """
+    Forma grupos aleatórios e os ajusta para minimizar pares que já se encontraram.
+
+    Args:
+        estudantes (list): Lista de dicionários com dados dos estudantes
+        tamanho_grupo (int): Tamanho desejado para cada grupo
+        matriz (MatrizPares, optional): Matriz de pares; usa a compartilhada se não informada
+        historico (list, optional): Histórico usado para sincronizar a matriz compartilhada
+        redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+        semente (int, optional): Semente para reprodutibilidade do sorteio aleatório
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+        tempo_limite (float): Tempo máximo de busca em segundos (com semente, o orçamento
+            convertido em iterações)
+        relatorio (dict, optional): Se informado, recebe as estatísticas da busca
+
+    Returns:
+        list: Lista de arrays de índices, um por grupo
+    """
+    if not estudantes:
+        return []
+
+    if matriz is None:
+        matriz = obter_matriz_pares(historico)
+    if gerador is None:
+        gerador = criar_gerador(semente)
+
+    grupos = formar_grupos_indices(
+        estudantes,
+        tamanho_grupo,
+        "Aleatório",
+        redistribuir_solitarios,
+        permitir_grupos_maiores,
+        gerador=gerador,
+    )
+
+    pontuador = PontuadorParceiros(atribuicao_de_grupos(grupos, len(estudantes)), pesos_por_indice(estudantes, matriz))
+    resultado = busca_local_trocas(
+        pontuador, tempo_limite, iteracoes_reproduziveis(tempo_limite, semente), gerador=gerador
+    )
+
+    if relatorio is not None:
+        relatorio.update(
+            {
+                "pares_repetidos": resultado["custo"],
+                "pares_repetidos_iniciais": resultado["custo_inicial"],
+                "iteracoes": resultado["iteracoes"],
+                "tempo": resultado["tempo"],
+                "interrompida_pelo_tempo": resultado["interrompida_pelo_tempo"],
+            }
+        )
+
+    return grupos_de_atribuicao(resultado["grupo_de"], len(grupos))
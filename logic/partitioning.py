@@ -0,0 +1,241 @@
+"""
+Módulo de particionamento vetorizado.
+Motor baseado em arrays de índices (NumPy) usado na formação de grupos.
+
+Os grupos são representados como arrays de índices inteiros para a lista
+original de estudantes; os dicionários só são materializados quando necessário.
+"""
+
+import heapq
+
+import numpy as np
+
+from logic.random_streams import permutacao_indices
+from logic.roster import Agrupamento, Turma, valores_coluna
+
+
+def ordenar_indices(estudantes, metodo="Aleatório", semente=None, gerador=None):
+    """
+    Calcula a ordem dos estudantes para o método de formação selecionado.
+
+    Args:
+        estudantes (list): Lista de dicionários com dados dos estudantes
+        metodo (str): Método de formação de grupos ("Aleatório", "Sequencial", "Balanceado")
+        semente (int, optional): Semente para reprodutibilidade do sorteio aleatório
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+
+    Returns:
+        ndarray: Permutação dos índices dos estudantes
+    """
+    total = len(estudantes)
+
+    if metodo == "Aleatório":
+        return permutacao_indices(total, semente, gerador)
+
+    if metodo == "Balanceado":
+        # Ordenação estável por matrícula, igual à ordenação da lista de dicionários
+        matriculas = valores_coluna(estudantes, "matricula")
+        ordenados = np.array(sorted(range(total), key=matriculas.__getitem__), dtype=np.intp)
+        return intercalar_metades(ordenados)
+
+    # Para "Sequencial" usamos a ordem original
+    return np.arange(total, dtype=np.intp)
+
+
+def intercalar_metades(ordem):
+    """
+    Intercala a primeira e a segunda metade de uma ordem de índices.
+
+    Args:
+        ordem (ndarray): Array de índices
+
+    Returns:
+        ndarray: Índices na ordem [a0, b0, a1, b1, ...] seguidos do último se ímpar
+    """
+    total = len(ordem)
+    meio = total // 2
+
+    intercalados = np.empty_like(ordem)
+    intercalados[0 : 2 * meio : 2] = ordem[:meio]
+    intercalados[1 : 2 * meio : 2] = ordem[meio : 2 * meio]
+    if total % 2 != 0:
+        intercalados[-1] = ordem[-1]
+
+    return intercalados
+
+
+def particionar_indices(ordem, tamanho_grupo):
+    """
+    Divide uma ordem de índices em grupos consecutivos de tamanho_grupo.
+
+    Args:
+        ordem (ndarray): Array de índices já ordenado
+        tamanho_grupo (int): Tamanho desejado para cada grupo
+
+    Returns:
+        list: Lista de arrays de índices (o último grupo pode ser menor)
+    """
+    return [ordem[inicio : inicio + tamanho_grupo] for inicio in range(0, len(ordem), tamanho_grupo)]
+
+
+def planejar_redistribuicao(tamanhos, tamanho_grupo, permitir_grupos_maiores):
+    """
+    Planeja a redistribuição de estudantes solitários a partir dos tamanhos dos grupos.
+
+    Percorre os grupos do último para o primeiro; cada grupo com apenas 1 estudante
+    é desfeito e seu estudante vai para o menor grupo restante (o primeiro na ordem
+    da lista, em caso de empate) ou para um novo grupo no final da lista. Os tamanhos
+    ficam em um heap mínimo com invalidação preguiçosa, evitando varreduras com min().
+
+    Args:
+        tamanhos (list): Tamanho de cada grupo, na ordem da lista
+        tamanho_grupo (int): Tamanho alvo dos grupos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+
+    Returns:
+        list: Composição de cada grupo final, como lista de índices dos grupos
+        originais cujos estudantes são concatenados nessa ordem
+    """
+    total = len(tamanhos)
+    tamanhos = list(tamanhos)
+    vivos = [True] * total
+    composicao = [[k] for k in range(total)]
+    posicoes = list(range(total))
+    novos = []
+
+    # Entradas (tamanho, posição na lista, id); a posição desempata como o min() original
+    heap = [(tamanho, k, k) for k, tamanho in enumerate(tamanhos)]
+    heapq.heapify(heap)
+
+    for k in range(total - 1, -1, -1):
+        if tamanhos[k] != 1:
+            continue
+
+        vivos[k] = False
+
+        # Descartar entradas desatualizadas do topo do heap
+        while heap and (not vivos[heap[0][2]] or tamanhos[heap[0][2]] != heap[0][0]):
+            heapq.heappop(heap)
+
+        if heap and (permitir_grupos_maiores or heap[0][0] < tamanho_grupo):
+            destino = heap[0][2]
+            composicao[destino].extend(composicao[k])
+            tamanhos[destino] += 1
+            heapq.heappush(heap, (tamanhos[destino], posicoes[destino], destino))
+        else:
+            # Recriar o estudante em um novo grupo no final da lista
+            novo = len(tamanhos)
+            tamanhos.append(1)
+            vivos.append(True)
+            composicao.append(composicao[k])
+            posicoes.append(total + len(novos))
+            novos.append(novo)
+            heapq.heappush(heap, (1, posicoes[novo], novo))
+
+    return [composicao[k] for k in range(total) if vivos[k]] + [composicao[k] for k in novos]
+
+
+def redistribuir_solitarios_indices(grupos, tamanho_grupo, permitir_grupos_maiores):
+    """
+    Redistribui índices de estudantes que ficariam sozinhos em grupos.
+
+    Segue as mesmas regras de redistribuir_solitarios_func, operando sobre arrays.
+
+    Args:
+        grupos (list): Lista de arrays de índices
+        tamanho_grupo (int): Tamanho alvo dos grupos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+
+    Returns:
+        list: Lista de arrays de índices redistribuídos
+    """
+    plano = planejar_redistribuicao([len(grupo) for grupo in grupos], tamanho_grupo, permitir_grupos_maiores)
+
+    return [grupos[partes[0]] if len(partes) == 1 else np.concatenate([grupos[k] for k in partes]) for partes in plano]
+
+
+def tamanhos_grupos(total, tamanho_grupo, redistribuir_solitarios=True, permitir_grupos_maiores=True):
+    """
+    Calcula os tamanhos dos grupos que a formação produziria, sem formar os grupos.
+
+    Args:
+        total (int): Número de estudantes
+        tamanho_grupo (int): Tamanho desejado para cada grupo
+        redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+
+    Returns:
+        list: Tamanho de cada grupo, na ordem da lista
+    """
+    completos, resto = divmod(total, tamanho_grupo)
+    tamanhos = [tamanho_grupo] * completos + ([resto] if resto else [])
+
+    if not redistribuir_solitarios:
+        return tamanhos
+
+    plano = planejar_redistribuicao(tamanhos, tamanho_grupo, permitir_grupos_maiores)
+    return [sum(tamanhos[k] for k in partes) for partes in plano]
+
+
+def formar_grupos_indices(
+    estudantes,
+    tamanho_grupo,
+    metodo="Aleatório",
+    redistribuir_solitarios=True,
+    permitir_grupos_maiores=True,
+    semente=None,
+    gerador=None,
+):
+    """
+    Forma grupos como arrays de índices, sem copiar os dicionários dos estudantes.
+
+    Produz exatamente os mesmos grupos que formar_grupos para os mesmos parâmetros.
+
+    Args:
+        estudantes (list): Lista de dicionários com dados dos estudantes
+        tamanho_grupo (int): Tamanho desejado para cada grupo
+        metodo (str): Método de formação de grupos ("Aleatório", "Sequencial", "Balanceado")
+        redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+        semente (int, optional): Semente para reprodutibilidade do sorteio aleatório
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+
+    Returns:
+        list: Lista de arrays de índices, um por grupo
+    """
+    if not estudantes:
+        return []
+
+    ordem = ordenar_indices(estudantes, metodo, semente, gerador)
+    grupos = particionar_indices(ordem, tamanho_grupo)
+
+    if redistribuir_solitarios:
+        grupos = redistribuir_solitarios_indices(grupos, tamanho_grupo, permitir_grupos_maiores)
+
+    return grupos
+
+
+def materializar_grupos(estudantes, grupos_indices):
+    """
+    Converte grupos de índices em grupos de dicionários de estudantes.
+
+    Para uma Turma, devolve um Agrupamento, que guarda apenas os índices.
+
+    Args:
+        estudantes (list or Turma): Lista original de estudantes
+        grupos_indices (list): Lista de arrays de índices
+
+    Returns:
+        list or Agrupamento: Lista de grupos, onde cada grupo é uma lista de estudantes
+    """
+    if isinstance(estudantes, Turma):
+        return Agrupamento(estudantes, grupos_indices)
+
+    if not grupos_indices:
+        return []
+
+    # Uma única conversão para lista de inteiros e fatiamento por tamanhos acumulados
+    ordem = [estudantes[i] for i in np.concatenate(grupos_indices).tolist()]
+    limites = np.cumsum([len(grupo) for grupo in grupos_indices]).tolist()
+
+    return [ordem[inicio:fim] for inicio, fim in zip([0] + limites[:-1], limites)]
@@ -0,0 +1,122 @@
+"""
+Módulo de geradores aleatórios isolados.
+Cada formação usa seu próprio gerador, sem tocar no estado global do módulo random,
+o que mantém os sorteios com semente reproduzíveis mesmo com várias sessões simultâneas.
+"""
+
+import random
+
+import numpy as np
+
+# Geradores de bits do NumPy que suportam fluxos independentes via jumped()
+TIPOS_FLUXO = {
+    "pcg64": np.random.PCG64,
+    "philox": np.random.Philox,
+}
+
+
+def criar_gerador(semente=None):
+    """
+    Cria um gerador aleatório independente para uma única chamada.
+
+    Com a mesma semente, produz a mesma sequência que random.seed(semente) produzia
+    no gerador global, preservando os resultados reproduzíveis já salvos.
+
+    Args:
+        semente (int, optional): Semente para reprodutibilidade do sorteio
+
+    Returns:
+        random.Random: Gerador isolado
+    """
+    return random.Random(semente)
+
+
+def criar_fluxos(semente, quantidade, tipo="pcg64"):
+    """
+    Cria fluxos aleatórios independentes a partir de uma única semente.
+
+    Cada fluxo i é o gerador base avançado i saltos (jumped), de modo que os fluxos
+    não se sobrepõem e o fluxo i é sempre o mesmo para a mesma semente,
+    independentemente da ordem em que as formações são executadas.
+
+    Args:
+        semente (int, optional): Semente base dos fluxos
+        quantidade (int): Número de fluxos a criar
+        tipo (str): Gerador de bits ("pcg64" saltável ou "philox" baseado em contador)
+
+    Returns:
+        list: Lista de numpy.random.Generator independentes
+    """
+    if tipo not in TIPOS_FLUXO:
+        raise ValueError(f"Tipo de fluxo desconhecido: {tipo}. Use um de {sorted(TIPOS_FLUXO)}")
+
+    base = TIPOS_FLUXO[tipo](semente)
+    return [np.random.Generator(base.jumped(i)) for i in range(quantidade)]
+
+
+def permutacao_indices(total, semente=None, gerador=None):
+    """
+    Sorteia uma permutação dos índices 0..total-1 sem usar o estado global.
+
+    Args:
+        total (int): Número de elementos
+        semente (int, optional): Semente usada quando nenhum gerador é informado
+        gerador (random.Random or numpy.random.Generator, optional): Gerador a ser usado
+
+    Returns:
+        ndarray: Permutação dos índices
+    """
+    if gerador is None:
+        gerador = criar_gerador(semente)
+
+    if isinstance(gerador, np.random.Generator):
+        return gerador.permutation(total).astype(np.intp, copy=False)
+
+    # Embaralhar inteiros consome o gerador exatamente como embaralhar os dicionários
+    ordem = list(range(total))
+    gerador.shuffle(ordem)
+    return np.array(ordem, dtype=np.intp)
+
+
+def gerador_numpy(semente=None, gerador=None):
+    """
+    Obtém um numpy.random.Generator isolado para rotinas vetorizadas.
+
+    Args:
+        semente (int, optional): Semente usada quando nenhum gerador é informado
+        gerador (random.Random or numpy.random.Generator, optional): Gerador de origem
+
+    Returns:
+        numpy.random.Generator: Gerador do NumPy derivado de forma determinística
+    """
+    if isinstance(gerador, np.random.Generator):
+        return gerador
+
+    if gerador is None:
+        gerador = criar_gerador(semente)
+
+    return np.random.default_rng(gerador.getrandbits(64))
+
+
+def sortear_sementes(quantidade, semente=None, gerador=None):
+    """
+    Sorteia sementes inteiras independentes, uma para cada tentativa de formação.
+
+    Cada semente reproduz sozinha a tentativa correspondente (basta passá-la como
+    semente para a formação), e a lista é sempre a mesma para a mesma semente base.
+
+    Args:
+        quantidade (int): Número de sementes
+        semente (int, optional): Semente base usada quando nenhum gerador é informado
+        gerador (random.Random or numpy.random.Generator, optional): Gerador de origem
+
+    Returns:
+        list: Lista de sementes (int de 32 bits)
+    """
+    if isinstance(gerador, np.random.Generator):
+        return [int(s) for s in gerador.integers(2**32, size=quantidade)]
+
+    if gerador is None:
+        gerador = criar_gerador(semente)
+
+    return [gerador.getrandbits(32) for _ in range(quantidade)]
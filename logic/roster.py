@@ -0,0 +1,434 @@
+"""
+Módulo de turma compacta.
+Guarda os estudantes em colunas (struct-of-arrays) em vez de um dicionário por
+estudante, o que reduz bastante a memória de turmas grandes.
+
+    ColunaTexto: textos UTF-8 concatenados em um único buffer, com deslocamentos
+    Turma: colunas de matrícula, nome, atributos e pontuação; "completo" é montado sob demanda
+    Agrupamento: grupos como arrays de índices para uma Turma
+
+Turma e Agrupamento se comportam como as listas de dicionários usadas no restante
+do código (len, índice e iteração devolvem dicionários), então podem ser passados às
+mesmas funções; as que conhecem os tipos usam as colunas diretamente.
+"""
+
+import hashlib
+
+import numpy as np
+
+# Chave do dicionário de estudante que guarda a pontuação numérica
+CHAVE_PONTUACAO = "pontuacao"
+
+# Chaves que não são guardadas como atributos
+CHAVES_FIXAS = ("matricula", "nome", "completo", CHAVE_PONTUACAO)
+
+
+def converter_pontuacao(valor):
+    """
+    Converte um valor em pontuação numérica, aceitando vírgula decimal ("7,5").
+
+    Args:
+        valor: Valor lido do CSV ou do dicionário do estudante
+
+    Returns:
+        float or None: Pontuação ou None se o valor não for numérico
+    """
+    if valor is None:
+        return None
+    if isinstance(valor, (int, float)):
+        return None if np.isnan(valor) else float(valor)
+    try:
+        numero = float(str(valor).strip().replace(",", "."))
+    except ValueError:
+        return None
+    return None if np.isnan(numero) else numero
+
+
+class ColunaTexto:
+    """
+    Coluna de textos guardada como um único bloco de bytes UTF-8 e os deslocamentos
+    de cada valor, sem um objeto str por estudante.
+    """
+
+    __slots__ = ("dados", "limites")
+
+    def __init__(self, valores):
+        """
+        Codifica os valores na coluna.
+
+        Args:
+            valores (iterable): Textos da coluna (None vira texto vazio)
+        """
+        codificados = [("" if valor is None else str(valor)).encode("utf-8") for valor in valores]
+        self.dados = b"".join(codificados)
+        # Deslocamentos de 32 bits bastam para colunas de até 2 GB
+        tipo = np.int32 if len(self.dados) < 2**31 else np.int64
+        self.limites = np.zeros(len(codificados) + 1, dtype=tipo)
+        np.cumsum([len(valor) for valor in codificados], out=self.limites[1:])
+
+    def __len__(self):
+        """Número de valores."""
+        return len(self.limites) - 1
+
+    def __getitem__(self, indice):
+        """Decodifica o valor na posição informada."""
+        if indice < 0:
+            indice += len(self)
+        return self.dados[self.limites[indice] : self.limites[indice + 1]].decode("utf-8")
+
+    def valores(self, indices=None):
+        """
+        Decodifica vários valores de uma vez.
+
+        Args:
+            indices (iterable, optional): Posições desejadas; por padrão, todas
+
+        Returns:
+            list: Lista de textos
+        """
+        dados = self.dados
+        if indices is None:
+            limites = self.limites.tolist()
+            return [dados[a:b].decode("utf-8") for a, b in zip(limites[:-1], limites[1:])]
+        # Inícios e fins reunidos pelos índices de uma vez, com NumPy
+        indices = np.asarray(indices, dtype=np.intp)
+        inicios = self.limites[indices].tolist()
+        fins = self.limites[indices + 1].tolist()
+        return [dados[a:b].decode("utf-8") for a, b in zip(inicios, fins)]
+
+    @property
+    def nbytes(self):
+        """Memória usada pela coluna, em bytes."""
+        return len(self.dados) + self.limites.nbytes
+
+    @classmethod
+    def de_buffers(cls, dados, limites):
+        """
+        Cria a coluna a partir de textos UTF-8 já concatenados e dos deslocamentos
+        (ex.: os buffers de uma coluna de texto do Arrow), sem decodificar os valores.
+
+        Args:
+            dados (bytes or buffer): Textos concatenados
+            limites (array): Início de cada valor e fim do último, a partir de 0
+
+        Returns:
+            ColunaTexto: Coluna com os valores informados
+        """
+        coluna = cls([])
+        coluna.dados = bytes(dados)
+        tipo = np.int32 if len(coluna.dados) < 2**31 else np.int64
+        coluna.limites = np.array(limites, dtype=tipo)
+        return coluna
+
+    @classmethod
+    def concatenar(cls, colunas):
+        """
+        Junta várias colunas em uma só, copiando apenas os buffers.
+
+        Args:
+            colunas (list): Colunas na ordem desejada
+
+        Returns:
+            ColunaTexto: Coluna com os valores de todas as colunas
+        """
+        coluna = cls([])
+        coluna.dados = b"".join(c.dados for c in colunas)
+        tipo = np.int32 if len(coluna.dados) < 2**31 else np.int64
+        # Cada coluna continua do ponto em que a anterior terminou
+        inicios = np.cumsum([0] + [len(c.dados) for c in colunas[:-1]])
+        partes = [c.limites[1:].astype(tipo) + inicio for c, inicio in zip(colunas, inicios.tolist())]
+        coluna.limites = np.concatenate([np.zeros(1, dtype=tipo)] + partes).astype(tipo)
+        return coluna
+
+
+class Turma:
+    """
+    Turma de estudantes em colunas compactas.
+    """
+
+    def __init__(self, matriculas, nomes, atributos=None, pontuacoes=None):
+        """
+        Inicializa a turma a partir das colunas.
+
+        Args:
+            matriculas (iterable): Matrícula de cada estudante
+            nomes (iterable): Nome de cada estudante
+            atributos (dict, optional): Colunas adicionais {nome: valores}
+            pontuacoes (iterable, optional): Pontuação de cada estudante (NaN = sem pontuação)
+        """
+        self.matriculas = matriculas if isinstance(matriculas, ColunaTexto) else ColunaTexto(matriculas)
+        self.nomes = nomes if isinstance(nomes, ColunaTexto) else ColunaTexto(nomes)
+        self.atributos = {
+            chave: valores if isinstance(valores, ColunaTexto) else ColunaTexto(valores)
+            for chave, valores in (atributos or {}).items()
+        }
+        self.pontuacoes = None if pontuacoes is None else np.asarray(pontuacoes, dtype=float)
+
+        if len(self.nomes) != len(self.matriculas):
+            raise ValueError("As colunas de matrícula e nome devem ter o mesmo tamanho")
+
+    @classmethod
+    def de_estudantes(cls, estudantes):
+        """
+        Converte uma lista de dicionários de estudantes em uma Turma.
+
+        Args:
+            estudantes (list): Lista de dicionários de estudantes
+
+        Returns:
+            Turma: Turma com as mesmas informações
+        """
+        if isinstance(estudantes, cls):
+            return estudantes
+
+        chaves = []
+        for estudante in estudantes:
+            for chave in estudante:
+                if chave not in CHAVES_FIXAS and chave not in chaves:
+                    chaves.append(chave)
+
+        pontuacoes = [converter_pontuacao(e.get(CHAVE_PONTUACAO)) for e in estudantes]
+        tem_pontuacao = any(valor is not None for valor in pontuacoes)
+
+        return cls(
+            [e.get("matricula", "") for e in estudantes],
+            [e.get("nome", "") for e in estudantes],
+            {chave: [e.get(chave, "") for e in estudantes] for chave in chaves},
+            np.array([np.nan if v is None else v for v in pontuacoes], dtype=float) if tem_pontuacao else None,
+        )
+
+    @classmethod
+    def concatenar(cls, turmas):
+        """
+        Junta várias turmas em uma só, na ordem informada.
+
+        Atributos ausentes em alguma das turmas ficam vazios nela; a pontuação só é
+        guardada se alguma turma a tiver (NaN nas demais).
+
+        Args:
+            turmas (list): Turmas a juntar
+
+        Returns:
+            Turma: Turma com os estudantes de todas as turmas
+        """
+        chaves = []
+        for turma in turmas:
+            chaves.extend(chave for chave in turma.atributos if chave not in chaves)
+
+        atributos = {
+            chave: ColunaTexto.concatenar(
+                [turma.atributos.get(chave) or ColunaTexto([""] * len(turma)) for turma in turmas]
+            )
+            for chave in chaves
+        }
+
+        pontuacoes = None
+        if any(turma.pontuacoes is not None for turma in turmas):
+            pontuacoes = np.concatenate(
+                [np.full(len(t), np.nan) if t.pontuacoes is None else t.pontuacoes for t in turmas] + [np.empty(0)]
+            )
+
+        return cls(
+            ColunaTexto.concatenar([turma.matriculas for turma in turmas]),
+            ColunaTexto.concatenar([turma.nomes for turma in turmas]),
+            atributos,
+            pontuacoes,
+        )
+
+    def __len__(self):
+        """Número de estudantes."""
+        return len(self.matriculas)
+
+    def __getitem__(self, indice):
+        """
+        Monta o dicionário de um estudante, como nas listas de estudantes.
+
+        Args:
+            indice (int): Posição do estudante
+
+        Returns:
+            dict: Dicionário com matrícula, nome, completo, atributos e pontuação
+        """
+        indice = int(indice)
+        if not -len(self) <= indice < len(self):
+            raise IndexError("Índice de estudante fora da turma")
+
+        matricula = self.matriculas[indice]
+        nome = self.nomes[indice]
+        estudante = {"matricula": matricula, "nome": nome, "completo": f"{matricula}, {nome}"}
+        for chave, coluna in self.atributos.items():
+            estudante[chave] = coluna[indice]
+        if self.pontuacoes is not None and not np.isnan(self.pontuacoes[indice]):
+            estudante[CHAVE_PONTUACAO] = float(self.pontuacoes[indice])
+        return estudante
+
+    def __iter__(self):
+        """Itera sobre os dicionários dos estudantes."""
+        for indice in range(len(self)):
+            yield self[indice]
+
+    def coluna(self, chave, indices=None):
+        """
+        Retorna os valores de uma coluna sem montar os dicionários.
+
+        Args:
+            chave (str): "matricula", "nome", "completo", "pontuacao" ou um atributo
+            indices (iterable, optional): Posições desejadas; por padrão, todas
+
+        Returns:
+            list: Valores da coluna ("" para atributos inexistentes, None para pontuação ausente)
+        """
+        if chave == "matricula":
+            return self.matriculas.valores(indices)
+        if chave == "nome":
+            return self.nomes.valores(indices)
+        if chave == "completo":
+            return [f"{m}, {n}" for m, n in zip(self.matriculas.valores(indices), self.nomes.valores(indices))]
+        if chave == CHAVE_PONTUACAO:
+            total = len(self) if indices is None else len(indices)
+            if self.pontuacoes is None:
+                return [None] * total
+            valores = self.pontuacoes if indices is None else self.pontuacoes[np.asarray(indices)]
+            return [None if np.isnan(v) else v for v in valores.tolist()]
+        if chave in self.atributos:
+            return self.atributos[chave].valores(indices)
+        return [""] * (len(self) if indices is None else len(indices))
+
+    def selecionar(self, indices):
+        """
+        Cria uma nova Turma só com os estudantes informados, na ordem dos índices.
+
+        Args:
+            indices (iterable): Posições dos estudantes
+
+        Returns:
+            Turma: Turma com os estudantes selecionados
+        """
+        indices = np.asarray(indices, dtype=np.intp)
+        return Turma(
+            self.matriculas.valores(indices),
+            self.nomes.valores(indices),
+            {chave: coluna.valores(indices) for chave, coluna in self.atributos.items()},
+            None if self.pontuacoes is None else self.pontuacoes[indices],
+        )
+
+    def para_estudantes(self):
+        """
+        Converte a turma de volta em uma lista de dicionários.
+
+        Returns:
+            list: Lista de dicionários de estudantes
+        """
+        return list(self)
+
+    def impressao(self):
+        """
+        Calcula uma impressão digital da turma a partir dos buffers das colunas.
+
+        Returns:
+            str: Hash hexadecimal da turma
+        """
+        conteudo = hashlib.blake2b(digest_size=16)
+        colunas = [("matricula", self.matriculas), ("nome", self.nomes)] + sorted(self.atributos.items())
+        for chave, coluna in colunas:
+            conteudo.update(chave.encode("utf-8"))
+            conteudo.update(coluna.limites.tobytes())
+            conteudo.update(coluna.dados)
+        if self.pontuacoes is not None:
+            conteudo.update(self.pontuacoes.tobytes())
+        return conteudo.hexdigest()
+
+    @property
+    def nbytes(self):
+        """Memória usada pelas colunas, em bytes."""
+        total = self.matriculas.nbytes + self.nomes.nbytes + sum(c.nbytes for c in self.atributos.values())
+        return total + (self.pontuacoes.nbytes if self.pontuacoes is not None else 0)
+
+
+class Agrupamento:
+    """
+    Grupos de uma formação como arrays de índices para uma Turma.
+    """
+
+    def __init__(self, turma, grupos_indices):
+        """
+        Inicializa o agrupamento.
+
+        Args:
+            turma (Turma): Turma dos estudantes
+            grupos_indices (list): Lista de arrays de índices, um por grupo
+        """
+        self.turma = turma
+        self.grupos_indices = [np.asarray(grupo, dtype=np.intp) for grupo in grupos_indices]
+
+    def __len__(self):
+        """Número de grupos."""
+        return len(self.grupos_indices)
+
+    def __getitem__(self, numero):
+        """
+        Monta a lista de dicionários de um grupo (0-indexed).
+
+        Args:
+            numero (int): Posição do grupo
+
+        Returns:
+            list: Lista de dicionários dos estudantes do grupo
+        """
+        return [self.turma[i] for i in self.grupos_indices[numero].tolist()]
+
+    def __iter__(self):
+        """Itera sobre os grupos como listas de dicionários."""
+        for numero in range(len(self)):
+            yield self[numero]
+
+    def tamanhos(self):
+        """
+        Retorna o tamanho de cada grupo.
+
+        Returns:
+            list: Tamanho de cada grupo
+        """
+        return [len(grupo) for grupo in self.grupos_indices]
+
+    def colunas(self, chaves=("matricula", "nome")):
+        """
+        Retorna o número do grupo (1-indexed) e as colunas pedidas de cada estudante,
+        na ordem dos grupos, sem montar os dicionários.
+
+        Args:
+            chaves (tuple): Colunas desejadas (ver Turma.coluna)
+
+        Returns:
+            tuple: (ndarray com o número do grupo, dict {chave: valores})
+        """
+        tamanhos = self.tamanhos()
+        numeros = np.repeat(np.arange(1, len(tamanhos) + 1), tamanhos)
+        ordem = np.concatenate(self.grupos_indices) if self.grupos_indices else np.empty(0, dtype=np.intp)
+        return numeros, {chave: self.turma.coluna(chave, ordem) for chave in chaves}
+
+    def para_listas(self):
+        """
+        Converte o agrupamento em uma lista de grupos de dicionários.
+
+        Returns:
+            list: Lista de grupos, onde cada grupo é uma lista de estudantes
+        """
+        return list(self)
+
+
+def valores_coluna(estudantes, chave, padrao=""):
+    """
+    Retorna uma coluna de uma Turma ou de uma lista de dicionários.
+
+    Args:
+        estudantes (Turma or list): Estudantes
+        chave (str): Chave desejada
+        padrao: Valor usado quando o dicionário não tem a chave
+
+    Returns:
+        list: Valor de cada estudante
+    """
+    if isinstance(estudantes, Turma):
+        return estudantes.coluna(chave)
+    return [estudante.get(chave, padrao) for estudante in estudantes]
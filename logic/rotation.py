@@ -0,0 +1,109 @@
+"""
+Módulo de rodízio de grupos.
+Planeja várias rodadas de uma vez (ex.: grupos semanais de um semestre) evitando que
+os mesmos estudantes se encontrem de novo, no estilo do problema do "social golfer".
+
+Cada rodada parte de uma formação aleatória e é ajustada por busca local contra os
+encontros acumulados das rodadas anteriores (e, opcionalmente, do histórico salvo).
+"""
+
+from logic.local_search import atribuicao_de_grupos, busca_local_trocas, grupos_de_atribuicao, iteracoes_reproduziveis
+from logic.pair_history import PontuadorParceiros, obter_matriz_pares, pesos_por_indice
+from logic.partitioning import formar_grupos_indices, materializar_grupos
+from logic.random_streams import criar_gerador
+
+
+def somar_encontros(pesos, grupos_indices):
+    """
+    Soma os pares de uma formação aos pesos por índice.
+
+    Args:
+        pesos (list): Para cada estudante, dicionário {índice: encontros anteriores}
+        grupos_indices (list): Lista de arrays de índices
+    """
+    for grupo in grupos_indices:
+        membros = grupo.tolist()
+        for a in membros:
+            vizinhos = pesos[a]
+            for b in membros:
+                if a != b:
+                    vizinhos[b] = vizinhos.get(b, 0) + 1
+
+
+def formar_rodadas(
+    estudantes,
+    tamanho_grupo,
+    num_rodadas,
+    redistribuir_solitarios=True,
+    permitir_grupos_maiores=True,
+    semente=None,
+    gerador=None,
+    historico=None,
+    tempo_limite=1.0,
+    relatorio=None,
+):
+    """
+    Forma várias rodadas de grupos minimizando pares que se repetem entre elas.
+
+    Args:
+        estudantes (list): Lista de dicionários com dados dos estudantes
+        tamanho_grupo (int): Tamanho desejado para cada grupo
+        num_rodadas (int): Número de rodadas a formar
+        redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+        semente (int, optional): Semente para reprodutibilidade do sorteio aleatório
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+        historico (list, optional): Se informado, encontros do histórico também contam
+        tempo_limite (float): Tempo máximo de busca em segundos, dividido entre as rodadas
+            (com semente, o orçamento convertido em iterações)
+        relatorio (dict, optional): Se informado, recebe os pares repetidos por rodada
+
+    Returns:
+        list: Lista de rodadas, cada uma uma lista de grupos de estudantes
+    """
+    if not estudantes or num_rodadas < 1:
+        return []
+
+    if gerador is None:
+        gerador = criar_gerador(semente)
+
+    if historico is not None:
+        pesos = pesos_por_indice(estudantes, obter_matriz_pares(historico))
+    else:
+        pesos = [{} for _ in estudantes]
+
+    tempo_rodada = tempo_limite / num_rodadas
+    iteracoes_rodada = iteracoes_reproduziveis(tempo_rodada, semente)
+    rodadas = []
+    repetidos = []
+    tempo_total = 0.0
+
+    for _ in range(num_rodadas):
+        grupos = formar_grupos_indices(
+            estudantes,
+            tamanho_grupo,
+            "Aleatório",
+            redistribuir_solitarios,
+            permitir_grupos_maiores,
+            gerador=gerador,
+        )
+
+        pontuador = PontuadorParceiros(atribuicao_de_grupos(grupos, len(estudantes)), pesos)
+        resultado = busca_local_trocas(pontuador, tempo_rodada, iteracoes_rodada, gerador=gerador)
+        grupos = grupos_de_atribuicao(resultado["grupo_de"], len(grupos))
+
+        somar_encontros(pesos, grupos)
+        rodadas.append(materializar_grupos(estudantes, grupos))
+        repetidos.append(resultado["custo"])
+        tempo_total += resultado["tempo"]
+
+    if relatorio is not None:
+        relatorio.update(
+            {
+                "pares_repetidos": sum(repetidos),
+                "pares_repetidos_por_rodada": repetidos,
+                "tempo": tempo_total,
+            }
+        )
+
+    return rodadas
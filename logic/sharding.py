@@ -0,0 +1,184 @@
+"""
+Módulo de formação por turma.
+Divide uma planilha com várias turmas (ex.: um CSV do campus inteiro com a coluna
+"turma") pelos valores de uma coluna e forma os grupos dentro de cada turma, com as
+turmas distribuídas entre processos.
+
+Cada turma recebe sua própria semente, sorteada da semente base na ordem em que as
+turmas aparecem; assim o resultado não depende do número de processos nem da ordem
+em que eles terminam.
+"""
+
+import numpy as np
+import pandas as pd
+
+from logic.group_formation import formar_grupos_metodo
+from logic.partitioning import materializar_grupos
+from logic.random_streams import sortear_sementes
+from logic.roster import Agrupamento, Turma, valores_coluna
+from logic.worker_pool import contexto_trabalhador, criar_executor, planejar_trabalhadores
+
+
+def dividir_por_coluna(estudantes, coluna):
+    """
+    Agrupa os índices dos estudantes pelos valores de uma coluna.
+
+    Args:
+        estudantes (list or Turma): Estudantes de todas as turmas
+        coluna (str): Coluna que identifica a turma (ex.: "turma")
+
+    Returns:
+        dict: {valor: ndarray de índices}, na ordem em que os valores aparecem
+    """
+    valores = pd.Series(valores_coluna(estudantes, coluna), dtype=object).fillna("").astype(str).str.strip()
+    indices = valores.groupby(valores, sort=False).indices
+    return {valor: indices[valor].astype(np.intp) for valor in valores.unique()}
+
+
+def selecionar_estudantes(estudantes, indices):
+    """
+    Extrai os estudantes de uma turma, mantendo o tipo da entrada.
+
+    Args:
+        estudantes (list or Turma): Estudantes de todas as turmas
+        indices (ndarray): Índices dos estudantes da turma
+
+    Returns:
+        list or Turma: Estudantes da turma
+    """
+    if isinstance(estudantes, Turma):
+        return estudantes.selecionar(indices)
+    return [estudantes[i] for i in indices.tolist()]
+
+
+def formar_turma(estudantes, semente, parametros):
+    """
+    Forma os grupos de índices de uma turma.
+
+    Args:
+        estudantes (list or Turma): Estudantes da turma
+        semente (int): Semente da turma
+        parametros (dict): Argumentos nomeados repassados a formar_grupos_metodo
+
+    Returns:
+        tuple: (grupos de índices locais à turma, relatório da turma)
+    """
+    relatorio = {}
+    grupos_indices = formar_grupos_metodo(estudantes, semente=semente, relatorio=relatorio, **parametros)
+    return grupos_indices, relatorio
+
+
+def _formar_no_trabalhador(estudantes, semente):
+    """Forma uma turma usando o contexto do processo trabalhador."""
+    return formar_turma(estudantes, semente, contexto_trabalhador()["parametros"])
+
+
+def formar_grupos_por_turma(
+    estudantes,
+    coluna,
+    tamanho_grupo,
+    metodo="Aleatório",
+    redistribuir_solitarios=True,
+    permitir_grupos_maiores=True,
+    semente=None,
+    gerador=None,
+    restricoes=None,
+    historico=None,
+    tempo_limite=1.0,
+    max_trabalhadores=None,
+    relatorio=None,
+    otimizacao=None,
+):
+    """
+    Forma grupos dentro de cada turma, sem misturar estudantes de turmas diferentes.
+
+    Args:
+        estudantes (list or Turma): Estudantes de todas as turmas
+        coluna (str): Coluna que identifica a turma (ex.: "turma")
+        tamanho_grupo (int): Tamanho desejado para cada grupo
+        metodo (str): Método de formação de grupos (ver METODOS_FORMACAO)
+        redistribuir_solitarios (bool): Se deve redistribuir estudantes que ficariam sozinhos
+        permitir_grupos_maiores (bool): Se permite grupos maiores que o tamanho_grupo
+        semente (int, optional): Semente base das sementes das turmas
+        gerador (random.Random or numpy.random.Generator, optional): Gerador isolado a ser usado
+        restricoes (dict, optional): Restrições do método "Restrições", aplicadas em cada turma
+        historico (list, optional): Histórico de formações usado pelo método "Novos parceiros"
+        tempo_limite (float): Tempo máximo de otimização por turma, em segundos
+        max_trabalhadores (int, optional): Máximo de processos (padrão:
+            logic.worker_pool.MAX_TRABALHADORES)
+        relatorio (dict, optional): Se informado, recebe o relatório de cada turma em
+            relatorio["turmas"] e se a formação rodou em paralelo
+        otimizacao (dict, optional): Opções do método "Diversidade", aplicadas em cada turma
+
+    Returns:
+        dict: {turma: grupos}, na ordem em que as turmas aparecem; os grupos são listas
+        de estudantes (um Agrupamento da turma completa quando estudantes é uma Turma)
+    """
+    if not estudantes:
+        return {}
+
+    divisao = dividir_por_coluna(estudantes, coluna)
+    nomes = list(divisao)
+    sementes = sortear_sementes(len(nomes), semente, gerador)
+    parametros = {
+        "tamanho_grupo": tamanho_grupo,
+        "metodo": metodo,
+        "redistribuir_solitarios": redistribuir_solitarios,
+        "permitir_grupos_maiores": permitir_grupos_maiores,
+        "restricoes": restricoes,
+        "historico": historico,
+        "tempo_limite": tempo_limite,
+        "otimizacao": otimizacao,
+    }
+
+    trabalhadores, paralelo = planejar_trabalhadores(len(nomes), len(estudantes), max_trabalhadores)
+
+    subturmas = [selecionar_estudantes(estudantes, divisao[nome]) for nome in nomes]
+
+    if paralelo:
+        with criar_executor(trabalhadores, parametros=parametros) as executor:
+            resultados = list(executor.map(_formar_no_trabalhador, subturmas, sementes))
+    else:
+        resultados = [formar_turma(sub, s, parametros) for sub, s in zip(subturmas, sementes)]
+
+    formacoes = {}
+    for nome, subturma, (grupos_indices, _) in zip(nomes, subturmas, resultados):
+        if isinstance(estudantes, Turma):
+            # Índices locais convertidos para a turma completa, sem copiar estudantes
+            formacoes[nome] = Agrupamento(estudantes, [divisao[nome][grupo] for grupo in grupos_indices])
+        else:
+            formacoes[nome] = materializar_grupos(subturma, grupos_indices)
+
+    if relatorio is not None:
+        relatorio.update(
+            {
+                "turmas": {nome: dict(rel, semente=s) for nome, s, (_, rel) in zip(nomes, sementes, resultados)},
+                "paralelo": paralelo,
+            }
+        )
+
+    return formacoes
+
+
+def juntar_formacoes(formacoes):
+    """
+    Junta as formações das turmas em uma única lista de grupos, numerando os grupos
+    dentro de cada turma.
+
+    Args:
+        formacoes (dict): {turma: grupos}, como devolvido por formar_grupos_por_turma
+
+    Returns:
+        tuple: (grupos, rótulos) com os grupos de todas as turmas em sequência e, para
+        cada grupo, o rótulo "turma - Grupo n"; os grupos formam um Agrupamento quando
+        todas as turmas vêm da mesma Turma
+    """
+    rotulos = [f"{nome} - Grupo {numero}" for nome, grupos in formacoes.items() for numero in range(1, len(grupos) + 1)]
+
+    agrupamentos = list(formacoes.values())
+    if agrupamentos and all(isinstance(grupos, Agrupamento) for grupos in agrupamentos):
+        turma = agrupamentos[0].turma
+        if all(grupos.turma is turma for grupos in agrupamentos):
+            return Agrupamento(turma, [g for grupos in agrupamentos for g in grupos.grupos_indices]), rotulos
+
+    return [grupo for grupos in agrupamentos for grupo in grupos], rotulos
@@ -3,8 +3,30 @@ Módulo de validação de dados de estudantes.
 Contém funções para validar e detectar problemas nos dados de entrada.
 """
 
+import mmap
+import os
 import re
 
+import numpy as np
+import pandas as pd
+
+from logic.roster import valores_coluna
+
+# Formato alternativo "Matrícula Nome" (sem vírgula), aplicado a linhas já sem espaços nas pontas
+PADRAO_SEM_VIRGULA = re.compile(r"(\d+)\s*(.*)")
+
+# Bytes copiados por vez ao procurar quebras de linha em um memoryview
+BYTES_BUSCA = 64 * 1024
+
+# Abaixo desse número de linhas, as duplicatas são indexadas com um dicionário: montar
+# os arrays do factorize custa mais do que percorrer as poucas linhas da caixa de texto
+LIMIAR_DUPLICATAS_VETORIZADO = 500
+
+# Mensagens de erro de formato das linhas de entrada
+ERRO_VAZIO = "Matrícula ou nome vazio"
+ERRO_SEM_NOME = "Nome não encontrado após matrícula"
+ERRO_FORMATO = "Formato não reconhecido. Use 'Matrícula, Nome' ou 'Matrícula Nome'"
+
 
 def validar_formato_entrada(linha):
     """
@@ -28,7 +50,7 @@ def validar_formato_entrada(linha):
         nome = partes[1].strip()
 
         if not matricula or not nome:
-            return False, "Matrícula ou nome vazio"
+            return False, ERRO_VAZIO
 
         return True, {
             "matricula": matricula,
@@ -37,13 +59,13 @@ def validar_formato_entrada(linha):
         }
 
     # Formato alternativo: "Matrícula Nome" (sem vírgula)
-    match = re.match(r"^(\d+)\s*(.*?)$", linha)
+    match = PADRAO_SEM_VIRGULA.match(linha)
     if match:
         matricula = match.group(1)
         nome = match.group(2).strip()
 
         if not nome:
-            return False, "Nome não encontrado após matrícula"
+            return False, ERRO_SEM_NOME
 
         return True, {
             "matricula": matricula,
@@ -51,36 +73,154 @@ def validar_formato_entrada(linha):
             "completo": f"{matricula}, {nome}",
         }
 
-    return False, "Formato não reconhecido. Use 'Matrícula, Nome' ou 'Matrícula Nome'"
+    return False, ERRO_FORMATO
 
 
-def validar_duplicatas(estudantes):
+def interpretar_texto_entrada(texto_input):
     """
-    Detecta matrículas duplicadas na lista de estudantes.
+    Interpreta todas as linhas de um texto de entrada de uma vez.
+
+    Aplica as mesmas regras de validar_formato_entrada, mas em uma única passada
+    pelo texto, sem a chamada por linha e com a expressão regular pré-compilada;
+    só as linhas sem vírgula passam pela expressão regular.
 
     Args:
-        estudantes (list): Lista de dicionários de estudantes
+        texto_input (str): Texto contendo dados dos estudantes, um por linha
 
     Returns:
-        dict: Dicionário com matrículas duplicadas e suas ocorrências
+        tuple: (estudantes, erros), com os erros no formato {"linha", "conteudo", "erro"}
+        e as linhas numeradas a partir de 1
+    """
+    estudantes = []
+    erros = []
+    casar = PADRAO_SEM_VIRGULA.match
+
+    for num_linha, linha in enumerate(texto_input.split("\n"), 1):
+        linha = linha.strip()
+        if not linha:
+            continue  # Linha vazia
+
+        matricula, virgula, nome = linha.partition(",")
+        if virgula:
+            matricula = matricula.strip()
+            nome = nome.strip()
+            erro = ERRO_VAZIO
+        else:
+            encontrado = casar(linha)
+            if encontrado is None:
+                erros.append({"linha": num_linha, "conteudo": linha, "erro": ERRO_FORMATO})
+                continue
+            matricula = encontrado.group(1)
+            nome = encontrado.group(2).strip()
+            erro = ERRO_SEM_NOME
+
+        if matricula and nome:
+            estudantes.append({"matricula": matricula, "nome": nome, "completo": f"{matricula}, {nome}"})
+        else:
+            erros.append({"linha": num_linha, "conteudo": linha, "erro": erro})
+
+    return estudantes, erros
+
+
+def indexar_duplicatas(matriculas, nomes=None, limite=None):
+    """
+    Detecta matrículas repetidas, de forma vetorizada (factorize + agrupamento por
+    código) a partir de LIMIAR_DUPLICATAS_VETORIZADO linhas.
+
+    As matrículas são comparadas como texto sem espaços nas pontas; matrículas vazias
+    são ignoradas.
+
+    Args:
+        matriculas (iterable): Matrícula de cada linha
+        nomes (list, optional): Nome de cada linha, na mesma ordem
+        limite (int, optional): Máximo de índices e nomes guardados por matrícula
+            ("count" continua contando todas as ocorrências)
+
+    Returns:
+        dict: {matrícula: {"count", "indices", "nomes"}} só para as matrículas repetidas,
+        na ordem em que aparecem pela primeira vez
     """
-    matriculas_count = {}
+    valores = [valor.strip() if valor.__class__ is str else str(valor).strip() for valor in matriculas]
+
+    # Sem nenhuma repetição (o caso comum), não há índice a montar
+    if len(set(valores)) == len(valores):
+        return {}
+
+    if len(valores) < LIMIAR_DUPLICATAS_VETORIZADO:
+        return _indexar_duplicatas_dicionario(valores, nomes, limite)
+    return _indexar_duplicatas_vetorizado(valores, nomes, limite)
+
+
+def _indexar_duplicatas_dicionario(valores, nomes, limite):
+    """Indexa as matrículas repetidas percorrendo as linhas com um dicionário."""
+    posicoes_por_matricula: dict[str, list[int]] = {}
+    for posicao, valor in enumerate(valores):
+        if valor:
+            posicoes_por_matricula.setdefault(valor, []).append(posicao)
+
+    duplicatas = {}
+    for valor, posicoes in posicoes_por_matricula.items():
+        if len(posicoes) > 1:
+            guardadas = posicoes if limite is None else posicoes[:limite]
+            duplicatas[valor] = {
+                "count": len(posicoes),
+                "indices": guardadas,
+                "nomes": [nomes[i] for i in guardadas] if nomes is not None else [],
+            }
+
+    return duplicatas
 
-    for i, estudante in enumerate(estudantes):
-        matricula = str(estudante.get("matricula", "")).strip()
-        if matricula:
-            if matricula not in matriculas_count:
-                matriculas_count[matricula] = {"count": 0, "indices": [], "nomes": []}
-            matriculas_count[matricula]["count"] += 1
-            matriculas_count[matricula]["indices"].append(i)
-            matriculas_count[matricula]["nomes"].append(estudante.get("nome", ""))
 
-    # Filtrar apenas duplicatas
-    duplicatas = {matricula: info for matricula, info in matriculas_count.items() if info["count"] > 1}
+def _indexar_duplicatas_vetorizado(valores, nomes, limite):
+    """Indexa as matrículas repetidas com factorize e agrupamento por código."""
+    vetor = np.array(valores, dtype=object)
+
+    # Os códigos seguem a ordem da primeira aparição; matrículas vazias ficam de fora
+    codigos, unicos = pd.factorize(vetor)
+    codigos[vetor == ""] = -1
+    contagem = np.bincount(codigos[codigos >= 0], minlength=len(unicos))
+    repetidos = np.flatnonzero(contagem > 1)
+    if not len(repetidos):
+        return {}
+
+    # Linhas das matrículas repetidas agrupadas por código, mantendo a ordem das linhas
+    repetido = np.zeros(len(unicos) + 1, dtype=bool)
+    repetido[repetidos] = True
+    ordem = np.flatnonzero(repetido[codigos])
+    ordem = ordem[np.argsort(codigos[ordem], kind="stable")]
+
+    # Uma única conversão para listas e fatiamento pelos tamanhos acumulados
+    tamanhos = contagem[repetidos].tolist()
+    limites = np.cumsum(tamanhos).tolist()
+    posicoes = ordem.tolist()
+    nomes_repetidos = [nomes[i] for i in posicoes] if nomes is not None else None
+
+    duplicatas = {}
+    for codigo, tamanho, inicio in zip(repetidos.tolist(), tamanhos, [0] + limites[:-1]):
+        fim = inicio + (tamanho if limite is None else min(tamanho, limite))
+        duplicatas[unicos[codigo]] = {
+            "count": tamanho,
+            "indices": posicoes[inicio:fim],
+            "nomes": nomes_repetidos[inicio:fim] if nomes_repetidos is not None else [],
+        }
 
     return duplicatas
 
 
+def validar_duplicatas(estudantes, limite=None):
+    """
+    Detecta matrículas duplicadas na lista de estudantes.
+
+    Args:
+        estudantes (list or Turma): Lista de dicionários de estudantes
+        limite (int, optional): Máximo de índices e nomes guardados por matrícula
+
+    Returns:
+        dict: Dicionário com matrículas duplicadas e suas ocorrências
+    """
+    return indexar_duplicatas(valores_coluna(estudantes, "matricula"), valores_coluna(estudantes, "nome"), limite)
+
+
 def validar_csv(df, col_matricula, col_nome):
     """
     Valida um DataFrame importado de CSV.
@@ -104,52 +244,50 @@ def validar_csv(df, col_matricula, col_nome):
     if erros:
         return False, erros
 
-    # Verificar valores vazios
-    matriculas_vazias = df[col_matricula].isna().sum()
-    nomes_vazios = df[col_nome].isna().sum()
+    # Verificar valores vazios e duplicatas
+    duplicatas = indexar_duplicatas(df[col_matricula].dropna(), limite=0)
+    erros = mensagens_validacao_csv(df[col_matricula].isna().sum(), df[col_nome].isna().sum(), list(duplicatas))
+
+    return len(erros) == 0, erros
+
+
+def mensagens_validacao_csv(matriculas_vazias, nomes_vazios, duplicadas):
+    """
+    Monta as mensagens de erro da validação de um CSV.
+
+    Args:
+        matriculas_vazias (int): Número de matrículas vazias
+        nomes_vazios (int): Número de nomes vazios
+        duplicadas (list): Matrículas duplicadas, na ordem da primeira aparição
 
+    Returns:
+        list: Mensagens de erro (vazia se o CSV for válido)
+    """
+    erros = []
     if matriculas_vazias > 0:
         erros.append(f"{matriculas_vazias} matrículas vazias encontradas")
     if nomes_vazios > 0:
         erros.append(f"{nomes_vazios} nomes vazios encontrados")
-
-    # Verificar duplicatas
-    matriculas = df[col_matricula].dropna().astype(str).str.strip()
-    duplicatas = matriculas[matriculas.duplicated(keep=False)]
-
-    if not duplicatas.empty:
-        valores_dup = duplicatas.unique()
-        erros.append(f"Matrículas duplicadas: {', '.join(valores_dup[:5])}")
-
-    return len(erros) == 0, erros
+    if duplicadas:
+        erros.append(f"Matrículas duplicadas: {', '.join(duplicadas[:5])}")
+    return erros
 
 
-def processar_entrada_com_validacao(texto_input):
+def processar_entrada_com_validacao(texto_input, limite_duplicatas=None):
     """
     Processa entrada de texto com validação completa.
 
     Args:
         texto_input (str): Texto contendo dados dos estudantes
+        limite_duplicatas (int, optional): Máximo de índices e nomes guardados por matrícula duplicada
 
     Returns:
         dict: Resultado do processamento com estudantes, erros e duplicatas
     """
-    estudantes = []
-    erros_linhas = []
-
-    for num_linha, linha in enumerate(texto_input.split("\n"), 1):
-        valido, resultado = validar_formato_entrada(linha)
-
-        if resultado is None:
-            continue  # Linha vazia
-
-        if valido:
-            estudantes.append(resultado)
-        else:
-            erros_linhas.append({"linha": num_linha, "conteudo": linha.strip(), "erro": resultado})
+    estudantes, erros_linhas = interpretar_texto_entrada(texto_input)
 
     # Verificar duplicatas
-    duplicatas = validar_duplicatas(estudantes)
+    duplicatas = validar_duplicatas(estudantes, limite_duplicatas)
 
     return {
         "estudantes": estudantes,
@@ -160,22 +298,94 @@ def processar_entrada_com_validacao(texto_input):
     }
 
 
-def extrair_preview_dados(texto_input, limite=5):
+def _encontrar(buffer, quebra, inicio=0):
     """
-    Extrai um preview dos dados para exibição antes do processamento completo.
+    Posição da próxima quebra de linha, como find(), também para memoryview (ex.:
+    getbuffer() de um arquivo enviado), que não tem o método: só blocos de
+    BYTES_BUSCA bytes são copiados por vez.
+    """
+    if hasattr(buffer, "find"):
+        return buffer.find(quebra, inicio)
+    tamanho = len(buffer)
+    while inicio < tamanho:
+        posicao = buffer[inicio : inicio + BYTES_BUSCA].tobytes().find(quebra)
+        if posicao >= 0:
+            return inicio + posicao
+        inicio += BYTES_BUSCA
+    return -1
+
+
+def _fatia(buffer, inicio, fim):
+    """Trecho do buffer como str ou bytes (memoryview é copiado só nesse trecho)."""
+    trecho = buffer[inicio:fim]
+    return trecho.tobytes() if isinstance(trecho, memoryview) else trecho
+
+
+def primeiras_linhas(buffer, limite, quebra="\n"):
+    """
+    Percorre o início de um texto (ou buffer de bytes) até achar limite linhas não vazias,
+    sem dividir o restante.
 
     Args:
-        texto_input (str): Texto de entrada
-        limite (int): Número máximo de linhas para preview
+        buffer (str, bytes, mmap.mmap or memoryview): Conteúdo com um registro por linha
+        limite (int): Número de linhas não vazias desejadas
+        quebra (str or bytes): Quebra de linha, do mesmo tipo do buffer
 
     Returns:
-        dict: Preview dos dados com estatísticas
+        tuple: (até limite linhas não vazias, sem espaços nas pontas; posição em que
+            a leitura parou, maior que o tamanho do buffer se chegou ao fim)
     """
-    linhas = [l.strip() for l in texto_input.split("\n") if l.strip()]
-    total_linhas = len(linhas)
+    linhas: list = []
+    inicio = 0
+    tamanho = len(buffer)
+    while len(linhas) < limite and inicio <= tamanho:
+        fim = _encontrar(buffer, quebra, inicio)
+        if fim < 0:
+            fim = tamanho
+        linha = _fatia(buffer, inicio, fim).strip()
+        if linha:
+            linhas.append(linha)
+        inicio = fim + 1
+    return linhas, inicio
+
+
+def estimar_linhas_preenchidas(buffer, limite, quebra="\n"):
+    """
+    Lê as primeiras linhas não vazias e estima o total sem percorrer o restante.
+
+    Uma linha a mais que o limite é lida para saber se há outras depois do preview.
+    Se a leitura chega ao fim, o total é exato; senão, é estimado pelo tamanho médio
+    das linhas lidas, de modo que o custo não depende do tamanho da entrada.
+
+    Args:
+        buffer (str, bytes, mmap.mmap or memoryview): Conteúdo com um registro por linha
+        limite (int): Número de linhas do preview
+        quebra (str or bytes): Quebra de linha, do mesmo tipo do buffer
 
+    Returns:
+        tuple: (até limite linhas não vazias, total de linhas não vazias, se o total é aproximado)
+    """
+    linhas, lido = primeiras_linhas(buffer, limite + 1, quebra)
+    tamanho = len(buffer)
+    if lido > tamanho:
+        return linhas[:limite], len(linhas), False
+    return linhas[:limite], max(len(linhas), round(len(linhas) * tamanho / lido)), True
+
+
+def montar_preview(linhas, total_linhas, total_aproximado=False):
+    """
+    Valida as linhas do preview e monta as estatísticas.
+
+    Args:
+        linhas (list): Primeiras linhas não vazias
+        total_linhas (int): Total de linhas não vazias da entrada
+        total_aproximado (bool): Se o total é uma estimativa
+
+    Returns:
+        dict: Preview dos dados com estatísticas
+    """
     preview = []
-    for i, linha in enumerate(linhas[:limite]):
+    for i, linha in enumerate(linhas):
         valido, resultado = validar_formato_entrada(linha)
         preview.append(
             {
@@ -191,8 +401,67 @@ def extrair_preview_dados(texto_input, limite=5):
 
     return {
         "total_linhas": total_linhas,
+        "total_aproximado": total_aproximado,
         "mostradas": len(preview),
         "preview": preview,
         "validas_preview": validas,
         "invalidas_preview": len(preview) - validas,
     }
+
+
+def extrair_preview_dados(texto_input, limite=5):
+    """
+    Extrai um preview dos dados para exibição antes do processamento completo.
+
+    Só o início do texto é lido: o total de linhas não vazias é exato quando o texto
+    cabe no preview e estimado (total_aproximado) quando há mais linhas; a contagem
+    exata vem da validação completa.
+
+    Args:
+        texto_input (str): Texto de entrada
+        limite (int): Número máximo de linhas para preview
+
+    Returns:
+        dict: Preview dos dados com estatísticas
+    """
+    return montar_preview(*estimar_linhas_preenchidas(texto_input, limite))
+
+
+def extrair_preview_buffer(buffer, limite=5, codificacao="utf-8"):
+    """
+    Extrai o preview de um buffer de bytes (ex.: arquivo enviado ou mapeado em memória)
+    sem decodificar nem percorrer o conteúdo inteiro.
+
+    O total de linhas segue a mesma regra de extrair_preview_dados; linhas em branco
+    são as que só têm espaços ASCII.
+
+    Args:
+        buffer (bytes, mmap.mmap or memoryview): Conteúdo com um estudante por linha
+        limite (int): Número máximo de linhas para preview
+        codificacao (str): Codificação do texto
+
+    Returns:
+        dict: Preview dos dados com estatísticas
+    """
+    linhas, total_linhas, aproximado = estimar_linhas_preenchidas(buffer, limite, b"\n")
+    linhas = [linha.decode(codificacao, errors="replace").strip() for linha in linhas]
+    return montar_preview([linha for linha in linhas if linha], total_linhas, aproximado)
+
+
+def extrair_preview_arquivo(caminho, limite=5, codificacao="utf-8"):
+    """
+    Extrai o preview de um arquivo de texto mapeando-o em memória.
+
+    Args:
+        caminho (str): Caminho do arquivo
+        limite (int): Número máximo de linhas para preview
+        codificacao (str): Codificação do texto
+
+    Returns:
+        dict: Preview dos dados com estatísticas
+    """
+    with open(caminho, "rb") as arquivo:
+        if not os.fstat(arquivo.fileno()).st_size:
+            return extrair_preview_buffer(b"", limite, codificacao)
+        with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            return extrair_preview_buffer(buffer, limite, codificacao)
@@ -0,0 +1,225 @@
+"""
+Módulo de validação incremental da entrada manual.
+Guarda o resultado de cada linha da caixa de texto para que, a cada edição, apenas
+as linhas alteradas sejam interpretadas de novo.
+
+A cada atualização:
+    - O trecho alterado é o que sobra depois de descartar as linhas iguais no início
+      e no fim do texto anterior (uma edição costuma mexer em poucas linhas seguidas).
+    - As linhas do trecho são buscadas em um cache indexado pelo conteúdo da linha;
+      só as ausentes passam por validar_formato_entrada. Cada linha recebe sua própria
+      cópia do estudante guardado, para que linhas repetidas não compartilhem o
+      mesmo dicionário.
+    - A lista de estudantes, as posições das linhas vazias e com erro e a contagem de
+      matrículas são atualizadas apenas com as linhas que saíram e entraram; o índice
+      de duplicatas só é montado quando há matrículas repetidas.
+"""
+
+from bisect import bisect_left
+from collections import Counter
+
+from logic.name_matching import LIMIAR_SEMELHANCA, detectar_nomes_semelhantes
+from logic.validation import validar_duplicatas, validar_formato_entrada
+
+# Marca de linha ausente do cache (None é o resultado de uma linha vazia)
+_AUSENTE = object()
+
+# Abaixo desse número de linhas guardadas, o cache não é podado
+CACHE_MINIMO = 1_000
+
+# Linhas comparadas de uma vez (em C) ao procurar o trecho alterado
+BLOCO_COMPARACAO = 512
+
+
+class SessaoValidacao:
+    """
+    Resultados por linha da entrada manual, atualizados a cada edição do texto.
+    """
+
+    def __init__(self, limite_duplicatas=None):
+        """
+        Inicializa uma sessão sem texto.
+
+        Args:
+            limite_duplicatas (int, optional): Máximo de índices e nomes guardados por matrícula duplicada
+        """
+        self.limite_duplicatas = limite_duplicatas
+        self.linhas = []
+        # Por linha: None (vazia), dict (estudante) ou str (mensagem de erro)
+        self.resultados = []
+        self.estudantes = []
+        # Posições (0-indexed) das linhas vazias e das linhas com erro, em ordem
+        self.vazias = []
+        self.com_erro = []
+        self.cache = {}
+        self.contagem = Counter()
+        self.repetidas = set()
+        self.reprocessadas = 0
+        # Incrementada a cada edição; invalida a busca de nomes semelhantes guardada
+        self.versao = 0
+        self._semelhantes = None
+
+    def _interpretar(self, linha):
+        """Retorna o resultado de uma linha, interpretando-a só se não estiver no cache."""
+        resultado = self.cache.get(linha, _AUSENTE)
+        if resultado is _AUSENTE:
+            _, resultado = validar_formato_entrada(linha)
+            self.cache[linha] = resultado
+            self.reprocessadas += 1
+        # O dicionário do cache nunca sai da sessão; cada linha recebe uma cópia
+        return dict(resultado) if resultado.__class__ is dict else resultado
+
+    def _contar(self, resultados, sinal):
+        """Soma (sinal=1) ou subtrai (sinal=-1) as matrículas dos resultados na contagem."""
+        contagem = self.contagem
+        for resultado in resultados:
+            if resultado.__class__ is not dict:
+                continue
+            matricula = resultado["matricula"]
+            contagem[matricula] += sinal
+            if contagem[matricula] > 1:
+                self.repetidas.add(matricula)
+            else:
+                self.repetidas.discard(matricula)
+                if not contagem[matricula]:
+                    del contagem[matricula]
+
+    def _substituir(self, inicio, fim_anterior, novos):
+        """Troca os resultados das linhas [inicio, fim_anterior) pelos novos, atualizando os índices."""
+        anteriores = self.resultados[inicio:fim_anterior]
+        deslocamento = len(novos) - len(anteriores)
+
+        # Posição do primeiro estudante do trecho: linhas anteriores menos as vazias e com erro
+        primeiro = inicio - bisect_left(self.vazias, inicio) - bisect_left(self.com_erro, inicio)
+        removidos = sum(1 for resultado in anteriores if resultado.__class__ is dict)
+        self.estudantes[primeiro : primeiro + removidos] = [r for r in novos if r.__class__ is dict]
+
+        self.vazias = _deslocar(
+            self.vazias, inicio, fim_anterior, [inicio + k for k, r in enumerate(novos) if r is None], deslocamento
+        )
+        self.com_erro = _deslocar(
+            self.com_erro,
+            inicio,
+            fim_anterior,
+            [inicio + k for k, r in enumerate(novos) if r.__class__ is str],
+            deslocamento,
+        )
+
+        self._contar(anteriores, -1)
+        self._contar(novos, 1)
+        self.resultados[inicio:fim_anterior] = novos
+
+    def atualizar(self, texto_input):
+        """
+        Atualiza a sessão com o texto atual da caixa de entrada.
+
+        Args:
+            texto_input (str): Texto contendo dados dos estudantes
+
+        Returns:
+            dict: Resultado no mesmo formato de processar_entrada_com_validacao
+        """
+        linhas = texto_input.split("\n")
+        anteriores = self.linhas
+        self.reprocessadas = 0
+
+        # Linhas iguais no início e no fim delimitam o trecho alterado
+        inicio = _prefixo_comum(linhas, anteriores)
+        sufixo = _prefixo_comum(linhas[inicio:][::-1], anteriores[inicio:][::-1])
+        fim_novo, fim_anterior = len(linhas) - sufixo, len(anteriores) - sufixo
+
+        if inicio < fim_novo or inicio < fim_anterior:
+            self._substituir(inicio, fim_anterior, [self._interpretar(linha) for linha in linhas[inicio:fim_novo]])
+            self.versao += 1
+        self.linhas = linhas
+
+        # Descartar linhas antigas do cache quando ele cresce demais
+        if len(self.cache) > max(CACHE_MINIMO, 2 * len(linhas)):
+            cache = self.cache
+            self.cache = {linha: cache[linha] for linha in linhas}
+
+        return self.resultado()
+
+    def nomes_semelhantes(self, limiar=LIMIAR_SEMELHANCA, limite=None):
+        """
+        Procura nomes semelhantes com matrículas diferentes (ver detectar_nomes_semelhantes),
+        repetindo a busca só se o texto mudou desde a última chamada.
+
+        Args:
+            limiar (float): Coeficiente de Dice mínimo entre os trigramas, de 0 a 1
+            limite (int, optional): Máximo de pares devolvidos
+
+        Returns:
+            list: Pares {"indices", "matriculas", "nomes", "similaridade"} ordenados pelos índices
+        """
+        chave = (self.versao, limiar, limite)
+        if self._semelhantes is None or self._semelhantes[0] != chave:
+            self._semelhantes = (chave, detectar_nomes_semelhantes(self.estudantes, limiar, limite))
+        return self._semelhantes[1]
+
+    def resultado(self):
+        """
+        Monta o resultado da validação a partir dos resultados por linha.
+
+        Returns:
+            dict: Estudantes, total, erros, duplicatas e se a entrada é válida
+        """
+        estudantes = list(self.estudantes)
+        erros = [
+            {"linha": posicao + 1, "conteudo": self.linhas[posicao].strip(), "erro": self.resultados[posicao]}
+            for posicao in self.com_erro
+        ]
+
+        duplicatas = validar_duplicatas(estudantes, self.limite_duplicatas) if self.repetidas else {}
+
+        return {
+            "estudantes": estudantes,
+            "total": len(estudantes),
+            "erros": erros,
+            "duplicatas": duplicatas,
+            "valido": len(erros) == 0,
+        }
+
+
+def _prefixo_comum(linhas, anteriores):
+    """
+    Conta as linhas iguais no início de duas listas, comparando blocos inteiros antes
+    de comparar linha a linha.
+
+    Args:
+        linhas (list): Linhas do texto atual
+        anteriores (list): Linhas do texto anterior
+
+    Returns:
+        int: Número de linhas iguais no início
+    """
+    limite = min(len(linhas), len(anteriores))
+    inicio = 0
+    while inicio + BLOCO_COMPARACAO <= limite and (
+        linhas[inicio : inicio + BLOCO_COMPARACAO] == anteriores[inicio : inicio + BLOCO_COMPARACAO]
+    ):
+        inicio += BLOCO_COMPARACAO
+    while inicio < limite and linhas[inicio] == anteriores[inicio]:
+        inicio += 1
+    return inicio
+
+
+def _deslocar(posicoes, inicio, fim_anterior, novas, deslocamento):
+    """
+    Atualiza uma lista ordenada de posições após a troca das linhas [inicio, fim_anterior).
+
+    Args:
+        posicoes (list): Posições ordenadas antes da troca
+        inicio (int): Primeira linha trocada
+        fim_anterior (int): Fim (exclusivo) do trecho trocado no texto anterior
+        novas (list): Posições ordenadas dentro do trecho novo
+        deslocamento (int): Diferença entre o número de linhas novas e anteriores do trecho
+
+    Returns:
+        list: Posições ordenadas após a troca
+    """
+    antes = bisect_left(posicoes, inicio)
+    depois = bisect_left(posicoes, fim_anterior)
+    if not deslocamento:
+        return posicoes[:antes] + novas + posicoes[depois:]
+    return posicoes[:antes] + novas + [posicao + deslocamento for posicao in posicoes[depois:]]
@@ -0,0 +1,76 @@
+"""
+Módulo de execução em processos.
+Reúne os limites e o padrão de pool de processos das formações que distribuem
+trabalho entre processos (tentativas com várias sementes e formação por turma).
+
+O contexto comum a todas as tarefas (função de formação, turma, parâmetros) é
+enviado uma única vez a cada processo trabalhador, pelo inicializador do pool, em
+vez de ser serializado a cada tarefa. As funções executadas nos trabalhadores
+precisam ser definidas no nível do módulo e leem esse contexto com
+contexto_trabalhador().
+"""
+
+import concurrent.futures
+import os
+
+# Abaixo dessa carga (estudantes, ou estudantes x tentativas), o trabalho roda em série:
+# criar processos custaria mais do que as próprias formações
+LIMIAR_PARALELO = 20_000
+
+# Máximo de processos por formação, para não monopolizar servidores compartilhados
+MAX_TRABALHADORES = 4
+
+# Contexto compartilhado por todas as tarefas de um processo trabalhador
+_contexto_trabalhador = {}
+
+
+def planejar_trabalhadores(tarefas, carga, max_trabalhadores=None):
+    """
+    Decide quantos processos usar e se vale a pena rodar em paralelo.
+
+    Args:
+        tarefas (int): Número de tarefas independentes
+        carga (int): Tamanho total do trabalho, comparado com o limiar
+        max_trabalhadores (int, optional): Máximo de processos (padrão: MAX_TRABALHADORES)
+
+    Returns:
+        tuple: (número de processos, se roda em paralelo)
+    """
+    if max_trabalhadores is None:
+        max_trabalhadores = MAX_TRABALHADORES
+    trabalhadores = max(1, min(max_trabalhadores, tarefas, os.cpu_count() or 1))
+    return trabalhadores, trabalhadores > 1 and carga >= LIMIAR_PARALELO
+
+
+def criar_executor(trabalhadores, **contexto):
+    """
+    Cria um pool de processos que recebe o contexto comum uma vez por processo.
+
+    Args:
+        trabalhadores (int): Número de processos
+        **contexto: Dados comuns a todas as tarefas, lidos com contexto_trabalhador()
+
+    Returns:
+        concurrent.futures.ProcessPoolExecutor: Pool de processos
+    """
+    return concurrent.futures.ProcessPoolExecutor(
+        max_workers=trabalhadores,
+        initializer=_inicializar_trabalhador,
+        initargs=(contexto,),
+    )
+
+
+def contexto_trabalhador():
+    """
+    Obtém o contexto recebido pelo processo trabalhador atual.
+
+    Returns:
+        dict: Contexto passado a criar_executor
+    """
+    return _contexto_trabalhador
+
+
+def _inicializar_trabalhador(contexto):
+    """Guarda no processo trabalhador os dados comuns a todas as tarefas."""
+    _contexto_trabalhador.clear()
+    _contexto_trabalhador.update(contexto)
@@ -0,0 +1,117 @@
+"""
+Testes para o módulo de formação balanceada por pontuação.
+"""
+
+import time
+
+import numpy as np
+
+from logic.balancing import (
+    converter_pontuacao,
+    formar_grupos_por_pontuacao,
+    particionar_por_pontuacao,
+    pontuacoes_estudantes,
+    refinar_por_trocas,
+)
+from logic.group_formation import calcular_estatisticas, formar_grupos
+
+
+def _estudantes(pontuacoes):
+    """Cria estudantes com as pontuações informadas."""
+    return [{"matricula": str(i), "nome": f"Aluno {i}", "pontuacao": p} for i, p in enumerate(pontuacoes)]
+
+
+def _dispersao(pontuacoes, grupos):
+    """Diferença entre a maior e a menor média dos grupos."""
+    medias = [pontuacoes[grupo].mean() for grupo in grupos]
+    return max(medias) - min(medias)
+
+
+class TestConverterPontuacao:
+    """Testes para a função converter_pontuacao."""
+
+    def test_converter_valores(self):
+        """Testa números, vírgula decimal e valores inválidos."""
+        assert converter_pontuacao(7) == 7.0
+        assert converter_pontuacao("7,5") == 7.5
+        assert converter_pontuacao(" 8.25 ") == 8.25
+        assert converter_pontuacao("abc") is None
+        assert converter_pontuacao(None) is None
+        assert converter_pontuacao(float("nan")) is None
+
+    def test_ausentes_recebem_media(self):
+        """Testa que estudantes sem pontuação recebem a média dos demais."""
+        estudantes = [{"pontuacao": 4}, {"pontuacao": "8"}, {}]
+
+        assert pontuacoes_estudantes(estudantes).tolist() == [4.0, 8.0, 6.0]
+
+
+class TestParticionarPorPontuacao:
+    """Testes para particionar_por_pontuacao e formar_grupos_por_pontuacao."""
+
+    def test_tamanhos_respeitados(self):
+        """Testa que cada estudante aparece uma vez e os tamanhos são mantidos."""
+        pontuacoes = np.arange(11, dtype=float)
+
+        grupos = particionar_por_pontuacao(pontuacoes, [4, 4, 3], semente=1)
+
+        assert [len(g) for g in grupos] == [4, 4, 3]
+        assert sorted(np.concatenate(grupos).tolist()) == list(range(11))
+
+    def test_somas_equilibradas(self):
+        """Testa um caso pequeno em que a divisão perfeita é possível."""
+        estudantes = _estudantes([10, 9, 8, 7, 3, 2, 1, 0])
+
+        grupos = formar_grupos_por_pontuacao(estudantes, 4, semente=3)
+
+        assert [sum(estudantes[i]["pontuacao"] for i in g) for g in grupos] == [20, 20]
+
+    def test_mesmas_regras_de_tamanho(self):
+        """Testa que os tamanhos seguem a redistribuição de solitários dos outros métodos."""
+        estudantes = _estudantes(range(7))
+
+        grupos = formar_grupos_por_pontuacao(estudantes, 3, permitir_grupos_maiores=True)
+
+        assert sorted(len(g) for g in grupos) == [3, 4]
+
+    def test_reproduzivel_com_semente(self):
+        """Testa que a mesma semente produz os mesmos grupos com pontuações empatadas."""
+        estudantes = _estudantes([5] * 12)
+
+        a = formar_grupos_por_pontuacao(estudantes, 3, semente=42)
+        b = formar_grupos_por_pontuacao(estudantes, 3, semente=42)
+
+        assert [g.tolist() for g in a] == [g.tolist() for g in b]
+
+    def test_turma_grande_rapida_e_equilibrada(self):
+        """Testa 100 mil estudantes: rápido e com médias muito mais próximas que o sorteio."""
+        rng = np.random.default_rng(0)
+        pontuacoes = rng.normal(7, 2, 100_000).round(1)
+
+        inicio = time.perf_counter()
+        grupos = particionar_por_pontuacao(pontuacoes, [5] * 20_000, semente=1)
+        grupos = refinar_por_trocas(pontuacoes, grupos)
+        decorrido = time.perf_counter() - inicio
+
+        assert decorrido < 1.0
+        assert _dispersao(pontuacoes, grupos) < 0.1
+
+
+class TestBalanceadoComPontuacao:
+    """Testes para o método "Balanceado" com pontuação e suas estatísticas."""
+
+    def test_formar_grupos_balanceado_usa_pontuacao(self):
+        """Testa que o método Balanceado equilibra as médias e as estatísticas mostram a dispersão."""
+        estudantes = _estudantes([10, 10, 10, 0, 0, 0])
+
+        grupos = formar_grupos(estudantes, 2, "Balanceado", semente=5)
+        stats = calcular_estatisticas(grupos)
+
+        assert stats["dispersao_pontuacao"] == 0
+        assert stats["medias_pontuacao"] == [5.0, 5.0, 5.0]
+
+    def test_estatisticas_sem_pontuacao(self):
+        """Testa que as estatísticas de pontuação só aparecem quando há pontuação."""
+        stats = calcular_estatisticas([[{"matricula": "1"}], [{"matricula": "2"}]])
+
+        assert "dispersao_pontuacao" not in stats
@@ -0,0 +1,205 @@
+"""
+Testes para o módulo de leitura de formatos colunares (Parquet e Feather).
+"""
+
+import io
+
+import pandas as pd
+import pytest
+
+import utils.exporters as exporters
+from logic.columnar_io import (
+    COLUNAR_DISPONIVEL,
+    MENSAGEM_SEM_PYARROW,
+    colunas_colunar,
+    como_texto,
+    formato_colunar,
+    importar_colunar,
+    ler_colunar,
+)
+from logic.roster import Agrupamento, Turma
+from utils.exporters import gerar_colunar_grupos, gerar_colunar_turma
+
+requer_pyarrow = pytest.mark.skipif(not COLUNAR_DISPONIVEL, reason=MENSAGEM_SEM_PYARROW)
+
+ESTUDANTES = [
+    {"matricula": "001", "nome": "Ana", "completo": "001, Ana", "turma": "A", "pontuacao": 7.5},
+    {"matricula": "002", "nome": "Bruno", "completo": "002, Bruno", "turma": "B"},
+    {"matricula": "003", "nome": "Carla", "completo": "003, Carla", "turma": "A", "pontuacao": 9.0},
+    {"matricula": "004", "nome": "Davi", "completo": "004, Davi", "turma": "", "pontuacao": 6.0},
+]
+
+
+class TestFormatoColunar:
+    """Testes para a função formato_colunar."""
+
+    def test_extensoes(self):
+        """Testa a identificação do formato pela extensão, sem diferenciar maiúsculas."""
+        assert formato_colunar("turma.parquet") == "parquet"
+        assert formato_colunar("turma.PQ") == "parquet"
+        assert formato_colunar("/tmp/turma.feather") == "feather"
+        assert formato_colunar("turma.arrow") == "feather"
+
+    def test_csv_nao_e_colunar(self):
+        """Testa que CSV e arquivos sem extensão não são colunares."""
+        assert formato_colunar("turma.csv") is None
+        assert formato_colunar("turma") is None
+
+
+@requer_pyarrow
+class TestImportarColunar:
+    """Testes para a função importar_colunar e a exportação da turma."""
+
+    @pytest.mark.parametrize("formato", ["parquet", "feather"])
+    def test_ida_e_volta_da_turma(self, formato):
+        """Testa que exportar e reimportar a turma preserva os estudantes."""
+        dados, filename = gerar_colunar_turma(ESTUDANTES, formato)
+        assert filename.endswith(exporters.ARQUIVOS_COLUNARES[formato][0])
+
+        turma, erros = importar_colunar(io.BytesIO(dados), formato, "matricula", "nome", ["turma"], "pontuacao")
+
+        assert erros == []
+        assert isinstance(turma, Turma)
+        assert turma.para_estudantes() == ESTUDANTES
+
+    def test_pontuacao_guardada_como_numero(self):
+        """Testa que a pontuação é gravada como número, não como texto."""
+        dados, _ = gerar_colunar_turma(ESTUDANTES)
+        df = ler_colunar(io.BytesIO(dados), "parquet")
+
+        assert df["pontuacao"].dtype == "float64"
+        assert df["pontuacao"].isna().tolist() == [False, True, False, False]
+
+    def test_le_so_as_colunas_mapeadas(self):
+        """Testa a leitura das colunas sem ler os dados e a leitura parcial."""
+        dados, _ = gerar_colunar_turma(ESTUDANTES, "feather")
+
+        assert colunas_colunar(io.BytesIO(dados), "feather") == ["matricula", "nome", "turma", "pontuacao"]
+        amostra = ler_colunar(io.BytesIO(dados), "feather", ["nome"], linhas=2)
+        assert amostra.columns.tolist() == ["nome"]
+        assert amostra["nome"].tolist() == ["Ana", "Bruno"]
+
+    def test_amostra_parquet(self):
+        """Testa a leitura das primeiras linhas de um Parquet."""
+        dados, _ = gerar_colunar_turma(ESTUDANTES)
+
+        assert len(ler_colunar(io.BytesIO(dados), "parquet", linhas=3)) == 3
+
+    def test_coluna_inexistente(self):
+        """Testa o erro de coluna não encontrada, sem ler os dados."""
+        dados, _ = gerar_colunar_turma(ESTUDANTES)
+
+        turma, erros = importar_colunar(io.BytesIO(dados), "parquet", "ra", "nome")
+
+        assert len(turma) == 0
+        assert erros == ["Coluna 'ra' não encontrada"]
+
+    def test_matriculas_numericas_e_vazias(self):
+        """Testa um arquivo de outra origem, com matrículas numéricas e nomes vazios."""
+        df = pd.DataFrame({"ra": [10, 20, 10], "aluno": ["Ana", None, "Ana Clara"]})
+        arquivo = io.BytesIO()
+        df.to_parquet(arquivo, index=False)
+
+        turma, erros = importar_colunar(arquivo, "parquet", "ra", "aluno")
+
+        assert [estudante["matricula"] for estudante in turma.para_estudantes()] == ["10", "10"]
+        assert erros == ["1 nomes vazios encontrados", "Matrículas duplicadas: 10"]
+
+    def test_matriculas_numericas_com_lacunas(self):
+        """Testa que matrículas numéricas com lacunas (float no arquivo) não viram "10.0"."""
+        df = pd.DataFrame({"ra": [10, None, 30], "aluno": ["Ana", "Bruno", "Carla"]})
+        arquivo = io.BytesIO()
+        df.to_parquet(arquivo, index=False)
+
+        turma, erros = importar_colunar(arquivo, "parquet", "ra", "aluno")
+
+        assert [estudante["completo"] for estudante in turma.para_estudantes()] == ["10, Ana", "30, Carla"]
+        assert erros == ["1 matrículas vazias encontradas"]
+
+    def test_feather_em_blocos_e_categorias(self):
+        """Testa colunas em vários blocos, categóricas, com NaN e pontuação com vírgula decimal."""
+        df = pd.DataFrame(
+            {
+                "ra": [10.0, float("nan"), 20.0, 30.0],
+                "aluno": pd.Categorical([" Ana ", "Bruno", "Carla", ""]),
+                "nota": ["7,5", "8", None, "9"],
+            }
+        )
+        arquivo = io.BytesIO()
+        df.to_feather(arquivo, chunksize=2)
+
+        turma, erros = importar_colunar(arquivo, "feather", "ra", "aluno", col_pontuacao="nota")
+
+        assert turma.para_estudantes() == [
+            {"matricula": "10", "nome": "Ana", "completo": "10, Ana", "pontuacao": 7.5},
+            {"matricula": "20", "nome": "Carla", "completo": "20, Carla"},
+        ]
+        assert erros == ["1 matrículas vazias encontradas", "1 nomes vazios encontrados"]
+
+
+@requer_pyarrow
+class TestComoTexto:
+    """Testes para a função como_texto."""
+
+    def test_inteiros_e_ausentes(self):
+        """Testa que inteiros guardados como float voltam sem ".0" e ausentes continuam ausentes."""
+        serie = como_texto(pd.Series([10.0, None, 30.0]))
+
+        assert serie.tolist()[::2] == ["10", "30"]
+        assert serie.isna().tolist() == [False, True, False]
+
+    def test_decimais_preservados(self):
+        """Testa que valores não inteiros não são truncados."""
+        assert como_texto(pd.Series([1.5, 2.0])).tolist() == ["1.5", "2.0"]
+
+
+@requer_pyarrow
+class TestGerarColunarGrupos:
+    """Testes para a função gerar_colunar_grupos."""
+
+    def test_grupos_preservam_tipos(self):
+        """Testa que os grupos exportados voltam com o número do grupo como inteiro."""
+        agrupamento = Agrupamento(Turma.de_estudantes(ESTUDANTES), [[0, 2], [1, 3]])
+
+        dados, filename = gerar_colunar_grupos(agrupamento)
+        df = pd.read_parquet(io.BytesIO(dados))
+
+        assert filename.endswith(".parquet")
+        assert df["Grupo"].tolist() == [1, 1, 2, 2]
+        assert pd.api.types.is_integer_dtype(df["Grupo"])
+        assert df["Nome"].tolist() == ["Ana", "Carla", "Bruno", "Davi"]
+
+    def test_formato_desconhecido(self):
+        """Testa o erro para um formato não suportado."""
+        with pytest.raises(ValueError):
+            gerar_colunar_grupos([ESTUDANTES[:2]], "orc")
+
+    def test_arquivo_guardado_por_agrupamento(self):
+        """Testa que o arquivo de um Agrupamento é gravado uma vez e reutilizado."""
+        agrupamento = Agrupamento(Turma.de_estudantes(ESTUDANTES), [[0, 2], [1, 3]])
+
+        primeiro, _ = gerar_colunar_grupos(agrupamento)
+        segundo, _ = gerar_colunar_grupos(agrupamento)
+        feather, _ = gerar_colunar_grupos(agrupamento, "feather")
+
+        assert segundo is primeiro
+        assert feather is not primeiro
+
+    def test_matriculas_gravadas_como_texto(self):
+        """Testa que matrículas numéricas de uma lista de grupos são gravadas como texto."""
+        grupos = [[{"matricula": 10, "nome": "Ana"}], [{"matricula": 20, "nome": "Bruno"}]]
+
+        dados, _ = gerar_colunar_grupos(grupos)
+
+        assert pd.read_parquet(io.BytesIO(dados))["Matrícula"].tolist() == ["10", "20"]
+
+
+class TestSemPyarrow:
+    """Testes do comportamento sem o pacote pyarrow."""
+
+    def test_exportacao_explica_dependencia(self, monkeypatch):
+        """Testa que a exportação falha com uma mensagem indicando o pacote a instalar."""
+        monkeypatch.setattr(exporters, "COLUNAR_DISPONIVEL", False)
+
+        with pytest.raises(ImportError, match="pyarrow"):
+            gerar_colunar_turma(ESTUDANTES)
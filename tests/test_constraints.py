@@ -0,0 +1,141 @@
+"""
+Testes para o módulo de formação de grupos com restrições.
+"""
+
+import itertools
+import random
+
+from logic import local_search
+from logic.constraints import (
+    PontuadorRestricoes,
+    atributos_disponiveis,
+    formar_grupos_com_restricoes,
+    interpretar_pares,
+)
+from logic.group_formation import formar_grupos
+
+
+def _criar_estudantes(total):
+    """Cria estudantes com o atributo 'repetente' em um a cada cinco."""
+    return [
+        {"matricula": str(i), "nome": f"Aluno {i}", "repetente": "sim" if i % 5 == 0 else "não"} for i in range(total)
+    ]
+
+
+def _grupo_por_matricula(grupos):
+    """Mapeia cada matrícula para o número do grupo."""
+    return {e["matricula"]: numero for numero, grupo in enumerate(grupos) for e in grupo}
+
+
+class TestInterpretarPares:
+    """Testes para a função interpretar_pares."""
+
+    def test_separadores_variados(self):
+        """Testa pares separados por vírgula, ponto e vírgula e espaço."""
+        pares, invalidas = interpretar_pares("1, 2\n3;4\n\n5 6\n7")
+
+        assert pares == [("1", "2"), ("3", "4"), ("5", "6")]
+        assert invalidas == [5]
+
+
+class TestAtributosDisponiveis:
+    """Testes para a função atributos_disponiveis."""
+
+    def test_atributos_extras(self):
+        """Testa que apenas chaves além de matrícula, nome e completo são listadas."""
+        estudantes = [{"matricula": "1", "nome": "Ana", "completo": "1, Ana", "turma": "A"}]
+
+        assert atributos_disponiveis(estudantes) == ["turma"]
+
+
+class TestPontuadorRestricoes:
+    """Testes para o pontuador incremental."""
+
+    def test_delta_igual_a_recalculo(self):
+        """Testa que o custo incremental coincide com o custo recalculado."""
+        gerador = random.Random(5)
+        total, num_grupos = 24, 6
+        grupo_de = [i % num_grupos for i in range(total)]
+        juntos = [(0, 7), (3, 14), (8, 9)]
+        separados = [(1, 2), (4, 10), (12, 18)]
+        limites = [([i % 3 == 0 for i in range(total)], 1)]
+
+        pontuador = PontuadorRestricoes(grupo_de, num_grupos, juntos, separados, limites)
+
+        for _ in range(200):
+            a, b = gerador.sample(range(total), 2)
+            esperado = pontuador.custo + pontuador.delta_troca(a, b)
+            pontuador.aplicar_troca(a, b)
+            assert pontuador.custo == esperado == pontuador.custo_total()
+
+
+class TestFormarGruposComRestricoes:
+    """Testes para a formação com restrições."""
+
+    def test_restricoes_atendidas(self):
+        """Testa que juntos, separados e limites são respeitados."""
+        estudantes = _criar_estudantes(60)
+        restricoes = {
+            "juntos": [("1", "2"), ("3", "4")],
+            "separados": [("6", "7"), ("8", "9")],
+            "limites": [{"atributo": "repetente", "valor": "sim", "maximo": 1}],
+        }
+        relatorio = {}
+
+        grupos = formar_grupos(estudantes, 4, "Restrições", semente=1, restricoes=restricoes, relatorio=relatorio)
+        grupo_de = _grupo_por_matricula(grupos)
+
+        assert relatorio["valido"] is True
+        assert grupo_de["1"] == grupo_de["2"]
+        assert grupo_de["3"] == grupo_de["4"]
+        assert grupo_de["6"] != grupo_de["7"]
+        assert grupo_de["8"] != grupo_de["9"]
+        assert all(sum(e["repetente"] == "sim" for e in grupo) <= 1 for grupo in grupos)
+        assert sorted(len(g) for g in grupos) == [4] * 15
+
+    def test_reprodutivel_com_semente(self):
+        """Testa que a mesma semente gera a mesma formação."""
+        estudantes = _criar_estudantes(40)
+        restricoes = {"separados": [(str(i), str(i + 1)) for i in range(0, 39, 2)]}
+
+        primeiro = formar_grupos_com_restricoes(estudantes, 4, restricoes, semente=9)
+        segundo = formar_grupos_com_restricoes(estudantes, 4, restricoes, semente=9)
+
+        assert [g.tolist() for g in primeiro] == [g.tolist() for g in segundo]
+
+    def test_semente_independe_da_velocidade(self, monkeypatch):
+        """Testa que, com semente, a busca para pelo número de trocas, e não pelo relógio."""
+        estudantes = _criar_estudantes(40)
+        restricoes = {"limites": [{"atributo": "repetente", "valor": "não", "maximo": 0}]}
+        relatorio = {}
+
+        normal = formar_grupos_com_restricoes(
+            estudantes, 4, restricoes, semente=5, tempo_limite=0.05, relatorio=relatorio
+        )
+        assert relatorio["iteracoes"] == local_search.iteracoes_reproduziveis(0.05, 5)
+
+        # Máquina lenta: cada leitura do relógio avança 20 ms, estourando o orçamento de 50 ms
+        relogio = itertools.count(0.0, 0.02)
+        monkeypatch.setattr(local_search.time, "perf_counter", lambda: next(relogio))
+        lenta = formar_grupos_com_restricoes(estudantes, 4, restricoes, semente=5, tempo_limite=0.05)
+
+        assert [g.tolist() for g in lenta] == [g.tolist() for g in normal]
+
+    def test_restricao_impossivel(self):
+        """Testa que restrições impossíveis devolvem a melhor formação encontrada."""
+        estudantes = _criar_estudantes(6)
+        restricoes = {"limites": [{"atributo": "repetente", "valor": "não", "maximo": 0}]}
+        relatorio = {}
+
+        grupos = formar_grupos_com_restricoes(estudantes, 3, restricoes, tempo_limite=0.05, relatorio=relatorio)
+
+        assert sum(len(g) for g in grupos) == 6
+        assert relatorio["valido"] is False
+
+    def test_matriculas_desconhecidas(self):
+        """Testa que pares com matrículas inexistentes são ignorados e reportados."""
+        relatorio = {}
+
+        formar_grupos_com_restricoes(_criar_estudantes(6), 3, {"juntos": [("1", "99")]}, relatorio=relatorio)
+
+        assert relatorio["ignorados"] == [("1", "99")]
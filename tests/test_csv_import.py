@@ -0,0 +1,99 @@
+"""
+Testes para o módulo de importação de CSV em blocos.
+"""
+
+import io
+
+import pandas as pd
+
+from logic.csv_import import importar_csv_em_blocos
+from logic.data_processing import processar_csv_para_estudantes
+from logic.roster import Turma
+from logic.validation import validar_csv
+
+CSV = (
+    "matricula,nome,turma,nota,obs\n"
+    '001,Ana,A,"7,5",x\n'
+    "002,Bruno,B,,y\n"
+    "001,Ana Clara,A,8,z\n"
+    ",Sem Matrícula,C,1,w\n"
+    "003,,C,2,v\n"
+    "002,Bruno,B,abc,u\n"
+    "004,Carla,A,9,t\n"
+)
+
+
+def _arquivo(texto=CSV):
+    """Cria um arquivo binário em memória, como o upload do Streamlit."""
+    return io.BytesIO(texto.encode("utf-8"))
+
+
+class TestImportarCsvEmBlocos:
+    """Testes para a função importar_csv_em_blocos."""
+
+    def test_mesmo_resultado_da_leitura_completa(self):
+        """Testa que a leitura em blocos produz os mesmos estudantes que a leitura de uma vez."""
+        turma, _ = importar_csv_em_blocos(_arquivo(), "matricula", "nome", ["turma"], "nota", tamanho_bloco=2)
+
+        df = pd.read_csv(_arquivo(), dtype=str)
+        esperado = processar_csv_para_estudantes(df, "matricula", "nome", ["turma"], "nota")
+
+        assert isinstance(turma, Turma)
+        assert turma.para_estudantes() == Turma.de_estudantes(esperado).para_estudantes()
+        assert turma[0]["matricula"] == "001"
+        assert turma[0]["pontuacao"] == 7.5
+
+    def test_erros_entre_blocos(self):
+        """Testa que vazios e duplicatas são contados em todos os blocos, como em validar_csv."""
+        _, erros = importar_csv_em_blocos(_arquivo(), "matricula", "nome", tamanho_bloco=2)
+        _, esperado = validar_csv(pd.read_csv(_arquivo(), dtype=str), "matricula", "nome")
+
+        assert erros == esperado
+        assert erros[-1] == "Matrículas duplicadas: 001, 002"
+
+    def test_vazios_so_com_espacos(self):
+        """Testa que valores só com espaços contam como vazios, como as linhas descartadas."""
+        texto = 'matricula,nome\n001,Ana\n"   ",Bruno\n003,"  "\n004,Carla\n'
+
+        turma, erros = importar_csv_em_blocos(_arquivo(texto), "matricula", "nome", tamanho_bloco=2)
+
+        assert len(turma) == 2
+        assert erros == ["1 matrículas vazias encontradas", "1 nomes vazios encontrados"]
+
+    def test_coluna_inexistente(self):
+        """Testa que colunas ausentes são apontadas sem ler os dados."""
+        turma, erros = importar_csv_em_blocos(_arquivo(), "ra", "nome")
+
+        assert len(turma) == 0
+        assert erros == ["Coluna 'ra' não encontrada"]
+
+    def test_progresso_e_relatorio(self):
+        """Testa as chamadas de progresso e o relatório da importação."""
+        chamadas = []
+        relatorio = {}
+        texto = "matricula,nome\n" + "".join(f"{i},Estudante {i}\n" for i in range(20_000))
+
+        turma, erros = importar_csv_em_blocos(
+            _arquivo(texto),
+            "matricula",
+            "nome",
+            tamanho_bloco=5_000,
+            progresso=lambda lidos, total: chamadas.append((lidos, total)),
+            relatorio=relatorio,
+        )
+
+        assert erros == []
+        assert relatorio == {"linhas": 20_000, "blocos": 4, "estudantes": 20_000}
+        assert len(chamadas) == 4
+        assert chamadas[-1] == (len(texto), len(texto))
+        assert [lidos for lidos, _ in chamadas] == sorted(lidos for lidos, _ in chamadas)
+
+    def test_caminho_e_separador(self, tmp_path):
+        """Testa a leitura de um caminho com opções repassadas ao pandas."""
+        caminho = tmp_path / "turma.csv"
+        caminho.write_text("matricula;nome\n10;Ana\n11;Bia\n", encoding="latin-1")
+
+        turma, erros = importar_csv_em_blocos(caminho, "matricula", "nome", sep=";", encoding="latin-1")
+
+        assert erros == []
+        assert turma.coluna("nome") == ["Ana", "Bia"]
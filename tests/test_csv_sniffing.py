@@ -0,0 +1,111 @@
+"""
+Testes para o módulo de detecção do formato de CSV.
+"""
+
+import io
+
+import pandas as pd
+
+from logic.csv_import import importar_csv_em_blocos
+from logic.csv_sniffing import (
+    amostra_reservatorio,
+    detectar_cabecalho,
+    detectar_codificacao,
+    detectar_separador,
+    farejar_csv,
+    sugerir_colunas,
+)
+
+CSV_EXCEL = (
+    "Código;Nome do Aluno;Turma;Nota\r\n"
+    '20230001;João da Silva;A;"7,5"\r\n'
+    "20230002;Ângela Souza;B;8\r\n"
+    "20230003;Conceição Araújo;A;6,25\r\n"
+).encode("cp1252")
+
+
+class TestDetectarFormato:
+    """Testes para a detecção de codificação, separador e cabeçalho."""
+
+    def test_codificacao(self):
+        """Testa UTF-8 com e sem BOM, cp1252 e um caractere cortado no fim da amostra."""
+        assert detectar_codificacao("José".encode()) == "utf-8"
+        assert detectar_codificacao(b"\xef\xbb\xbfmatricula") == "utf-8-sig"
+        assert detectar_codificacao(CSV_EXCEL) == "cp1252"
+        assert detectar_codificacao("Joã".encode()[:-1]) == "utf-8"
+
+    def test_separador_com_aspas(self):
+        """Testa que vírgulas entre aspas não confundem a detecção do separador."""
+        linhas = ["a;b;c", '1;"x, y, z";3', "4;5;6"]
+
+        assert detectar_separador(linhas) == ";"
+        assert detectar_separador(["a\tb", "1\t2"]) == "\t"
+        assert detectar_separador(["só uma coluna", "outra"]) == ","
+
+    def test_cabecalho(self):
+        """Testa a detecção de cabeçalho e de arquivos sem cabeçalho."""
+        assert detectar_cabecalho(["matricula,nome", "1,Ana", "2,Bia"], ",")
+        assert not detectar_cabecalho(["1,Ana", "2,Bia", "3,Caio"], ",")
+        assert detectar_cabecalho(["nome,turma", "Ana,A"], ",")
+
+    def test_farejar_excel(self):
+        """Testa o arquivo exportado do Excel: ponto e vírgula, cp1252 e cabeçalho."""
+        arquivo = io.BytesIO(CSV_EXCEL)
+
+        opcoes = farejar_csv(arquivo)
+
+        assert opcoes == {"encoding": "cp1252", "sep": ";"}
+        assert arquivo.tell() == 0
+        df = pd.read_csv(arquivo, dtype=str, **opcoes)
+        assert df["Nome do Aluno"].tolist()[1] == "Ângela Souza"
+
+    def test_farejar_sem_cabecalho(self):
+        """Testa que arquivos sem cabeçalho recebem nomes de coluna e são importados inteiros."""
+        arquivo = io.BytesIO(b"1001,Ana Lima\n1002,Bruno Reis\n1003,Caio Melo\n")
+
+        opcoes = farejar_csv(arquivo)
+        turma, erros = importar_csv_em_blocos(arquivo, "Coluna 1", "Coluna 2", **opcoes)
+
+        assert opcoes["header"] is None
+        assert erros == []
+        assert turma.coluna("matricula") == ["1001", "1002", "1003"]
+
+    def test_amostra_cortada(self):
+        """Testa que a linha cortada no fim da amostra é ignorada."""
+        texto = "matricula|nome\n" + "".join(f"{i}|Aluno Número {i}\n" for i in range(2_000))
+
+        assert farejar_csv(io.BytesIO(texto.encode()), tamanho=1_000) == {"encoding": "utf-8", "sep": "|"}
+
+
+class TestSugerirColunas:
+    """Testes para a sugestão das colunas de matrícula e de nome."""
+
+    def test_pelo_conteudo(self):
+        """Testa a sugestão com cabeçalhos que não ajudam."""
+        df = pd.DataFrame(
+            {
+                "c1": ["A", "B", "A", "B"],
+                "c2": ["Ana Lima", "Bruno Reis", "Caio de Melo", "Dora Dias"],
+                "c3": ["7", "8", "7", "9"],
+                "c4": ["2023001", "2023002", "2023003", "2023004"],
+            }
+        )
+
+        assert sugerir_colunas(df) == ("c4", "c2")
+
+    def test_pelo_cabecalho_e_sem_sugestao(self):
+        """Testa o desempate pelo cabeçalho e a ausência de sugestão."""
+        df = pd.read_csv(io.BytesIO(CSV_EXCEL), dtype=str, **farejar_csv(io.BytesIO(CSV_EXCEL)))
+
+        assert sugerir_colunas(df) == ("Código", "Nome do Aluno")
+        assert sugerir_colunas(pd.DataFrame({"x": ["?", "!"]})) == (None, None)
+
+    def test_reservatorio(self):
+        """Testa o tamanho e a reprodutibilidade da amostra."""
+        amostra = amostra_reservatorio(iter(range(10_000)), 50, semente=3)
+
+        assert len(amostra) == 50
+        assert len(set(amostra)) == 50
+        assert amostra == amostra_reservatorio(range(10_000), 50, semente=3)
+        assert max(amostra) > 1_000
+        assert amostra_reservatorio([1, 2], 5) == [1, 2]
@@ -9,7 +9,9 @@ from logic.data_processing import (
     filtrar_estudantes_por_grupo,
     preparar_dados_exportacao,
     processar_csv_para_estudantes,
+    tabela_grupos,
 )
+from logic.roster import Agrupamento, Turma
 
 
 class TestProcessarCsvParaEstudantes:
@@ -87,3 +89,133 @@ class TestFiltrarEstudantesPorGrupo:
         estudantes = filtrar_estudantes_por_grupo(grupos, 5)
 
         assert estudantes == []
+
+
+class TestProcessarCsvColunasExtras:
+    """Testes para colunas adicionais em processar_csv_para_estudantes."""
+
+    def test_colunas_extras_como_atributos(self):
+        """Testa que colunas extras são copiadas como atributos."""
+        df = pd.DataFrame({"matricula": ["1", "2"], "nome": ["Ana", "Bruno"], "turma": ["A", None]})
+
+        estudantes = processar_csv_para_estudantes(df, "matricula", "nome", ["turma"])
+
+        assert estudantes[0]["turma"] == "A"
+        assert estudantes[1]["turma"] == ""
+
+    def test_coluna_pontuacao(self):
+        """Testa que a coluna de pontuação vira número, aceitando vírgula decimal."""
+        df = pd.DataFrame({"matricula": ["1", "2", "3"], "nome": ["Ana", "Bruno", "Carla"], "nota": ["7,5", 9, "-"]})
+
+        estudantes = processar_csv_para_estudantes(df, "matricula", "nome", col_pontuacao="nota")
+
+        assert estudantes[0]["pontuacao"] == 7.5
+        assert estudantes[1]["pontuacao"] == 9.0
+        assert "pontuacao" not in estudantes[2]
+
+
+def _processar_linha_a_linha(df, col_matricula, col_nome, colunas_extras=None, col_pontuacao=None):
+    """Conversão anterior, linha a linha com iterrows, usada como referência."""
+    estudantes = []
+    colunas_extras = colunas_extras or []
+    if col_pontuacao:
+        pontuacoes = pd.to_numeric(df[col_pontuacao].astype(str).str.replace(",", ".", regex=False), errors="coerce")
+
+    for posicao, (_, row) in enumerate(df.iterrows()):
+        matricula = str(row[col_matricula]).strip() if pd.notna(row[col_matricula]) else ""
+        nome = str(row[col_nome]).strip() if pd.notna(row[col_nome]) else ""
+        if matricula and nome:
+            estudante = {"matricula": matricula, "nome": nome, "completo": f"{matricula}, {nome}"}
+            for coluna in colunas_extras:
+                estudante[coluna] = str(row[coluna]).strip() if pd.notna(row[coluna]) else ""
+            if col_pontuacao and pd.notna(pontuacoes.iat[posicao]):
+                estudante["pontuacao"] = float(pontuacoes.iat[posicao])
+            estudantes.append(estudante)
+
+    return estudantes
+
+
+class TestProcessarCsvVetorizado:
+    """Testes de equivalência da conversão coluna a coluna com a conversão linha a linha."""
+
+    DF = pd.DataFrame(
+        {
+            "matricula": ["  001 ", "002", None, "004", "", "006", 7, "008"],
+            "nome": ["Ana ", " Bruno", "Carla", None, "Eva", "   ", "Gil", "Hugo"],
+            "turma": ["A", None, "B", "A", "B", "A", " C ", True],
+            "nota": ["7,5", 9, "-", None, "8", 6.25, float("nan"), " 10 "],
+        },
+        index=[10, 3, 7, 0, 1, 2, 5, 4],
+    )
+
+    def test_mesmos_estudantes(self):
+        """Testa que a lista de dicionários é idêntica, com atributos e pontuação."""
+        esperado = _processar_linha_a_linha(self.DF, "matricula", "nome", ["turma"], "nota")
+
+        estudantes = processar_csv_para_estudantes(self.DF, "matricula", "nome", ["turma"], "nota")
+
+        assert estudantes == esperado
+        assert [list(e) for e in estudantes] == [list(e) for e in esperado]
+        assert [e["matricula"] for e in estudantes] == ["001", "002", "7", "008"]
+
+    def test_sem_colunas_opcionais(self):
+        """Testa a equivalência só com matrícula e nome."""
+        esperado = _processar_linha_a_linha(self.DF, "matricula", "nome")
+
+        assert processar_csv_para_estudantes(self.DF, "matricula", "nome") == esperado
+
+    def test_formato_compacto(self):
+        """Testa que a Turma compacta tem os mesmos estudantes que a lista."""
+        esperado = _processar_linha_a_linha(self.DF, "matricula", "nome", ["turma"], "nota")
+
+        turma = processar_csv_para_estudantes(self.DF, "matricula", "nome", ["turma"], "nota", compacto=True)
+
+        assert isinstance(turma, Turma)
+        assert turma.para_estudantes() == esperado
+
+    def test_compacto_sem_pontuacao(self):
+        """Testa que a Turma não guarda pontuação quando nenhum valor é numérico."""
+        df = pd.DataFrame({"matricula": ["1", "2"], "nome": ["Ana", "Bia"], "nota": ["-", None]})
+
+        turma = processar_csv_para_estudantes(df, "matricula", "nome", col_pontuacao="nota", compacto=True)
+
+        assert turma.pontuacoes is None
+        assert len(processar_csv_para_estudantes(df.iloc[:0], "matricula", "nome", compacto=True)) == 0
+
+
+class TestTabelaGrupos:
+    """Testes para a tabela de exportação montada coluna a coluna."""
+
+    ESTUDANTES = [{"matricula": str(i), "nome": f"Aluno {i}", "completo": f"{i}, Aluno {i}"} for i in range(7)]
+    INDICES = [[4, 0, 2], [], [6, 1], [3, 5]]
+
+    def test_lista_e_agrupamento(self):
+        """Testa que listas e Agrupamento produzem a mesma tabela, na ordem dos grupos."""
+        grupos = [[self.ESTUDANTES[i] for i in grupo] for grupo in self.INDICES]
+        agrupamento = Agrupamento(Turma.de_estudantes(self.ESTUDANTES), self.INDICES)
+
+        tabela = tabela_grupos(grupos)
+
+        assert tabela["Grupo"].tolist() == [1, 1, 1, 3, 3, 4, 4]
+        assert tabela["Matrícula"].tolist() == ["4", "0", "2", "6", "1", "3", "5"]
+        assert tabela.to_dict("records") == tabela_grupos(agrupamento).to_dict("records")
+        assert list(tabela_grupos(grupos, ("Nome",)).columns) == ["Grupo", "Nome"]
+
+    def test_cache_do_agrupamento(self):
+        """Testa que a tabela guardada não é afetada por alterações do chamador."""
+        agrupamento = Agrupamento(Turma.de_estudantes(self.ESTUDANTES), self.INDICES)
+
+        primeira = tabela_grupos(agrupamento)
+        primeira["Nome"] = "alterado"
+        primeira.loc[0, "Matrícula"] = "x"
+
+        segunda = tabela_grupos(agrupamento)
+        assert segunda["Nome"].tolist()[0] == "Aluno 4"
+        assert segunda["Matrícula"].tolist()[0] == "4"
+
+    def test_dados_exportacao_nativos(self):
+        """Testa que os registros de exportação usam tipos nativos do Python."""
+        dados = preparar_dados_exportacao(Agrupamento(Turma.de_estudantes(self.ESTUDANTES), self.INDICES))
+
+        assert dados[0] == {"Grupo": 1, "Matrícula": "4", "Nome": "Aluno 4", "Completo": "4, Aluno 4"}
+        assert type(dados[0]["Grupo"]) is int
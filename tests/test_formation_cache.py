@@ -0,0 +1,129 @@
+"""
+Testes para o módulo de cache de formações.
+"""
+
+import itertools
+
+import numpy as np
+
+import logic.local_search as local_search
+from logic.formation_cache import CacheFormacoes, chave_formacao, impressao_turma, obter_cache_formacoes
+from logic.group_formation import formar_grupos
+
+ESTUDANTES = [{"matricula": str(i), "nome": f"Aluno {i}"} for i in range(20)]
+
+
+def _matriculas(grupos):
+    """Extrai as matrículas de cada grupo."""
+    return [[e["matricula"] for e in grupo] for grupo in grupos]
+
+
+class TestChaveFormacao:
+    """Testes para a impressão digital da turma e a chave da formação."""
+
+    def test_impressao_sensivel_a_ordem_e_atributos(self):
+        """Testa que a ordem e os atributos dos estudantes mudam a impressão."""
+        base = impressao_turma(ESTUDANTES)
+
+        assert impressao_turma([dict(e) for e in ESTUDANTES]) == base
+        assert impressao_turma(ESTUDANTES[::-1]) != base
+        assert impressao_turma(ESTUDANTES[:-1] + [{**ESTUDANTES[-1], "turma": "B"}]) != base
+
+    def test_historico_so_conta_para_novos_parceiros(self):
+        """Testa que o histórico entra na chave apenas do método que o usa."""
+        historico = [{"id": "a", "grupos": []}]
+
+        aleatorio = chave_formacao(ESTUDANTES, 3, "Aleatório", True, True, 1, historico=historico)
+        parceiros = chave_formacao(ESTUDANTES, 3, "Novos parceiros", True, True, 1, historico=historico)
+
+        assert aleatorio == chave_formacao(ESTUDANTES, 3, "Aleatório", True, True, 1, historico=[])
+        assert parceiros != chave_formacao(ESTUDANTES, 3, "Novos parceiros", True, True, 1, historico=[])
+
+
+class TestCacheFormacoes:
+    """Testes para a classe CacheFormacoes."""
+
+    def test_lru_descarta_menos_usada(self):
+        """Testa que, cheio, o cache descarta a formação menos usada recentemente."""
+        cache = CacheFormacoes(tamanho_maximo=2)
+        cache.guardar("a", [np.array([0])])
+        cache.guardar("b", [np.array([1])])
+        cache.obter("a")
+        cache.guardar("c", [np.array([2])])
+
+        assert cache.obter("b") is None
+        assert cache.obter("a") is not None
+        assert len(cache) == 2
+        assert cache.estatisticas()["acertos"] == 2
+        assert cache.estatisticas()["falhas"] == 1
+
+    def test_formar_grupos_com_semente_usa_cache(self):
+        """Testa que um pedido idêntico com semente é servido pelo cache."""
+        cache = obter_cache_formacoes()
+        cache.limpar()
+
+        primeiro = formar_grupos(ESTUDANTES, 4, "Aleatório", semente=11)
+        segundo = formar_grupos([dict(e) for e in ESTUDANTES], 4, "Aleatório", semente=11)
+
+        assert _matriculas(primeiro) == _matriculas(segundo)
+        assert cache.estatisticas()["acertos"] == 1
+        assert cache.estatisticas()["falhas"] == 1
+
+    def test_relatorio_preservado(self):
+        """Testa que o relatório da formação é devolvido também no acerto."""
+        obter_cache_formacoes().limpar()
+        restricoes = {"juntos": [("1", "2")], "separados": [], "limites": []}
+        primeiro, segundo = {}, {}
+
+        formar_grupos(ESTUDANTES, 4, "Restrições", semente=3, restricoes=restricoes, relatorio=primeiro)
+        formar_grupos(ESTUDANTES, 4, "Restrições", semente=3, restricoes=restricoes, relatorio=segundo)
+
+        assert segundo == primeiro
+
+    def test_sem_semente_nao_usa_cache(self):
+        """Testa que formações sem semente não passam pelo cache."""
+        cache = obter_cache_formacoes()
+        cache.limpar()
+
+        formar_grupos(ESTUDANTES, 4, "Aleatório")
+        formar_grupos(ESTUDANTES, 4, "Aleatório")
+
+        assert cache.estatisticas()["acertos"] + cache.estatisticas()["falhas"] == 0
+
+    def test_tentativas_cortadas_pelo_tempo_nao_entram_no_cache(self):
+        """Testa que tentativas descartadas pelo tempo_maximo não congelam o resultado no cache."""
+        cache = obter_cache_formacoes()
+        cache.limpar()
+        relatorio = {}
+
+        formar_grupos(ESTUDANTES, 3, semente=5, tentativas=50, tempo_maximo=0, relatorio=relatorio)
+
+        assert relatorio["interrompida_pelo_tempo"]
+        assert len(cache) == 0
+
+    def test_busca_parada_pelo_teto_nao_entra_no_cache(self, monkeypatch):
+        """Testa que uma busca com semente parada pelo teto de segurança do relógio não é guardada."""
+        cache = obter_cache_formacoes()
+        cache.limpar()
+        # Oito estudantes que precisariam ficar juntos em grupos de 4: o custo nunca zera
+        restricoes = {"juntos": [(str(i), str(i + 1)) for i in range(7)], "separados": [], "limites": []}
+        relatorio = {}
+
+        # Máquina lenta: cada leitura do relógio avança 1 s, estourando qualquer teto
+        relogio = itertools.count(0.0, 1.0)
+        monkeypatch.setattr(local_search.time, "perf_counter", lambda: next(relogio))
+        formar_grupos(ESTUDANTES, 4, "Restrições", semente=3, restricoes=restricoes, relatorio=relatorio)
+
+        assert relatorio["interrompida_pelo_tempo"]
+        assert len(cache) == 0
+
+    def test_formacao_completa_entra_no_cache(self):
+        """Testa que uma busca com semente concluída pelas iterações é guardada."""
+        cache = obter_cache_formacoes()
+        cache.limpar()
+        relatorio = {}
+
+        formar_grupos(ESTUDANTES, 4, "Novos parceiros", semente=3, historico=[], relatorio=relatorio)
+
+        assert not relatorio["interrompida_pelo_tempo"]
+        assert len(cache) == 1
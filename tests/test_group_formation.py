@@ -131,3 +131,25 @@ class TestRedistribuirSolitarios:
 
         # O estudante solitário deve formar novo grupo
         assert len(novos_grupos) == 3
+
+    def test_redistribuir_todos_solitarios(self):
+        """Testa muitos grupos de 1 estudante, sempre preenchendo o menor grupo."""
+        grupos = [[{"matricula": str(i)}] for i in range(100_000)]
+
+        novos_grupos = redistribuir_solitarios_func(grupos, 2, permitir_grupos_maiores=True)
+
+        assert sum(len(g) for g in novos_grupos) == 100_000
+        assert {len(g) for g in novos_grupos} == {2}
+
+    def test_redistribuir_solitarios_sem_permitir_maior_preenche_incompletos(self):
+        """Testa que, sem grupos maiores, o solitário ainda completa grupos abaixo do limite."""
+        grupos = [
+            [{"matricula": "1"}, {"matricula": "2"}, {"matricula": "3"}],
+            [{"matricula": "4"}, {"matricula": "5"}],
+            [{"matricula": "6"}],
+        ]
+
+        novos_grupos = redistribuir_solitarios_func(grupos, 3, permitir_grupos_maiores=False)
+
+        assert [len(g) for g in novos_grupos] == [3, 3]
+        assert novos_grupos[1][-1]["matricula"] == "6"
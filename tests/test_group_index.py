@@ -0,0 +1,69 @@
+"""
+Testes para o módulo de índice de grupos.
+"""
+
+from logic.group_index import IndiceGrupos
+from logic.roster import Agrupamento, Turma
+
+ESTUDANTES = [
+    {"matricula": "101", "nome": "João da Silva"},
+    {"matricula": "102", "nome": "Ana Maria Souza"},
+    {"matricula": "103", "nome": "Ângela Joana"},
+    {"matricula": "104", "nome": "Bruno Silveira"},
+    {"matricula": "105", "nome": "Ana Beatriz"},
+]
+INDICES = [[1, 3], [0, 4], [2]]
+
+
+def _grupos():
+    """Monta os grupos como listas de dicionários."""
+    return [[ESTUDANTES[i] for i in grupo] for grupo in INDICES]
+
+
+class TestIndiceGrupos:
+    """Testes para a classe IndiceGrupos."""
+
+    def test_grupo_da_matricula(self):
+        """Testa a busca exata por matrícula, com espaços e matrícula ausente."""
+        indice = IndiceGrupos(_grupos())
+
+        assert len(indice) == 5
+        assert indice.grupo_da_matricula("101") == 2
+        assert indice.grupo_da_matricula(" 103 ") == 3
+        assert indice.grupo_da_matricula("999") is None
+
+    def test_prefixo_do_nome_e_sobrenome(self):
+        """Testa a busca pelo começo do nome ou de um sobrenome, sem acentos e maiúsculas."""
+        indice = IndiceGrupos(_grupos())
+
+        assert [e["matricula"] for e in indice.buscar_nome("ana")] == ["105", "102"]
+        assert [e["matricula"] for e in indice.buscar_nome("angela")] == ["103"]
+        assert [e["matricula"] for e in indice.buscar_nome("SILV")] == ["101", "104"]
+        assert [e["matricula"] for e in indice.buscar_nome("jo")] == ["103", "101"]
+        assert [e["matricula"] for e in indice.buscar_nome("maria sou")] == ["102"]
+        assert indice.buscar_nome("  ") == []
+        assert indice.buscar_nome("zzz") == []
+
+    def test_buscar(self):
+        """Testa a busca combinada, o limite e que um estudante não aparece duas vezes."""
+        indice = IndiceGrupos(_grupos())
+
+        assert indice.buscar("104") == [{"grupo": 1, "matricula": "104", "nome": "Bruno Silveira"}]
+        assert len(indice.buscar("ana", limite=1)) == 1
+        assert len(indice.buscar("ana maria souza")) == 1
+        assert indice.buscar("") == []
+
+    def test_agrupamento(self):
+        """Testa que o índice de um Agrupamento é igual ao das listas."""
+        agrupamento = Agrupamento(Turma.de_estudantes(ESTUDANTES), INDICES)
+
+        assert IndiceGrupos(agrupamento).buscar("s") == IndiceGrupos(_grupos()).buscar("s")
+
+    def test_turma_grande(self):
+        """Testa a busca em uma turma grande com vários estudantes de mesmo nome."""
+        turma = Turma([str(i) for i in range(900)], [f"Estudante {i % 300} Silva" for i in range(900)])
+        indice = IndiceGrupos(Agrupamento(turma, [list(range(i, i + 3)) for i in range(0, 900, 3)]))
+
+        assert indice.grupo_da_matricula("899") == 300
+        assert {e["grupo"] for e in indice.buscar("estudante 7 silva")} == {3, 103, 203}
+        assert len(indice.buscar("silva")) == 20
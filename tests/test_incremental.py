@@ -0,0 +1,123 @@
+"""
+Testes para o módulo de reformação incremental.
+"""
+
+from logic.group_formation import formar_grupos
+from logic.incremental import reformar_incremental
+
+
+def _estudante(matricula):
+    """Cria um estudante com a matrícula informada."""
+    return {"matricula": str(matricula), "nome": f"Aluno {matricula}"}
+
+
+def _item(grupos, tamanho_grupo=3):
+    """Cria um item de histórico a partir de grupos de matrículas."""
+    grupos = [[_estudante(m) for m in grupo] for grupo in grupos]
+    return {
+        "grupos": grupos,
+        "estudantes": [e for grupo in grupos for e in grupo],
+        "tamanho_grupo": tamanho_grupo,
+        "metodo": "Aleatório",
+    }
+
+
+def _matriculas(grupos):
+    """Extrai as matrículas de cada grupo."""
+    return [[e["matricula"] for e in grupo] for grupo in grupos]
+
+
+class TestReformarIncremental:
+    """Testes para a função reformar_incremental."""
+
+    def test_entrada_ocupa_vaga(self):
+        """Testa que o novato vai para o grupo incompleto sem mover ninguém."""
+        item = _item([[1, 2, 3], [4, 5]])
+        relatorio = {}
+
+        novo = reformar_incremental(item, entradas=[_estudante(6)], relatorio=relatorio)
+
+        assert _matriculas(novo["grupos"]) == [["1", "2", "3"], ["4", "5", "6"]]
+        assert len(novo["estudantes"]) == 6
+        assert relatorio["movidos"] == 0
+        assert relatorio["grupos_alterados"] == 1
+
+    def test_saida_abre_vaga_para_entrada(self):
+        """Testa que a vaga deixada por quem sai é ocupada por quem entra."""
+        item = _item([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+
+        novo = reformar_incremental(item, entradas=[_estudante(10)], saidas=["5"])
+
+        assert _matriculas(novo["grupos"]) == [["1", "2", "3"], ["4", "6", "10"], ["7", "8", "9"]]
+        assert [e["matricula"] for e in novo["estudantes"]][-1] == "10"
+        assert "5" not in {e["matricula"] for e in novo["estudantes"]}
+
+    def test_sem_vagas_cria_grupos_novos(self):
+        """Testa que, sem vagas, os novatos formam grupos novos."""
+        item = _item([[1, 2, 3], [4, 5, 6]])
+
+        novo = reformar_incremental(item, entradas=[_estudante(m) for m in (7, 8, 9, 10)])
+
+        assert sorted(len(g) for g in novo["grupos"]) == [3, 3, 4]
+        assert _matriculas(novo["grupos"])[2] == ["7", "8", "9"]
+
+    def test_solitario_redistribuido(self):
+        """Testa que quem fica sozinho após saídas vai para o menor outro grupo."""
+        item = _item([[1, 2, 3], [4, 5]])
+        relatorio = {}
+
+        novo = reformar_incremental(item, saidas=["5"], relatorio=relatorio)
+
+        assert _matriculas(novo["grupos"]) == [["1", "2", "3", "4"]]
+        assert relatorio["movidos"] == 1
+
+    def test_solitario_sem_permitir_maior(self):
+        """Testa que, sem grupos maiores, o solitário permanece sozinho se não houver vaga."""
+        item = _item([[1, 2, 3], [4, 5]])
+
+        novo = reformar_incremental(item, saidas=["5"], permitir_grupos_maiores=False)
+
+        assert _matriculas(novo["grupos"]) == [["1", "2", "3"], ["4"]]
+
+    def test_grupo_vazio_removido_e_matricula_desconhecida(self):
+        """Testa que grupos esvaziados somem e matrículas inexistentes são relatadas."""
+        item = _item([[1, 2], [3, 4]], tamanho_grupo=2)
+        relatorio = {}
+
+        novo = reformar_incremental(item, saidas=["3", "4", "99"], relatorio=relatorio)
+
+        assert _matriculas(novo["grupos"]) == [["1", "2"]]
+        assert relatorio["nao_encontrados"] == ["99"]
+
+    def test_saida_repetida(self):
+        """Testa que uma matrícula repetida nas saídas é removida uma vez, sem contar como não encontrada."""
+        item = _item([[1, 2, 3], [4, 5, 6]])
+        relatorio = {}
+
+        novo = reformar_incremental(item, saidas=["1", " 1 "], relatorio=relatorio)
+
+        assert relatorio["removidos"] == 1
+        assert relatorio["nao_encontrados"] == []
+        assert "1" not in [e["matricula"] for e in novo["estudantes"]]
+        assert "1" not in [m for grupo in _matriculas(novo["grupos"]) for m in grupo]
+
+    def test_nao_altera_item_original(self):
+        """Testa que o item do histórico não é modificado."""
+        item = _item([[1, 2, 3], [4, 5]])
+
+        reformar_incremental(item, entradas=[_estudante(6)], saidas=["1"])
+
+        assert _matriculas(item["grupos"]) == [["1", "2", "3"], ["4", "5"]]
+
+    def test_turma_grande_preserva_grupos(self):
+        """Testa que poucas alterações em uma turma grande mantêm os demais grupos."""
+        estudantes = [_estudante(i) for i in range(3000)]
+        grupos = formar_grupos(estudantes, 4, semente=1)
+        item = {"grupos": grupos, "estudantes": estudantes, "tamanho_grupo": 4}
+        saidas = [grupos[10][0]["matricula"], grupos[20][1]["matricula"]]
+
+        novo = reformar_incremental(item, entradas=[_estudante("novo")], saidas=saidas)
+
+        mantidos = sum(1 for antes, depois in zip(grupos, novo["grupos"]) if antes is depois)
+        assert mantidos == len(grupos) - 2
+        assert sum(len(g) for g in novo["grupos"]) == 2999
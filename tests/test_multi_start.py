@@ -0,0 +1,128 @@
+"""
+Testes para o módulo de busca com várias sementes.
+"""
+
+import pytest
+
+from logic import worker_pool
+from logic.group_formation import formar_grupos
+from logic.multi_start import resolver_objetivo
+from logic.random_streams import sortear_sementes
+
+ESTUDANTES = [{"matricula": str(i), "nome": f"Aluno {i}", "pontuacao": i % 7} for i in range(30)]
+
+
+def _matriculas(grupos):
+    """Extrai as matrículas de cada grupo."""
+    return [[e["matricula"] for e in grupo] for grupo in grupos]
+
+
+def objetivo_primeiro_grupo(estudantes, grupos_indices, relatorio):
+    """Objetivo de teste: menor matrícula no primeiro grupo é melhor."""
+    return int(grupos_indices[0].min())
+
+
+class TestBuscarMelhorSemente:
+    """Testes para formar_grupos com várias tentativas."""
+
+    def test_semente_reproduz_resultado(self):
+        """Testa que a semente vencedora reproduz a mesma formação em uma única tentativa."""
+        relatorio = {}
+        grupos = formar_grupos(ESTUDANTES, 4, "Aleatório", semente=3, tentativas=8, relatorio=relatorio)
+
+        repetidos = formar_grupos(ESTUDANTES, 4, "Aleatório", semente=relatorio["semente"])
+
+        assert _matriculas(grupos) == _matriculas(repetidos)
+        assert relatorio["tentativas"] == 8
+        assert relatorio["tentativas_concluidas"] == 8
+        assert relatorio["semente"] in sortear_sementes(8, 3)
+
+    @pytest.mark.parametrize(
+        ("metodo", "opcoes"),
+        [
+            ("Restrições", {"restricoes": {"limites": [{"atributo": "pontuacao", "valor": "1", "maximo": 0}]}}),
+            ("Novos parceiros", {"historico": [{"grupos": [ESTUDANTES[:10], ESTUDANTES[10:20], ESTUDANTES[20:]]}]}),
+            ("Diversidade", {"otimizacao": {"objetivos": {"pontuacao": 1.0}, "colunas": ["pontuacao"]}}),
+        ],
+    )
+    def test_semente_reproduz_metodos_com_busca(self, metodo, opcoes):
+        """Testa que a semente vencedora reproduz a formação nos métodos com orçamento de tempo."""
+        relatorio = {}
+        grupos = formar_grupos(
+            ESTUDANTES, 4, metodo, semente=7, tempo_limite=0.02, tentativas=4, relatorio=relatorio, **opcoes
+        )
+
+        repetidos = formar_grupos(
+            ESTUDANTES, 4, metodo, semente=relatorio["semente"], tempo_limite=0.02, usar_cache=False, **opcoes
+        )
+
+        assert _matriculas(grupos) == _matriculas(repetidos)
+
+    def test_objetivo_plugavel(self):
+        """Testa que a melhor tentativa segundo um objetivo próprio é escolhida."""
+        relatorio = {}
+        grupos = formar_grupos(
+            ESTUDANTES, 5, "Aleatório", semente=1, tentativas=20, objetivo=objetivo_primeiro_grupo, relatorio=relatorio
+        )
+
+        melhores = []
+        for semente in sortear_sementes(20, 1):
+            tentativa = formar_grupos(ESTUDANTES, 5, "Aleatório", semente=semente)
+            melhores.append(min(int(e["matricula"]) for e in tentativa[0]))
+
+        assert relatorio["pontuacao"] == min(melhores)
+        assert min(int(e["matricula"]) for e in grupos[0]) == min(melhores)
+
+    def test_objetivo_padrao_do_metodo(self):
+        """Testa que o método Restrições usa as violações como objetivo padrão."""
+        restricoes = {"juntos": [("1", "2")], "separados": [], "limites": []}
+        relatorio = {}
+
+        formar_grupos(ESTUDANTES, 3, "Restrições", semente=2, restricoes=restricoes, tentativas=3, relatorio=relatorio)
+
+        assert relatorio["pontuacao"] == relatorio["violacoes"] == 0
+
+    def test_objetivo_desconhecido(self):
+        """Testa que um objetivo inexistente gera erro."""
+        with pytest.raises(ValueError):
+            resolver_objetivo("inexistente")
+
+    def test_tempo_maximo_conclui_ao_menos_uma(self):
+        """Testa que, com tempo esgotado, ao menos uma tentativa é concluída."""
+        relatorio = {}
+        grupos = formar_grupos(ESTUDANTES, 3, semente=5, tentativas=50, tempo_maximo=0, relatorio=relatorio)
+
+        assert relatorio["tentativas_concluidas"] == 1
+        assert sum(len(g) for g in grupos) == len(ESTUDANTES)
+
+    def test_turma_pequena_roda_em_serie(self):
+        """Testa que turmas pequenas não criam processos."""
+        relatorio = {}
+        formar_grupos(ESTUDANTES, 3, semente=5, tentativas=4, relatorio=relatorio)
+
+        assert relatorio["paralelo"] is False
+
+    def test_paralelo_igual_ao_serial(self, monkeypatch):
+        """Testa que a execução em processos escolhe a mesma formação que a serial."""
+        serial = {}
+        esperado = formar_grupos(
+            ESTUDANTES, 3, "Balanceado", semente=9, tentativas=4, relatorio=serial, usar_cache=False
+        )
+
+        monkeypatch.setattr(worker_pool, "LIMIAR_PARALELO", 0)
+        monkeypatch.setattr(worker_pool.os, "cpu_count", lambda: 2)
+        paralelo = {}
+        grupos = formar_grupos(
+            ESTUDANTES,
+            3,
+            "Balanceado",
+            semente=9,
+            tentativas=4,
+            max_trabalhadores=2,
+            relatorio=paralelo,
+            usar_cache=False,
+        )
+
+        assert paralelo["paralelo"] is True
+        assert paralelo["semente"] == serial["semente"]
+        assert _matriculas(grupos) == _matriculas(esperado)
@@ -0,0 +1,99 @@
+"""
+Testes para o módulo de nomes semelhantes.
+"""
+
+import random
+
+from logic.name_matching import (
+    detectar_nomes_semelhantes,
+    encontrar_pares_semelhantes,
+    normalizar_nome,
+)
+from logic.roster import Turma
+from logic.validation_session import SessaoValidacao
+
+
+class TestNormalizarNome:
+    """Testes para a função normalizar_nome."""
+
+    def test_acentos_particulas_e_ordem(self):
+        """Testa que acentos, maiúsculas, partículas e a ordem das palavras são ignorados."""
+        assert normalizar_nome("João da Silva") == normalizar_nome("Joao Silva") == "joao silva"
+        assert normalizar_nome("SILVA, João dos") == "joao silva"
+
+    def test_so_particulas(self):
+        """Testa nome sem palavras além das partículas."""
+        assert normalizar_nome("de da") == ""
+
+
+class TestEncontrarParesSemelhantes:
+    """Testes para a função encontrar_pares_semelhantes."""
+
+    def test_pares_semelhantes(self):
+        """Testa nomes iguais após a normalização e com um erro de digitação."""
+        matriculas = ["1", "2", "3", "4", "5"]
+        nomes = ["João da Silva", "Joao Silva", "Maria Souza", "Pedro Alves", "Joao Silvo"]
+
+        pares = encontrar_pares_semelhantes(matriculas, nomes)
+
+        assert [par["indices"] for par in pares] == [[0, 1], [0, 4], [1, 4]]
+        assert pares[0]["similaridade"] == 1.0
+        assert pares[0]["matriculas"] == ["1", "2"]
+        assert pares[0]["nomes"] == ["João da Silva", "Joao Silva"]
+
+    def test_mesma_matricula_ignorada(self):
+        """Testa que nomes iguais com a mesma matrícula não formam par."""
+        assert encontrar_pares_semelhantes(["1", "1"], ["Ana Lima", "Ana Lima"]) == []
+
+    def test_nomes_diferentes(self):
+        """Testa que nomes diferentes não são apontados."""
+        assert encontrar_pares_semelhantes(["1", "2"], ["Ana Lima", "Bruno Costa"]) == []
+
+    def test_copias_com_erro_em_turma_grande(self):
+        """Testa que cópias com um erro de digitação são encontradas no meio de muitos nomes."""
+        rng = random.Random(0)
+        letras = "abcdefghijklmnopqrstuvwxyz"
+        nomes = [
+            " ".join("".join(rng.choice(letras) for _ in range(rng.randint(6, 9))) for _ in range(3))
+            for _ in range(2000)
+        ]
+        # Uma letra trocada no início do nome e outra no fim
+        copias = {}
+        for indice in rng.sample(range(len(nomes)), 20):
+            posicao = rng.choice([1, len(nomes[indice]) - 2])
+            copias[indice] = nomes[indice][:posicao] + "x" + nomes[indice][posicao + 1 :]
+
+        todos = nomes + list(copias.values())
+        pares = encontrar_pares_semelhantes([str(i) for i in range(len(todos))], todos)
+        encontrados = {tuple(par["indices"]) for par in pares}
+
+        for k, indice in enumerate(copias):
+            assert (indice, len(nomes) + k) in encontrados
+
+    def test_limite_e_relatorio(self):
+        """Testa o limite de pares e o relatório da busca."""
+        nomes = ["Ana Lima"] * 10
+        relatorio = {}
+
+        pares = encontrar_pares_semelhantes([str(i) for i in range(10)], nomes, limite=5, relatorio=relatorio)
+
+        assert len(pares) == 5
+        assert pares[0]["indices"] == [0, 1]
+        assert relatorio["nomes"] == 1
+        assert relatorio["pares"] == 5
+
+    def test_turma_e_sessao(self):
+        """Testa que Turma, lista de dicionários e SessaoValidacao dão o mesmo resultado."""
+        estudantes = [
+            {"matricula": "1", "nome": "João da Silva"},
+            {"matricula": "2", "nome": "Joao Silva"},
+            {"matricula": "3", "nome": "Maria Souza"},
+        ]
+        sessao = SessaoValidacao()
+        sessao.atualizar("1, João da Silva\n2, Joao Silva\n3, Maria Souza")
+
+        esperado = detectar_nomes_semelhantes(estudantes)
+
+        assert len(esperado) == 1
+        assert detectar_nomes_semelhantes(Turma.de_estudantes(estudantes)) == esperado
+        assert sessao.nomes_semelhantes() == esperado
@@ -0,0 +1,143 @@
+"""
+Testes para o módulo de otimização da qualidade dos grupos.
+"""
+
+import random
+
+import numpy as np
+import pytest
+
+from logic import optimization
+from logic.group_formation import formar_grupos
+from logic.local_search import atribuicao_de_grupos
+from logic.optimization import (
+    PontuadorDiversidade,
+    PontuadorPontuacao,
+    criar_pontuador,
+    formar_grupos_otimizados,
+    registrar_objetivo,
+)
+from logic.partitioning import formar_grupos_indices
+
+
+def _estudantes(total, semente=0):
+    """Gera estudantes com curso, gênero e pontuação sorteados."""
+    rng = random.Random(semente)
+    return [
+        {
+            "matricula": str(1000 + i),
+            "nome": f"Aluno {i}",
+            "curso": rng.choice(["ADS", "SI", "CC"]),
+            "genero": rng.choice(["F", "M"]),
+            "pontuacao": round(rng.uniform(0, 10), 1),
+        }
+        for i in range(total)
+    ]
+
+
+ESTUDANTES = _estudantes(60)
+
+
+def _verificar_deltas(pontuador, total, semente):
+    """Aplica trocas sorteadas conferindo o custo incremental com o custo do zero."""
+    rng = random.Random(semente)
+    for _ in range(200):
+        a, b = rng.randrange(total), rng.randrange(total)
+        esperado = pontuador.custo + pontuador.delta_troca(a, b)
+        pontuador.aplicar_troca(a, b)
+        assert pontuador.custo == pytest.approx(esperado)
+        assert pontuador.custo == pytest.approx(pontuador.custo_total())
+
+
+class TestPontuadores:
+    """Testes dos pontuadores incrementais."""
+
+    def test_diversidade_incremental(self):
+        """Testa que o custo incremental da diversidade bate com o recálculo."""
+        grupos = formar_grupos_indices(ESTUDANTES, 4, semente=1)
+        codigos = [[ord(e["curso"][0]) % 5 for e in ESTUDANTES], [int(e["genero"] == "F") for e in ESTUDANTES]]
+        pontuador = PontuadorDiversidade(atribuicao_de_grupos(grupos, 60), len(grupos), codigos)
+
+        _verificar_deltas(pontuador, 60, 2)
+
+    def test_diversidade_conta_pares(self):
+        """Testa o custo de um caso pequeno: pares com o mesmo valor no mesmo grupo."""
+        pontuador = PontuadorDiversidade([0, 0, 0, 1, 1, 1], 2, [[0, 0, 1, 1, 1, 0]])
+
+        # Trocar 2 e 5 deixaria cada grupo com um único valor (3 pares em cada)
+        assert pontuador.custo == 2
+        assert pontuador.delta_troca(2, 5) == 4
+
+    def test_pontuacao_incremental(self):
+        """Testa que o custo incremental do equilíbrio de pontuação bate com o recálculo."""
+        grupos = formar_grupos_indices(ESTUDANTES, 4, semente=3)
+        pontuacoes = np.array([e["pontuacao"] for e in ESTUDANTES])
+        pontuacoes[::7] = np.nan
+        pontuador = PontuadorPontuacao(atribuicao_de_grupos(grupos, 60), len(grupos), pontuacoes)
+
+        _verificar_deltas(pontuador, 60, 4)
+
+
+def objetivo_curso_ads_separado(estudantes, grupo_de, num_grupos, opcoes):
+    """Objetivo de teste: diversidade apenas da coluna curso."""
+    return optimization.criar_pontuador_diversidade(estudantes, grupo_de, num_grupos, {"colunas": ["curso"]})
+
+
+class TestFormarGruposOtimizados:
+    """Testes para a função formar_grupos_otimizados e o método "Diversidade"."""
+
+    def test_melhora_diversidade(self):
+        """Testa que a otimização reduz o custo mantendo estudantes e tamanhos da formação aleatória."""
+        relatorio = {}
+        grupos = formar_grupos(
+            ESTUDANTES, 4, "Diversidade", semente=5, tempo_limite=0.05, relatorio=relatorio, usar_cache=False
+        )
+        aleatorios = formar_grupos(ESTUDANTES, 4, "Aleatório", semente=5)
+
+        assert sorted(len(g) for g in grupos) == sorted(len(g) for g in aleatorios)
+        assert sorted(e["matricula"] for g in grupos for e in g) == sorted(e["matricula"] for e in ESTUDANTES)
+        assert relatorio["custo"] < relatorio["custo_inicial"]
+        assert relatorio["custos_objetivos"]["diversidade"] == relatorio["custo"]
+
+    def test_convergencia(self):
+        """Testa que o relatório traz a curva do melhor custo, sem subir."""
+        relatorio = {}
+        formar_grupos_otimizados(ESTUDANTES, 4, semente=1, max_iteracoes=5000, relatorio=relatorio)
+
+        custos = [custo for _, custo in relatorio["convergencia"]]
+        assert relatorio["iteracoes"] == 5000
+        assert custos == sorted(custos, reverse=True)
+        assert custos[-1] == relatorio["custo"]
+        assert 0 <= relatorio["tempo_ate_melhor"] <= relatorio["tempo"]
+
+    def test_reprodutivel_por_iteracoes(self):
+        """Testa que, com max_iteracoes, a mesma semente produz os mesmos grupos."""
+        opcoes = {"objetivos": {"diversidade": 1.0, "pontuacao": 2.0}}
+        primeira = formar_grupos_otimizados(ESTUDANTES, 3, opcoes, semente=8, max_iteracoes=3000)
+        segunda = formar_grupos_otimizados(ESTUDANTES, 3, opcoes, semente=8, max_iteracoes=3000)
+
+        assert [g.tolist() for g in primeira] == [g.tolist() for g in segunda]
+
+    def test_objetivo_registrado(self, monkeypatch):
+        """Testa que um objetivo registrado pode ser usado pelo nome."""
+        monkeypatch.setattr(optimization, "OBJETIVOS_OTIMIZACAO", dict(optimization.OBJETIVOS_OTIMIZACAO))
+        registrar_objetivo("curso", objetivo_curso_ads_separado)
+        relatorio = {}
+
+        formar_grupos_otimizados(
+            ESTUDANTES, 4, {"objetivos": {"curso": 1.0}}, semente=2, max_iteracoes=2000, relatorio=relatorio
+        )
+
+        assert set(relatorio["custos_objetivos"]) == {"curso"}
+
+    def test_objetivo_desconhecido(self):
+        """Testa que um objetivo inexistente gera erro."""
+        with pytest.raises(ValueError):
+            criar_pontuador(ESTUDANTES, np.zeros(60, dtype=np.intp), 1, {"objetivos": {"inexistente": 1.0}})
+
+    def test_varias_tentativas(self):
+        """Testa que as tentativas do método ficam com o menor custo da otimização."""
+        relatorio = {}
+        formar_grupos(ESTUDANTES, 4, "Diversidade", semente=3, tempo_limite=0.01, tentativas=3, relatorio=relatorio)
+
+        assert relatorio["pontuacao"] == relatorio["custo"]
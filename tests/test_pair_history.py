@@ -0,0 +1,144 @@
+"""
+Testes para o módulo de histórico de pares.
+"""
+
+import random
+
+from logic.group_formation import formar_grupos
+from logic.pair_history import (
+    MatrizPares,
+    PontuadorParceiros,
+    chave_item,
+    formar_grupos_novos_parceiros,
+    obter_matriz_pares,
+    pesos_por_indice,
+)
+from logic.partitioning import materializar_grupos
+from utils import persistence
+
+ESTUDANTES = [{"matricula": str(i), "nome": f"Aluno {i}"} for i in range(40)]
+
+
+def _item(grupos, id_item=None):
+    """Cria um item de histórico a partir de grupos de matrículas."""
+    item = {
+        "data": "01/01/2025 10:00",
+        "descricao": "Teste",
+        "grupos": [[{"matricula": m, "nome": f"Aluno {m}"} for m in grupo] for grupo in grupos],
+    }
+    if id_item:
+        item["id"] = id_item
+    return item
+
+
+class TestMatrizPares:
+    """Testes para a classe MatrizPares."""
+
+    def test_adicionar_e_remover_item(self):
+        """Testa que remover um item desfaz exatamente a sua soma."""
+        matriz = MatrizPares()
+        matriz.adicionar_item(_item([["1", "2", "3"], ["4", "5"]], "a"))
+        matriz.adicionar_item(_item([["1", "2"], ["3", "4", "5"]], "b"))
+
+        assert matriz.contagem("1", "2") == 2
+        assert matriz.contagem("2", "1") == 2
+        assert matriz.contagem("1", "4") == 0
+        assert len(matriz) == 6
+
+        assert matriz.remover_item("a") is True
+        assert matriz.contagem("1", "2") == 1
+        assert matriz.contagem("1", "3") == 0
+        assert "1" not in matriz.contagens or "3" not in matriz.contagens["1"]
+
+    def test_item_somado_uma_vez(self):
+        """Testa que o mesmo item não é somado duas vezes."""
+        matriz = MatrizPares()
+        item = _item([["1", "2"]], "a")
+
+        assert matriz.adicionar_item(item) is True
+        assert matriz.adicionar_item(item) is False
+        assert matriz.contagem("1", "2") == 1
+
+    def test_sincronizar_incremental(self):
+        """Testa que a sincronização só soma itens novos e subtrai removidos."""
+        matriz = MatrizPares()
+        a = _item([["1", "2"]], "a")
+        b = _item([["2", "3"]], "b")
+        c = _item([["1", "3"]], "c")
+
+        assert matriz.sincronizar([a, b]) == (2, 0)
+        assert matriz.sincronizar([b, c]) == (1, 1)
+        assert matriz.contagem("1", "2") == 0
+        assert matriz.contagem("2", "3") == 1
+        assert matriz.contagem("1", "3") == 1
+
+    def test_chave_item_legado(self):
+        """Testa que itens sem id recebem um identificador estável."""
+        primeiro = _item([["1", "2"]])
+        segundo = _item([["1", "2"]])
+
+        assert chave_item(primeiro) == chave_item(segundo)
+        assert primeiro["id"] == chave_item(primeiro)
+        assert chave_item(_item([["1", "3"]])) != primeiro["id"]
+
+
+class TestPontuadorParceiros:
+    """Testes para o pontuador incremental de pares repetidos."""
+
+    def test_delta_igual_recalculo(self):
+        """Testa que o delta incremental coincide com o recálculo completo."""
+        rng = random.Random(3)
+        matriz = MatrizPares()
+        for k in range(5):
+            ordem = [e["matricula"] for e in ESTUDANTES]
+            rng.shuffle(ordem)
+            matriz.adicionar_item(_item([ordem[i : i + 4] for i in range(0, len(ordem), 4)], str(k)))
+
+        grupo_de = [i // 4 for i in range(len(ESTUDANTES))]
+        pontuador = PontuadorParceiros(grupo_de, pesos_por_indice(ESTUDANTES, matriz))
+
+        for _ in range(300):
+            a, b = rng.randrange(40), rng.randrange(40)
+            esperado = pontuador.custo + pontuador.delta_troca(a, b)
+            pontuador.aplicar_troca(a, b)
+            assert pontuador.custo == esperado == pontuador.custo_total()
+
+
+class TestFormarGruposNovosParceiros:
+    """Testes para o método "Novos parceiros"."""
+
+    def test_evita_pares_repetidos(self):
+        """Testa que semanas seguidas não repetem parceiros quando há espaço."""
+        matriz = MatrizPares()
+        for semana in range(4):
+            relatorio = {}
+            grupos = formar_grupos_novos_parceiros(ESTUDANTES, 4, matriz=matriz, semente=semana, relatorio=relatorio)
+            materializados = materializar_grupos(ESTUDANTES, grupos)
+
+            assert relatorio["pares_repetidos"] == 0
+            assert matriz.pares_repetidos(materializados) == 0
+            assert sorted(int(i) for g in grupos for i in g) == list(range(len(ESTUDANTES)))
+            matriz.adicionar_item(_item([[e["matricula"] for e in g] for g in materializados], str(semana)))
+
+    def test_mesmos_tamanhos_do_aleatorio(self):
+        """Testa que os tamanhos dos grupos seguem a formação aleatória."""
+        historico = [_item([["0", "1", "2", "3", "4", "5", "6"]], "a")]
+
+        grupos = formar_grupos(ESTUDANTES[:23], 5, metodo="Novos parceiros", historico=historico, semente=1)
+        aleatorio = formar_grupos(ESTUDANTES[:23], 5, metodo="Aleatório", semente=1)
+
+        assert sorted(len(g) for g in grupos) == sorted(len(g) for g in aleatorio)
+        assert sum(len(g) for g in grupos) == 23
+
+    def test_save_history_atualiza_matriz(self, tmp_path, monkeypatch):
+        """Testa que salvar o histórico mantém a matriz compartilhada em dia."""
+        monkeypatch.setattr(persistence, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(persistence, "HISTORY_FILE", tmp_path / "history.json")
+        monkeypatch.setattr(persistence, "BACKUP_DIR", tmp_path / "backups")
+
+        historico = [_item([["900", "901"]], "salvo")]
+        assert persistence.save_history(historico) is True
+        assert obter_matriz_pares().contagem("900", "901") == 1
+
+        assert persistence.save_history([]) is True
+        assert obter_matriz_pares().contagem("900", "901") == 0
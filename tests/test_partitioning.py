@@ -0,0 +1,107 @@
+"""
+Testes para o módulo de particionamento vetorizado.
+"""
+
+import math
+import random
+
+import numpy as np
+
+from logic.group_formation import formar_grupos, redistribuir_solitarios_func
+from logic.partitioning import (
+    formar_grupos_indices,
+    intercalar_metades,
+    materializar_grupos,
+    particionar_indices,
+    redistribuir_solitarios_indices,
+)
+
+
+def _formar_grupos_referencia(estudantes, tamanho_grupo, metodo, redistribuir, permitir, semente):
+    """Implementação original baseada em listas de dicionários, usada como referência."""
+    estudantes_copia = estudantes.copy()
+
+    if metodo == "Aleatório":
+        random.seed(semente)
+        random.shuffle(estudantes_copia)
+        random.seed(None)
+    elif metodo == "Balanceado":
+        estudantes_copia.sort(key=lambda x: x.get("matricula", ""))
+        balanceados = []
+        meio = len(estudantes_copia) // 2
+        for i in range(meio):
+            balanceados.append(estudantes_copia[i])
+            if i + meio < len(estudantes_copia):
+                balanceados.append(estudantes_copia[i + meio])
+        if len(estudantes_copia) % 2 != 0:
+            balanceados.append(estudantes_copia[-1])
+        estudantes_copia = balanceados
+
+    num_grupos = math.ceil(len(estudantes_copia) / tamanho_grupo)
+    grupos = [estudantes_copia[i * tamanho_grupo : (i + 1) * tamanho_grupo] for i in range(num_grupos)]
+
+    if redistribuir:
+        grupos = redistribuir_solitarios_func(grupos, tamanho_grupo, permitir)
+
+    return grupos
+
+
+def _criar_estudantes(total, gerador):
+    """Cria estudantes com matrículas repetíveis para testar ordenação estável."""
+    return [{"matricula": str(gerador.randint(0, total)), "nome": f"Aluno {i}"} for i in range(total)]
+
+
+class TestParidadeFormarGrupos:
+    """Testes de equivalência entre o motor de índices e o algoritmo original."""
+
+    def test_paridade_todos_metodos(self):
+        """Testa que os três métodos geram exatamente os mesmos grupos."""
+        gerador = random.Random(123)
+
+        for _ in range(300):
+            estudantes = _criar_estudantes(gerador.randint(1, 40), gerador)
+            tamanho = gerador.randint(1, 6)
+            metodo = gerador.choice(["Aleatório", "Sequencial", "Balanceado"])
+            redistribuir = gerador.random() < 0.7
+            permitir = gerador.random() < 0.5
+            semente = gerador.randint(0, 10**6)
+
+            esperado = _formar_grupos_referencia(estudantes, tamanho, metodo, redistribuir, permitir, semente)
+            obtido = formar_grupos(estudantes, tamanho, metodo, redistribuir, permitir, semente)
+
+            assert [[id(e) for e in g] for g in obtido] == [[id(e) for e in g] for g in esperado]
+
+    def test_indices_materializados(self):
+        """Testa que materializar os índices reproduz formar_grupos."""
+        estudantes = [{"matricula": str(i), "nome": f"Aluno {i}"} for i in range(11)]
+
+        indices = formar_grupos_indices(estudantes, 3, "Aleatório", semente=42)
+
+        assert all(isinstance(g, np.ndarray) for g in indices)
+        assert materializar_grupos(estudantes, indices) == formar_grupos(estudantes, 3, "Aleatório", semente=42)
+
+    def test_formar_grupos_indices_vazio(self):
+        """Testa formação com lista vazia."""
+        assert formar_grupos_indices([], 3) == []
+
+
+class TestParticionarIndices:
+    """Testes para as funções auxiliares de particionamento."""
+
+    def test_particionar_ultimo_menor(self):
+        """Testa divisão com último grupo incompleto."""
+        grupos = particionar_indices(np.arange(7), 3)
+
+        assert [g.tolist() for g in grupos] == [[0, 1, 2], [3, 4, 5], [6]]
+
+    def test_intercalar_metades_impar(self):
+        """Testa intercalação com número ímpar de elementos."""
+        assert intercalar_metades(np.arange(5)).tolist() == [0, 2, 1, 3, 4]
+
+    def test_redistribuir_solitario(self):
+        """Testa que o índice solitário vai para o menor grupo."""
+        grupos = [np.array([0, 1]), np.array([2, 3]), np.array([4])]
+
+        novos = redistribuir_solitarios_indices(grupos, 2, permitir_grupos_maiores=True)
+
+        assert [g.tolist() for g in novos] == [[0, 1, 4], [2, 3]]
@@ -0,0 +1,141 @@
+"""
+Testes para o módulo de geradores aleatórios isolados.
+"""
+
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+from logic.group_formation import formar_grupos, sortear_grupo_ao_vivo, sortear_grupos_em_fluxo
+from logic.random_streams import criar_fluxos, criar_gerador, permutacao_indices
+
+ESTUDANTES = [{"matricula": str(i), "nome": f"Aluno {i}"} for i in range(60)]
+
+
+def _matriculas(grupos):
+    """Extrai as matrículas de cada grupo."""
+    return [[e["matricula"] for e in grupo] for grupo in grupos]
+
+
+class TestGeradorIsolado:
+    """Testes de isolamento do gerador por chamada."""
+
+    def test_nao_altera_estado_global(self):
+        """Testa que formar grupos com semente não reinicia o random global."""
+        random.seed(99)
+        esperado = [random.random() for _ in range(3)]
+
+        random.seed(99)
+        formar_grupos(ESTUDANTES, 4, "Aleatório", semente=7)
+        obtido = [random.random() for _ in range(3)]
+
+        assert obtido == esperado
+
+    def test_reprodutivel_em_threads(self):
+        """Testa que cada semente produz sempre o mesmo resultado em paralelo."""
+        sementes = list(range(1, 41)) * 3
+        esperado = {s: _matriculas(formar_grupos(ESTUDANTES, 3, "Aleatório", semente=s)) for s in set(sementes)}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            resultados = list(
+                executor.map(lambda s: _matriculas(formar_grupos(ESTUDANTES, 3, "Aleatório", semente=s)), sementes)
+            )
+
+        for semente, resultado in zip(sementes, resultados):
+            assert resultado == esperado[semente]
+
+    def test_gerador_equivale_a_semente(self):
+        """Testa que passar um gerador com a semente equivale a passar a semente."""
+        grupos_semente = formar_grupos(ESTUDANTES, 5, "Aleatório", semente=3)
+        grupos_gerador = formar_grupos(ESTUDANTES, 5, "Aleatório", gerador=criar_gerador(3))
+
+        assert grupos_semente == grupos_gerador
+
+    def test_sorteio_ao_vivo_com_semente(self):
+        """Testa que o sorteio ao vivo é reproduzível com semente."""
+        primeiro = sortear_grupo_ao_vivo(ESTUDANTES, 4, semente=11)
+        segundo = sortear_grupo_ao_vivo(ESTUDANTES, 4, semente=11)
+
+        assert primeiro == segundo
+
+    def test_sorteio_em_fluxo(self):
+        """Testa que o fluxo entrega grupos completos na ordem, igual à lista do sorteio ao vivo."""
+        fluxo = sortear_grupos_em_fluxo(ESTUDANTES[:23], 5, semente=4)
+
+        primeiro = next(fluxo)
+        grupos = [primeiro] + list(fluxo)
+
+        assert primeiro["numero"] == 1
+        assert [len(g["estudantes"]) for g in grupos] == [5, 5, 5, 5, 3]
+        assert sorted(e["matricula"] for g in grupos for e in g["estudantes"]) == sorted(
+            e["matricula"] for e in ESTUDANTES[:23]
+        )
+        assert grupos == sortear_grupo_ao_vivo(ESTUDANTES[:23], 5, semente=4)
+
+    def test_sorteio_ao_vivo_callback(self):
+        """Testa que o callback recebe cada grupo assim que é sorteado."""
+        recebidos = []
+
+        grupos = sortear_grupo_ao_vivo(ESTUDANTES, 7, callback=recebidos.append, semente=2)
+
+        assert recebidos == grupos
+
+
+class TestSortearGruposEmFluxo:
+    """Testes para a função sortear_grupos_em_fluxo."""
+
+    @pytest.mark.parametrize("total", [23, 25, 60])
+    def test_mesmos_grupos_de_formar_grupos(self, total):
+        """Testa que o sorteio ao vivo produz a mesma formação que formar_grupos com a mesma semente."""
+        esperado = formar_grupos(ESTUDANTES[:total], 4, "Aleatório", semente=8, usar_cache=False)
+
+        grupos = [g["estudantes"] for g in sortear_grupos_em_fluxo(ESTUDANTES[:total], 4, semente=8, usar_cache=False)]
+
+        assert _matriculas(grupos) == _matriculas(esperado)
+
+    def test_redistribui_solitario(self):
+        """Testa que o último estudante não fica sozinho, como em formar_grupos."""
+        grupos = sortear_grupo_ao_vivo(ESTUDANTES[:21], 5, semente=3)
+
+        assert min(len(g["estudantes"]) for g in grupos) > 1
+        assert sum(len(g["estudantes"]) for g in grupos) == 21
+
+    def test_tentativas(self):
+        """Testa que, com várias tentativas, o sorteio ao vivo revela a tentativa vencedora."""
+        relatorio = {}
+        esperado = formar_grupos(ESTUDANTES, 4, "Aleatório", semente=6, tentativas=5, usar_cache=False)
+
+        fluxo = sortear_grupos_em_fluxo(ESTUDANTES, 4, semente=6, tentativas=5, relatorio=relatorio, usar_cache=False)
+
+        assert _matriculas(g["estudantes"] for g in fluxo) == _matriculas(esperado)
+        assert relatorio["tentativas"] == 5
+
+
+class TestCriarFluxos:
+    """Testes para a função criar_fluxos."""
+
+    @pytest.mark.parametrize("tipo", ["pcg64", "philox"])
+    def test_fluxos_reprodutiveis_e_distintos(self, tipo):
+        """Testa que os fluxos são fixos por semente e diferentes entre si."""
+        primeiros = [permutacao_indices(50, gerador=g).tolist() for g in criar_fluxos(42, 4, tipo)]
+        segundos = [permutacao_indices(50, gerador=g).tolist() for g in criar_fluxos(42, 4, tipo)]
+
+        assert primeiros == segundos
+        assert len({tuple(p) for p in primeiros}) == 4
+
+    def test_fluxos_com_formar_grupos(self):
+        """Testa formação com fluxos independentes em paralelo."""
+        fluxos = criar_fluxos(5, 6)
+        esperado = [_matriculas(formar_grupos(ESTUDANTES, 3, gerador=g)) for g in criar_fluxos(5, 6)]
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            obtido = list(executor.map(lambda g: _matriculas(formar_grupos(ESTUDANTES, 3, gerador=g)), fluxos))
+
+        assert obtido == esperado
+
+    def test_tipo_invalido(self):
+        """Testa erro para tipo de fluxo desconhecido."""
+        with pytest.raises(ValueError):
+            criar_fluxos(1, 2, tipo="xorshift")
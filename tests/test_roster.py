@@ -0,0 +1,121 @@
+"""
+Testes para o módulo de turma compacta.
+"""
+
+import json
+
+import numpy as np
+
+from logic.group_formation import calcular_estatisticas, formar_grupos
+from logic.roster import Agrupamento, ColunaTexto, Turma
+from utils.exporters import gerar_csv_grupos
+from utils.persistence import serializar_json
+
+ESTUDANTES = [
+    {"matricula": str(i), "nome": f"Aluno {i}", "completo": f"{i}, Aluno {i}", "turma": "AB"[i % 2]} for i in range(12)
+]
+
+
+def _matriculas(grupos):
+    """Extrai as matrículas de cada grupo."""
+    return [[e["matricula"] for e in grupo] for grupo in grupos]
+
+
+class TestColunaTexto:
+    """Testes para a classe ColunaTexto."""
+
+    def test_valores_com_acentos(self):
+        """Testa leitura individual, em lote e com índice negativo."""
+        coluna = ColunaTexto(["José", "", None, "Ângela"])
+
+        assert len(coluna) == 4
+        assert coluna[0] == "José"
+        assert coluna[2] == ""
+        assert coluna[-1] == "Ângela"
+        assert coluna.valores([3, 0]) == ["Ângela", "José"]
+
+    def test_de_buffers(self):
+        """Testa a coluna montada direto dos textos concatenados e dos deslocamentos."""
+        original = ColunaTexto(["José", "", "Ângela"])
+
+        coluna = ColunaTexto.de_buffers(memoryview(original.dados), original.limites.astype(np.int64))
+
+        assert coluna.valores() == ["José", "", "Ângela"]
+        assert coluna.limites.dtype == np.int32
+
+
+class TestTurma:
+    """Testes para a classe Turma."""
+
+    def test_ida_e_volta(self):
+        """Testa que a turma devolve os mesmos dicionários, com completo montado."""
+        turma = Turma.de_estudantes(ESTUDANTES)
+
+        assert len(turma) == 12
+        assert turma.para_estudantes() == ESTUDANTES
+        assert turma.coluna("completo")[3] == "3, Aluno 3"
+
+    def test_pontuacao(self):
+        """Testa que a pontuação ausente não aparece no dicionário."""
+        turma = Turma.de_estudantes(
+            [{"matricula": "1", "nome": "A", "pontuacao": "7,5"}, {"matricula": "2", "nome": "B"}]
+        )
+
+        assert turma[0]["pontuacao"] == 7.5
+        assert "pontuacao" not in turma[1]
+        assert turma.coluna("pontuacao") == [7.5, None]
+
+    def test_memoria_compacta(self):
+        """Testa que a turma usa bem menos memória que os dicionários."""
+        turma = Turma([str(20_000_000 + i) for i in range(100_000)], [f"Estudante {i}" for i in range(100_000)])
+
+        assert turma.nbytes / len(turma) < 40
+
+    def test_concatenar(self):
+        """Testa a junção de turmas com atributos e pontuações só em parte delas."""
+        primeira = Turma.de_estudantes(ESTUDANTES[:5])
+        segunda = Turma.de_estudantes([{"matricula": "90", "nome": "Zé", "pontuacao": 8.0}])
+        vazia = Turma([], [])
+
+        turma = Turma.concatenar([primeira, vazia, segunda])
+
+        assert len(turma) == 6
+        assert turma.para_estudantes()[:5] == ESTUDANTES[:5]
+        assert turma[5] == {"matricula": "90", "nome": "Zé", "completo": "90, Zé", "turma": "", "pontuacao": 8.0}
+        assert turma.coluna("pontuacao") == [None] * 5 + [8.0]
+        assert len(Turma.concatenar([])) == 0
+
+
+class TestFormarGruposComTurma:
+    """Testes de formar_grupos e consumidores com Turma e Agrupamento."""
+
+    def test_mesmos_grupos_que_lista(self):
+        """Testa que a formação com Turma é igual à formação com a lista."""
+        turma = Turma.de_estudantes(ESTUDANTES)
+
+        agrupamento = formar_grupos(turma, 5, "Aleatório", semente=4, usar_cache=False)
+        grupos = formar_grupos(ESTUDANTES, 5, "Aleatório", semente=4, usar_cache=False)
+
+        assert isinstance(agrupamento, Agrupamento)
+        assert _matriculas(agrupamento) == _matriculas(grupos)
+        assert calcular_estatisticas(agrupamento) == calcular_estatisticas(grupos)
+
+    def test_balanceado_com_pontuacao(self):
+        """Testa que a pontuação da Turma é usada pelo método Balanceado e nas estatísticas."""
+        turma = Turma.de_estudantes([{"matricula": str(i), "nome": "X", "pontuacao": i % 2 * 10} for i in range(8)])
+
+        stats = calcular_estatisticas(formar_grupos(turma, 2, "Balanceado", semente=1))
+
+        assert stats["dispersao_pontuacao"] == 0
+
+    def test_exportacao_e_json(self):
+        """Testa que exportadores e persistência aceitam o Agrupamento diretamente."""
+        turma = Turma.de_estudantes(ESTUDANTES)
+        agrupamento = Agrupamento(turma, [np.array([2, 0]), np.array([1])])
+
+        csv, _ = gerar_csv_grupos(agrupamento)
+        dados = json.loads(json.dumps({"grupos": agrupamento, "estudantes": turma}, default=serializar_json))
+
+        assert csv.decode("utf-8").splitlines()[1:] == ["1,2,Aluno 2", "1,0,Aluno 0", "2,1,Aluno 1"]
+        assert _matriculas(dados["grupos"]) == [["2", "0"], ["1"]]
+        assert dados["estudantes"] == ESTUDANTES
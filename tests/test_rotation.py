@@ -0,0 +1,57 @@
+"""
+Testes para o módulo de rodízio de grupos.
+"""
+
+from itertools import combinations
+
+from logic.rotation import formar_rodadas
+
+ESTUDANTES = [{"matricula": str(i), "nome": f"Aluno {i}"} for i in range(24)]
+
+
+def _contar_repeticoes(rodadas):
+    """Conta encontros repetidos entre as rodadas, recalculando do zero."""
+    vistos = {}
+    repetidos = 0
+    for grupos in rodadas:
+        for grupo in grupos:
+            for a, b in combinations(sorted(e["matricula"] for e in grupo), 2):
+                repetidos += vistos.get((a, b), 0)
+                vistos[(a, b)] = vistos.get((a, b), 0) + 1
+    return repetidos
+
+
+class TestFormarRodadas:
+    """Testes para a função formar_rodadas."""
+
+    def test_rodadas_sem_repeticao(self):
+        """Testa que poucas rodadas não repetem pares e cobrem todos os estudantes."""
+        relatorio = {}
+        rodadas = formar_rodadas(ESTUDANTES, 3, 4, semente=7, relatorio=relatorio)
+
+        assert len(rodadas) == 4
+        for grupos in rodadas:
+            assert sorted(e["matricula"] for g in grupos for e in g) == sorted(e["matricula"] for e in ESTUDANTES)
+        assert relatorio["pares_repetidos"] == 0
+        assert _contar_repeticoes(rodadas) == 0
+
+    def test_relatorio_confere_com_recalculo(self):
+        """Testa que o relatório conta os mesmos encontros repetidos que o recálculo."""
+        relatorio = {}
+        rodadas = formar_rodadas(ESTUDANTES[:10], 5, 6, semente=1, relatorio=relatorio)
+
+        assert relatorio["pares_repetidos"] == _contar_repeticoes(rodadas) > 0
+        assert len(relatorio["pares_repetidos_por_rodada"]) == 6
+        assert relatorio["pares_repetidos_por_rodada"][0] == 0
+
+    def test_reproduzivel_com_semente(self):
+        """Testa que a mesma semente gera o mesmo rodízio."""
+        primeiro = formar_rodadas(ESTUDANTES, 4, 3, semente=42)
+        segundo = formar_rodadas(ESTUDANTES, 4, 3, semente=42)
+
+        assert primeiro == segundo
+
+    def test_entrada_vazia(self):
+        """Testa lista vazia e número de rodadas inválido."""
+        assert formar_rodadas([], 3, 4) == []
+        assert formar_rodadas(ESTUDANTES, 3, 0) == []
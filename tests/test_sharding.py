@@ -0,0 +1,111 @@
+"""
+Testes para o módulo de formação por turma.
+"""
+
+from logic import worker_pool
+from logic.roster import Agrupamento, Turma
+from logic.sharding import dividir_por_coluna, formar_grupos_por_turma, juntar_formacoes
+from utils.exporters import gerar_csv_turmas
+
+# 3 turmas intercaladas, com tamanhos 10, 7 e 5
+TURMAS = ["A"] * 10 + ["B"] * 7 + ["C"] * 5
+ESTUDANTES = [
+    {"matricula": str(100 + i), "nome": f"Aluno {i}", "turma": turma}
+    for i, turma in enumerate(TURMAS[::2] + TURMAS[1::2])
+]
+
+
+def _matriculas(grupos):
+    """Extrai as matrículas de cada grupo."""
+    return [[e["matricula"] for e in grupo] for grupo in grupos]
+
+
+class TestDividirPorColuna:
+    """Testes para a função dividir_por_coluna."""
+
+    def test_ordem_de_aparicao(self):
+        """Testa que as turmas aparecem na ordem da planilha, com os índices de cada uma."""
+        divisao = dividir_por_coluna(ESTUDANTES, "turma")
+
+        assert list(divisao) == ["A", "B", "C"]
+        assert [len(indices) for indices in divisao.values()] == [10, 7, 5]
+        assert all(ESTUDANTES[i]["turma"] == "B" for i in divisao["B"])
+
+    def test_valores_ausentes(self):
+        """Testa que estudantes sem a coluna ficam juntos em uma turma vazia."""
+        divisao = dividir_por_coluna([{"matricula": "1"}, {"matricula": "2", "turma": " A "}], "turma")
+
+        assert list(divisao) == ["", "A"]
+
+
+class TestFormarGruposPorTurma:
+    """Testes para a função formar_grupos_por_turma."""
+
+    def test_grupos_nao_misturam_turmas(self):
+        """Testa que cada grupo tem estudantes de uma única turma e ninguém se perde."""
+        formacoes = formar_grupos_por_turma(ESTUDANTES, "turma", 3, semente=1)
+
+        assert list(formacoes) == ["A", "B", "C"]
+        for nome, grupos in formacoes.items():
+            assert all(e["turma"] == nome for grupo in grupos for e in grupo)
+        assert sorted(m for grupos in formacoes.values() for g in _matriculas(grupos) for m in g) == sorted(
+            e["matricula"] for e in ESTUDANTES
+        )
+
+    def test_reprodutivel(self):
+        """Testa que a mesma semente produz os mesmos grupos."""
+        primeira = formar_grupos_por_turma(ESTUDANTES, "turma", 3, semente=7)
+        segunda = formar_grupos_por_turma(ESTUDANTES, "turma", 3, semente=7)
+
+        assert {n: _matriculas(g) for n, g in primeira.items()} == {n: _matriculas(g) for n, g in segunda.items()}
+
+    def test_turma_compacta(self):
+        """Testa que uma Turma produz Agrupamentos da turma completa com os mesmos grupos."""
+        turma = Turma.de_estudantes(ESTUDANTES)
+        relatorio = {}
+
+        formacoes = formar_grupos_por_turma(turma, "turma", 3, "Balanceado", semente=3, relatorio=relatorio)
+        esperado = formar_grupos_por_turma(ESTUDANTES, "turma", 3, "Balanceado", semente=3)
+
+        assert all(isinstance(grupos, Agrupamento) and grupos.turma is turma for grupos in formacoes.values())
+        assert {n: _matriculas(g) for n, g in formacoes.items()} == {n: _matriculas(g) for n, g in esperado.items()}
+        assert set(relatorio["turmas"]) == {"A", "B", "C"}
+        assert relatorio["paralelo"] is False
+
+    def test_paralelo_igual_ao_serial(self, monkeypatch):
+        """Testa que a formação em processos produz os mesmos grupos que a serial."""
+        esperado = formar_grupos_por_turma(ESTUDANTES, "turma", 3, semente=11)
+
+        monkeypatch.setattr(worker_pool, "LIMIAR_PARALELO", 0)
+        monkeypatch.setattr(worker_pool.os, "cpu_count", lambda: 2)
+        relatorio = {}
+        formacoes = formar_grupos_por_turma(
+            ESTUDANTES, "turma", 3, semente=11, max_trabalhadores=2, relatorio=relatorio
+        )
+
+        assert relatorio["paralelo"] is True
+        assert {n: _matriculas(g) for n, g in formacoes.items()} == {n: _matriculas(g) for n, g in esperado.items()}
+
+
+class TestJuntarFormacoes:
+    """Testes para a função juntar_formacoes e a exportação por turma."""
+
+    def test_numeracao_por_turma(self):
+        """Testa que os grupos são numerados dentro de cada turma."""
+        formacoes = formar_grupos_por_turma(Turma.de_estudantes(ESTUDANTES), "turma", 3, "Sequencial")
+
+        grupos, rotulos = juntar_formacoes(formacoes)
+
+        assert isinstance(grupos, Agrupamento)
+        assert len(grupos) == len(rotulos) == 3 + 2 + 2
+        assert rotulos[:4] == ["A - Grupo 1", "A - Grupo 2", "A - Grupo 3", "B - Grupo 1"]
+
+    def test_csv_turmas(self):
+        """Testa que o CSV traz a turma e o número do grupo dentro dela."""
+        formacoes = formar_grupos_por_turma(ESTUDANTES, "turma", 5, "Sequencial")
+
+        linhas = gerar_csv_turmas(formacoes)[0].decode("utf-8").splitlines()
+
+        assert linhas[0] == "Turma,Grupo,Matrícula,Nome"
+        assert linhas[1].startswith("A,1,")
+        assert linhas[-1].startswith("C,1,")
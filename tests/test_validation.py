@@ -2,8 +2,20 @@
 Testes para o módulo de validação.
 """
 
+import io
+import random
+
+import pandas as pd
+
+from logic import validation
+from logic.roster import Turma
 from logic.validation import (
+    extrair_preview_arquivo,
+    extrair_preview_buffer,
+    extrair_preview_dados,
+    interpretar_texto_entrada,
     processar_entrada_com_validacao,
+    validar_csv,
     validar_duplicatas,
     validar_formato_entrada,
 )
@@ -74,6 +86,91 @@ class TestValidarDuplicatas:
         assert "1" in duplicatas
         assert duplicatas["1"]["count"] == 2
 
+    def test_estrutura_completa(self):
+        """Testa contagem, índices e nomes na ordem da primeira aparição, ignorando matrículas vazias."""
+        estudantes = [
+            {"matricula": "2", "nome": "Bruno"},
+            {"matricula": " 1 ", "nome": "Ana"},
+            {"matricula": "", "nome": "Sem matrícula"},
+            {"matricula": "1", "nome": "Ana Nova"},
+            {"matricula": "", "nome": "Outro sem matrícula"},
+            {"matricula": "2", "nome": "Bruno Novo"},
+            {"nome": "Sem chave"},
+        ]
+
+        duplicatas = validar_duplicatas(estudantes)
+
+        assert list(duplicatas) == ["2", "1"]
+        assert duplicatas["2"] == {"count": 2, "indices": [0, 5], "nomes": ["Bruno", "Bruno Novo"]}
+        assert duplicatas["1"] == {"count": 2, "indices": [1, 3], "nomes": ["Ana", "Ana Nova"]}
+
+    def test_equivale_a_contagem_por_estudante(self):
+        """Testa o resultado contra a contagem estudante a estudante."""
+        rng = random.Random(0)
+        estudantes = [{"matricula": str(rng.randrange(300)), "nome": f"Aluno {i}"} for i in range(1000)]
+
+        esperado = {}
+        for i, estudante in enumerate(estudantes):
+            info = esperado.setdefault(estudante["matricula"], {"count": 0, "indices": [], "nomes": []})
+            info["count"] += 1
+            info["indices"].append(i)
+            info["nomes"].append(estudante["nome"])
+        esperado = {matricula: info for matricula, info in esperado.items() if info["count"] > 1}
+
+        duplicatas = validar_duplicatas(estudantes)
+
+        assert duplicatas == esperado
+        assert list(duplicatas) == list(esperado)
+
+    def test_limite(self):
+        """Testa que o limite corta índices e nomes, mas não a contagem."""
+        estudantes = [{"matricula": "1", "nome": f"Aluno {i}"} for i in range(100)]
+
+        duplicatas = validar_duplicatas(estudantes, limite=3)
+
+        assert duplicatas["1"]["count"] == 100
+        assert duplicatas["1"]["indices"] == [0, 1, 2]
+        assert duplicatas["1"]["nomes"] == ["Aluno 0", "Aluno 1", "Aluno 2"]
+
+    def test_dicionario_igual_ao_vetorizado(self, monkeypatch):
+        """Testa que o caminho com dicionário (entradas pequenas) e o vetorizado dão o mesmo resultado."""
+        rng = random.Random(1)
+        matriculas = ["", " 7 ", "7"] + [str(rng.randrange(200)) for _ in range(800)]
+        estudantes = [{"matricula": matricula, "nome": f"Aluno {i}"} for i, matricula in enumerate(matriculas)]
+
+        monkeypatch.setattr(validation, "LIMIAR_DUPLICATAS_VETORIZADO", 10**9)
+        por_dicionario = validar_duplicatas(estudantes, limite=4)
+        monkeypatch.setattr(validation, "LIMIAR_DUPLICATAS_VETORIZADO", 0)
+        vetorizado = validar_duplicatas(estudantes, limite=4)
+
+        assert por_dicionario == vetorizado
+        assert list(por_dicionario) == list(vetorizado)
+
+    def test_turma(self):
+        """Testa que uma Turma dá o mesmo resultado que a lista de dicionários."""
+        estudantes = [{"matricula": m, "nome": f"Aluno {i}"} for i, m in enumerate(["1", "2", "1", "3", "2"])]
+
+        assert validar_duplicatas(Turma.de_estudantes(estudantes)) == validar_duplicatas(estudantes)
+
+
+class TestValidarCsv:
+    """Testes para a função validar_csv."""
+
+    def test_csv_valido(self):
+        """Testa DataFrame sem problemas."""
+        df = pd.DataFrame({"mat": ["1", "2"], "nome": ["Ana", "Bia"]})
+
+        assert validar_csv(df, "mat", "nome") == (True, [])
+
+    def test_csv_com_duplicatas(self):
+        """Testa que as matrículas duplicadas são listadas na ordem em que aparecem."""
+        df = pd.DataFrame({"mat": [2, 1, " 1", 2, 3, None], "nome": ["A", "B", "C", "D", "E", "F"]})
+
+        valido, erros = validar_csv(df, "mat", "nome")
+
+        assert valido is False
+        assert "Matrículas duplicadas: 2, 1" in erros
+
 
 class TestProcessarEntradaComValidacao:
     """Testes para a função processar_entrada_com_validacao."""
@@ -95,3 +192,130 @@ class TestProcessarEntradaComValidacao:
 
         assert resultado["valido"] is False
         assert len(resultado["erros"]) == 1
+
+
+class TestInterpretarTextoEntrada:
+    """Testes para a função interpretar_texto_entrada."""
+
+    def _linha_a_linha(self, texto):
+        """Resultado esperado, aplicando validar_formato_entrada a cada linha."""
+        estudantes = []
+        erros = []
+        for num_linha, linha in enumerate(texto.split("\n"), 1):
+            valido, resultado = validar_formato_entrada(linha)
+            if resultado is None:
+                continue
+            if valido:
+                estudantes.append(resultado)
+            else:
+                erros.append({"linha": num_linha, "conteudo": linha.strip(), "erro": resultado})
+        return estudantes, erros
+
+    def test_equivale_a_validacao_por_linha(self):
+        """Testa que o resultado e os números das linhas são os mesmos da validação por linha."""
+        texto = (
+            "123, João Silva\n"
+            "\n"
+            "  456 Maria Santos  \r\n"
+            "789\n"
+            ", Sem matrícula\n"
+            "321,\n"
+            "texto qualquer\n"
+            "\t\u00a0654,  Ana, Beatriz \n"
+            "987Pedro\n"
+            "   \n"
+            "١٢٣ Nome com dígitos árabes"
+        )
+
+        assert interpretar_texto_entrada(texto) == self._linha_a_linha(texto)
+
+    def test_linhas_numeradas_a_partir_de_um(self):
+        """Testa que linhas vazias contam na numeração dos erros."""
+        estudantes, erros = interpretar_texto_entrada("\n\n123, João\ninvalida")
+
+        assert len(estudantes) == 1
+        assert erros[0]["linha"] == 4
+
+    def test_texto_vazio(self):
+        """Testa texto sem estudantes."""
+        assert interpretar_texto_entrada("") == ([], [])
+
+
+class TestExtrairPreviewDados:
+    """Testes para a função extrair_preview_dados e suas variantes para buffers."""
+
+    TEXTO = "\n  \n123, João\r\n\t\ninvalida\n\u00a0\u2028 \n456 Maria\n789, Pedro\n\n321, Ana\n\n"
+
+    def _preview_completo(self, texto, limite, total_aproximado=False):
+        """Resultado esperado, separando e limpando todas as linhas."""
+        linhas = [linha.strip() for linha in texto.split("\n") if linha.strip()]
+        preview = [
+            {"linha": i + 1, "conteudo": linha, "valido": valido, "dados": dados if valido else None}
+            for i, linha in enumerate(linhas[:limite])
+            for valido, dados in [validar_formato_entrada(linha)]
+        ]
+        validas = sum(1 for p in preview if p["valido"])
+        return {
+            "total_linhas": len(linhas),
+            "total_aproximado": total_aproximado,
+            "mostradas": len(preview),
+            "preview": preview,
+            "validas_preview": validas,
+            "invalidas_preview": len(preview) - validas,
+        }
+
+    def test_equivale_a_separar_todas_as_linhas(self):
+        """Testa o mesmo resultado que separar e limpar o texto inteiro quando ele cabe no preview."""
+        for limite in (5, 10):
+            assert extrair_preview_dados(self.TEXTO, limite) == self._preview_completo(self.TEXTO, limite)
+
+    def test_total_estimado_alem_do_preview(self):
+        """Testa que, com mais linhas que o preview, só o total muda e é marcado como aproximado."""
+        for limite in (0, 1, 3):
+            preview = extrair_preview_dados(self.TEXTO, limite)
+            esperado = self._preview_completo(self.TEXTO, limite, total_aproximado=True)
+
+            assert preview["total_linhas"] > limite
+            assert {**preview, "total_linhas": 5} == esperado
+
+    def test_estimativa_nao_percorre_o_texto(self):
+        """Testa a estimativa pelo tamanho médio das primeiras linhas de um texto grande."""
+        texto = "".join(f"{i:06d}, Aluno {i:06d}\n" for i in range(100_000))
+
+        preview = extrair_preview_dados(texto)
+
+        assert preview["total_aproximado"]
+        assert preview["total_linhas"] == 100_000
+        assert preview["mostradas"] == 5
+
+    def test_texto_vazio(self):
+        """Testa texto vazio ou só com linhas em branco."""
+        assert extrair_preview_dados("")["total_linhas"] == 0
+        assert extrair_preview_dados(" \n\n\t")["total_linhas"] == 0
+
+    def test_buffer(self):
+        """Testa que o buffer de bytes dá o mesmo resultado que o texto."""
+        texto = "123, João\r\n\n  \ninvalida\n456 Maria\n"
+
+        assert extrair_preview_buffer(texto.encode("utf-8"), 2) == extrair_preview_dados(texto, 2)
+        assert extrair_preview_buffer(b"")["total_linhas"] == 0
+
+    def test_memoryview(self, monkeypatch):
+        """Testa o buffer de um arquivo enviado (memoryview), buscando as quebras em blocos pequenos."""
+        monkeypatch.setattr(validation, "BYTES_BUSCA", 4)
+        texto = "\n  \n123, João da Silva\ninvalida\n456 Maria\n789, Ana\n"
+
+        with io.BytesIO(texto.encode("utf-8")).getbuffer() as buffer:
+            assert extrair_preview_buffer(buffer, 2) == extrair_preview_dados(texto, 2)
+            assert extrair_preview_buffer(buffer)["total_linhas"] == 4
+
+    def test_arquivo(self, tmp_path):
+        """Testa o preview de um arquivo mapeado em memória."""
+        caminho = tmp_path / "estudantes.txt"
+        texto = "".join(f"{i}, Aluno {i}\n" for i in range(1000))
+        caminho.write_text(texto, encoding="utf-8")
+        vazio = tmp_path / "vazio.txt"
+        vazio.write_bytes(b"")
+
+        assert extrair_preview_arquivo(str(caminho)) == extrair_preview_dados(texto)
+        assert extrair_preview_arquivo(str(vazio))["total_linhas"] == 0
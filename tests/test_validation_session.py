@@ -0,0 +1,107 @@
+"""
+Testes para o módulo de validação incremental.
+"""
+
+import random
+
+from logic.validation import processar_entrada_com_validacao
+from logic.validation_session import SessaoValidacao
+
+
+def _texto(total):
+    """Cria um texto com um estudante por linha."""
+    return "\n".join(f"{i}, Aluno {i}" for i in range(total))
+
+
+class TestSessaoValidacao:
+    """Testes para a classe SessaoValidacao."""
+
+    def test_equivale_ao_processamento_completo(self):
+        """Testa que cada edição produz o mesmo resultado que reprocessar o texto inteiro."""
+        edicoes = [
+            "123, João\n\ninvalida\n456 Maria",
+            "123, João\n\ninvalida\n456 Maria\n123, João de novo",
+            "0, Novo\n123, João\n\ninvalida\n456 Maria\n123, João de novo",
+            "0, Novo\n123, João\n456 Maria\n123, João de novo",
+            "0, Novo\n123, João\n456 Maria\n789,",
+            "",
+            "123, João\n123, João",
+        ]
+        sessao = SessaoValidacao()
+
+        for texto in edicoes:
+            assert sessao.atualizar(texto) == processar_entrada_com_validacao(texto)
+
+    def test_reprocessa_apenas_linhas_alteradas(self):
+        """Testa que editar uma linha só reinterpreta essa linha."""
+        sessao = SessaoValidacao()
+        linhas = _texto(1000).split("\n")
+        sessao.atualizar("\n".join(linhas))
+        assert sessao.reprocessadas == 1000
+
+        linhas[500] = "500, Aluno Editado"
+        resultado = sessao.atualizar("\n".join(linhas))
+
+        assert sessao.reprocessadas == 1
+        assert resultado["estudantes"][500]["nome"] == "Aluno Editado"
+        assert resultado["total"] == 1000
+
+    def test_insercao_desloca_numeros_das_linhas(self):
+        """Testa que inserir linhas atualiza o número das linhas com erro seguintes."""
+        sessao = SessaoValidacao()
+        sessao.atualizar("1, Ana\ninvalida")
+        resultado = sessao.atualizar("0, Zé\n1, Ana\ninvalida")
+
+        assert sessao.reprocessadas == 1
+        assert resultado["erros"][0]["linha"] == 3
+
+    def test_duplicatas_atualizadas(self):
+        """Testa que as duplicatas aparecem e somem conforme as edições."""
+        sessao = SessaoValidacao()
+
+        resultado = sessao.atualizar("1, Ana\n2, Bia\n1, Ana Clara")
+        assert resultado["duplicatas"] == {"1": {"count": 2, "indices": [0, 2], "nomes": ["Ana", "Ana Clara"]}}
+
+        resultado = sessao.atualizar("1, Ana\n2, Bia\n3, Ana Clara")
+        assert resultado["duplicatas"] == {}
+        assert not sessao.repetidas
+
+    def test_linha_desfeita_vem_do_cache(self):
+        """Testa que voltar a um texto anterior não reinterpreta as linhas."""
+        sessao = SessaoValidacao()
+        sessao.atualizar("1, Ana\n2, Bia")
+        sessao.atualizar("1, Ana\n2, Beatriz")
+        sessao.atualizar("1, Ana\n2, Bia")
+
+        assert sessao.reprocessadas == 0
+
+    def test_linhas_repetidas_nao_compartilham_estudante(self):
+        """Testa que alterar o estudante de uma linha não altera as linhas iguais, nem as próximas edições."""
+        sessao = SessaoValidacao()
+        estudantes = sessao.atualizar("1, Ana\n1, Ana")["estudantes"]
+
+        estudantes[0]["grupo"] = 3
+
+        assert estudantes[1] == {"matricula": "1", "nome": "Ana", "completo": "1, Ana"}
+        novo = sessao.atualizar("1, Ana\n1, Ana\n1, Ana")["estudantes"][2]
+        assert novo == {"matricula": "1", "nome": "Ana", "completo": "1, Ana"}
+
+    def test_edicoes_aleatorias(self):
+        """Testa sequências aleatórias de inserções, remoções e trocas de linhas, inclusive em blocos grandes."""
+        rng = random.Random(0)
+        opcoes = ["", "invalida", "1, Ana", "1, Ana Clara", "2 Bia", "3,", "4, Davi"]
+        linhas = [rng.choice(opcoes) for _ in range(1500)]
+        sessao = SessaoValidacao()
+
+        for _ in range(40):
+            posicao = rng.randrange(len(linhas) + 1)
+            operacao = rng.random()
+            if operacao < 0.4:
+                linhas[posicao:posicao] = [rng.choice(opcoes) for _ in range(rng.randint(1, 3))]
+            elif operacao < 0.7:
+                del linhas[posicao : posicao + rng.randint(1, 3)]
+            else:
+                linhas[posicao : posicao + 1] = [rng.choice(opcoes)]
+
+            texto = "\n".join(linhas)
+            assert sessao.atualizar(texto) == processar_entrada_com_validacao(texto)
@@ -21,11 +21,12 @@ from ui.components import (
     card_grupo,
     divisoria,
 )
-from ui.group_display import exibir_grupos
+from ui.group_display import exibir_grupos, exibir_rodadas
 from ui.history_view import exibir_historico
 from ui.input_forms import (
     carregar_grupos_salvos,
     entrada_manual_com_preview,
+    formulario_restricoes,
     importar_csv_com_mapeamento,
 )
 from ui.settings_view import exibir_configuracoes
@@ -35,8 +36,10 @@ __all__ = [
     "entrada_manual_com_preview",
     "importar_csv_com_mapeamento",
     "carregar_grupos_salvos",
+    "formulario_restricoes",
     # group_display
     "exibir_grupos",
+    "exibir_rodadas",
     # history_view
     "exibir_historico",
     # settings_view
@@ -12,9 +12,15 @@ def animacao_sorteio_flip_cards(grupos, delay=1.5):
     """
     Exibe animação de sorteio com efeito de cards virando (flip cards).
 
+    Cada grupo é revelado assim que chega, então grupos pode ser um iterador, como
+    o de sortear_grupos_em_fluxo, consumido enquanto o sorteio acontece.
+
     Args:
-        grupos (list): Lista de grupos a serem revelados
+        grupos (iterable): Grupos a serem revelados (listas de estudantes)
         delay (float): Delay entre revelações em segundos
+
+    Returns:
+        list: Grupos revelados, na ordem em que chegaram
     """
     # CSS para o efeito de flip card
     flip_css = """
@@ -95,21 +101,20 @@ def animacao_sorteio_flip_cards(grupos, delay=1.5):
 
     st.markdown(flip_css, unsafe_allow_html=True)
 
-    # Container para os cards
+    # Os cards são criados à medida que os grupos chegam: o primeiro aparece sem
+    # esperar pelos demais, e grupos podem vir de um sorteio em andamento
     cards_container = st.container()
+    revelados = []
 
-    # Placeholders para cada card
-    cards_placeholders = []
-    with cards_container:
-        cols = st.columns(min(3, len(grupos)))
-        for i in range(len(grupos)):
+    for i, grupo in enumerate(grupos):
+        with cards_container:
+            if i % 3 == 0:
+                cols = st.columns(3)
             with cols[i % 3]:
-                cards_placeholders.append(st.empty())
+                card = st.empty()
 
-    # Revelar grupos um por um
-    for i, grupo in enumerate(grupos):
         # Mostrar card fechado
-        cards_placeholders[i].markdown(
+        card.markdown(
             f"""
         <div class="flip-card" id="card-{i}">
             <div class="flip-card-inner">
@@ -127,11 +132,6 @@ def animacao_sorteio_flip_cards(grupos, delay=1.5):
             unsafe_allow_html=True,
         )
 
-    # Pausa inicial
-    time.sleep(1)
-
-    # Revelar cada grupo com animação
-    for i, grupo in enumerate(grupos):
         # Aguardar delay
         time.sleep(delay)
 
@@ -144,7 +144,7 @@ def animacao_sorteio_flip_cards(grupos, delay=1.5):
             estudantes_html += f"<p><em>... e mais {len(grupo) - 5} estudantes</em></p>"
 
         # Atualizar card com efeito de virada
-        cards_placeholders[i].markdown(
+        card.markdown(
             f"""
         <div class="flip-card flipped grupo-revelado" id="card-{i}-revealed">
             <div class="flip-card-inner">
@@ -164,11 +164,14 @@ def animacao_sorteio_flip_cards(grupos, delay=1.5):
         """,
             unsafe_allow_html=True,
         )
+        revelados.append(grupo)
 
     # Efeito de confete ao final
     time.sleep(0.5)
     adicionar_confete()
 
+    return revelados
+
 
 def adicionar_confete():
     """Adiciona efeito de confete caindo."""
@@ -194,7 +197,7 @@ def adicionar_confete():
     st.markdown(confete_js, unsafe_allow_html=True)
 
 
-def animacao_progresso(etapa, total, mensagem=""):
+def animacao_progresso(etapa, total, mensagem="", container=None):
     """
     Exibe uma barra de progresso animada.
 
@@ -202,20 +205,22 @@ def animacao_progresso(etapa, total, mensagem=""):
         etapa (int): Etapa atual
         total (int): Total de etapas
         mensagem (str): Mensagem opcional
+        container (optional): Espaço do Streamlit (ex.: st.empty()) em que a barra é
+            desenhada, para atualizá-la no lugar a cada etapa
     """
-    progresso = etapa / total
+    progresso = etapa / total if total else 1.0
 
     progress_html = f"""
     <style>
-    .progress-container {
+    .progress-container {{
         width: 100%;
         background-color: #f0f0f0;
         border-radius: 10px;
         padding: 3px;
         margin: 10px 0;
-    }
-    
-    .progress-bar {
+    }}
+
+    .progress-bar {{
         width: {progresso * 100}%;
         height: 20px;
         background: linear-gradient(90deg, #4CAF50, #8BC34A);
@@ -226,16 +231,16 @@ def animacao_progresso(etapa, total, mensagem=""):
         color: white;
         font-size: 12px;
         font-weight: bold;
-    }
+    }}
     </style>
-    
+
     <div class="progress-container">
         <div class="progress-bar">{int(progresso * 100)}%</div>
     </div>
     <p style="text-align: center; color: #666;">{mensagem} ({etapa}/{total})</p>
     """
 
-    st.markdown(progress_html, unsafe_allow_html=True)
+    (st if container is None else container).markdown(progress_html, unsafe_allow_html=True)
 
 
 def animacao_contador(numero, duracao=2.0):
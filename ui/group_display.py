@@ -8,10 +8,18 @@ import base64
 import pandas as pd
 import streamlit as st
 
+from logic.columnar_io import COLUNAR_DISPONIVEL
 from logic.group_formation import calcular_estatisticas
+from logic.group_index import IndiceGrupos
 from ui.animations import animacao_sorteio_flip_cards
 from ui.components import alerta_info, card_estatistica
-from utils.exporters import gerar_csv_grupos, gerar_excel_grupos
+from utils.exporters import (
+    ARQUIVOS_COLUNARES,
+    gerar_colunar_grupos,
+    gerar_csv_grupos,
+    gerar_csv_turmas,
+    gerar_excel_grupos,
+)
 from utils.helpers import formato_display
 from utils.qr_generator import gerar_qr_code_grupo, gerar_qr_code_todos_grupos
 
@@ -49,6 +57,16 @@ def exibir_grupos(grupos, tamanho_grupo, estudantes_originais, show_animation=Tr
     with col4:
         card_estatistica("Maior Grupo", stats["maior_grupo"], "📈", "#9C27B0")
 
+    if "dispersao_pontuacao" in stats:
+        medias = [media for media in stats["medias_pontuacao"] if media is not None]
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            card_estatistica("Menor Média", f"{min(medias):.2f}", "🔻", "#FF9800")
+        with col2:
+            card_estatistica("Maior Média", f"{max(medias):.2f}", "🔺", "#9C27B0")
+        with col3:
+            card_estatistica("Dispersão", f"{stats['dispersao_pontuacao']:.2f}", "⚖️", "#2196F3")
+
     # Opções de formato de exibição
     st.divider()
 
@@ -63,32 +81,7 @@ def exibir_grupos(grupos, tamanho_grupo, estudantes_originais, show_animation=Tr
         )
 
     with col2:
-        # Exportação
-        st.markdown("**📤 Exportar**")
-
-        exp_col1, exp_col2 = st.columns(2)
-
-        with exp_col1:
-            # CSV
-            csv_data, csv_filename = gerar_csv_grupos(grupos)
-            st.download_button(
-                "📄 CSV",
-                data=csv_data,
-                file_name=csv_filename,
-                mime="text/csv",
-                use_container_width=True,
-            )
-
-        with exp_col2:
-            # Excel
-            excel_data, excel_filename = gerar_excel_grupos(grupos)
-            st.download_button(
-                "📊 Excel",
-                data=excel_data,
-                file_name=excel_filename,
-                mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                use_container_width=True,
-            )
+        exibir_exportacao(grupos)
 
     # QR Codes
     with st.expander("📱 QR Codes"):
@@ -143,6 +136,10 @@ def exibir_grupos(grupos, tamanho_grupo, estudantes_originais, show_animation=Tr
                     mime="image/png",
                 )
 
+    # Busca do grupo de um estudante
+    st.divider()
+    exibir_busca_grupo(grupos)
+
     # Tabs para visualização
     st.divider()
 
@@ -170,6 +167,154 @@ def exibir_grupos(grupos, tamanho_grupo, estudantes_originais, show_animation=Tr
         )
 
 
+def exibir_exportacao(grupos):
+    """
+    Exibe os botões de download dos grupos (CSV, Excel e, com o pyarrow, Parquet).
+
+    Args:
+        grupos (list): Lista de grupos
+    """
+    # Exportação
+    st.markdown("**📤 Exportar**")
+
+    exp_col1, exp_col2 = st.columns(2)
+
+    with exp_col1:
+        # CSV
+        csv_data, csv_filename = gerar_csv_grupos(grupos)
+        st.download_button(
+            "📄 CSV",
+            data=csv_data,
+            file_name=csv_filename,
+            mime="text/csv",
+            use_container_width=True,
+        )
+
+    with exp_col2:
+        # Excel
+        excel_data, excel_filename = gerar_excel_grupos(grupos)
+        st.download_button(
+            "📊 Excel",
+            data=excel_data,
+            file_name=excel_filename,
+            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+            use_container_width=True,
+        )
+
+    if COLUNAR_DISPONIVEL:
+        # Parquet guarda os tipos e é lido de volta bem mais rápido que CSV
+        parquet_data, parquet_filename = gerar_colunar_grupos(grupos)
+        st.download_button(
+            "🗜️ Parquet",
+            data=parquet_data,
+            file_name=parquet_filename,
+            mime=ARQUIVOS_COLUNARES["parquet"][1],
+            use_container_width=True,
+        )
+
+
+def indice_grupos_sessao(grupos):
+    """
+    Retorna o índice de busca da formação exibida, montando-o só quando a formação muda.
+
+    Args:
+        grupos (list or Agrupamento): Grupos exibidos
+
+    Returns:
+        IndiceGrupos: Índice guardado no estado da sessão do Streamlit
+    """
+    guardado = st.session_state.get("indice_grupos")
+    if guardado is None or guardado[0] is not grupos:
+        guardado = (grupos, IndiceGrupos(grupos))
+        st.session_state["indice_grupos"] = guardado
+    return guardado[1]
+
+
+def exibir_busca_grupo(grupos):
+    """
+    Exibe a busca "Encontre seu grupo", por matrícula ou pelo começo do nome.
+
+    Args:
+        grupos (list or Agrupamento): Grupos exibidos
+    """
+    consulta = st.text_input(
+        "🔍 Encontre seu grupo",
+        placeholder="Digite sua matrícula ou o começo do seu nome",
+        key="busca_grupo",
+    )
+    if not consulta.strip():
+        return
+
+    resultados = indice_grupos_sessao(grupos).buscar(consulta)
+    if not resultados:
+        alerta_info("Nenhum estudante encontrado.")
+        return
+
+    st.dataframe(
+        pd.DataFrame(resultados).rename(columns={"grupo": "Grupo", "matricula": "Matrícula", "nome": "Nome"}),
+        hide_index=True,
+        use_container_width=True,
+    )
+
+
+def exibir_rodadas(rodadas, relatorio=None):
+    """
+    Exibe um rodízio com várias rodadas de grupos, uma aba por rodada.
+
+    Args:
+        rodadas (list): Lista de rodadas, cada uma uma lista de grupos
+        relatorio (dict, optional): Relatório com os pares repetidos por rodada
+    """
+    st.subheader(f"🔁 Rodízio com {len(rodadas)} rodadas")
+
+    repetidos = (relatorio or {}).get("pares_repetidos_por_rodada", [0] * len(rodadas))
+    col1, col2 = st.columns(2)
+    with col1:
+        card_estatistica("Rodadas", len(rodadas), "🔁", "#2196F3")
+    with col2:
+        card_estatistica("Pares Repetidos", sum(repetidos), "🔄", "#FF9800")
+
+    st.caption("Cada rodada foi salva no histórico, onde pode ser exportada individualmente.")
+
+    abas = st.tabs([f"Rodada {i + 1}" for i in range(len(rodadas))])
+    for i, (aba, grupos) in enumerate(zip(abas, rodadas)):
+        with aba:
+            if repetidos[i]:
+                alerta_info(f"{repetidos[i]} encontros repetidos nesta rodada.")
+            exibir_visao_geral(grupos, "Matrícula e Nome")
+
+
+def exibir_turmas(formacoes, relatorio=None):
+    """
+    Exibe os grupos formados por turma, uma aba por turma.
+
+    Args:
+        formacoes (dict): {turma: grupos}, como devolvido por formar_grupos_por_turma
+        relatorio (dict, optional): Relatório da formação por turma
+    """
+    st.subheader(f"🏫 Grupos de {len(formacoes)} turmas")
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        card_estatistica("Turmas", len(formacoes), "🏫", "#2196F3")
+    with col2:
+        card_estatistica("Total Grupos", sum(len(grupos) for grupos in formacoes.values()), "📦", "#4CAF50")
+    with col3:
+        total = sum(calcular_estatisticas(grupos)["total_estudantes"] for grupos in formacoes.values())
+        card_estatistica("Total Estudantes", total, "👥", "#9C27B0")
+
+    csv_data, csv_filename = gerar_csv_turmas(formacoes)
+    st.download_button("📄 CSV de todas as turmas", data=csv_data, file_name=csv_filename, mime="text/csv")
+
+    if (relatorio or {}).get("paralelo"):
+        st.caption("As turmas foram formadas em paralelo.")
+
+    abas = st.tabs([f"{nome} ({len(grupos)} grupos)" for nome, grupos in formacoes.items()])
+    for aba, grupos in zip(abas, formacoes.values()):
+        with aba:
+            exibir_visao_geral(grupos, "Matrícula e Nome")
+
+
 def exibir_visao_geral(grupos, formato_exibicao):
     """Exibe a visão geral de todos os grupos em uma tabela."""
     # Criar DataFrame
@@ -3,11 +3,15 @@ Módulo de visualização do histórico.
 Contém componentes para exibir e gerenciar grupos salvos.
 """
 
+import uuid
 from datetime import datetime
 
 import pandas as pd
 import streamlit as st
 
+from logic.data_processing import tabela_grupos
+from logic.incremental import reformar_incremental
+from logic.validation import processar_entrada_com_validacao
 from ui.components import alerta_aviso, alerta_info, alerta_sucesso, card_estatistica
 from utils.persistence import clear_history, load_history, save_history
 
@@ -15,6 +19,7 @@ from utils.persistence import clear_history, load_history, save_history
 def exibir_historico():
     """Exibe a página de histórico completa."""
     st.title("📚 Histórico de Grupos")
+    exibir_mensagens_pendentes()
 
     # Carregar histórico
     historico = st.session_state.get("historico_grupos", [])
@@ -136,6 +141,8 @@ def exibir_item_historico(item, indice):
             }
             alerta_sucesso("Dados carregados! Vá para 'Formar Grupos' para usá-los.")
 
+        atualizar_turma = st.checkbox("🔄 Entradas/saídas", key=f"atualizar_{indice}")
+
         if st.button("🗑️ Excluir", key=f"excluir_{indice}", use_container_width=True):
             # Remover do histórico
             historico = st.session_state["historico_grupos"]
@@ -159,16 +166,21 @@ def exibir_item_historico(item, indice):
             use_container_width=True,
         )
 
+    if atualizar_turma:
+        formulario_atualizacao_turma(item, indice)
+
     # Tabela com os grupos
     st.markdown("**👥 Grupos**")
 
+    # Itens combinados de várias turmas trazem o rótulo "turma - Grupo n" de cada grupo
+    rotulos = item.get("rotulos") or list(range(1, len(item["grupos"]) + 1))
     df_grupos = pd.DataFrame(
         [
             {
-                "Grupo": g_i + 1,
+                "Grupo": rotulo,
                 "Estudante": e.get("completo", f"{e.get('matricula', '')}, {e.get('nome', '')}"),
             }
-            for g_i, grupo in enumerate(item["grupos"])
+            for rotulo, grupo in zip(rotulos, item["grupos"])
             for e in grupo
         ]
     )
@@ -176,18 +188,72 @@ def exibir_item_historico(item, indice):
     st.dataframe(df_grupos, use_container_width=True)
 
 
+def formulario_atualizacao_turma(item, indice):
+    """
+    Atualiza os grupos de um item com estudantes que entraram ou saíram da turma,
+    mantendo os demais nos mesmos grupos, e salva o resultado como um novo item.
+    """
+    st.markdown("**🔄 Atualizar turma sem refazer os grupos**")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        texto_entradas = st.text_area(
+            "Entraram (Matrícula, Nome):",
+            placeholder="123456, João Silva",
+            key=f"entradas_{indice}",
+        )
+    with col2:
+        texto_saidas = st.text_area(
+            "Saíram (uma matrícula por linha):",
+            placeholder="789012",
+            key=f"saidas_{indice}",
+        )
+
+    if not st.button("✅ Aplicar alterações", key=f"aplicar_{indice}", type="primary"):
+        return
+
+    entradas = processar_entrada_com_validacao(texto_entradas)["estudantes"] if texto_entradas.strip() else []
+    saidas = [linha.strip() for linha in texto_saidas.splitlines() if linha.strip()]
+
+    relatorio = {}
+    novo_item = reformar_incremental(item, entradas, saidas, relatorio=relatorio)
+    novo_item.update(
+        {
+            "id": uuid.uuid4().hex,
+            "data": datetime.now().strftime("%d/%m/%Y %H:%M"),
+            "descricao": f"{item['descricao']} (atualizado)",
+        }
+    )
+
+    historico = st.session_state["historico_grupos"]
+    historico.insert(0, novo_item)  # Adicionar no início
+    save_history(historico)
+
+    # Guardadas para a próxima execução: o st.rerun() apagaria alertas exibidos agora
+    mensagens = []
+    if relatorio["nao_encontrados"]:
+        mensagens.append(("aviso", f"Matrículas não encontradas: {', '.join(relatorio['nao_encontrados'][:10])}"))
+    if relatorio["ignorados"]:
+        mensagens.append(("aviso", f"Já estavam em algum grupo: {', '.join(relatorio['ignorados'][:10])}"))
+    mensagens.append(
+        (
+            "sucesso",
+            f"{relatorio['adicionados']} entradas e {relatorio['removidos']} saídas aplicadas; "
+            f"{relatorio['grupos_alterados']} grupos alterados, {relatorio['movidos']} estudantes trocaram de grupo.",
+        )
+    )
+    st.session_state["mensagens_historico"] = mensagens
+    st.rerun()
+
+
+def exibir_mensagens_pendentes():
+    """Exibe, uma única vez, as mensagens guardadas antes do último st.rerun()."""
+    alertas = {"aviso": alerta_aviso, "sucesso": alerta_sucesso}
+    for tipo, mensagem in st.session_state.pop("mensagens_historico", []):
+        alertas[tipo](mensagem)
+
+
 def preparar_csv_item(item):
     """Prepara dados CSV de um item do histórico."""
-    dados = []
-    for g_i, grupo in enumerate(item["grupos"], 1):
-        for estudante in grupo:
-            dados.append(
-                {
-                    "Grupo": g_i,
-                    "Matricula": estudante.get("matricula", ""),
-                    "Nome": estudante.get("nome", ""),
-                }
-            )
-
-    df = pd.DataFrame(dados)
+    df = tabela_grupos(item["grupos"], ("Matrícula", "Nome")).rename(columns={"Matrícula": "Matricula"})
     return df.to_csv(index=False).encode("utf-8")
@@ -6,13 +6,89 @@ Contém componentes para entrada manual e importação de dados.
 import pandas as pd
 import streamlit as st
 
-from logic.data_processing import processar_csv_para_estudantes
-from logic.validation import (
-    extrair_preview_dados,
-    processar_entrada_com_validacao,
-    validar_csv,
-)
+from logic.columnar_io import COLUNAR_DISPONIVEL, EXTENSOES_COLUNARES, formato_colunar, importar_colunar, ler_colunar
+from logic.constraints import atributos_disponiveis, interpretar_pares
+from logic.csv_import import importar_csv_em_blocos
+from logic.csv_sniffing import BYTES_AMOSTRA, detectar_codificacao, farejar_csv, sugerir_colunas
+from logic.name_matching import encontrar_pares_semelhantes
+from logic.roster import CHAVE_PONTUACAO
+from logic.validation import extrair_preview_buffer, extrair_preview_dados
+from logic.validation_session import SessaoValidacao
+from ui.animations import animacao_progresso
 from ui.components import alerta_aviso, alerta_erro, alerta_info, alerta_sucesso
+from utils.exporters import ARQUIVOS_COLUNARES, gerar_colunar_turma
+
+# Máximo de nomes listados por matrícula duplicada e de matrículas duplicadas listadas
+LIMITE_NOMES_DUPLICATAS = 10
+LIMITE_MATRICULAS_DUPLICADAS = 20
+
+# Máximo de pares de nomes semelhantes procurados e exibidos
+LIMITE_NOMES_SEMELHANTES = 50
+AJUDA_NOMES_SEMELHANTES = (
+    "Aponta a mesma pessoa cadastrada com matrículas diferentes, como 'João da Silva' e 'Joao Silva'"
+)
+
+# Linhas do CSV lidas para o mapeamento de colunas e o preview; o arquivo inteiro
+# só é lido, em blocos, ao confirmar a importação
+LINHAS_AMOSTRA_CSV = 1_000
+
+# Extensões aceitas no upload para os formatos colunares
+TIPOS_COLUNARES = tuple(extensao.lstrip(".") for extensao in EXTENSOES_COLUNARES)
+
+# Nomes exibidos dos separadores detectados
+NOMES_SEPARADORES = {",": "vírgula", ";": "ponto e vírgula", "\t": "tabulação", "|": "barra vertical"}
+
+
+def sessao_validacao_manual():
+    """
+    Retorna a sessão de validação incremental da entrada manual, criando-a na primeira execução.
+
+    Returns:
+        SessaoValidacao: Sessão guardada no estado da sessão do Streamlit
+    """
+    if "sessao_validacao_manual" not in st.session_state:
+        st.session_state["sessao_validacao_manual"] = SessaoValidacao(limite_duplicatas=LIMITE_NOMES_DUPLICATAS)
+    return st.session_state["sessao_validacao_manual"]
+
+
+def exibir_duplicatas(duplicatas):
+    """
+    Exibe o alerta e os detalhes das matrículas duplicadas, limitando o que é listado.
+
+    Args:
+        duplicatas (dict): {matrícula: {"count", "indices", "nomes"}}, como em validar_duplicatas
+    """
+    alerta_aviso(f"Detectadas {len(duplicatas)} matrículas duplicadas!")
+    with st.expander("Ver duplicatas"):
+        for matricula, info in list(duplicatas.items())[:LIMITE_MATRICULAS_DUPLICADAS]:
+            st.write(f"Matrícula **{matricula}** aparece {info['count']} vezes:")
+            for nome in info["nomes"]:
+                st.write(f"  - {nome}")
+            if info["count"] > len(info["nomes"]):
+                st.write(f"  - ... e mais {info['count'] - len(info['nomes'])}")
+        if len(duplicatas) > LIMITE_MATRICULAS_DUPLICADAS:
+            st.write(f"... e mais {len(duplicatas) - LIMITE_MATRICULAS_DUPLICADAS} matrículas duplicadas")
+
+
+def exibir_nomes_semelhantes(pares):
+    """
+    Exibe os pares de estudantes com nomes semelhantes e matrículas diferentes.
+
+    Args:
+        pares (list): Pares {"indices", "matriculas", "nomes", "similaridade"}, como em
+            encontrar_pares_semelhantes
+    """
+    if not pares:
+        alerta_info("Nenhum nome parecido com matrícula diferente.")
+        return
+
+    alerta_aviso(f"Encontrados {len(pares)} pares de nomes parecidos com matrículas diferentes.")
+    with st.expander("Ver nomes parecidos"):
+        for par in pares:
+            (m1, m2), (n1, n2) = par["matriculas"], par["nomes"]
+            st.write(f"**{n1}** ({m1}) e **{n2}** ({m2}) - {par['similaridade']:.0%}")
+        if len(pares) >= LIMITE_NOMES_SEMELHANTES:
+            st.write(f"Mostrando os primeiros {LIMITE_NOMES_SEMELHANTES} pares.")
 
 
 def entrada_manual_com_preview():
@@ -33,32 +109,25 @@ def entrada_manual_com_preview():
         key="entrada_manual_texto",
     )
 
-    estudantes = []
+    arquivo_texto = st.file_uploader(
+        "Ou envie um arquivo .txt no mesmo formato:",
+        type="txt",
+        key="entrada_manual_arquivo",
+        help="O preview lê só o início do arquivo, direto do buffer do upload",
+    )
 
-    if estudantes_input:
-        # Extrair preview
+    estudantes = []
+    preview = None
+    if arquivo_texto is not None:
+        estudantes_input, preview = ler_arquivo_entrada(arquivo_texto)
+    elif estudantes_input:
         preview = extrair_preview_dados(estudantes_input, limite=5)
 
-        # Mostrar contadores
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Total de Linhas", preview["total_linhas"])
-        with col2:
-            st.metric("Válidas no Preview", preview["validas_preview"])
-        with col3:
-            st.metric("Inválidas no Preview", preview["invalidas_preview"])
-
-        # Mostrar preview
-        with st.expander("👁️ Preview dos dados", expanded=True):
-            for item in preview["preview"]:
-                status = "✅" if item["valido"] else "❌"
-                st.write(f"{status} Linha {item['linha']}: {item['conteudo'][:50]}")
-
-            if preview["total_linhas"] > preview["mostradas"]:
-                st.info(f"... e mais {preview['total_linhas'] - preview['mostradas']} linhas")
+    if estudantes_input:
+        exibir_preview_entrada(preview)
 
-        # Processar completamente
-        resultado = processar_entrada_com_validacao(estudantes_input)
+        # Processar completamente, reinterpretando só as linhas alteradas desde a última execução
+        resultado = sessao_validacao_manual().atualizar(estudantes_input)
         estudantes = resultado["estudantes"]
 
         # Mostrar alertas
@@ -71,13 +140,10 @@ def entrada_manual_com_preview():
                     st.write(f"... e mais {len(resultado['erros']) - 10} erros")
 
         if resultado["duplicatas"]:
-            num_dup = len(resultado["duplicatas"])
-            alerta_aviso(f"Detectadas {num_dup} matrículas duplicadas!")
-            with st.expander("Ver duplicatas"):
-                for matricula, info in resultado["duplicatas"].items():
-                    st.write(f"Matrícula **{matricula}** aparece {info['count']} vezes:")
-                    for nome in info["nomes"]:
-                        st.write(f"  - {nome}")
+            exibir_duplicatas(resultado["duplicatas"])
+
+        if st.checkbox("🔎 Procurar nomes parecidos", key="semelhantes_manual", help=AJUDA_NOMES_SEMELHANTES):
+            exibir_nomes_semelhantes(sessao_validacao_manual().nomes_semelhantes(limite=LIMITE_NOMES_SEMELHANTES))
 
         if estudantes:
             alerta_sucesso(f"{len(estudantes)} estudantes carregados com sucesso!")
@@ -85,6 +151,53 @@ def entrada_manual_com_preview():
     return estudantes
 
 
+def ler_arquivo_entrada(arquivo):
+    """
+    Lê um arquivo .txt enviado para a entrada manual.
+
+    O preview é extraído do buffer do upload (getbuffer(), sem copiar o arquivo); só
+    depois o conteúdo é decodificado para a validação completa.
+
+    Args:
+        arquivo (UploadedFile): Arquivo enviado pelo usuário
+
+    Returns:
+        tuple: (texto decodificado, preview no formato de extrair_preview_dados)
+    """
+    with arquivo.getbuffer() as buffer:
+        codificacao = detectar_codificacao(buffer[:BYTES_AMOSTRA].tobytes())
+        preview = extrair_preview_buffer(buffer, limite=5, codificacao=codificacao)
+        texto = str(buffer, codificacao, errors="replace")
+    return texto, preview
+
+
+def exibir_preview_entrada(preview):
+    """
+    Exibe os contadores e as primeiras linhas da entrada manual.
+
+    Args:
+        preview (dict): Preview no formato de extrair_preview_dados
+    """
+    # Com mais linhas que o preview, o total é estimado pelo início da entrada
+    aproximado = "≈ " if preview["total_aproximado"] else ""
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total de Linhas", f"{aproximado}{preview['total_linhas']}")
+    with col2:
+        st.metric("Válidas no Preview", preview["validas_preview"])
+    with col3:
+        st.metric("Inválidas no Preview", preview["invalidas_preview"])
+
+    with st.expander("👁️ Preview dos dados", expanded=True):
+        for item in preview["preview"]:
+            status = "✅" if item["valido"] else "❌"
+            st.write(f"{status} Linha {item['linha']}: {item['conteudo'][:50]}")
+
+        if preview["total_linhas"] > preview["mostradas"]:
+            st.info(f"... e mais {aproximado}{preview['total_linhas'] - preview['mostradas']} linhas")
+
+
 def importar_csv_com_mapeamento():
     """
     Formulário de importação de CSV com mapeamento de colunas.
@@ -96,19 +209,19 @@ def importar_csv_com_mapeamento():
 
     estudantes = []
 
-    # Upload de arquivo
+    # Upload de arquivo (Parquet e Feather só com o pyarrow instalado)
     uploaded_file = st.file_uploader(
-        "Escolha um arquivo CSV",
-        type="csv",
-        help="Arquivo CSV com colunas de matrícula e nome",
+        "Escolha um arquivo CSV" + (", Parquet ou Feather" if COLUNAR_DISPONIVEL else ""),
+        type=["csv"] + (list(TIPOS_COLUNARES) if COLUNAR_DISPONIVEL else []),
+        help="Arquivo com colunas de matrícula e nome",
     )
 
     if uploaded_file is not None:
         try:
-            # Ler CSV
-            df = pd.read_csv(uploaded_file)
-
-            st.write(f"**Arquivo carregado:** {len(df)} registros, {len(df.columns)} colunas")
+            # Ler só uma amostra para o mapeamento
+            formato = formato_colunar(uploaded_file.name)
+            df, opcoes = ler_amostra_upload(uploaded_file, formato)
+            sugerida_matricula, sugerida_nome = sugerir_colunas(df)
 
             # Preview dos dados
             with st.expander("👁️ Visualizar dados brutos"):
@@ -122,22 +235,47 @@ def importar_csv_com_mapeamento():
                 col_matricula = st.selectbox(
                     "Coluna da Matrícula",
                     options=df.columns,
+                    index=indice_sugerido(df.columns, sugerida_matricula),
                     help="Selecione a coluna que contém as matrículas",
                 )
             with col2:
                 col_nome = st.selectbox(
                     "Coluna do Nome",
                     options=df.columns,
+                    index=indice_sugerido(df.columns, sugerida_nome),
                     help="Selecione a coluna que contém os nomes",
                 )
 
-            # Validar
-            valido, erros = validar_csv(df, col_matricula, col_nome)
-
-            if not valido:
-                alerta_erro("Problemas encontrados no CSV:")
-                for erro in erros:
-                    st.write(f"- {erro}")
+            # Colunas extras viram atributos (usados pelo método "Restrições")
+            colunas_extras = st.multiselect(
+                "Colunas adicionais (atributos)",
+                options=[c for c in df.columns if c not in (col_matricula, col_nome)],
+                help="Ex.: turma, repetente. Podem ser usadas nas restrições de formação",
+            )
+
+            # Coluna numérica usada pelo método "Balanceado" para equilibrar as médias
+            colunas_numericas = [c for c in df.columns if c not in (col_matricula, col_nome) and coluna_numerica(df[c])]
+            col_pontuacao = st.selectbox(
+                "Coluna de pontuação (opcional)",
+                options=["(nenhuma)"] + colunas_numericas,
+                help="Ex.: nota ou nível de habilidade. O método Balanceado equilibra as médias dos grupos",
+            )
+            col_pontuacao = None if col_pontuacao == "(nenhuma)" else col_pontuacao
+
+            if st.checkbox("🔎 Procurar nomes parecidos", key="semelhantes_csv", help=AJUDA_NOMES_SEMELHANTES):
+                # Lê o arquivo inteiro, mas só as duas colunas mapeadas
+                uploaded_file.seek(0)
+                if formato:
+                    nomes_df = ler_colunar(uploaded_file, formato, [col_matricula, col_nome]).astype(str)
+                else:
+                    nomes_df = pd.read_csv(uploaded_file, usecols=[col_matricula, col_nome], dtype=str, **opcoes)
+                exibir_nomes_semelhantes(
+                    encontrar_pares_semelhantes(
+                        nomes_df[col_matricula].fillna("").tolist(),
+                        nomes_df[col_nome].fillna("").tolist(),
+                        limite=LIMITE_NOMES_SEMELHANTES,
+                    )
+                )
 
             # Preview dos dados mapeados
             st.markdown("**Preview dos dados selecionados:**")
@@ -146,7 +284,10 @@ def importar_csv_com_mapeamento():
 
             # Botão de confirmação
             if st.button("✅ Confirmar Importação", type="primary"):
-                estudantes = processar_csv_para_estudantes(df, col_matricula, col_nome)
+                uploaded_file.seek(0)
+                estudantes = importar_csv_com_progresso(
+                    uploaded_file, col_matricula, col_nome, colunas_extras, col_pontuacao, opcoes, formato
+                )
 
                 if estudantes:
                     st.session_state["estudantes_importados"] = estudantes
@@ -161,6 +302,15 @@ def importar_csv_com_mapeamento():
     elif "estudantes_importados" in st.session_state:
         estudantes = st.session_state["estudantes_importados"]
         alerta_info(f"Usando {len(estudantes)} estudantes importados anteriormente.")
+        if COLUNAR_DISPONIVEL:
+            dados, nome_arquivo = gerar_colunar_turma(estudantes)
+            st.download_button(
+                "💾 Baixar turma em Parquet",
+                data=dados,
+                file_name=nome_arquivo,
+                mime=ARQUIVOS_COLUNARES["parquet"][1],
+                help="Reimportar o arquivo Parquet é bem mais rápido que reimportar o CSV",
+            )
         if st.button("🗑️ Limpar importação anterior"):
             del st.session_state["estudantes_importados"]
             st.rerun()
@@ -168,6 +318,119 @@ def importar_csv_com_mapeamento():
     return estudantes
 
 
+def ler_amostra_upload(arquivo, formato):
+    """
+    Lê as primeiras linhas do arquivo enviado para o mapeamento de colunas.
+
+    Para CSV, detecta antes o formato pelos primeiros KB e o exibe.
+
+    Args:
+        arquivo (file): Arquivo enviado pelo usuário
+        formato (str or None): "parquet", "feather" ou None (CSV)
+
+    Returns:
+        tuple: (DataFrame com a amostra, opções de leitura do CSV ou None)
+    """
+    if formato:
+        df = ler_colunar(arquivo, formato, linhas=LINHAS_AMOSTRA_CSV)
+        opcoes = None
+    else:
+        opcoes = farejar_csv(arquivo)
+        df = pd.read_csv(arquivo, nrows=LINHAS_AMOSTRA_CSV, dtype=str, **opcoes)
+
+    st.write(
+        f"**Arquivo carregado:** {arquivo.size / 1024:,.0f} KB, {len(df.columns)} colunas "
+        f"(mapeamento feito com as primeiras {len(df)} linhas)"
+    )
+    if formato:
+        st.caption(f"Formato {formato.capitalize()}: tipos das colunas preservados")
+    else:
+        st.caption(
+            f"Formato detectado: separador {NOMES_SEPARADORES.get(opcoes['sep'], repr(opcoes['sep']))}, "
+            f"codificação {opcoes['encoding']}, {'sem' if 'names' in opcoes else 'com'} cabeçalho"
+        )
+    return df, opcoes
+
+
+def importar_csv_com_progresso(arquivo, col_matricula, col_nome, colunas_extras, col_pontuacao, opcoes, formato=None):
+    """
+    Importa o arquivo, exibindo os problemas encontrados; um CSV é lido em blocos,
+    com uma barra de progresso, e um Parquet ou Feather só nas colunas mapeadas.
+
+    Args:
+        arquivo (file): Arquivo enviado pelo usuário, posicionado no início
+        col_matricula (str): Nome da coluna de matrícula
+        col_nome (str): Nome da coluna de nome
+        colunas_extras (list): Colunas copiadas como atributos dos estudantes
+        col_pontuacao (str or None): Coluna de pontuação
+        opcoes (dict or None): Opções de leitura detectadas por farejar_csv
+        formato (str, optional): "parquet" ou "feather"; None para CSV
+
+    Returns:
+        Turma: Estudantes importados, em colunas compactas
+    """
+    if formato:
+        estudantes, erros = importar_colunar(arquivo, formato, col_matricula, col_nome, colunas_extras, col_pontuacao)
+        exibir_erros_importacao(erros)
+        return estudantes
+
+    barra = st.empty()
+
+    def progresso(lidos, total):
+        animacao_progresso(lidos // 1024, total // 1024, "Importando (KB)", container=barra)
+
+    estudantes, erros = importar_csv_em_blocos(
+        arquivo, col_matricula, col_nome, colunas_extras, col_pontuacao, progresso=progresso, **opcoes
+    )
+    barra.empty()
+
+    exibir_erros_importacao(erros)
+    return estudantes
+
+
+def exibir_erros_importacao(erros):
+    """
+    Exibe os problemas encontrados na importação.
+
+    Args:
+        erros (list): Mensagens de erro
+    """
+    if erros:
+        alerta_erro("Problemas encontrados no arquivo:")
+        for erro in erros:
+            st.write(f"- {erro}")
+
+
+def indice_sugerido(colunas, sugerida):
+    """
+    Retorna a posição da coluna sugerida nas opções de um selectbox.
+
+    Args:
+        colunas (Index): Colunas do CSV
+        sugerida (str or None): Coluna sugerida por sugerir_colunas
+
+    Returns:
+        int: Posição da coluna sugerida (0 se não houver sugestão)
+    """
+    return list(colunas).index(sugerida) if sugerida in colunas else 0
+
+
+def coluna_numerica(serie):
+    """
+    Verifica se a maioria dos valores preenchidos de uma coluna é numérica.
+
+    Args:
+        serie (Series): Coluna do DataFrame
+
+    Returns:
+        bool: True se a coluna pode ser usada como pontuação
+    """
+    preenchidos = serie.dropna().astype(str).str.replace(",", ".", regex=False)
+    if preenchidos.empty:
+        return False
+    return pd.to_numeric(preenchidos, errors="coerce").notna().mean() >= 0.5
+
+
 def carregar_grupos_salvos():
     """
     Permite carregar grupos do histórico salvo.
@@ -215,3 +478,128 @@ def carregar_grupos_salvos():
         alerta_info(f"Usando {len(estudantes)} estudantes carregados.")
 
     return estudantes
+
+
+def formulario_restricoes(estudantes):
+    """
+    Formulário das restrições do método "Restrições".
+
+    Args:
+        estudantes (list): Lista de estudantes carregados
+
+    Returns:
+        tuple: (dict, float) - (restrições, tempo limite em segundos)
+    """
+    restricoes = {"juntos": [], "separados": [], "limites": []}
+
+    with st.expander("🧩 Restrições", expanded=True):
+        col1, col2 = st.columns(2)
+
+        with col1:
+            texto_juntos = st.text_area(
+                "Manter juntos (um par por linha):",
+                placeholder="123456, 789012",
+                help="Pares de matrículas que devem ficar no mesmo grupo",
+            )
+        with col2:
+            texto_separados = st.text_area(
+                "Manter separados (um par por linha):",
+                placeholder="123456, 345678",
+                help="Pares de matrículas que não podem ficar no mesmo grupo",
+            )
+
+        for chave, texto in (("juntos", texto_juntos), ("separados", texto_separados)):
+            pares, invalidas = interpretar_pares(texto)
+            restricoes[chave] = pares
+            if invalidas:
+                alerta_aviso(f"Linhas ignoradas em '{chave}': {', '.join(map(str, invalidas[:10]))}")
+
+        atributos = atributos_disponiveis(estudantes)
+        if atributos:
+            st.markdown("**Limite por atributo**")
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                atributo = st.selectbox("Atributo", ["(nenhum)"] + atributos)
+            with col2:
+                valor = st.text_input("Valor", placeholder="Ex.: sim")
+            with col3:
+                maximo = st.number_input("Máximo por grupo", min_value=0, value=1)
+
+            if atributo != "(nenhum)" and valor:
+                restricoes["limites"].append({"atributo": atributo, "valor": valor, "maximo": maximo})
+        else:
+            st.caption("Importe um CSV com colunas adicionais para limitar atributos por grupo.")
+
+        tempo_limite = st.number_input(
+            "Tempo máximo de otimização (s)",
+            min_value=0.1,
+            max_value=30.0,
+            value=1.0,
+            step=0.5,
+        )
+
+    return restricoes, tempo_limite
+
+
+def formulario_turmas(estudantes):
+    """
+    Opções da formação por turma (um CSV com várias turmas).
+
+    Args:
+        estudantes (list or Turma): Lista de estudantes carregados
+
+    Returns:
+        tuple: (str or None, bool) - (coluna da turma ou None, se salva um item por turma)
+    """
+    atributos = [atributo for atributo in atributos_disponiveis(estudantes) if atributo != CHAVE_PONTUACAO]
+    if not atributos:
+        return None, True
+
+    with st.expander("🏫 Formar por turma"):
+        coluna = st.selectbox(
+            "Coluna da turma:",
+            ["(não dividir)"] + atributos,
+            help="Forma os grupos dentro de cada turma, sem misturar estudantes de turmas diferentes",
+        )
+        modo = st.radio("Salvar no histórico:", ["Um item por turma", "Um item combinado"], horizontal=True)
+
+    if coluna == "(não dividir)":
+        return None, True
+
+    return coluna, modo == "Um item por turma"
+
+
+def formulario_diversidade(estudantes):
+    """
+    Formulário dos objetivos do método "Diversidade".
+
+    Args:
+        estudantes (list or Turma): Lista de estudantes carregados
+
+    Returns:
+        tuple: (dict, float) - (opções de otimização, orçamento em segundos)
+    """
+    with st.expander("🌈 Diversidade", expanded=True):
+        atributos = [atributo for atributo in atributos_disponiveis(estudantes) if atributo != CHAVE_PONTUACAO]
+        if atributos:
+            colunas = st.multiselect(
+                "Misturar dentro dos grupos:",
+                atributos,
+                default=atributos,
+                help="Os valores de cada coluna ficam o mais distribuídos possível entre os grupos",
+            )
+        else:
+            colunas = []
+            st.caption("Importe um CSV com colunas adicionais (ex.: curso) para misturá-las nos grupos.")
+
+        objetivos = {"diversidade": 1.0}
+        if CHAVE_PONTUACAO in atributos_disponiveis(estudantes):
+            peso = st.slider("Peso do equilíbrio de pontuação", min_value=0.0, max_value=10.0, value=1.0, step=0.5)
+            if peso > 0:
+                objetivos["pontuacao"] = peso
+
+        orcamento_ms = st.number_input(
+            "Orçamento de otimização (ms)", min_value=10, max_value=30_000, value=200, step=50
+        )
+
+    return {"objetivos": objetivos, "colunas": colunas}, orcamento_ms / 1000
@@ -7,6 +7,8 @@ from datetime import datetime
 
 import streamlit as st
 
+from logic.formation_cache import obter_cache_formacoes
+from logic.group_formation import METODOS_FORMACAO
 from ui.components import alerta_aviso, alerta_sucesso
 from utils.persistence import load_config, reset_all, save_config
 
@@ -35,8 +37,8 @@ def exibir_configuracoes():
         # Método padrão
         metodo_padrao = st.selectbox(
             "Método padrão",
-            ["Aleatório", "Sequencial", "Balanceado"],
-            index=["Aleatório", "Sequencial", "Balanceado"].index(config.get("metodo_padrao", "Aleatório")),
+            METODOS_FORMACAO,
+            index=METODOS_FORMACAO.index(config.get("metodo_padrao", "Aleatório")),
             help="Método padrão de formação de grupos",
         )
 
@@ -93,7 +95,39 @@ def exibir_configuracoes():
 
     st.divider()
 
-    # Gerenciamento de dados
+    _exibir_gerenciamento_dados()
+
+    st.divider()
+
+    # Sobre
+    st.markdown("**ℹ️ Sobre o FormaDevs**")
+
+    st.markdown(f"""
+    **FormaDevs** é uma aplicação para formação de grupos de estudantes.
+    
+    **Versão:** 2.0  
+    **Desenvolvido com:** Python + Streamlit
+    
+    **Funcionalidades:**
+    - Formação de grupos com vários métodos ({", ".join(METODOS_FORMACAO)})
+    - Importação de dados via CSV
+    - QR Codes para cada grupo
+    - Animações de sorteio
+    - Persistência de dados
+    - Exportação em múltiplos formatos
+    """)
+
+    # Informações de debug (opcional)
+    with st.expander("🔧 Informações Técnicas"):
+        st.write("**Diretório de dados:** `./data/`")
+        st.write("**Arquivo de configuração:** `./data/config.json`")
+        st.write("**Arquivo de histórico:** `./data/history.json`")
+        st.write(f"**Session State keys:** {list(st.session_state.keys())}")
+        _exibir_cache()
+
+
+def _exibir_gerenciamento_dados():
+    """Exibe os botões de limpeza do histórico e de reset completo."""
     st.markdown("**🗄️ Gerenciamento de Dados**")
 
     col1, col2 = st.columns(2)
@@ -119,29 +153,15 @@ def exibir_configuracoes():
                     alerta_sucesso("Todas as configurações foram resetadas!")
                     st.rerun()
 
-    st.divider()
 
-    # Sobre
-    st.markdown("**ℹ️ Sobre o FormaDevs**")
-
-    st.markdown("""
-    **FormaDevs** é uma aplicação para formação de grupos de estudantes.
-    
-    **Versão:** 2.0  
-    **Desenvolvido com:** Python + Streamlit
-    
-    **Funcionalidades:**
-    - Formação de grupos com 3 métodos (Aleatório, Sequencial, Balanceado)
-    - Importação de dados via CSV
-    - QR Codes para cada grupo
-    - Animações de sorteio
-    - Persistência de dados
-    - Exportação em múltiplos formatos
-    """)
-
-    # Informações de debug (opcional)
-    with st.expander("🔧 Informações Técnicas"):
-        st.write("**Diretório de dados:** `./data/`")
-        st.write("**Arquivo de configuração:** `./data/config.json`")
-        st.write("**Arquivo de histórico:** `./data/history.json`")
-        st.write(f"**Session State keys:** {list(st.session_state.keys())}")
+def _exibir_cache():
+    """Exibe as estatísticas do cache de formações com semente (compartilhado entre sessões)."""
+    cache = obter_cache_formacoes()
+    stats_cache = cache.estatisticas()
+    st.write(
+        f"**Cache de formações:** {stats_cache['acertos']} acertos, {stats_cache['falhas']} falhas "
+        f"({stats_cache['taxa_acerto']:.0%}), {stats_cache['entradas']}/{stats_cache['tamanho_maximo']} formações"
+    )
+    if st.button("🧹 Limpar cache de formações"):
+        cache.limpar()
+        st.rerun()
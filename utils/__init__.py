@@ -3,6 +3,8 @@ Pacote de utilitários do FormaDevs.
 """
 
 from utils.exporters import (
+    gerar_colunar_grupos,
+    gerar_colunar_turma,
     gerar_csv_grupos,
     gerar_excel_grupos,
     gerar_lista_simples,
@@ -50,6 +52,8 @@ __all__ = [
     "gerar_excel_grupos",
     "gerar_txt_grupos",
     "gerar_lista_simples",
+    "gerar_colunar_grupos",
+    "gerar_colunar_turma",
     # qr_generator
     "gerar_qr_code_grupo",
     "gerar_qr_code_todos_grupos",
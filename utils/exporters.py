@@ -4,34 +4,49 @@ Contém funções para exportar grupos em diferentes formatos.
 """
 
 import io
+import weakref
 from datetime import datetime
 
 import pandas as pd
 
+from logic.columnar_io import COLUNAR_DISPONIVEL, MENSAGEM_SEM_PYARROW, como_texto
+from logic.data_processing import tabela_grupos
+from logic.roster import CHAVE_PONTUACAO, Agrupamento, Turma
+
+# Extensão e tipo MIME de cada formato colunar
+ARQUIVOS_COLUNARES = {
+    "parquet": (".parquet", "application/vnd.apache.parquet"),
+    "feather": (".feather", "application/vnd.apache.arrow.file"),
+}
+
+# Arquivos colunares já gravados de cada Turma ou Agrupamento, por formato
+_arquivos_colunares = weakref.WeakKeyDictionary()
+
+
+def dataframe_grupos(grupos):
+    """
+    Monta o DataFrame (Grupo, Matrícula, Nome) usado nas exportações.
+
+    Args:
+        grupos (list or Agrupamento): Lista de grupos
+
+    Returns:
+        DataFrame: Uma linha por estudante, na ordem dos grupos (ver tabela_grupos)
+    """
+    return tabela_grupos(grupos, ("Matrícula", "Nome"))
+
 
 def gerar_csv_grupos(grupos):
     """
     Gera dados CSV dos grupos.
 
     Args:
-        grupos (list): Lista de grupos
+        grupos (list or Agrupamento): Lista de grupos
 
     Returns:
         tuple: (bytes, filename) - Dados CSV e nome do arquivo sugerido
     """
-    # Criar listas para o DataFrame
-    grupo_nums = []
-    matriculas = []
-    nomes = []
-
-    for i, grupo in enumerate(grupos, 1):
-        for estudante in grupo:
-            grupo_nums.append(i)
-            matriculas.append(estudante.get("matricula", ""))
-            nomes.append(estudante.get("nome", ""))
-
-    # Criar DataFrame
-    df = pd.DataFrame({"Grupo": grupo_nums, "Matrícula": matriculas, "Nome": nomes})
+    df = dataframe_grupos(grupos)
 
     # Converter para CSV
     csv = df.to_csv(index=False).encode("utf-8")
@@ -41,29 +56,38 @@ def gerar_csv_grupos(grupos):
     return csv, filename
 
 
+def gerar_csv_turmas(formacoes):
+    """
+    Gera dados CSV dos grupos de várias turmas, com os grupos numerados por turma.
+
+    Args:
+        formacoes (dict): {turma: grupos}, como devolvido por formar_grupos_por_turma
+
+    Returns:
+        tuple: (bytes, filename) - Dados CSV e nome do arquivo sugerido
+    """
+    partes = [dataframe_grupos(grupos).assign(Turma=nome) for nome, grupos in formacoes.items()]
+    df = pd.concat(partes, ignore_index=True) if partes else dataframe_grupos([]).assign(Turma=[])
+    df = df[["Turma", "Grupo", "Matrícula", "Nome"]]
+
+    csv = df.to_csv(index=False).encode("utf-8")
+
+    filename = f"grupos_turmas_{datetime.now().strftime('%Y%m%d_%H%M')}.csv"
+
+    return csv, filename
+
+
 def gerar_excel_grupos(grupos):
     """
     Gera arquivo Excel dos grupos.
 
     Args:
-        grupos (list): Lista de grupos
+        grupos (list or Agrupamento): Lista de grupos
 
     Returns:
         tuple: (bytes, filename) - Dados Excel e nome do arquivo sugerido
     """
-    # Criar listas para o DataFrame
-    grupo_nums = []
-    matriculas = []
-    nomes = []
-
-    for i, grupo in enumerate(grupos, 1):
-        for estudante in grupo:
-            grupo_nums.append(i)
-            matriculas.append(estudante.get("matricula", ""))
-            nomes.append(estudante.get("nome", ""))
-
-    # Criar DataFrame
-    df = pd.DataFrame({"Grupo": grupo_nums, "Matrícula": matriculas, "Nome": nomes})
+    df = dataframe_grupos(grupos)
 
     # Salvar em um buffer de memória
     output = io.BytesIO()
@@ -83,6 +107,96 @@ def gerar_excel_grupos(grupos):
     return excel_data, filename
 
 
+def dataframe_turma(estudantes):
+    """
+    Monta o DataFrame de uma turma, com uma coluna por campo do estudante.
+
+    Args:
+        estudantes (list or Turma): Estudantes da turma
+
+    Returns:
+        DataFrame: Colunas matricula, nome, atributos e pontuacao (se houver), com a
+        pontuação como número e as demais colunas como texto
+    """
+    turma = Turma.de_estudantes(estudantes)
+    colunas = {"matricula": turma.coluna("matricula"), "nome": turma.coluna("nome")}
+    colunas.update({chave: coluna.valores() for chave, coluna in turma.atributos.items()})
+    if turma.pontuacoes is not None:
+        colunas[CHAVE_PONTUACAO] = turma.pontuacoes
+    return pd.DataFrame(colunas)
+
+
+def _serializar_colunar(origem, montar_dataframe, formato):
+    """
+    Grava em Parquet ou Feather, em memória, o DataFrame montado a partir da origem.
+
+    O arquivo de uma Turma ou de um Agrupamento fica guardado enquanto o objeto
+    existir, então os botões de download não regravam o arquivo a cada interação.
+    """
+    if not COLUNAR_DISPONIVEL:
+        raise ImportError(MENSAGEM_SEM_PYARROW)
+    if formato not in ARQUIVOS_COLUNARES:
+        raise ValueError(f"Formato colunar desconhecido: {formato}")
+
+    guardados = _arquivos_colunares.get(origem) if isinstance(origem, (Turma, Agrupamento)) else None
+    if guardados is not None and formato in guardados:
+        return guardados[formato]
+
+    df = montar_dataframe(origem)
+    for coluna in ("matricula", "nome", "Matrícula", "Nome"):
+        if coluna in df.columns:
+            df[coluna] = como_texto(df[coluna])
+
+    output = io.BytesIO()
+    if formato == "parquet":
+        df.to_parquet(output, index=False)
+    else:
+        df.to_feather(output)
+    dados = output.getvalue()
+
+    if isinstance(origem, (Turma, Agrupamento)):
+        _arquivos_colunares.setdefault(origem, {})[formato] = dados
+    return dados
+
+
+def gerar_colunar_grupos(grupos, formato="parquet"):
+    """
+    Gera um arquivo Parquet ou Feather dos grupos, mantendo os tipos das colunas.
+
+    Args:
+        grupos (list or Agrupamento): Lista de grupos
+        formato (str): "parquet" ou "feather"
+
+    Returns:
+        tuple: (bytes, filename) - Dados do arquivo e nome do arquivo sugerido
+    """
+    dados = _serializar_colunar(grupos, dataframe_grupos, formato)
+
+    extensao = ARQUIVOS_COLUNARES[formato][0]
+    filename = f"grupos_estudantes_{datetime.now().strftime('%Y%m%d_%H%M')}{extensao}"
+
+    return dados, filename
+
+
+def gerar_colunar_turma(estudantes, formato="parquet"):
+    """
+    Gera um arquivo Parquet ou Feather da turma, para reimportá-la sem passar por CSV.
+
+    Args:
+        estudantes (list or Turma): Estudantes da turma
+        formato (str): "parquet" ou "feather"
+
+    Returns:
+        tuple: (bytes, filename) - Dados do arquivo e nome do arquivo sugerido
+    """
+    dados = _serializar_colunar(estudantes, dataframe_turma, formato)
+
+    extensao = ARQUIVOS_COLUNARES[formato][0]
+    filename = f"turma_{datetime.now().strftime('%Y%m%d_%H%M')}{extensao}"
+
+    return dados, filename
+
+
 def gerar_txt_grupos(grupos, formato_exibicao="completo"):
     """
     Gera arquivo texto simples dos grupos.
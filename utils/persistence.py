@@ -20,6 +20,27 @@ def ensure_data_dir():
     BACKUP_DIR.mkdir(parents=True, exist_ok=True)
 
 
+def serializar_json(valor):
+    """
+    Converte para JSON os tipos compactos da lógica (Turma, Agrupamento e arrays).
+
+    Args:
+        valor: Objeto que o módulo json não sabe serializar
+
+    Returns:
+        Valor equivalente em listas e dicionários
+    """
+    from logic.roster import Agrupamento, Turma
+
+    if isinstance(valor, Turma):
+        return valor.para_estudantes()
+    if isinstance(valor, Agrupamento):
+        return valor.para_listas()
+    if hasattr(valor, "tolist"):
+        return valor.tolist()
+    raise TypeError(f"Objeto do tipo {type(valor).__name__} não é serializável em JSON")
+
+
 def save_history(historico):
     """
     Salva o histórico de grupos em arquivo JSON.
@@ -43,17 +64,22 @@ def save_history(historico):
 
         # Salvar no arquivo principal
         with open(HISTORY_FILE, "w", encoding="utf-8") as f:
-            json.dump(data_to_save, f, ensure_ascii=False, indent=2)
+            json.dump(data_to_save, f, ensure_ascii=False, indent=2, default=serializar_json)
 
         # Também criar backup
         backup_filename = f"history_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
         backup_path = BACKUP_DIR / backup_filename
         with open(backup_path, "w", encoding="utf-8") as f:
-            json.dump(data_to_save, f, ensure_ascii=False, indent=2)
+            json.dump(data_to_save, f, ensure_ascii=False, indent=2, default=serializar_json)
 
         # Limitar número de backups (manter últimos 10)
         limit_backups(10)
 
+        # Manter a matriz de pares em dia sem reconstruí-la a partir do JSON
+        from logic.pair_history import atualizar_matriz_pares
+
+        atualizar_matriz_pares(historico)
+
         return True
     except Exception as e:
         print(f"Erro ao salvar histórico: {e}")
@@ -216,6 +242,10 @@ def clear_history():
     try:
         if HISTORY_FILE.exists():
             HISTORY_FILE.unlink()
+
+        from logic.pair_history import atualizar_matriz_pares
+
+        atualizar_matriz_pares([])
         return True
     except Exception as e:
         print(f"Erro ao limpar histórico: {e}")
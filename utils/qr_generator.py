@@ -73,7 +73,8 @@ def gerar_qr_code_todos_grupos(grupos):
     Gera um QR Code contendo todos os grupos.
 
     Args:
-        grupos (list): Lista de todos os grupos
+        grupos (list or Agrupamento): Lista de todos os grupos (um Agrupamento é lido
+            grupo a grupo, como listas de estudantes)
 
     Returns:
         dict: Dicionário com a imagem em base64 e os dados